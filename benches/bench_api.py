@@ -0,0 +1,215 @@
+import asyncio
+import datetime
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+import pytest
+
+from prefect import flow, task
+from prefect.client.orchestration import PrefectClient, get_client
+from prefect.client.schemas.actions import LogCreate, VariableCreate, WorkPoolCreate
+from prefect.types._datetime import now
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+NUM_FLOW_RUNS = 200
+NUM_TASK_RUNS = 200
+NUM_LOGS = 1_000
+ROUNDS = 50
+
+BENCH_NAME = "bench-api"
+
+
+@flow
+def noop_flow():
+    pass
+
+
+@task
+def noop_task():
+    pass
+
+
+class Endpoint(NamedTuple):
+    method: str
+    path: str
+    json: Optional[dict[str, Any]] = None
+    params: Optional[dict[str, Any]] = None
+
+    def __str__(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def _history_body() -> dict[str, Any]:
+    end = now("UTC")
+    return {
+        "history_start": (end - datetime.timedelta(days=1)).isoformat(),
+        "history_end": end.isoformat(),
+        "history_interval_seconds": 3600,
+    }
+
+
+# The endpoints most frequently called by the UI, workers and flow runs. Paths are
+# formatted with the ids of the objects created by the `objects` fixture.
+ENDPOINTS = [
+    Endpoint("GET", "/flows/{flow_id}"),
+    Endpoint("POST", "/flows/filter", json={}),
+    Endpoint("GET", "/flow_runs/{flow_run_id}"),
+    Endpoint("POST", "/flow_runs/filter", json={}),
+    Endpoint("POST", "/flow_runs/count", json={}),
+    Endpoint("POST", "/flow_runs/paginate", json={}),
+    Endpoint("POST", "/flow_runs/history", json=_history_body()),
+    Endpoint("GET", "/flow_runs/{flow_run_id}/graph-v2"),
+    Endpoint("GET", "/flow_run_states/", params={"flow_run_id": "{flow_run_id}"}),
+    Endpoint("POST", "/ui/flow_runs/count-task-runs", json={"flow_run_ids": []}),
+    Endpoint("GET", "/task_runs/{task_run_id}"),
+    Endpoint("POST", "/task_runs/filter", json={}),
+    Endpoint("POST", "/task_runs/count", json={}),
+    Endpoint("GET", "/deployments/{deployment_id}"),
+    Endpoint("POST", "/deployments/filter", json={}),
+    Endpoint("GET", "/work_pools/{work_pool_name}"),
+    Endpoint("POST", "/work_pools/filter", json={}),
+    Endpoint("POST", "/work_pools/{work_pool_name}/get_scheduled_flow_runs", json={}),
+    Endpoint("POST", "/logs/filter", json={}),
+    Endpoint("POST", "/variables/filter", json={}),
+]
+
+
+async def _create_objects(client: PrefectClient) -> dict[str, Any]:
+    flow_runs = [await client.create_flow_run(noop_flow) for _ in range(NUM_FLOW_RUNS)]
+    flow_run = flow_runs[0]
+    task_runs = [
+        await client.create_task_run(
+            noop_task, flow_run_id=flow_run.id, dynamic_key=str(i)
+        )
+        for i in range(NUM_TASK_RUNS)
+    ]
+    await client.create_logs(
+        [
+            LogCreate(
+                name="prefect.flow_runs",
+                level=20,
+                message=f"Log message {i}",
+                timestamp=now("UTC"),
+                flow_run_id=flow_run.id,
+            )
+            for i in range(NUM_LOGS)
+        ]
+    )
+    deployment_id = await client.create_deployment(
+        flow_id=flow_run.flow_id, name=BENCH_NAME
+    )
+    work_pool = await client.create_work_pool(
+        WorkPoolCreate(name=BENCH_NAME, type="process")
+    )
+    await client.create_variable(VariableCreate(name="bench_api", value="value"))
+
+    return {
+        "flow_id": flow_run.flow_id,
+        "flow_run_id": flow_run.id,
+        "task_run_id": task_runs[0].id,
+        "deployment_id": deployment_id,
+        "work_pool_name": work_pool.name,
+    }
+
+
+async def _delete_objects(client: PrefectClient, objects: dict[str, Any]) -> None:
+    await client.delete_flow(objects["flow_id"])
+    await client.delete_work_pool(objects["work_pool_name"])
+    await client.delete_variable_by_name("bench_api")
+
+
+async def _request(
+    client: PrefectClient, endpoint: Endpoint, objects: dict[str, Any], encoding: str
+) -> int:
+    """
+    Send a request to an endpoint, returning the number of body bytes sent by the
+    server before decompression.
+    """
+    params = (
+        {key: value.format(**objects) for key, value in endpoint.params.items()}
+        if endpoint.params
+        else None
+    )
+    size = 0
+    async with client._client.stream(
+        endpoint.method,
+        endpoint.path.format(**objects),
+        json=endpoint.json,
+        params=params,
+        headers={"Accept-Encoding": encoding},
+    ) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_raw():
+            size += len(chunk)
+    return size
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def client(loop: asyncio.AbstractEventLoop) -> Iterator[PrefectClient]:
+    client = get_client()
+    loop.run_until_complete(client.__aenter__())
+    yield client
+    loop.run_until_complete(client.__aexit__(None, None, None))
+
+
+@pytest.fixture(scope="module")
+def objects(
+    loop: asyncio.AbstractEventLoop, client: PrefectClient
+) -> Iterator[dict[str, Any]]:
+    objects = loop.run_until_complete(_create_objects(client))
+    yield objects
+    loop.run_until_complete(_delete_objects(client, objects))
+
+
+@pytest.mark.timeout(600)
+@pytest.mark.parametrize(
+    "encoding",
+    [
+        "identity",
+        "gzip",
+        pytest.param(
+            "zstd",
+            marks=pytest.mark.skipif(
+                zstandard is None, reason="zstandard is not installed"
+            ),
+        ),
+    ],
+)
+@pytest.mark.parametrize("endpoint", ENDPOINTS, ids=str)
+def bench_api_endpoint(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    client: PrefectClient,
+    objects: dict[str, Any],
+    endpoint: Endpoint,
+    encoding: str,
+):
+    sizes: list[int] = []
+
+    def request() -> None:
+        sizes.append(
+            loop.run_until_complete(_request(client, endpoint, objects, encoding))
+        )
+
+    benchmark.pedantic(request, rounds=ROUNDS, warmup_rounds=1)
+
+    # pytest-benchmark reports the median but not tail latency, so the percentiles
+    # are recorded with the size of the responses in the benchmark's extra info
+    timings = benchmark.stats.stats.sorted_data
+    benchmark.extra_info["p50_ms"] = timings[len(timings) // 2] * 1000
+    benchmark.extra_info["p99_ms"] = timings[int(0.99 * (len(timings) - 1))] * 1000
+    benchmark.extra_info["bytes_on_wire"] = sizes[-1]
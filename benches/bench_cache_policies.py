@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect import task
+from prefect.cache_policies import _SOURCE_HASHES, DEFAULT
+from prefect.client.schemas.objects import TaskRun
+from prefect.context import TaskRunContext
+
+MAPPED_RUNS = 10_000
+
+
+@task
+def mapped_task(x: int) -> int:
+    return x + 1
+
+
+def _mapped_task_contexts() -> list[TaskRunContext]:
+    flow_run_id = uuid4()
+    return [
+        TaskRunContext.model_construct(
+            task=mapped_task,
+            task_run=TaskRun.model_construct(id=uuid4(), flow_run_id=flow_run_id),
+        )
+        for _ in range(MAPPED_RUNS)
+    ]
+
+
+def bench_default_policy_mapped_keys(benchmark: "BenchmarkFixture"):
+    contexts = _mapped_task_contexts()
+
+    def compute_keys():
+        for i, ctx in enumerate(contexts):
+            DEFAULT.compute_key(task_ctx=ctx, inputs={"x": i}, flow_parameters={})
+
+    benchmark(compute_keys)
+
+
+def bench_default_policy_mapped_keys_without_source_memo(
+    benchmark: "BenchmarkFixture",
+):
+    # Clears the memoized source hash before every key to reproduce the cost of
+    # reading and hashing the task source for each mapped run
+    contexts = _mapped_task_contexts()
+
+    def compute_keys():
+        for i, ctx in enumerate(contexts):
+            _SOURCE_HASHES.clear()
+            DEFAULT.compute_key(task_ctx=ctx, inputs={"x": i}, flow_parameters={})
+
+    benchmark(compute_keys)
@@ -0,0 +1,170 @@
+import asyncio
+import uuid
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+import sqlalchemy as sa
+
+import prefect.server.concurrency.ledger as ledger_module
+from prefect.server import models, schemas
+from prefect.server.concurrency.lease_storage import ConcurrencyLimitLeaseMetadata
+from prefect.server.concurrency.lease_storage.filesystem import ConcurrencyLeaseStorage
+from prefect.server.concurrency.ledger import get_slot_ledger
+from prefect.server.database import provide_database_interface
+from prefect.settings import (
+    PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_ENABLED,
+    temporary_settings,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+ACQUISITIONS_PER_WORKER = 50
+LEASES_PER_ROUND = 100
+ROUNDS = 3
+
+BENCH_NAME = "bench-concurrency-limits"
+
+
+async def _create_limit(limit: int) -> uuid.UUID:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        model = await models.concurrency_limits_v2.create_concurrency_limit(
+            session=session,
+            concurrency_limit=schemas.core.ConcurrencyLimitV2(
+                name=f"{BENCH_NAME}-{uuid.uuid4()}", limit=limit
+            ),
+        )
+    return model.id
+
+
+async def _delete_limit(limit_id: uuid.UUID) -> None:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        await models.concurrency_limits_v2.delete_concurrency_limit(
+            session=session, concurrency_limit_id=limit_id
+        )
+
+
+async def _acquire_and_release(limit_id: uuid.UUID) -> tuple[int, int]:
+    db = provide_database_interface()
+    acquired = errors = 0
+    for _ in range(ACQUISITIONS_PER_WORKER):
+        try:
+            # one transaction each, as the increment and decrement endpoints do
+            async with db.session_context(begin_transaction=True) as session:
+                if not await models.concurrency_limits_v2.bulk_increment_active_slots(
+                    session=session, concurrency_limit_ids=[limit_id], slots=1
+                ):
+                    await session.rollback()
+                    continue
+            acquired += 1
+            async with db.session_context(begin_transaction=True) as session:
+                await models.concurrency_limits_v2.bulk_decrement_active_slots(
+                    session=session,
+                    concurrency_limit_ids=[limit_id],
+                    slots=1,
+                    occupancy_seconds=0.1,
+                )
+        except sa.exc.OperationalError:
+            # contention on the limit's row, such as SQLite's "database is locked"
+            errors += 1
+    return acquired, errors
+
+
+async def _run_workers(limit_id: uuid.UUID, workers: int) -> tuple[int, int]:
+    results = await asyncio.gather(
+        *(_acquire_and_release(limit_id) for _ in range(workers))
+    )
+    return sum(acquired for acquired, _ in results), sum(e for _, e in results)
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.timeout(600)
+@pytest.mark.parametrize("ledger", [False, True], ids=["database", "ledger"])
+@pytest.mark.parametrize("workers", [1, 10, 50])
+def bench_acquire_release_hot_limit(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    ledger: bool,
+    workers: int,
+):
+    """
+    Acquires and releases one slot at a time on a single limit from many concurrent
+    workers, with slots counted either in the database or in the slot ledger.
+    """
+    limit_id = loop.run_until_complete(_create_limit(limit=workers))
+    ledger_module._slot_ledger = None
+    results: list[tuple[int, int]] = []
+
+    try:
+        with temporary_settings(
+            {PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_ENABLED: ledger}
+        ):
+            benchmark.pedantic(
+                lambda: results.append(
+                    loop.run_until_complete(_run_workers(limit_id, workers))
+                ),
+                rounds=ROUNDS,
+            )
+            if slot_ledger := get_slot_ledger():
+                loop.run_until_complete(slot_ledger.stop())
+    finally:
+        loop.run_until_complete(_delete_limit(limit_id))
+
+    operations = workers * ACQUISITIONS_PER_WORKER
+    benchmark.extra_info["acquisitions_per_second"] = (
+        operations / benchmark.stats.stats.mean
+    )
+    attempts = operations * len(results)
+    benchmark.extra_info["acquired_ratio"] = sum(a for a, _ in results) / attempts
+    benchmark.extra_info["error_ratio"] = sum(e for _, e in results) / attempts
+
+
+async def _churn_leases(storage: ConcurrencyLeaseStorage) -> None:
+    resource_ids = [uuid.uuid4()]
+    metadata = ConcurrencyLimitLeaseMetadata(slots=1)
+    for _ in range(LEASES_PER_ROUND):
+        lease = await storage.create_lease(
+            resource_ids, timedelta(seconds=30), metadata
+        )
+        await storage.renew_lease(lease.id, timedelta(seconds=30))
+        await storage.read_expired_lease_ids()
+        await storage.revoke_lease(lease.id)
+
+
+@pytest.mark.timeout(600)
+@pytest.mark.parametrize("active_leases", [100, 5000])
+def bench_filesystem_lease_churn(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    tmp_path: Path,
+    active_leases: int,
+):
+    """
+    Creates, renews, and revokes leases in the filesystem lease storage, checking
+    for expired leases after each renewal, while other leases are held.
+    """
+    storage = ConcurrencyLeaseStorage(storage_path=tmp_path)
+
+    async def hold_leases():
+        for _ in range(active_leases):
+            await storage.create_lease([uuid.uuid4()], timedelta(hours=1))
+
+    loop.run_until_complete(hold_leases())
+
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(_churn_leases(storage)), rounds=ROUNDS
+    )
+    benchmark.extra_info["leases_per_second"] = (
+        LEASES_PER_ROUND / benchmark.stats.stats.mean
+    )
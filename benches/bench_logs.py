@@ -0,0 +1,89 @@
+import asyncio
+import datetime
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+import sqlalchemy as sa
+
+from prefect import flow
+from prefect.client.orchestration import get_client
+from prefect.server.database import provide_database_interface
+from prefect.types._datetime import now
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_LOGS = 1_000_000
+INSERT_BATCH_SIZE = 10_000
+
+
+@flow
+def noop_flow():
+    pass
+
+
+async def _create_flow_run_with_logs(num_logs: int) -> uuid.UUID:
+    async with get_client() as client:
+        flow_run = await client.create_flow_run(noop_flow)
+
+    db = provide_database_interface()
+    start = now("UTC")
+    for offset in range(0, num_logs, INSERT_BATCH_SIZE):
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.insert(db.Log),
+                [
+                    dict(
+                        id=uuid.uuid4(),
+                        name="prefect.flow_runs",
+                        level=20,
+                        message=f"Log message {i} from a long running flow run",
+                        timestamp=start + datetime.timedelta(microseconds=i),
+                        flow_run_id=flow_run.id,
+                    )
+                    for i in range(offset, min(offset + INSERT_BATCH_SIZE, num_logs))
+                ],
+            )
+    return flow_run.id
+
+
+async def _delete_flow_run(flow_run_id: uuid.UUID) -> None:
+    async with get_client() as client:
+        await client.delete_flow_run(flow_run_id)
+
+
+async def _download_logs(flow_run_id: uuid.UUID, log_format: str, encoding: str) -> int:
+    size = 0
+    async with get_client() as client:
+        async with client._client.stream(
+            "GET",
+            f"/flow_runs/{flow_run_id}/logs/download",
+            params={"format": log_format},
+            headers={"Accept-Encoding": encoding},
+        ) as response:
+            async for chunk in response.aiter_raw():
+                size += len(chunk)
+    return size
+
+
+@pytest.fixture(scope="module")
+def flow_run_with_logs():
+    flow_run_id = asyncio.run(_create_flow_run_with_logs(NUM_LOGS))
+    yield flow_run_id
+    asyncio.run(_delete_flow_run(flow_run_id))
+
+
+@pytest.mark.timeout(1800)
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+@pytest.mark.parametrize("log_format", ["csv", "ndjson"])
+def bench_download_flow_run_logs(
+    benchmark: "BenchmarkFixture",
+    flow_run_with_logs: uuid.UUID,
+    log_format: str,
+    encoding: str,
+):
+    benchmark.pedantic(
+        lambda: asyncio.run(_download_logs(flow_run_with_logs, log_format, encoding)),
+        rounds=1,
+    )
@@ -0,0 +1,140 @@
+import asyncio
+import uuid
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from prefect.server import models, schemas
+from prefect.server.database import provide_database_interface
+from prefect.server.orchestration.core_policy import CoreFlowPolicy, CoreTaskPolicy
+from prefect.server.schemas.states import StateType
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+RUNS_PER_ROUND = 100
+ROUNDS = 3
+
+BENCH_NAME = "bench-orchestration"
+
+# the transitions of a run that completes on its first attempt
+TRANSITIONS = [StateType.PENDING, StateType.RUNNING, StateType.COMPLETED]
+
+
+async def _create_flow_run() -> schemas.core.FlowRun:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        flow = await models.flows.create_flow(
+            session=session,
+            flow=schemas.core.Flow(name=f"{BENCH_NAME}-{uuid.uuid4()}"),
+        )
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=schemas.states.Running(),
+            ),
+        )
+    return schemas.core.FlowRun.model_validate(flow_run, from_attributes=True)
+
+
+async def _delete_flow(flow_id: uuid.UUID) -> None:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        await models.flows.delete_flow(session=session, flow_id=flow_id)
+
+
+async def _create_runs(
+    parent: schemas.core.FlowRun, task_runs: bool
+) -> list[uuid.UUID]:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        if task_runs:
+            runs = [
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=schemas.core.TaskRun(
+                        flow_run_id=parent.id,
+                        task_key=f"{BENCH_NAME}-task",
+                        dynamic_key=str(uuid.uuid4()),
+                    ),
+                )
+                for _ in range(RUNS_PER_ROUND)
+            ]
+        else:
+            runs = [
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(flow_id=parent.flow_id),
+                )
+                for _ in range(RUNS_PER_ROUND)
+            ]
+    return [run.id for run in runs]
+
+
+async def _transition_runs(run_ids: list[uuid.UUID], task_runs: bool) -> None:
+    db = provide_database_interface()
+    for run_id in run_ids:
+        for state_type in TRANSITIONS:
+            # one transaction per transition, as the set state endpoints do
+            async with db.session_context(begin_transaction=True) as session:
+                state = schemas.states.State(type=state_type)
+                if task_runs:
+                    result = await models.task_runs.set_task_run_state(
+                        session=session,
+                        task_run_id=run_id,
+                        state=state,
+                        task_policy=CoreTaskPolicy,
+                    )
+                else:
+                    result = await models.flow_runs.set_flow_run_state(
+                        session=session,
+                        flow_run_id=run_id,
+                        state=state,
+                        flow_policy=CoreFlowPolicy,
+                    )
+            assert result.status == schemas.responses.SetStateStatus.ACCEPT
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def parent_flow_run(
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[schemas.core.FlowRun]:
+    flow_run = loop.run_until_complete(_create_flow_run())
+    yield flow_run
+    loop.run_until_complete(_delete_flow(flow_run.flow_id))
+
+
+@pytest.mark.timeout(600)
+@pytest.mark.parametrize("task_runs", [True, False], ids=["task_runs", "flow_runs"])
+def bench_state_transitions(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    parent_flow_run: schemas.core.FlowRun,
+    task_runs: bool,
+):
+    """
+    Orchestrates runs from being created to completion under the core policies,
+    one transition at a time.
+    """
+
+    def setup() -> tuple[tuple[Any, ...], dict[str, Any]]:
+        run_ids = loop.run_until_complete(_create_runs(parent_flow_run, task_runs))
+        return (run_ids,), {}
+
+    benchmark.pedantic(
+        lambda run_ids: loop.run_until_complete(_transition_runs(run_ids, task_runs)),
+        setup=setup,
+        rounds=ROUNDS,
+    )
+    benchmark.extra_info["transitions_per_second"] = (
+        RUNS_PER_ROUND * len(TRANSITIONS) / benchmark.stats.stats.mean
+    )
@@ -0,0 +1,114 @@
+import asyncio
+import datetime
+import uuid
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.database import provide_database_interface
+from prefect.server.services.scheduler import Scheduler
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY,
+    temporary_settings,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+CREATE_BATCH_SIZE = 500
+ROUNDS = 3
+
+BENCH_NAME = "bench-scheduler"
+
+
+async def _create_deployments(num_deployments: int) -> uuid.UUID:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        flow = await models.flows.create_flow(
+            session=session,
+            flow=schemas.core.Flow(name=f"{BENCH_NAME}-{uuid.uuid4()}"),
+        )
+
+    for offset in range(0, num_deployments, CREATE_BATCH_SIZE):
+        async with db.session_context(begin_transaction=True) as session:
+            for i in range(offset, min(offset + CREATE_BATCH_SIZE, num_deployments)):
+                await models.deployments.create_deployment(
+                    session=session,
+                    deployment=schemas.core.Deployment(
+                        name=f"{BENCH_NAME}-{i}",
+                        flow_id=flow.id,
+                        schedules=[
+                            schemas.core.DeploymentSchedule(
+                                schedule=schemas.schedules.IntervalSchedule(
+                                    interval=datetime.timedelta(minutes=10 + i % 50)
+                                ),
+                                active=True,
+                            )
+                        ],
+                    ),
+                )
+    return flow.id
+
+
+async def _delete_scheduled_runs(flow_id: uuid.UUID) -> None:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        await session.execute(
+            sa.delete(db.FlowRun).where(db.FlowRun.flow_id == flow_id)
+        )
+
+
+async def _delete_flow(flow_id: uuid.UUID) -> None:
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        await models.flows.delete_flow(session=session, flow_id=flow_id)
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module", params=[100, 1_000, 5_000])
+def num_deployments(
+    request: pytest.FixtureRequest, loop: asyncio.AbstractEventLoop
+) -> Iterator[tuple[int, uuid.UUID]]:
+    flow_id = loop.run_until_complete(_create_deployments(request.param))
+    yield request.param, flow_id
+    loop.run_until_complete(_delete_flow(flow_id))
+
+
+@pytest.mark.timeout(3600)
+@pytest.mark.parametrize("concurrency", [1, 5, 20])
+def bench_scheduler_loop(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    num_deployments: tuple[int, uuid.UUID],
+    concurrency: int,
+):
+    """
+    The duration of one scheduler loop that schedules runs for every deployment.
+
+    Every deployment in the target database is scheduled, not only those created by
+    the benchmark, so run it against an empty database.
+    """
+    count, flow_id = num_deployments
+
+    with temporary_settings(
+        {PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY: concurrency}
+    ):
+        scheduler = Scheduler()
+
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(scheduler.run_once()),
+        setup=lambda: loop.run_until_complete(_delete_scheduled_runs(flow_id)),
+        rounds=ROUNDS,
+    )
+
+    benchmark.extra_info["deployments"] = count
+    benchmark.extra_info["deployments_per_second"] = count / benchmark.stats.stats.mean
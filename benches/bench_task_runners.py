@@ -0,0 +1,64 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from prefect import flow, task
+from prefect.task_runners import ProcessPoolTaskRunner, ThreadPoolTaskRunner
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+async def anoop_function(x: int):
+    pass
+
+
+def fibonacci(n: int) -> int:
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+@task
+def cpu_bound_task(n: int) -> int:
+    return fibonacci(n)
+
+
+class PerTaskEventLoopTaskRunner(ThreadPoolTaskRunner[Any]):
+    """
+    Runs each async task with `asyncio.run`, creating a new event loop and client per
+    task run, for comparison with the long-lived worker event loops.
+    """
+
+    def _run_async_task(self, submit_kwargs: dict[str, Any]) -> Any:
+        from prefect.task_engine import run_task_async
+
+        return asyncio.run(run_task_async(**submit_kwargs))
+
+
+@pytest.mark.parametrize(
+    "task_runner_cls", [ThreadPoolTaskRunner, PerTaskEventLoopTaskRunner]
+)
+@pytest.mark.parametrize(
+    "num_tasks", [1_000, pytest.param(10_000, marks=pytest.mark.timeout(1800))]
+)
+def bench_submit_async_tasks(
+    benchmark: "BenchmarkFixture", task_runner_cls: type, num_tasks: int
+):
+    test_task = task(anoop_function)
+
+    @flow(task_runner=task_runner_cls(max_workers=10))
+    def benchmark_flow():
+        test_task.map(range(num_tasks)).wait()
+
+    benchmark.pedantic(benchmark_flow)
+
+
+@pytest.mark.parametrize(
+    "task_runner_cls", [ThreadPoolTaskRunner, ProcessPoolTaskRunner]
+)
+def bench_map_cpu_bound_tasks(benchmark: "BenchmarkFixture", task_runner_cls: type):
+    @flow(task_runner=task_runner_cls(max_workers=4))
+    def benchmark_flow():
+        cpu_bound_task.map([27] * 64).wait()
+
+    benchmark.pedantic(benchmark_flow)
@@ -0,0 +1,5 @@
+# Generated by versioningit
+__version__ = "0.0.0"
+__build_date__ = "2026-10-18 21:42:44.761595+00:00"
+__git_commit__ = "a25ca8190a94689803d3c87e0c4788fcbf9ff131"
+__dirty__ = False
@@ -0,0 +1,337 @@
+"""
+Tiered caching for result records.
+
+Result records are cached in a byte-bounded in-memory LRU tier and, optionally, in
+a byte-bounded on-disk LRU tier that is shared by every process on the host. Both
+tiers sit in front of the configured result storage so repeated reads of the same
+result avoid a round trip to (potentially remote) storage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from cachetools import LRUCache
+
+from prefect._result_records import ResultRecord
+from prefect.logging import get_logger
+
+if sys.platform != "win32":
+    import fcntl
+
+if TYPE_CHECKING:
+    import logging
+
+logger: "logging.Logger" = get_logger("results.cache")
+
+# Containers are walked to estimate the size of cached results; past this depth
+# objects are sized shallowly to keep estimation cheap for deeply nested results.
+_MAX_SIZE_ESTIMATE_DEPTH = 8
+
+
+@dataclass
+class CacheTierStats:
+    """
+    Counters for a single cache tier.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estimate the number of bytes of memory retained by an object.
+
+    Buffer-like objects (e.g. NumPy arrays) report their buffer size, containers are
+    walked recursively and shared references are only counted once.
+    """
+    seen: set[int] = set()
+
+    def _estimate(obj: Any, depth: int) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+
+        nbytes = getattr(obj, "nbytes", None)
+        if isinstance(nbytes, int):
+            return nbytes + sys.getsizeof(obj, 0)
+
+        size = sys.getsizeof(obj, 0)
+        if depth >= _MAX_SIZE_ESTIMATE_DEPTH or isinstance(
+            obj, (str, bytes, bytearray, int, float)
+        ):
+            return size
+        if isinstance(obj, dict):
+            size += sum(
+                _estimate(k, depth + 1) + _estimate(v, depth + 1)
+                for k, v in obj.items()  # type: ignore[reportUnknownVariableType]
+            )
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sum(_estimate(item, depth + 1) for item in obj)  # type: ignore[reportUnknownVariableType]
+        elif hasattr(obj, "__dict__"):
+            size += _estimate(vars(obj), depth + 1)
+        return size
+
+    return _estimate(obj, 0)
+
+
+def _estimate_record_size(record: "ResultRecord[Any]") -> int:
+    return max(estimate_size(record.result), 1)
+
+
+class LocalDiskResultCache:
+    """
+    A byte-bounded LRU cache of serialized result records on local disk.
+
+    Entries are written atomically so the cache directory can be shared by every
+    process on a host. Recency is tracked with file modification times, which lets
+    any process evict the least recently used entries once the cache grows past
+    `max_bytes`.
+
+    The total size of the entries is kept in a `.usage` file in the cache
+    directory, which every process updates under a lock on a `.lock` file, so that
+    the bound holds for the cache as a whole rather than for each process. File
+    locks are not available on Windows, where concurrent updates may leave the
+    total inaccurate until the next eviction recomputes it from the directory.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.stats = CacheTierStats()
+        self._lock = threading.Lock()
+
+    @property
+    def _usage_path(self) -> Path:
+        return self.path / ".usage"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            if sys.platform == "win32":
+                yield
+                return
+
+            with open(self.path / ".lock", "ab") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.path / digest[:2] / digest
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read serialized record content from the cache, or `None` if it is not present.
+        """
+        entry = self._entry_path(key)
+        try:
+            content = entry.read_bytes()
+            os.utime(entry)
+        except OSError:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Write serialized record content to the cache, evicting old entries if needed.
+        """
+        if len(content) > self.max_bytes:
+            return
+
+        entry = self._entry_path(key)
+        tmp = entry.with_name(f".{entry.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(content)
+            with self._locked():
+                try:
+                    previous_size = entry.stat().st_size
+                except OSError:
+                    previous_size = 0
+                os.replace(tmp, entry)
+
+                usage = self._read_usage()
+                if usage is None:
+                    usage = self._disk_usage()
+                else:
+                    usage += len(content) - previous_size
+                if usage > self.max_bytes:
+                    usage = self._evict()
+                self._usage_path.write_text(str(usage))
+        except OSError:
+            logger.debug("Failed to write result to local cache", exc_info=True)
+            tmp.unlink(missing_ok=True)
+
+    def _read_usage(self) -> Optional[int]:
+        try:
+            return int(self._usage_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries: list[tuple[float, int, str]] = []
+        try:
+            shards = list(os.scandir(self.path))
+        except OSError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            try:
+                files = list(os.scandir(shard.path))
+            except OSError:
+                continue
+            for file in files:
+                if file.name.startswith("."):
+                    continue
+                try:
+                    stat = file.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file.path))
+        return entries
+
+    def _disk_usage(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> int:
+        # re-scan rather than trusting the recorded total, which is off if entries
+        # were removed from the directory by other means
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats.evictions += 1
+        return total
+
+
+_local_disk_caches: dict[tuple[str, int], LocalDiskResultCache] = {}
+
+
+def get_local_disk_cache(path: Path, max_bytes: int) -> LocalDiskResultCache:
+    """
+    Get the process-wide local disk cache for the given directory and size bound.
+    """
+    cache_key = (str(path), max_bytes)
+    if cache_key not in _local_disk_caches:
+        _local_disk_caches[cache_key] = LocalDiskResultCache(path, max_bytes)
+    return _local_disk_caches[cache_key]
+
+
+class ResultRecordCache(LRUCache[str, "ResultRecord[Any]"]):
+    """
+    A two-tier cache of result records.
+
+    The first tier is an in-memory LRU bounded by the estimated size of cached
+    results in bytes. The optional second tier is a `LocalDiskResultCache` that
+    persists serialized records across processes on the same host.
+
+    Args:
+        max_bytes: The maximum estimated size of records held in memory.
+        disk_cache: An optional local disk cache to use as the second tier.
+    """
+
+    def __init__(
+        self, max_bytes: int, disk_cache: Optional[LocalDiskResultCache] = None
+    ):
+        super().__init__(maxsize=max_bytes, getsizeof=_estimate_record_size)
+        self.disk_cache = disk_cache
+        self.memory_stats = CacheTierStats()
+
+    @property
+    def stats(self) -> dict[str, CacheTierStats]:
+        """
+        Hit, miss and eviction counters for each cache tier.
+        """
+        stats = {"memory": self.memory_stats}
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats
+        return stats
+
+    def popitem(self) -> tuple[str, "ResultRecord[Any]"]:
+        item = super().popitem()
+        self.memory_stats.evictions += 1
+        return item
+
+    def lookup(
+        self, key: str, disk_key: Optional[str] = None
+    ) -> Optional["ResultRecord[Any]"]:
+        """
+        Look up a record in memory, falling back to the disk tier if a `disk_key`
+        is provided. Records found on disk are promoted into memory.
+        """
+        if key in self:
+            self.memory_stats.hits += 1
+            return self[key]
+        self.memory_stats.misses += 1
+
+        if self.disk_cache is None or disk_key is None:
+            return None
+        content = self.disk_cache.get(disk_key)
+        if content is None:
+            return None
+        try:
+            record: ResultRecord[Any] = ResultRecord.deserialize(content)
+        except Exception:
+            logger.debug("Failed to load result from local cache", exc_info=True)
+            return None
+        self._set_in_memory(key, record)
+        return record
+
+    def put(
+        self,
+        key: str,
+        record: "ResultRecord[Any]",
+        disk_key: Optional[str] = None,
+        content: Optional[bytes] = None,
+    ) -> None:
+        """
+        Cache a record in memory and, if a `disk_key` is provided, on disk.
+
+        Args:
+            key: The key to cache the record in memory under.
+            record: The record to cache.
+            disk_key: The key to cache the serialized record on disk under.
+            content: The serialized record, if already available. Avoids serializing
+                the record a second time when writing to disk.
+        """
+        self._set_in_memory(key, record)
+        if self.disk_cache is not None and disk_key is not None:
+            try:
+                content = content if content is not None else record.serialize()
+            except Exception:
+                logger.debug(
+                    "Failed to serialize result for local cache", exc_info=True
+                )
+                return
+            self.disk_cache.put(disk_key, content)
+
+    def _set_in_memory(self, key: str, record: "ResultRecord[Any]") -> None:
+        try:
+            self[key] = record
+        except ValueError:
+            # The record alone is larger than the memory tier
+            self.pop(key, None)
@@ -1,4 +1,5 @@
 import inspect
+import weakref
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -16,7 +17,12 @@ from typing_extensions import Self
 
 from prefect.context import TaskRunContext
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import hash_objects
+from prefect.utilities.hashing import (
+    get_hash_memo,
+    hash_objects,
+    stable_hash,
+    structural_hash,
+)
 
 if TYPE_CHECKING:
     from prefect.filesystems import WritableFileSystem
@@ -25,6 +31,12 @@ if TYPE_CHECKING:
 
 STABLE_TRANSFORMS: dict[type, Callable[[Any], Any]] = {}
 
+# Memoized source hashes for `TaskSource`, keyed by task function. Each entry stores
+# the function's code object so that redefining the function body invalidates it.
+_SOURCE_HASHES: "weakref.WeakKeyDictionary[Any, tuple[Any, Optional[str]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def _register_stable_transforms() -> None:
     """
@@ -280,6 +292,8 @@ class TaskSource(CachePolicy):
     Policy for computing a cache key based on the source code of the task.
 
     This policy only considers raw lines of code in the task, and not the source code of nested tasks.
+    The hash of the source is memoized per task function and recomputed if the
+    function's code object changes.
     """
 
     def compute_key(
@@ -291,6 +305,17 @@ class TaskSource(CachePolicy):
     ) -> Optional[str]:
         if not task_ctx:
             return None
+
+        fn = getattr(task_ctx.task, "fn", task_ctx.task)
+        code = getattr(fn, "__code__", None)
+        try:
+            memoized_code, source_hash = _SOURCE_HASHES[fn]
+        except (KeyError, TypeError):
+            pass
+        else:
+            if memoized_code is code:
+                return source_hash
+
         try:
             lines = inspect.getsource(task_ctx.task)
         except TypeError:
@@ -300,7 +325,14 @@ class TaskSource(CachePolicy):
                 lines = task_ctx.task.fn.__code__.co_code
             else:
                 raise
-        return hash_objects(lines, raise_on_failure=True)
+        source_hash = hash_objects(lines, raise_on_failure=True)
+
+        try:
+            _SOURCE_HASHES[fn] = (code, source_hash)
+        except TypeError:
+            # the task function cannot be weakly referenced, so it is not memoized
+            pass
+        return source_hash
 
 
 @dataclass
@@ -347,6 +379,10 @@ class RunId(CachePolicy):
 class Inputs(CachePolicy):
     """
     Policy that computes a cache key based on a hash of the runtime inputs provided to the task..
+
+    Inputs are hashed incrementally with a structural hasher, so large inputs are
+    never serialized as a whole. Within a `map` call, the hash of an input that is
+    passed to every child (e.g. an `unmapped` value) is computed once.
     """
 
     exclude: list[str] = field(default_factory=lambda: [])
@@ -358,20 +394,27 @@ class Inputs(CachePolicy):
         flow_parameters: dict[str, Any],
         **kwargs: Any,
     ) -> Optional[str]:
-        hashed_inputs = {}
         inputs = inputs or {}
         exclude = self.exclude or []
 
         if not inputs:
             return None
 
-        for key, val in inputs.items():
-            if key not in exclude:
-                transformer = STABLE_TRANSFORMS.get(type(val))  # type: ignore[reportUnknownMemberType]
-                hashed_inputs[key] = transformer(val) if transformer else val
-
+        memo = get_hash_memo()
+        hashed_inputs: list[str] = []
         try:
-            return hash_objects(hashed_inputs, raise_on_failure=True)
+            for key in sorted(inputs):
+                if key in exclude:
+                    continue
+                val = inputs[key]
+                digest = memo.get(val) if memo is not None else None
+                if digest is None:
+                    transformer = STABLE_TRANSFORMS.get(type(val))  # type: ignore[reportUnknownMemberType]
+                    digest = structural_hash(transformer(val) if transformer else val)
+                    if memo is not None:
+                        memo.set(val, digest)
+                hashed_inputs.append(f"{key}:{digest};")
+            return stable_hash(*hashed_inputs)
         except HashError as exc:
             msg = (
                 f"{exc}\n\n"
@@ -10,7 +10,7 @@ import signal
 import threading
 import webbrowser
 from types import FrameType
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
 import httpx
@@ -43,6 +43,7 @@ flow_run_app: PrefectTyper = PrefectTyper(
 app.add_typer(flow_run_app, aliases=["flow-runs"])
 
 LOGS_DEFAULT_PAGE_SIZE = 200
+BULK_OPERATION_PAGE_SIZE = 200
 LOGS_WITH_LIMIT_FLAG_DEFAULT_NUM_LOGS = 20
 
 logger: "logging.Logger" = get_logger(__name__)
@@ -98,37 +99,12 @@ async def inspect(
             app.console.print(Pretty(flow_run))
 
 
-@flow_run_app.command()
-async def ls(
-    flow_name: List[str] = typer.Option(None, help="Name of the flow"),
-    limit: int = typer.Option(15, help="Maximum number of flow runs to list"),
-    state: List[str] = typer.Option(None, help="Name of the flow run's state"),
-    state_type: List[str] = typer.Option(None, help="Type of the flow run's state"),
-):
+def _build_state_filter(
+    state: Optional[List[str]], state_type: Optional[List[str]]
+) -> dict[str, Any]:
     """
-    View recent flow runs or flow runs for specific flows.
-
-    Arguments:
-
-        flow_name: Name of the flow
-
-        limit: Maximum number of flow runs to list. Defaults to 15.
-
-        state: Name of the flow run's state. Can be provided multiple times. Options are 'SCHEDULED', 'PENDING', 'RUNNING', 'COMPLETED', 'FAILED', 'CRASHED', 'CANCELLING', 'CANCELLED', 'PAUSED', 'SUSPENDED', 'AWAITINGRETRY', 'RETRYING', and 'LATE'.
-
-        state_type: Type of the flow run's state. Can be provided multiple times. Options are 'SCHEDULED', 'PENDING', 'RUNNING', 'COMPLETED', 'FAILED', 'CRASHED', 'CANCELLING', 'CANCELLED', 'CRASHED', and 'PAUSED'.
-
-    Examples:
-
-    $ prefect flow-runs ls --state Running
-
-    $ prefect flow-runs ls --state Running --state late
-
-    $ prefect flow-runs ls --state-type RUNNING
-
-    $ prefect flow-runs ls --state-type RUNNING --state-type FAILED
+    Build a flow run state filter from the `--state` and `--state-type` options.
     """
-
     # Handling `state` and `state_type` argument validity in the function instead of by specifying
     # List[StateType] and List[StateName] in the type hints, allows users to provide
     # case-insensitive arguments for `state` and `state_type`.
@@ -149,8 +125,8 @@ async def ls(
         "LATE": "Late",
     }
 
-    state_filter = {}
-    formatted_states = []
+    state_filter: dict[str, Any] = {}
+    formatted_states: list[str] = []
 
     if state:
         for s in state:
@@ -178,6 +154,42 @@ async def ls(
             "any_": [StateType[s].value for s in upper_cased_states]
         }
 
+    return state_filter
+
+
+@flow_run_app.command()
+async def ls(
+    flow_name: List[str] = typer.Option(None, help="Name of the flow"),
+    limit: int = typer.Option(15, help="Maximum number of flow runs to list"),
+    state: List[str] = typer.Option(None, help="Name of the flow run's state"),
+    state_type: List[str] = typer.Option(None, help="Type of the flow run's state"),
+):
+    """
+    View recent flow runs or flow runs for specific flows.
+
+    Arguments:
+
+        flow_name: Name of the flow
+
+        limit: Maximum number of flow runs to list. Defaults to 15.
+
+        state: Name of the flow run's state. Can be provided multiple times. Options are 'SCHEDULED', 'PENDING', 'RUNNING', 'COMPLETED', 'FAILED', 'CRASHED', 'CANCELLING', 'CANCELLED', 'PAUSED', 'SUSPENDED', 'AWAITINGRETRY', 'RETRYING', and 'LATE'.
+
+        state_type: Type of the flow run's state. Can be provided multiple times. Options are 'SCHEDULED', 'PENDING', 'RUNNING', 'COMPLETED', 'FAILED', 'CRASHED', 'CANCELLING', 'CANCELLED', 'CRASHED', and 'PAUSED'.
+
+    Examples:
+
+    $ prefect flow-runs ls --state Running
+
+    $ prefect flow-runs ls --state Running --state late
+
+    $ prefect flow-runs ls --state-type RUNNING
+
+    $ prefect flow-runs ls --state-type RUNNING --state-type FAILED
+    """
+
+    state_filter = _build_state_filter(state, state_type)
+
     async with get_client() as client:
         flow_runs = await client.read_flow_runs(
             flow_filter=FlowFilter(name={"any_": flow_name}) if flow_name else None,
@@ -260,6 +272,178 @@ async def cancel(id: UUID):
     exit_with_success(f"Flow run '{id}' was successfully scheduled for cancellation.")
 
 
+def _build_bulk_flow_run_filter(
+    state: Optional[List[str]],
+    state_type: Optional[List[str]],
+    deployment_id: Optional[List[UUID]],
+    tag: Optional[List[str]],
+) -> dict[str, Any]:
+    flow_run_filter = {}
+    state_filter = _build_state_filter(state, state_type)
+    if state_filter:
+        flow_run_filter["state"] = state_filter
+    if deployment_id:
+        flow_run_filter["deployment_id"] = {"any_": deployment_id}
+    if tag:
+        flow_run_filter["tags"] = {"all_": tag}
+    return flow_run_filter
+
+
+@flow_run_app.command()
+async def bulk_cancel(
+    flow_name: List[str] = typer.Option(None, help="Name of the flow"),
+    deployment_id: List[UUID] = typer.Option(None, help="ID of the deployment"),
+    state: List[str] = typer.Option(None, help="Name of the flow run's state"),
+    state_type: List[str] = typer.Option(None, help="Type of the flow run's state"),
+    tag: List[str] = typer.Option(None, help="Tag of the flow run"),
+    limit: Optional[int] = typer.Option(
+        None, help="Maximum number of flow runs to cancel"
+    ),
+):
+    """
+    Cancel all flow runs matching the given filters.
+
+    Flow runs are cancelled in batches on the server, and each cancellation is
+    orchestrated as if the flow run were cancelled by ID. If no `--state` or
+    `--state-type` is given, only scheduled, pending, running and paused flow runs
+    are cancelled.
+
+    Examples:
+
+    $ prefect flow-run bulk-cancel --deployment-id <DEPLOYMENT_ID>
+
+    $ prefect flow-run bulk-cancel --flow-name my-flow --state Late
+    """
+    if not (flow_name or deployment_id or state or state_type or tag):
+        exit_with_error(
+            "Provide at least one filter: --flow-name, --deployment-id, --state,"
+            " --state-type or --tag."
+        )
+
+    flow_run_filter = _build_bulk_flow_run_filter(state, state_type, deployment_id, tag)
+    flow_run_filter.setdefault(
+        "state",
+        {
+            "type": {
+                "any_": [
+                    StateType.SCHEDULED,
+                    StateType.PENDING,
+                    StateType.RUNNING,
+                    StateType.PAUSED,
+                ]
+            }
+        },
+    )
+    flow_filter = FlowFilter(name={"any_": flow_name}) if flow_name else None
+
+    if is_interactive() and not typer.confirm(
+        "Are you sure you want to cancel all flow runs matching these filters?",
+        default=False,
+    ):
+        exit_with_error("Cancellation aborted.")
+
+    # Flow runs whose cancellation is rejected still match the filters, so each
+    # request resumes after the last flow run processed by the previous one
+    processed = 0
+    cancelled = 0
+    after: Optional[UUID] = None
+    async with get_client() as client:
+        while limit is None or processed < limit:
+            page_size = BULK_OPERATION_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - processed)
+
+            results = await client.bulk_set_flow_run_state(
+                State(type=StateType.CANCELLING),
+                flow_filter=flow_filter,
+                flow_run_filter=FlowRunFilter(**flow_run_filter),
+                limit=page_size,
+                after=after,
+            )
+            for result in results:
+                processed += 1
+                after = result.flow_run_id
+                if result.status == SetStateStatus.ABORT:
+                    app.console.print(
+                        f"Flow run '{result.flow_run_id}' was unable to be cancelled."
+                        f" Reason: '{result.details.reason}'"
+                    )
+                else:
+                    cancelled += 1
+
+            if len(results) < page_size:
+                break
+
+    if not processed:
+        exit_with_success("No flow runs found.")
+
+    exit_with_success(
+        f"Scheduled {cancelled} of {processed} flow run(s) for cancellation."
+    )
+
+
+@flow_run_app.command()
+async def bulk_delete(
+    flow_name: List[str] = typer.Option(None, help="Name of the flow"),
+    deployment_id: List[UUID] = typer.Option(None, help="ID of the deployment"),
+    state: List[str] = typer.Option(None, help="Name of the flow run's state"),
+    state_type: List[str] = typer.Option(None, help="Type of the flow run's state"),
+    tag: List[str] = typer.Option(None, help="Tag of the flow run"),
+    limit: Optional[int] = typer.Option(
+        None, help="Maximum number of flow runs to delete"
+    ),
+):
+    """
+    Delete all flow runs matching the given filters.
+
+    Flow runs are deleted in batches on the server.
+
+    Examples:
+
+    $ prefect flow-run bulk-delete --deployment-id <DEPLOYMENT_ID>
+
+    $ prefect flow-run bulk-delete --flow-name my-flow --state-type FAILED
+    """
+    if not (flow_name or deployment_id or state or state_type or tag):
+        exit_with_error(
+            "Provide at least one filter: --flow-name, --deployment-id, --state,"
+            " --state-type or --tag."
+        )
+
+    flow_run_filter = FlowRunFilter(
+        **_build_bulk_flow_run_filter(state, state_type, deployment_id, tag)
+    )
+    flow_filter = FlowFilter(name={"any_": flow_name}) if flow_name else None
+
+    if is_interactive() and not typer.confirm(
+        "Are you sure you want to delete all flow runs matching these filters?",
+        default=False,
+    ):
+        exit_with_error("Deletion aborted.")
+
+    deleted = 0
+    async with get_client() as client:
+        while limit is None or deleted < limit:
+            page_size = BULK_OPERATION_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - deleted)
+
+            deleted_ids = await client.bulk_delete_flow_runs(
+                flow_filter=flow_filter,
+                flow_run_filter=flow_run_filter,
+                limit=page_size,
+            )
+            deleted += len(deleted_ids)
+
+            if len(deleted_ids) < page_size:
+                break
+
+    if not deleted:
+        exit_with_success("No flow runs found.")
+
+    exit_with_success(f"Successfully deleted {deleted} flow run(s).")
+
+
 @flow_run_app.command()
 async def logs(
     id: UUID,
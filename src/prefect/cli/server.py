@@ -501,6 +501,72 @@ async def downgrade(
     exit_with_success(f"Prefect database at {engine.url!r} downgraded!")
 
 
+@database_app.command()
+async def analyze(
+    threshold: float = typer.Option(
+        100,
+        "--threshold",
+        "-t",
+        help="Report queries that take longer than this many milliseconds.",
+    ),
+    explain_all: bool = typer.Option(
+        False,
+        "--all",
+        help="Show the query plan of every query, not only slow ones.",
+    ),
+    update_statistics: bool = typer.Option(
+        True,
+        help=(
+            "Run `ANALYZE` to refresh the statistics used by the query planner"
+            " before timing queries."
+        ),
+    ),
+):
+    """
+    Time common flow run and task run filter queries and show the query plans
+    of slow ones
+    """
+    from prefect.server.database import provide_database_interface, query_analysis
+
+    db = provide_database_interface()
+    engine = await db.engine()
+
+    async with db.session_context() as session:
+        if update_statistics:
+            app.console.print("Updating query planner statistics...")
+            await query_analysis.update_statistics(session)
+            await session.commit()
+
+        analyses = await query_analysis.analyze_filter_queries(
+            session, slow_query_threshold=threshold / 1000, explain_all=explain_all
+        )
+
+    table = Table(title=f"Filter queries against {engine.url!r}")
+    table.add_column("Query", style="blue", no_wrap=True)
+    table.add_column("Duration (ms)", justify="right")
+    table.add_column("Slow", justify="center")
+    slow = [analysis for analysis in analyses if analysis.duration * 1000 > threshold]
+    for analysis in analyses:
+        table.add_row(
+            analysis.name,
+            f"{analysis.duration * 1000:.1f}",
+            "[red]yes[/red]" if analysis in slow else "no",
+        )
+    app.console.print(table)
+
+    for analysis in analyses:
+        if analysis.plan is None:
+            continue
+        app.console.print(f"\n[bold]{analysis.name}[/bold]")
+        app.console.print(Text("\n".join(analysis.plan)))
+
+    if slow:
+        exit_with_error(
+            f"{len(slow)} of {len(analyses)} queries took longer than {threshold}ms."
+        )
+    exit_with_success(f"All queries completed within {threshold}ms.")
+
+
 @database_app.command()
 async def revision(
     message: str = typer.Option(
@@ -1,9 +1,8 @@
-import copy
 import sys
 import threading
 import time
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import AsyncGenerator, Awaitable, MutableMapping
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -171,11 +170,106 @@ class PrefectResponse(httpx.Response):
         resolution order to look for methods defined in PrefectResponse, while leaving
         everything else about the original Response instance intact.
         """
-        new_response = copy.copy(response)
-        new_response.__class__ = cls
+        # `copy.copy` would go through `Response.__getstate__`, which detaches the
+        # stream of responses that have not been read yet
+        new_response = cls.__new__(cls)
+        new_response.__dict__.update(response.__dict__)
         return new_response
 
 
+class ConditionalRequestCache:
+    """
+    A small least-recently-used cache of responses to `GET` requests that carried an
+    `ETag` header.
+
+    Cached requests are revalidated by sending the tag in an `If-None-Match` header.
+    If the server responds with `304 Not Modified`, the cached response is returned
+    instead, so unchanged objects are neither read from the database nor encoded
+    and sent again.
+    """
+
+    # headers describing the encoding of the original response body, which no
+    # longer apply once it has been decoded
+    _dropped_headers: frozenset[str] = frozenset(
+        {"content-encoding", "content-length", "transfer-encoding"}
+    )
+
+    def __init__(self, maxsize: int = 256, max_body_size: int = 1024 * 1024):
+        self.maxsize = maxsize
+        self.max_body_size = max_body_size
+        self._entries: OrderedDict[tuple[str, str], tuple[str, Response]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(request: Request) -> tuple[str, str]:
+        return (str(request.url), request.headers.get("Accept", ""))
+
+    def prepare(self, request: Request) -> Optional[Response]:
+        """
+        Add an `If-None-Match` header to a request for a cached response, returning
+        the cached response.
+        """
+        if request.method != "GET" or "If-None-Match" in request.headers:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key := self._key(request))
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+
+        etag, cached = entry
+        request.headers["If-None-Match"] = etag
+        return cached
+
+    def update(
+        self, request: Request, response: Response, cached: Optional[Response]
+    ) -> Response:
+        """
+        Cache a response to a request prepared with `prepare`, or replace a
+        `304 Not Modified` response with the cached response.
+        """
+        if request.method != "GET":
+            return response
+
+        if response.status_code == status.HTTP_304_NOT_MODIFIED and cached is not None:
+            return Response(
+                status_code=cached.status_code,
+                headers=cached.headers,
+                content=cached.content,
+                request=request,
+            )
+
+        key = self._key(request)
+        etag = response.headers.get("ETag")
+        if (
+            response.status_code == status.HTTP_200_OK
+            and etag
+            and len(response.content) <= self.max_body_size
+        ):
+            entry = Response(
+                status_code=response.status_code,
+                headers=[
+                    (name, value)
+                    for name, value in response.headers.multi_items()
+                    if name.lower() not in self._dropped_headers
+                ],
+                content=response.content,
+            )
+            with self._lock:
+                self._entries[key] = (etag, entry)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        elif cached is not None:
+            with self._lock:
+                self._entries.pop(key, None)
+
+        return response
+
+
 class PrefectHttpxAsyncClient(httpx.AsyncClient):
     """
     A Prefect wrapper for the async httpx client with support for retry-after headers
@@ -199,6 +293,9 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
         self.csrf_token_expiration: Optional[datetime] = None
         self.csrf_client_id: uuid.UUID = uuid.uuid4()
         self.raise_on_all_errors: bool = raise_on_all_errors
+        self.conditional_request_cache: ConditionalRequestCache = (
+            ConditionalRequestCache()
+        )
 
         super().__init__(*args, **kwargs)
 
@@ -344,6 +441,13 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
         - Any additional status codes provided in `PREFECT_CLIENT_RETRY_EXTRA_CODES`
         """
 
+        # responses that are streamed are not read, so cannot be cached
+        cached = (
+            None
+            if kwargs.get("stream")
+            else self.conditional_request_cache.prepare(request)
+        )
+
         super_send = super().send
         response = await self._send_with_retry(
             request=request,
@@ -372,6 +476,9 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
             ),
         )
 
+        if not kwargs.get("stream"):
+            response = self.conditional_request_cache.update(request, response, cached)
+
         # Convert to a Prefect response to add nicer errors messages
         response = PrefectResponse.from_httpx_response(response)
 
@@ -442,6 +549,9 @@ class PrefectHttpxSyncClient(httpx.Client):
         self.csrf_token_expiration: Optional[datetime] = None
         self.csrf_client_id: uuid.UUID = uuid.uuid4()
         self.raise_on_all_errors: bool = raise_on_all_errors
+        self.conditional_request_cache: ConditionalRequestCache = (
+            ConditionalRequestCache()
+        )
 
         super().__init__(*args, **kwargs)
 
@@ -587,6 +697,13 @@ class PrefectHttpxSyncClient(httpx.Client):
         - Any additional status codes provided in `PREFECT_CLIENT_RETRY_EXTRA_CODES`
         """
 
+        # responses that are streamed are not read, so cannot be cached
+        cached = (
+            None
+            if kwargs.get("stream")
+            else self.conditional_request_cache.prepare(request)
+        )
+
         super_send = super().send
         response = self._send_with_retry(
             request=request,
@@ -615,6 +732,9 @@ class PrefectHttpxSyncClient(httpx.Client):
             ),
         )
 
+        if not kwargs.get("stream"):
+            response = self.conditional_request_cache.update(request, response, cached)
+
         # Convert to a Prefect response to add nicer errors messages
         response = PrefectResponse.from_httpx_response(response)
 
@@ -3,7 +3,7 @@ import asyncio
 import base64
 import datetime
 import ssl
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from contextlib import AsyncExitStack
 from logging import Logger
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, Optional, Union, overload
@@ -110,6 +110,7 @@ from prefect.client.schemas.objects import (
     WorkQueueStatusDetail,
 )
 
+from prefect.client.schemas.responses import CursorPaginationResponse
 from prefect.client.schemas.sorting import (
     TaskRunSort,
 )
@@ -156,6 +157,17 @@ def _get_type_adapter(type_: type) -> pydantic.TypeAdapter[Any]:
     return _TYPE_ADAPTER_CACHE[type_]
 
 
+def _task_run_creates_to_json(
+    task_runs: Iterable[TaskRunCreate],
+) -> list[dict[str, Any]]:
+    return [
+        task_run.model_dump(
+            mode="json", exclude={"id"} if task_run.id is None else None
+        )
+        for task_run in task_runs
+    ]
+
+
 @overload
 def get_client(
     httpx_settings: Optional[dict[str, Any]],
@@ -262,6 +274,55 @@ def get_client(
         )
 
 
+def build_task_run_create(
+    task: "TaskObject[P, R]",
+    flow_run_id: Optional[UUID],
+    dynamic_key: str,
+    id: Optional[UUID] = None,
+    name: Optional[str] = None,
+    extra_tags: Optional[Iterable[str]] = None,
+    state: Optional[prefect.states.State[R]] = None,
+    task_inputs: Optional[
+        dict[
+            str,
+            list[Union[TaskRunResult, FlowRunResult, Parameter, Constant]],
+        ]
+    ] = None,
+) -> TaskRunCreate:
+    """
+    Build the request body used to create a task run for a task.
+
+    See `PrefectClient.create_task_run` for a description of the arguments.
+    """
+    tags = set(task.tags).union(extra_tags or [])
+
+    if state is None:
+        state = prefect.states.Pending()
+
+    retry_delay = task.retry_delay_seconds
+    if isinstance(retry_delay, list):
+        retry_delay = [int(rd) for rd in retry_delay]
+    elif isinstance(retry_delay, float):
+        retry_delay = int(retry_delay)
+
+    return TaskRunCreate(
+        id=id,
+        name=name,
+        flow_run_id=flow_run_id,
+        task_key=task.task_key,
+        dynamic_key=str(dynamic_key),
+        tags=list(tags),
+        task_version=task.version,
+        empirical_policy=TaskRunPolicy(
+            retries=task.retries,
+            retry_delay=retry_delay,
+            retry_jitter_factor=task.retry_jitter_factor,
+        ),
+        state=prefect.states.to_state_create(state),
+        task_inputs=task_inputs or {},
+    )
+
+
 class PrefectClient(
     ArtifactAsyncClient,
     ArtifactCollectionAsyncClient,
@@ -800,38 +861,41 @@ class PrefectClient(
         Returns:
             The created task run.
         """
-        tags = set(task.tags).union(extra_tags or [])
-
-        if state is None:
-            state = prefect.states.Pending()
-
-        retry_delay = task.retry_delay_seconds
-        if isinstance(retry_delay, list):
-            retry_delay = [int(rd) for rd in retry_delay]
-        elif isinstance(retry_delay, float):
-            retry_delay = int(retry_delay)
-
-        task_run_data = TaskRunCreate(
+        task_run_data = build_task_run_create(
+            task=task,
+            flow_run_id=flow_run_id,
+            dynamic_key=dynamic_key,
             id=id,
             name=name,
-            flow_run_id=flow_run_id,
-            task_key=task.task_key,
-            dynamic_key=str(dynamic_key),
-            tags=list(tags),
-            task_version=task.version,
-            empirical_policy=TaskRunPolicy(
-                retries=task.retries,
-                retry_delay=retry_delay,
-                retry_jitter_factor=task.retry_jitter_factor,
-            ),
-            state=prefect.states.to_state_create(state),
-            task_inputs=task_inputs or {},
+            extra_tags=extra_tags,
+            state=state,
+            task_inputs=task_inputs,
         )
         content = task_run_data.model_dump_json(exclude={"id"} if id is None else None)
 
         response = await self._client.post("/task_runs/", content=content)
         return TaskRun.model_validate(response.json())
 
+    async def create_task_runs(
+        self, task_runs: Iterable[TaskRunCreate]
+    ) -> list[TaskRun]:
+        """
+        Create multiple task runs in a single request.
+
+        Args:
+            task_runs: the task runs to create, e.g. built with
+                `build_task_run_create`
+
+        Returns:
+            The created task runs, in the order they were provided. Task runs that
+            already exist are returned in place of new ones.
+        """
+        response = await self._client.post(
+            "/task_runs/bulk",
+            json={"task_runs": _task_run_creates_to_json(task_runs)},
+        )
+        return _get_type_adapter(list[TaskRun]).validate_python(response.json())
+
     async def read_task_run(self, task_run_id: UUID) -> TaskRun:
         """
         Query the Prefect API for a task run by id.
@@ -899,6 +963,108 @@ class PrefectClient(
         response = await self._client.post("/task_runs/filter", json=body)
         return _get_type_adapter(list[TaskRun]).validate_python(response.json())
 
+    async def read_task_runs_page(
+        self,
+        *,
+        flow_filter: Optional[FlowFilter] = None,
+        flow_run_filter: Optional[FlowRunFilter] = None,
+        task_run_filter: Optional[TaskRunFilter] = None,
+        deployment_filter: Optional[DeploymentFilter] = None,
+        sort: Optional[TaskRunSort] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> CursorPaginationResponse[TaskRun]:
+        """
+        Query the Prefect API for a page of task runs, paginated with a cursor.
+
+        Pass the `next_cursor` of a page, along with the same filters and sort, to
+        read the following page. Unlike `read_task_runs` with an `offset`, reading
+        deep pages is as fast as reading the first one.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the task runs
+            limit: the maximum number of task runs in the page
+            cursor: the `next_cursor` of the previous page, if any
+
+        Returns:
+            a page of task runs and the cursor for the next page
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "sort": sort,
+            "limit": limit,
+            "cursor": cursor,
+        }
+        response = await self._client.post("/task_runs/filter/cursor", json=body)
+        return CursorPaginationResponse[TaskRun].model_validate(response.json())
+
+    async def iter_task_runs(
+        self,
+        *,
+        flow_filter: Optional[FlowFilter] = None,
+        flow_run_filter: Optional[FlowRunFilter] = None,
+        task_run_filter: Optional[TaskRunFilter] = None,
+        deployment_filter: Optional[DeploymentFilter] = None,
+        sort: Optional[TaskRunSort] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> AsyncIterator[TaskRun]:
+        """
+        Iterate over task runs matching all criteria, streamed from the Prefect API.
+
+        Task runs are yielded as they are received, so large result sets can be
+        processed without holding them in memory. Unlike `read_task_runs`, all
+        matching task runs are returned unless a `limit` is provided.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the task runs
+            limit: a limit for the task run query
+            offset: an offset for the task run query
+
+        Yields:
+            Task Run model representations of the task runs
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "sort": sort,
+            "limit": limit,
+            "offset": offset,
+        }
+        async for task_run in self.stream_ndjson(
+            "POST", "/task_runs/filter", json=body
+        ):
+            yield TaskRun.model_validate(task_run)
+
     async def delete_task_run(self, task_run_id: UUID) -> None:
         """
         Delete a task run by id.
@@ -1458,32 +1624,15 @@ class SyncPrefectClient(
         Returns:
             The created task run.
         """
-        tags = set(task.tags).union(extra_tags or [])
-
-        if state is None:
-            state = prefect.states.Pending()
-
-        retry_delay = task.retry_delay_seconds
-        if isinstance(retry_delay, list):
-            retry_delay = [int(rd) for rd in retry_delay]
-        elif isinstance(retry_delay, float):
-            retry_delay = int(retry_delay)
-
-        task_run_data = TaskRunCreate(
-            id=id,
-            name=name,
+        task_run_data = build_task_run_create(
+            task=task,
             flow_run_id=flow_run_id,
-            task_key=task.task_key,
             dynamic_key=dynamic_key,
-            tags=list(tags),
-            task_version=task.version,
-            empirical_policy=TaskRunPolicy(
-                retries=task.retries,
-                retry_delay=retry_delay,
-                retry_jitter_factor=task.retry_jitter_factor,
-            ),
-            state=prefect.states.to_state_create(state),
-            task_inputs=task_inputs or {},
+            id=id,
+            name=name,
+            extra_tags=extra_tags,
+            state=state,
+            task_inputs=task_inputs,
         )
 
         content = task_run_data.model_dump_json(exclude={"id"} if id is None else None)
@@ -1491,6 +1640,24 @@ class SyncPrefectClient(
         response = self._client.post("/task_runs/", content=content)
         return TaskRun.model_validate(response.json())
 
+    def create_task_runs(self, task_runs: Iterable[TaskRunCreate]) -> list[TaskRun]:
+        """
+        Create multiple task runs in a single request.
+
+        Args:
+            task_runs: the task runs to create, e.g. built with
+                `build_task_run_create`
+
+        Returns:
+            The created task runs, in the order they were provided. Task runs that
+            already exist are returned in place of new ones.
+        """
+        response = self._client.post(
+            "/task_runs/bulk",
+            json={"task_runs": _task_run_creates_to_json(task_runs)},
+        )
+        return _get_type_adapter(list[TaskRun]).validate_python(response.json())
+
     def read_task_run(self, task_run_id: UUID) -> TaskRun:
         """
         Query the Prefect API for a task run by id.
@@ -1558,6 +1725,56 @@ class SyncPrefectClient(
         response = self._client.post("/task_runs/filter", json=body)
         return _get_type_adapter(list[TaskRun]).validate_python(response.json())
 
+    def read_task_runs_page(
+        self,
+        *,
+        flow_filter: Optional[FlowFilter] = None,
+        flow_run_filter: Optional[FlowRunFilter] = None,
+        task_run_filter: Optional[TaskRunFilter] = None,
+        deployment_filter: Optional[DeploymentFilter] = None,
+        sort: Optional[TaskRunSort] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> CursorPaginationResponse[TaskRun]:
+        """
+        Query the Prefect API for a page of task runs, paginated with a cursor.
+
+        Pass the `next_cursor` of a page, along with the same filters and sort, to
+        read the following page. Unlike `read_task_runs` with an `offset`, reading
+        deep pages is as fast as reading the first one.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the task runs
+            limit: the maximum number of task runs in the page
+            cursor: the `next_cursor` of the previous page, if any
+
+        Returns:
+            a page of task runs and the cursor for the next page
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "sort": sort,
+            "limit": limit,
+            "cursor": cursor,
+        }
+        response = self._client.post("/task_runs/filter/cursor", json=body)
+        return CursorPaginationResponse[TaskRun].model_validate(response.json())
+
     def set_task_run_state(
         self,
         task_run_id: UUID,
@@ -20,6 +20,22 @@ if TYPE_CHECKING:
     from prefect.client.schemas.responses import GlobalConcurrencyLimitResponse
 
 
+def _increment_body(
+    names: list[str],
+    slots: int,
+    mode: str,
+    wait_seconds: float | None,
+    waiter_id: "UUID | None",
+) -> dict[str, Any]:
+    body: dict[str, Any] = {"names": names, "slots": slots, "mode": mode}
+    # only sent when waiting so that requests stay compatible with older servers
+    if wait_seconds:
+        body["wait_seconds"] = wait_seconds
+        if waiter_id is not None:
+            body["waiter_id"] = str(waiter_id)
+    return body
+
+
 class ConcurrencyLimitClient(BaseClient):
     def create_concurrency_limit(
         self,
@@ -244,6 +260,8 @@ class ConcurrencyLimitClient(BaseClient):
         names: list[str],
         slots: int,
         mode: str,
+        wait_seconds: float | None = None,
+        waiter_id: "UUID | None" = None,
     ) -> "Response":
         """
         Increment concurrency slots for the specified limits.
@@ -252,15 +270,21 @@ class ConcurrencyLimitClient(BaseClient):
             names: A list of limit names for which to occupy slots.
             slots: The number of concurrency slots to occupy.
             mode: The mode of the concurrency limits.
+            wait_seconds: The number of seconds the server should wait for slots
+                to become available before responding with a 423.
+            waiter_id: The waiter ID returned with the 423 response to a previous
+                request that waited, used to keep that request's place in line.
         """
         return self.request(
             "POST",
             "/v2/concurrency_limits/increment",
-            json={
-                "names": names,
-                "slots": slots,
-                "mode": mode,
-            },
+            json=_increment_body(
+                names=names,
+                slots=slots,
+                mode=mode,
+                wait_seconds=wait_seconds,
+                waiter_id=waiter_id,
+            ),
         )
 
     def increment_concurrency_slots_with_lease(
@@ -269,6 +293,8 @@ class ConcurrencyLimitClient(BaseClient):
         slots: int,
         mode: Literal["concurrency", "rate_limit"],
         lease_duration: float,
+        wait_seconds: float | None = None,
+        waiter_id: "UUID | None" = None,
     ) -> "Response":
         """
         Increment concurrency slots for the specified limits with a lease.
@@ -278,14 +304,22 @@ class ConcurrencyLimitClient(BaseClient):
             slots: The number of concurrency slots to occupy.
             mode: The mode of the concurrency limits.
             lease_duration: The duration of the lease in seconds.
+            wait_seconds: The number of seconds the server should wait for slots
+                to become available before responding with a 423.
+            waiter_id: The waiter ID returned with the 423 response to a previous
+                request that waited, used to keep that request's place in line.
         """
         return self.request(
             "POST",
             "/v2/concurrency_limits/increment-with-lease",
             json={
-                "names": names,
-                "slots": slots,
-                "mode": mode,
+                **_increment_body(
+                    names=names,
+                    slots=slots,
+                    mode=mode,
+                    wait_seconds=wait_seconds,
+                    waiter_id=waiter_id,
+                ),
                 "lease_duration": lease_duration,
             },
         )
@@ -309,6 +343,31 @@ class ConcurrencyLimitClient(BaseClient):
             json={"lease_duration": lease_duration},
         )
 
+    def renew_concurrency_leases(
+        self,
+        lease_ids: list["UUID"],
+        lease_duration: float,
+    ) -> "Response":
+        """
+        Renew many concurrency leases in a single request.
+
+        Args:
+            lease_ids: The IDs of the leases to renew.
+            lease_duration: The new lease duration in seconds.
+
+        Returns:
+            "Response": The HTTP response from the server, with the IDs of the
+                leases that were renewed.
+        """
+        return self.request(
+            "POST",
+            "/v2/concurrency_limits/leases/renew",
+            json={
+                "lease_ids": [str(lease_id) for lease_id in lease_ids],
+                "lease_duration": lease_duration,
+            },
+        )
+
     def release_concurrency_slots(
         self, names: list[str], slots: int, occupancy_seconds: float
     ) -> "Response":
@@ -684,6 +743,8 @@ class ConcurrencyLimitAsyncClient(BaseAsyncClient):
         names: list[str],
         slots: int,
         mode: Literal["concurrency", "rate_limit"],
+        wait_seconds: float | None = None,
+        waiter_id: "UUID | None" = None,
     ) -> "Response":
         """
         Increment concurrency slots for the specified limits.
@@ -692,15 +753,21 @@ class ConcurrencyLimitAsyncClient(BaseAsyncClient):
             names: A list of limit names for which to occupy slots.
             slots: The number of concurrency slots to occupy.
             mode: The mode of the concurrency limits.
+            wait_seconds: The number of seconds the server should wait for slots
+                to become available before responding with a 423.
+            waiter_id: The waiter ID returned with the 423 response to a previous
+                request that waited, used to keep that request's place in line.
         """
         return await self.request(
             "POST",
             "/v2/concurrency_limits/increment",
-            json={
-                "names": names,
-                "slots": slots,
-                "mode": mode,
-            },
+            json=_increment_body(
+                names=names,
+                slots=slots,
+                mode=mode,
+                wait_seconds=wait_seconds,
+                waiter_id=waiter_id,
+            ),
         )
 
     async def increment_concurrency_slots_with_lease(
@@ -709,6 +776,8 @@ class ConcurrencyLimitAsyncClient(BaseAsyncClient):
         slots: int,
         mode: Literal["concurrency", "rate_limit"],
         lease_duration: float,
+        wait_seconds: float | None = None,
+        waiter_id: "UUID | None" = None,
     ) -> "Response":
         """
         Increment concurrency slots for the specified limits with a lease.
@@ -718,14 +787,22 @@ class ConcurrencyLimitAsyncClient(BaseAsyncClient):
             slots: The number of concurrency slots to occupy.
             mode: The mode of the concurrency limits.
             lease_duration: The duration of the lease in seconds.
+            wait_seconds: The number of seconds the server should wait for slots
+                to become available before responding with a 423.
+            waiter_id: The waiter ID returned with the 423 response to a previous
+                request that waited, used to keep that request's place in line.
         """
         return await self.request(
             "POST",
             "/v2/concurrency_limits/increment-with-lease",
             json={
-                "names": names,
-                "slots": slots,
-                "mode": mode,
+                **_increment_body(
+                    names=names,
+                    slots=slots,
+                    mode=mode,
+                    wait_seconds=wait_seconds,
+                    waiter_id=waiter_id,
+                ),
                 "lease_duration": lease_duration,
             },
         )
@@ -749,6 +826,31 @@ class ConcurrencyLimitAsyncClient(BaseAsyncClient):
             json={"lease_duration": lease_duration},
         )
 
+    async def renew_concurrency_leases(
+        self,
+        lease_ids: list["UUID"],
+        lease_duration: float,
+    ) -> "Response":
+        """
+        Renew many concurrency leases in a single request.
+
+        Args:
+            lease_ids: The IDs of the leases to renew.
+            lease_duration: The new lease duration in seconds.
+
+        Returns:
+            "Response": The HTTP response from the server, with the IDs of the
+                leases that were renewed.
+        """
+        return await self.request(
+            "POST",
+            "/v2/concurrency_limits/leases/renew",
+            json={
+                "lease_ids": [str(lease_id) for lease_id in lease_ids],
+                "lease_duration": lease_duration,
+            },
+        )
+
     async def release_concurrency_slots(
         self, names: list[str], slots: int, occupancy_seconds: float
     ) -> "Response":
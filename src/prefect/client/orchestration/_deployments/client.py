@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from typing import TYPE_CHECKING, Any, Union
 from uuid import UUID
 
@@ -1086,6 +1086,71 @@ class DeploymentAsyncClient(BaseAsyncClient):
         response = await self.request("POST", "/deployments/filter", json=body)
         return DeploymentResponse.model_validate_list(response.json())
 
+    async def iter_deployments(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        limit: int | None = None,
+        sort: "DeploymentSort | None" = None,
+        offset: int = 0,
+    ) -> AsyncIterator["DeploymentResponse"]:
+        """
+        Iterate over deployments matching all the provided criteria, streamed from
+        the Prefect API.
+
+        Deployments are yielded as they are received, so large result sets can be
+        processed without holding them in memory. Unlike `read_deployments`, all
+        matching deployments are returned unless a `limit` is provided.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            limit: a limit for the deployment query
+            offset: an offset for the deployment query
+
+        Yields:
+            Deployment model representations of the deployments
+        """
+        from prefect.client.schemas.responses import DeploymentResponse
+
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "work_pools": (
+                work_pool_filter.model_dump(mode="json") if work_pool_filter else None
+            ),
+            "work_pool_queues": (
+                work_queue_filter.model_dump(mode="json") if work_queue_filter else None
+            ),
+            "limit": limit,
+            "offset": offset,
+            "sort": sort,
+        }
+
+        async for deployment in self.stream_ndjson(
+            "POST", "/deployments/filter", json=body
+        ):
+            yield DeploymentResponse.model_validate(deployment)
+
     async def delete_deployment(
         self,
         deployment_id: UUID,
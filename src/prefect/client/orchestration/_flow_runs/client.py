@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -28,6 +28,10 @@ if TYPE_CHECKING:
         FlowRunInput,
         FlowRunPolicy,
     )
+    from prefect.client.schemas.responses import (
+        CursorPaginationResponse,
+        FlowRunOrchestrationResult,
+    )
     from prefect.client.schemas.sorting import (
         FlowRunSort,
     )
@@ -36,6 +40,36 @@ if TYPE_CHECKING:
     from prefect.types import KeyValueLabelsField
 
 
+def _filter_body(
+    flow_filter: "FlowFilter | None" = None,
+    flow_run_filter: "FlowRunFilter | None" = None,
+    task_run_filter: "TaskRunFilter | None" = None,
+    deployment_filter: "DeploymentFilter | None" = None,
+    work_pool_filter: "WorkPoolFilter | None" = None,
+    work_queue_filter: "WorkQueueFilter | None" = None,
+) -> dict[str, Any]:
+    return {
+        "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+        "flow_runs": (
+            flow_run_filter.model_dump(mode="json", exclude_unset=True)
+            if flow_run_filter
+            else None
+        ),
+        "task_runs": (
+            task_run_filter.model_dump(mode="json") if task_run_filter else None
+        ),
+        "deployments": (
+            deployment_filter.model_dump(mode="json") if deployment_filter else None
+        ),
+        "work_pools": (
+            work_pool_filter.model_dump(mode="json") if work_pool_filter else None
+        ),
+        "work_pool_queues": (
+            work_queue_filter.model_dump(mode="json") if work_queue_filter else None
+        ),
+    }
+
+
 class FlowRunClient(BaseClient):
     def create_flow_run(
         self,
@@ -317,6 +351,70 @@ class FlowRunClient(BaseClient):
 
         return FlowRun.model_validate_list(response.json())
 
+    def read_flow_runs_page(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        sort: "FlowRunSort | None" = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> "CursorPaginationResponse[FlowRun]":
+        """
+        Query the Prefect API for a page of flow runs, paginated with a cursor.
+
+        Pass the `next_cursor` of a page, along with the same filters and sort, to
+        read the following page. Unlike `read_flow_runs` with an `offset`, reading
+        deep pages is as fast as reading the first one.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            sort: sort criteria for the flow runs
+            limit: the maximum number of flow runs in the page
+            cursor: the `next_cursor` of the previous page, if any
+
+        Returns:
+            a page of flow runs and the cursor for the next page
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "work_pools": (
+                work_pool_filter.model_dump(mode="json") if work_pool_filter else None
+            ),
+            "work_pool_queues": (
+                work_queue_filter.model_dump(mode="json") if work_queue_filter else None
+            ),
+            "sort": sort,
+            "limit": limit,
+            "cursor": cursor,
+        }
+
+        response = self.request("POST", "/flow_runs/filter/cursor", json=body)
+        from prefect.client.schemas.objects import FlowRun
+        from prefect.client.schemas.responses import CursorPaginationResponse
+
+        return CursorPaginationResponse[FlowRun].model_validate(response.json())
+
     def set_flow_run_state(
         self,
         flow_run_id: "UUID | str",
@@ -367,6 +465,116 @@ class FlowRunClient(BaseClient):
         )
         return result
 
+    def bulk_set_flow_run_state(
+        self,
+        state: "State[T]",
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        force: bool = False,
+        limit: int | None = None,
+        after: "UUID | None" = None,
+    ) -> "list[FlowRunOrchestrationResult[T]]":
+        """
+        Set the state of the flow runs matching all criteria in a single request.
+
+        Each state is orchestrated independently on the server. A single request
+        updates at most `limit` flow runs, up to a maximum set by the server.
+
+        Args:
+            state: the state to set
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Prefect API to accept them
+            limit: the maximum number of flow runs to update
+            after: only update flow runs whose id is greater than this one, to
+                resume after the last flow run of a previous request
+
+        Returns:
+            the orchestration result for each matching flow run, in order of id
+        """
+        from uuid import uuid4
+
+        from prefect.states import to_state_create
+
+        state_create = to_state_create(state)
+        state_create.state_details.transition_id = uuid4()
+        body: dict[str, Any] = {
+            "state": state_create.model_dump(mode="json", serialize_as_any=True),
+            "force": force,
+            **_filter_body(
+                flow_filter=flow_filter,
+                flow_run_filter=flow_run_filter,
+                task_run_filter=task_run_filter,
+                deployment_filter=deployment_filter,
+                work_pool_filter=work_pool_filter,
+                work_queue_filter=work_queue_filter,
+            ),
+        }
+        if limit is not None:
+            body["limit"] = limit
+        if after is not None:
+            body["after"] = str(after)
+
+        response = self.request("POST", "/flow_runs/bulk_set_state", json=body)
+        from prefect.client.schemas.responses import FlowRunOrchestrationResult
+
+        return FlowRunOrchestrationResult.model_validate_list(response.json())
+
+    def bulk_delete_flow_runs(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        limit: int | None = None,
+    ) -> "list[UUID]":
+        """
+        Delete the flow runs matching all criteria in a single request.
+
+        A single request deletes at most `limit` flow runs, up to a maximum set by
+        the server.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            limit: the maximum number of flow runs to delete
+
+        Returns:
+            the ids of the deleted flow runs
+        """
+        body: dict[str, Any] = _filter_body(
+            flow_filter=flow_filter,
+            flow_run_filter=flow_run_filter,
+            task_run_filter=task_run_filter,
+            deployment_filter=deployment_filter,
+            work_pool_filter=work_pool_filter,
+            work_queue_filter=work_queue_filter,
+        )
+        if limit is not None:
+            body["limit"] = limit
+
+        response = self.request("POST", "/flow_runs/bulk_delete", json=body)
+        from uuid import UUID
+
+        return [UUID(flow_run_id) for flow_run_id in response.json()["deleted"]]
+
     def read_flow_run_states(self, flow_run_id: "UUID") -> "list[State]":
         """
         Query for the states of a flow run
@@ -767,6 +975,134 @@ class FlowRunAsyncClient(BaseAsyncClient):
 
         return FlowRun.model_validate_list(response.json())
 
+    async def read_flow_runs_page(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        sort: "FlowRunSort | None" = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> "CursorPaginationResponse[FlowRun]":
+        """
+        Query the Prefect API for a page of flow runs, paginated with a cursor.
+
+        Pass the `next_cursor` of a page, along with the same filters and sort, to
+        read the following page. Unlike `read_flow_runs` with an `offset`, reading
+        deep pages is as fast as reading the first one.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            sort: sort criteria for the flow runs
+            limit: the maximum number of flow runs in the page
+            cursor: the `next_cursor` of the previous page, if any
+
+        Returns:
+            a page of flow runs and the cursor for the next page
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "work_pools": (
+                work_pool_filter.model_dump(mode="json") if work_pool_filter else None
+            ),
+            "work_pool_queues": (
+                work_queue_filter.model_dump(mode="json") if work_queue_filter else None
+            ),
+            "sort": sort,
+            "limit": limit,
+            "cursor": cursor,
+        }
+
+        response = await self.request("POST", "/flow_runs/filter/cursor", json=body)
+        from prefect.client.schemas.objects import FlowRun
+        from prefect.client.schemas.responses import CursorPaginationResponse
+
+        return CursorPaginationResponse[FlowRun].model_validate(response.json())
+
+    async def iter_flow_runs(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        sort: "FlowRunSort | None" = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> "AsyncIterator[FlowRun]":
+        """
+        Iterate over flow runs matching all criteria, streamed from the Prefect API.
+
+        Flow runs are yielded as they are received, so large result sets can be
+        processed without holding them in memory. Unlike `read_flow_runs`, all
+        matching flow runs are returned unless a `limit` is provided.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            sort: sort criteria for the flow runs
+            limit: limit for the flow run query
+            offset: offset for the flow run query
+
+        Yields:
+            Flow Run model representations of the flow runs
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "work_pools": (
+                work_pool_filter.model_dump(mode="json") if work_pool_filter else None
+            ),
+            "work_pool_queues": (
+                work_queue_filter.model_dump(mode="json") if work_queue_filter else None
+            ),
+            "sort": sort,
+            "limit": limit,
+            "offset": offset,
+        }
+        from prefect.client.schemas.objects import FlowRun
+
+        async for flow_run in self.stream_ndjson(
+            "POST", "/flow_runs/filter", json=body
+        ):
+            yield FlowRun.model_validate(flow_run)
+
     async def set_flow_run_state(
         self,
         flow_run_id: "UUID | str",
@@ -817,6 +1153,116 @@ class FlowRunAsyncClient(BaseAsyncClient):
         )
         return result
 
+    async def bulk_set_flow_run_state(
+        self,
+        state: "State[T]",
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        force: bool = False,
+        limit: int | None = None,
+        after: "UUID | None" = None,
+    ) -> "list[FlowRunOrchestrationResult[T]]":
+        """
+        Set the state of the flow runs matching all criteria in a single request.
+
+        Each state is orchestrated independently on the server. A single request
+        updates at most `limit` flow runs, up to a maximum set by the server.
+
+        Args:
+            state: the state to set
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Prefect API to accept them
+            limit: the maximum number of flow runs to update
+            after: only update flow runs whose id is greater than this one, to
+                resume after the last flow run of a previous request
+
+        Returns:
+            the orchestration result for each matching flow run, in order of id
+        """
+        from uuid import uuid4
+
+        from prefect.states import to_state_create
+
+        state_create = to_state_create(state)
+        state_create.state_details.transition_id = uuid4()
+        body: dict[str, Any] = {
+            "state": state_create.model_dump(mode="json", serialize_as_any=True),
+            "force": force,
+            **_filter_body(
+                flow_filter=flow_filter,
+                flow_run_filter=flow_run_filter,
+                task_run_filter=task_run_filter,
+                deployment_filter=deployment_filter,
+                work_pool_filter=work_pool_filter,
+                work_queue_filter=work_queue_filter,
+            ),
+        }
+        if limit is not None:
+            body["limit"] = limit
+        if after is not None:
+            body["after"] = str(after)
+
+        response = await self.request("POST", "/flow_runs/bulk_set_state", json=body)
+        from prefect.client.schemas.responses import FlowRunOrchestrationResult
+
+        return FlowRunOrchestrationResult.model_validate_list(response.json())
+
+    async def bulk_delete_flow_runs(
+        self,
+        *,
+        flow_filter: "FlowFilter | None" = None,
+        flow_run_filter: "FlowRunFilter | None" = None,
+        task_run_filter: "TaskRunFilter | None" = None,
+        deployment_filter: "DeploymentFilter | None" = None,
+        work_pool_filter: "WorkPoolFilter | None" = None,
+        work_queue_filter: "WorkQueueFilter | None" = None,
+        limit: int | None = None,
+    ) -> "list[UUID]":
+        """
+        Delete the flow runs matching all criteria in a single request.
+
+        A single request deletes at most `limit` flow runs, up to a maximum set by
+        the server.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            limit: the maximum number of flow runs to delete
+
+        Returns:
+            the ids of the deleted flow runs
+        """
+        body: dict[str, Any] = _filter_body(
+            flow_filter=flow_filter,
+            flow_run_filter=flow_run_filter,
+            task_run_filter=task_run_filter,
+            deployment_filter=deployment_filter,
+            work_pool_filter=work_pool_filter,
+            work_queue_filter=work_queue_filter,
+        )
+        if limit is not None:
+            body["limit"] = limit
+
+        response = await self.request("POST", "/flow_runs/bulk_delete", json=body)
+        from uuid import UUID
+
+        return [UUID(flow_run_id) for flow_run_id in response.json()["deleted"]]
+
     async def read_flow_run_states(self, flow_run_id: "UUID") -> "list[State]":
         """
         Query for the states of a flow run
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterable, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Union
 
 from prefect.client.orchestration.base import BaseAsyncClient, BaseClient
 
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from prefect.client.schemas.objects import (
         Log,
     )
+    from prefect.client.schemas.responses import CursorPaginationResponse
     from prefect.client.schemas.sorting import LogSort
 
 
@@ -53,6 +54,34 @@ class LogClient(BaseClient):
 
         return Log.model_validate_list(response.json())
 
+    def read_logs_page(
+        self,
+        log_filter: "LogFilter | None" = None,
+        limit: int | None = None,
+        sort: "LogSort | None" = None,
+        cursor: str | None = None,
+    ) -> "CursorPaginationResponse[Log]":
+        """
+        Read a page of flow and task run logs, paginated with a cursor.
+
+        Pass the `next_cursor` of a page, along with the same filter and sort, to
+        read the following page.
+        """
+        from prefect.client.schemas.sorting import LogSort
+
+        body: dict[str, Any] = {
+            "logs": log_filter.model_dump(mode="json") if log_filter else None,
+            "limit": limit,
+            "sort": sort or LogSort.TIMESTAMP_ASC,
+            "cursor": cursor,
+        }
+
+        response = self.request("POST", "/logs/filter/cursor", json=body)
+        from prefect.client.schemas.objects import Log
+        from prefect.client.schemas.responses import CursorPaginationResponse
+
+        return CursorPaginationResponse[Log].model_validate(response.json())
+
 
 class LogAsyncClient(BaseAsyncClient):
     async def create_logs(
@@ -95,3 +124,57 @@ class LogAsyncClient(BaseAsyncClient):
         from prefect.client.schemas.objects import Log
 
         return Log.model_validate_list(response.json())
+
+    async def iter_logs(
+        self,
+        log_filter: "LogFilter | None" = None,
+        limit: int | None = None,
+        offset: int = 0,
+        sort: "LogSort | None" = None,
+    ) -> AsyncIterator["Log"]:
+        """
+        Iterate over flow and task run logs, streamed from the Prefect API.
+
+        Unlike `read_logs`, all matching logs are returned unless a `limit` is
+        provided.
+        """
+        from prefect.client.schemas.objects import Log
+        from prefect.client.schemas.sorting import LogSort
+
+        body: dict[str, Any] = {
+            "logs": log_filter.model_dump(mode="json") if log_filter else None,
+            "limit": limit,
+            "offset": offset,
+            "sort": sort or LogSort.TIMESTAMP_ASC,
+        }
+
+        async for log in self.stream_ndjson("POST", "/logs/filter", json=body):
+            yield Log.model_validate(log)
+
+    async def read_logs_page(
+        self,
+        log_filter: "LogFilter | None" = None,
+        limit: int | None = None,
+        sort: "LogSort | None" = None,
+        cursor: str | None = None,
+    ) -> "CursorPaginationResponse[Log]":
+        """
+        Read a page of flow and task run logs, paginated with a cursor.
+
+        Pass the `next_cursor` of a page, along with the same filter and sort, to
+        read the following page.
+        """
+        from prefect.client.schemas.sorting import LogSort
+
+        body: dict[str, Any] = {
+            "logs": log_filter.model_dump(mode="json") if log_filter else None,
+            "limit": limit,
+            "sort": sort or LogSort.TIMESTAMP_ASC,
+            "cursor": cursor,
+        }
+
+        response = await self.request("POST", "/logs/filter/cursor", json=body)
+        from prefect.client.schemas.objects import Log
+        from prefect.client.schemas.responses import CursorPaginationResponse
+
+        return CursorPaginationResponse[Log].model_validate(response.json())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Any, Literal
 
 from typing_extensions import TypeAlias
@@ -12,6 +14,8 @@ if TYPE_CHECKING:
 
 HTTP_METHODS: TypeAlias = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 class BaseClient:
     server_type: "ServerType"
@@ -51,3 +55,32 @@ class BaseAsyncClient:
             path = path.format(**path_params)  # type: ignore
         request = self._client.build_request(method, path, params=params, **kwargs)
         return await self._client.send(request)
+
+    async def stream_ndjson(
+        self,
+        method: HTTP_METHODS,
+        path: "ServerRoutes",
+        params: dict[str, Any] | None = None,
+        path_params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Send a request that accepts a newline-delimited JSON response, yielding each
+        decoded line as it is received.
+        """
+        if path_params:
+            path = path.format(**path_params)  # type: ignore
+        request = self._client.build_request(
+            method,
+            path,
+            params=params,
+            headers={"Accept": NDJSON_MEDIA_TYPE},
+            **kwargs,
+        )
+        response = await self._client.send(request, stream=True)
+        try:
+            async for line in response.aiter_lines():
+                if line:
+                    yield json.loads(line)
+        finally:
+            await response.aclose()
@@ -69,6 +69,7 @@ ServerRoutes = Literal[
     "/flow_runs/{id}",
     "/flow_runs/{id}/graph",
     "/flow_runs/{id}/graph-v2",
+    "/flow_runs/{id}/graph-v2/delta",
     "/flow_runs/{id}/input",
     "/flow_runs/{id}/input/{key}",
     "/flow_runs/{id}/input/filter",
@@ -76,8 +77,11 @@ ServerRoutes = Literal[
     "/flow_runs/{id}/logs/download",
     "/flow_runs/{id}/resume",
     "/flow_runs/{id}/set_state",
+    "/flow_runs/bulk_delete",
+    "/flow_runs/bulk_set_state",
     "/flow_runs/count",
     "/flow_runs/filter",
+    "/flow_runs/filter/cursor",
     "/flow_runs/history",
     "/flow_runs/lateness",
     "/flow_runs/paginate",
@@ -91,6 +95,7 @@ ServerRoutes = Literal[
     "/hello",
     "/logs/",
     "/logs/filter",
+    "/logs/filter/cursor",
     "/ready",
     "/saved_searches/",
     "/saved_searches/{id}",
@@ -100,8 +105,10 @@ ServerRoutes = Literal[
     "/task_runs/",
     "/task_runs/{id}",
     "/task_runs/{id}/set_state",
+    "/task_runs/bulk",
     "/task_runs/count",
     "/task_runs/filter",
+    "/task_runs/filter/cursor",
     "/task_runs/history",
     "/task_workers/filter",
     "/templates/validate",
@@ -120,6 +127,7 @@ ServerRoutes = Literal[
     "/v2/concurrency_limits/increment",
     "/v2/concurrency_limits/increment-with-lease",
     "/v2/concurrency_limits/leases/{lease_id}/renew",
+    "/v2/concurrency_limits/leases/renew",
     "/variables/",
     "/variables/{id}",
     "/variables/count",
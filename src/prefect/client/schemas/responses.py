@@ -142,6 +142,27 @@ class OrchestrationResult(PrefectBaseModel, Generic[T]):
     details: StateResponseDetails
 
 
+class FlowRunOrchestrationResult(OrchestrationResult[T], Generic[T]):
+    """
+    The output of state orchestration for one of several flow runs.
+    """
+
+    flow_run_id: UUID
+
+
+class CursorPaginationResponse(PrefectBaseModel, Generic[T]):
+    """
+    A page of results from a cursor-paginated query.
+    """
+
+    results: list[T]
+    limit: int
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="A cursor for the next page of results, if there are any.",
+    )
+
+
 class WorkerFlowRunResponse(PrefectBaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
 
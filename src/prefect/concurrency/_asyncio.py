@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from typing import Literal, Optional
 from uuid import UUID
 
@@ -14,7 +15,12 @@ from prefect.logging import get_logger
 from prefect.logging.loggers import get_run_logger
 from prefect.utilities.timeout import timeout_async
 
-from .services import ConcurrencySlotAcquisitionService
+from .services import (
+    ConcurrencyLeaseRenewalService,
+    ConcurrencySlotAcquisitionService,
+    long_poll_seconds,
+    waiter_id_from_response,
+)
 
 
 class ConcurrencySlotAcquisitionError(Exception):
@@ -83,6 +89,10 @@ async def aacquire_concurrency_slots_with_lease(
     except Exception:
         logger = get_logger("concurrency")
 
+    deadline = (
+        time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+    )
+    waiter_id: Optional[UUID] = None
     try:
         with timeout_async(seconds=timeout_seconds):
             async with get_client() as client:
@@ -93,6 +103,12 @@ async def aacquire_concurrency_slots_with_lease(
                             slots=slots,
                             mode=mode,
                             lease_duration=lease_duration,
+                            wait_seconds=(
+                                long_poll_seconds(deadline)
+                                if max_retries is None
+                                else None
+                            ),
+                            waiter_id=waiter_id,
                         )
                         retval = ConcurrencyLimitWithLeaseResponse.model_validate(
                             response.json()
@@ -114,6 +130,7 @@ async def aacquire_concurrency_slots_with_lease(
 
                         if max_retries is not None and max_retries <= 0:
                             raise exc
+                        waiter_id = waiter_id_from_response(exc.response)
                         retry_after = float(exc.response.headers["Retry-After"])
                         logger.debug(
                             f"Unable to acquire concurrency slot. Retrying in {retry_after} second(s)."
@@ -138,18 +155,21 @@ async def amaintain_concurrency_lease(
     """
     Maintain a concurrency lease by renewing it after the given interval.
 
+    Leases held by the process are renewed together by the
+    `ConcurrencyLeaseRenewalService`. Returns only by raising an exception if the
+    lease could not be renewed.
+
     Args:
         lease_id: The ID of the lease to maintain.
         lease_duration: The duration of the lease in seconds.
     """
-    async with get_client() as client:
-        while True:
-            await asyncio.sleep(  # Renew the lease 3/4 of the way through the lease duration
-                lease_duration * 0.75
-            )
-            await client.renew_concurrency_lease(
-                lease_id=lease_id, lease_duration=lease_duration
-            )
+    service = ConcurrencyLeaseRenewalService.instance()
+    future = service.maintain(lease_id, lease_duration, acquired_at=time.monotonic())
+    try:
+        await asyncio.wrap_future(future)
+    finally:
+        future.cancel()
+        service.release(lease_id, lease_duration)
 
 
 async def arelease_concurrency_slots(
@@ -1,14 +1,18 @@
 import asyncio
+import concurrent.futures
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal, Optional
+from uuid import UUID
 
 import httpx
 from starlette import status
 from typing_extensions import TypeAlias, Unpack
 
 from prefect._internal.concurrency import logger
-from prefect._internal.concurrency.services import FutureQueueService
+from prefect._internal.concurrency.services import FutureQueueService, QueueService
 from prefect.client.orchestration import get_client
 from prefect.utilities.timeout import timeout_async
 
@@ -19,6 +23,48 @@ _Item: TypeAlias = tuple[
     int, Literal["concurrency", "rate_limit"], Optional[float], Optional[int]
 ]
 
+# the longest that one request waits on the server for slots, kept well under the
+# default API request timeout
+LONG_POLL_SECONDS = 20.0
+
+# returned by the server with a 423 response to a request that waited for slots
+WAITER_ID_HEADER = "Prefect-Concurrency-Waiter-Id"
+
+# leases are renewed once this fraction of their duration has passed
+LEASE_RENEWAL_FRACTION = 0.75
+
+# leases whose renewal is due within this fraction of their duration are renewed
+# along with leases that are due, so that leases acquired at different times are
+# renewed together
+LEASE_RENEWAL_WINDOW_FRACTION = 0.25
+
+# (lease ID, lease duration, `time.monotonic()` at acquisition, future), or
+# (lease ID, lease duration, None, None) to stop renewing the lease
+_LeaseItem: TypeAlias = tuple[
+    UUID,
+    float,
+    Optional[float],
+    Optional[concurrent.futures.Future[None]],
+]
+
+
+def long_poll_seconds(deadline: Optional[float]) -> float:
+    """
+    Returns how long the next request should wait on the server for slots, given
+    the `time.monotonic()` deadline of the acquisition.
+    """
+    if deadline is None:
+        return LONG_POLL_SECONDS
+    # leave time for the response to arrive before the acquisition times out, so
+    # that slots granted at the end of the wait are not abandoned
+    return max(0.0, min(LONG_POLL_SECONDS, deadline - time.monotonic() - 1.0))
+
+
+def waiter_id_from_response(response: httpx.Response) -> Optional[UUID]:
+    """Returns the waiter ID sent with a 423 response, if the server sent one"""
+    waiter_id = response.headers.get(WAITER_ID_HEADER)
+    return UUID(waiter_id) if waiter_id else None
+
 
 class ConcurrencySlotAcquisitionService(
     FutureQueueService[Unpack[_Item], httpx.Response]
@@ -41,6 +87,10 @@ class ConcurrencySlotAcquisitionService(
         timeout_seconds: Optional[float] = None,
         max_retries: Optional[int] = None,
     ) -> httpx.Response:
+        deadline = (
+            time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+        )
+        waiter_id: Optional[UUID] = None
         with timeout_async(seconds=timeout_seconds):
             while True:
                 try:
@@ -48,6 +98,12 @@ class ConcurrencySlotAcquisitionService(
                         names=self.concurrency_limit_names,
                         slots=slots,
                         mode=mode,
+                        # callers that limit retries expect each attempt to
+                        # return promptly, so only wait on the server otherwise
+                        wait_seconds=(
+                            long_poll_seconds(deadline) if max_retries is None else None
+                        ),
+                        waiter_id=waiter_id,
                     )
                 except httpx.HTTPStatusError as exc:
                     if not exc.response.status_code == status.HTTP_423_LOCKED:
@@ -55,6 +111,7 @@ class ConcurrencySlotAcquisitionService(
 
                     if max_retries is not None and max_retries <= 0:
                         raise exc
+                    waiter_id = waiter_id_from_response(exc.response)
                     retry_after = float(exc.response.headers["Retry-After"])
                     logger.debug(
                         f"Unable to acquire concurrency slot. Retrying in {retry_after} second(s)."
@@ -62,3 +119,153 @@ class ConcurrencySlotAcquisitionService(
                     await asyncio.sleep(retry_after)
                     if max_retries is not None:
                         max_retries -= 1
+
+
+@dataclass
+class _MaintainedLease:
+    lease_duration: float
+    renew_at: float
+    # set to an exception if the lease could not be renewed
+    future: concurrent.futures.Future[None]
+
+
+class ConcurrencyLeaseRenewalService(QueueService[_LeaseItem]):
+    """
+    Renews the concurrency leases held by this process on a shared timer.
+
+    Rather than each `concurrency` context renewing its own lease, every lease that
+    is due for renewal is renewed in a single bulk request, along with the leases
+    that will be due soon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._client: PrefectClient
+        self._leases: dict[UUID, _MaintainedLease] = {}
+        self._leases_changed: asyncio.Event
+
+    @asynccontextmanager
+    async def _lifespan(self) -> AsyncGenerator[None, None]:
+        async with get_client() as client:
+            self._client = client
+            self._leases_changed = asyncio.Event()
+            renewals = asyncio.create_task(self._renew_periodically())
+            try:
+                yield
+            finally:
+                renewals.cancel()
+                try:
+                    await renewals
+                except asyncio.CancelledError:
+                    pass
+
+    def maintain(
+        self, lease_id: UUID, lease_duration: float, acquired_at: float
+    ) -> concurrent.futures.Future[None]:
+        """
+        Starts renewing a lease that was acquired at the `time.monotonic()` time
+        `acquired_at`.
+
+        Returns a future that is set to an exception if the lease could not be
+        renewed, and otherwise never completes.
+        """
+        future: concurrent.futures.Future[None] = concurrent.futures.Future()
+        self.send((lease_id, lease_duration, acquired_at, future))
+        return future
+
+    def release(self, lease_id: UUID, lease_duration: float) -> None:
+        """Stops renewing a lease"""
+        try:
+            self.send((lease_id, lease_duration, None, None))
+        except RuntimeError:
+            # the service has stopped, and with it the renewal of every lease
+            pass
+
+    async def _handle(self, item: _LeaseItem) -> None:
+        lease_id, lease_duration, acquired_at, future = item
+        if acquired_at is None or future is None:
+            self._leases.pop(lease_id, None)
+            return
+
+        self._leases[lease_id] = _MaintainedLease(
+            lease_duration=lease_duration,
+            renew_at=acquired_at + lease_duration * LEASE_RENEWAL_FRACTION,
+            future=future,
+        )
+        self._leases_changed.set()
+
+    async def _renew_periodically(self) -> None:
+        while True:
+            self._leases_changed.clear()
+            timeout = (
+                min(lease.renew_at for lease in self._leases.values())
+                - time.monotonic()
+                if self._leases
+                else None
+            )
+            try:
+                await asyncio.wait_for(self._leases_changed.wait(), timeout=timeout)
+                continue
+            except asyncio.TimeoutError:
+                pass
+
+            await self._renew_due_leases()
+
+    async def _renew_due_leases(self) -> None:
+        now = time.monotonic()
+        due: dict[float, list[UUID]] = {}
+        for lease_id, lease in list(self._leases.items()):
+            if lease.future.done():
+                # the holder of the lease stopped waiting on it
+                del self._leases[lease_id]
+            elif lease.renew_at <= now + lease.lease_duration * (
+                LEASE_RENEWAL_WINDOW_FRACTION
+            ):
+                due.setdefault(lease.lease_duration, []).append(lease_id)
+
+        for lease_duration, lease_ids in due.items():
+            renewed_lease_ids: set[UUID] = set()
+            error: Optional[Exception] = None
+            try:
+                renewed_lease_ids = await self._renew(lease_ids, lease_duration)
+            except Exception as exc:
+                logger.debug("Failed to renew %d concurrency leases", len(lease_ids))
+                error = exc
+
+            for lease_id in lease_ids:
+                maintained = self._leases.get(lease_id)
+                if maintained is None:
+                    continue
+                if lease_id in renewed_lease_ids:
+                    maintained.renew_at = now + lease_duration * LEASE_RENEWAL_FRACTION
+                    continue
+                del self._leases[lease_id]
+                if not maintained.future.done():
+                    maintained.future.set_exception(
+                        error or RuntimeError(f"Concurrency lease {lease_id} not found")
+                    )
+
+    async def _renew(self, lease_ids: list[UUID], lease_duration: float) -> set[UUID]:
+        try:
+            response = await self._client.renew_concurrency_leases(
+                lease_ids=lease_ids, lease_duration=lease_duration
+            )
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != status.HTTP_404_NOT_FOUND:
+                raise
+        else:
+            return {UUID(lease_id) for lease_id in response.json()}
+
+        # servers without bulk renewal renew one lease at a time
+        renewed_lease_ids: set[UUID] = set()
+        for lease_id in lease_ids:
+            try:
+                await self._client.renew_concurrency_lease(
+                    lease_id=lease_id, lease_duration=lease_duration
+                )
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code != status.HTTP_404_NOT_FOUND:
+                    raise
+            else:
+                renewed_lease_ids.add(lease_id)
+        return renewed_lease_ids
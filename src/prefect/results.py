@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
 import socket
 import threading
@@ -37,6 +38,7 @@ from prefect._internal.compatibility.async_dispatch import async_dispatch
 from prefect._internal.compatibility.blocks import call_explicitly_async_block_method
 from prefect._internal.compatibility.deprecated import deprecated_callable
 from prefect._internal.concurrency.event_loop import get_running_loop
+from prefect._result_cache import ResultRecordCache, get_local_disk_cache
 from prefect._result_records import R, ResultRecord, ResultRecordMetadata
 from prefect.blocks.core import Block
 from prefect.exceptions import (
@@ -55,6 +57,7 @@ from prefect.settings.context import get_current_settings
 from prefect.types import DateTime
 from prefect.utilities.annotations import NotSet
 from prefect.utilities.asyncutils import sync_compatible
+from prefect.utilities.hashing import hash_objects
 
 if TYPE_CHECKING:
     import logging
@@ -291,7 +294,15 @@ T = TypeVar("T")
 
 
 def default_cache() -> LRUCache[str, "ResultRecord[Any]"]:
-    return LRUCache(maxsize=1000)
+    settings = get_current_settings().results
+    disk_cache = (
+        get_local_disk_cache(settings.local_cache_path, settings.local_cache_max_bytes)
+        if settings.local_cache_enabled
+        else None
+    )
+    return ResultRecordCache(
+        max_bytes=settings.memory_cache_max_bytes, disk_cache=disk_cache
+    )
 
 
 def result_storage_discriminator(x: Any) -> str:
@@ -548,6 +559,45 @@ class ResultStore(BaseModel):
                 return key
         return key
 
+    def _disk_cache_key(self, key: str) -> str | None:
+        """
+        The key to cache a result record under on local disk, or `None` if
+        the record should not be cached on disk.
+
+        Results in local file system storage are already on disk and are not cached
+        again. Keys are namespaced by storage block since the disk cache is shared by
+        every result store on the host, and blocks that are not saved are told apart
+        by a hash of their configuration, including secrets so that blocks with
+        different credentials do not share cached results.
+        """
+        if self.result_storage is None or isinstance(
+            self.result_storage, LocalFileSystem
+        ):
+            return None
+        namespace = self.result_storage_block_id or hash_objects(
+            self.result_storage.get_block_type_slug(),
+            self.result_storage.model_dump(
+                mode="json", context={"include_secrets": True}
+            ),
+            hash_algo=hashlib.sha256,
+        )
+        if namespace is None:
+            return None
+        return f"{namespace}:{key}"
+
+    def _cache_result_record(
+        self, key: str, result_record: "ResultRecord[Any]", content: bytes | None
+    ) -> None:
+        if isinstance(self.cache, ResultRecordCache):
+            self.cache.put(
+                key,
+                result_record,
+                disk_key=self._disk_cache_key(key),
+                content=content,
+            )
+        else:
+            self.cache[key] = result_record
+
     @sync_compatible
     async def _read(self, key: str, holder: str) -> "ResultRecord[Any]":
         """
@@ -571,14 +621,21 @@ class ResultStore(BaseModel):
 
         resolved_key_path = self._resolved_key_path(key)
 
-        if resolved_key_path in self.cache:
-            cached_result: ResultRecord[Any] = self.cache[resolved_key_path]
+        if isinstance(self.cache, ResultRecordCache):
+            cached_result = self.cache.lookup(
+                resolved_key_path, disk_key=self._disk_cache_key(resolved_key_path)
+            )
+        else:
+            cached_result = self.cache.get(resolved_key_path)
+        if cached_result is not None:
             await emit_result_read_event(self, resolved_key_path, cached=True)
             return cached_result
 
         if self.result_storage is None:
             self.result_storage = await aget_default_result_storage()
 
+        content = None
+
         if self.metadata_storage is not None:
             metadata_content = await call_explicitly_async_block_method(
                 self.metadata_storage,
@@ -615,7 +672,7 @@ class ResultStore(BaseModel):
             await emit_result_read_event(self, resolved_key_path)
 
         if self.cache_result_in_memory:
-            self.cache[resolved_key_path] = result_record
+            self._cache_result_record(resolved_key_path, result_record, content)
         return result_record
 
     def read(
@@ -783,6 +840,7 @@ class ResultStore(BaseModel):
         if self.result_storage is None:
             self.result_storage = await aget_default_result_storage()
 
+        content = None
         # If metadata storage is configured, write result and metadata separately
         if self.metadata_storage is not None:
             await call_explicitly_async_block_method(
@@ -800,15 +858,16 @@ class ResultStore(BaseModel):
             await emit_result_write_event(self, result_record.metadata.storage_key)
         # Otherwise, write the result metadata and result together
         else:
+            content = result_record.serialize()
             await call_explicitly_async_block_method(
                 self.result_storage,
                 "write_path",
                 (result_record.metadata.storage_key,),
-                {"content": result_record.serialize()},
+                {"content": content},
             )
             await emit_result_write_event(self, result_record.metadata.storage_key)
         if self.cache_result_in_memory:
-            self.cache[key] = result_record
+            self._cache_result_record(key, result_record, content)
 
     def persist_result_record(
         self, result_record: "ResultRecord[Any]", holder: str | None = None
@@ -1,5 +1,6 @@
+import time
 from datetime import datetime, timedelta, timezone
-from typing import List, Literal, Optional, Union
+from typing import List, Literal, Optional, TypeVar, Union
 from uuid import UUID
 
 from fastapi import Body, Depends, HTTPException, Path, status
@@ -12,6 +13,8 @@ from prefect.server.concurrency.lease_storage import (
     ConcurrencyLimitLeaseMetadata,
     get_concurrency_lease_storage,
 )
+from prefect.server.concurrency.ledger import get_slot_ledger
+from prefect.server.concurrency.waiters import get_slot_waiters
 from prefect.server.database import PrefectDBInterface, provide_database_interface
 from prefect.server.schemas import actions
 from prefect.server.utilities.schemas import PrefectBaseModel
@@ -21,6 +24,40 @@ router: PrefectRouter = PrefectRouter(
     prefix="/v2/concurrency_limits", tags=["Concurrency Limits V2"]
 )
 
+# returned with a 423 response to a request that waited for slots, so that the client
+# can keep its place in line when it asks again
+WAITER_ID_HEADER = "Prefect-Concurrency-Waiter-Id"
+
+# how often a waiting request checks for slots that were released by another server
+# or have decayed, since only releases handled by this server wake waiters
+WAIT_RECHECK_SECONDS = 1.0
+
+WaitSecondsBody = Body(
+    0,
+    ge=0,
+    le=30,
+    description=(
+        "The number of seconds to wait for slots to become available before "
+        "responding with a 423. Waiting requests are granted slots in the order "
+        "they arrived."
+    ),
+)
+WaiterIdBody = Body(
+    None,
+    description=(
+        "The waiter ID returned by a previous request that waited for the same "
+        "slots, used to keep that request's place in line."
+    ),
+)
+
+Limit = TypeVar("Limit", bound=PrefectBaseModel)
+
+
+def _with_slot_counts(limit: Limit) -> Limit:
+    # slot counts held by the slot ledger may not have been written to the database
+    ledger = get_slot_ledger()
+    return ledger.with_slot_counts(limit) if ledger else limit
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_concurrency_limit_v2(
@@ -67,7 +104,9 @@ async def read_concurrency_limit_v2(
             status_code=status.HTTP_404_NOT_FOUND, detail="Concurrency Limit not found"
         )
 
-    return schemas.responses.GlobalConcurrencyLimitResponse.model_validate(model)
+    return _with_slot_counts(
+        schemas.responses.GlobalConcurrencyLimitResponse.model_validate(model)
+    )
 
 
 @router.post("/filter")
@@ -86,7 +125,9 @@ async def read_all_concurrency_limits_v2(
         )
 
     return [
-        schemas.responses.GlobalConcurrencyLimitResponse.model_validate(limit)
+        _with_slot_counts(
+            schemas.responses.GlobalConcurrencyLimitResponse.model_validate(limit)
+        )
         for limit in concurrency_limits
     ]
 
@@ -169,7 +210,7 @@ async def _acquire_concurrency_slots(
     mode: Literal["concurrency", "rate_limit"],
 ) -> tuple[list[schemas.core.ConcurrencyLimitV2], bool]:
     limits = [
-        schemas.core.ConcurrencyLimitV2.model_validate(limit)
+        _with_slot_counts(schemas.core.ConcurrencyLimitV2.model_validate(limit))
         for limit in (
             await models.concurrency_limits_v2.bulk_read_concurrency_limits(
                 session=session, names=names
@@ -248,6 +289,68 @@ async def _generate_concurrency_locked_response(
     )
 
 
+async def _acquire_concurrency_slots_in_turn(
+    db: PrefectDBInterface,
+    names: List[str],
+    slots: int,
+    mode: Literal["concurrency", "rate_limit"],
+    wait_seconds: float,
+    waiter_id: Optional[UUID],
+) -> list[schemas.core.ConcurrencyLimitV2]:
+    """
+    Waits up to `wait_seconds` for the requested slots, taking them only once every
+    request that started waiting on the same limits earlier has been served.
+
+    Raises a 423 carrying the waiter ID if the slots were not acquired in time.
+    """
+    async with db.session_context() as session:
+        limits = await models.concurrency_limits_v2.bulk_read_concurrency_limits(
+            session=session, names=names
+        )
+
+    waiters = get_slot_waiters()
+    waiter = waiters.join(
+        [limit.id for limit in limits if bool(limit.active)], waiter_id=waiter_id
+    )
+    deadline = time.monotonic() + wait_seconds
+
+    try:
+        while True:
+            if waiters.is_next(waiter):
+                async with db.session_context(
+                    begin_transaction=True, with_for_update=True
+                ) as session:
+                    acquired_limits, acquired = await _acquire_concurrency_slots(
+                        session=session,
+                        names=names,
+                        slots=slots,
+                        mode=mode,
+                    )
+                if acquired:
+                    waiters.leave(waiter)
+                    return acquired_limits
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await waiters.wait(waiter, timeout=min(remaining, WAIT_RECHECK_SECONDS))
+    except HTTPException:
+        waiters.leave(waiter)
+        raise
+    except BaseException:
+        waiters.hold(waiter)
+        raise
+
+    waiters.hold(waiter)
+    raise HTTPException(
+        status_code=status.HTTP_423_LOCKED,
+        headers={
+            "Retry-After": "0",
+            WAITER_ID_HEADER: str(waiter.id),
+        },
+    )
+
+
 @router.post("/increment", status_code=status.HTTP_200_OK)
 async def bulk_increment_active_slots(
     slots: int = Body(..., gt=0),
@@ -257,15 +360,30 @@ async def bulk_increment_active_slots(
         None,
         deprecated="Limits must be explicitly created before acquiring concurrency slots.",
     ),
+    wait_seconds: float = WaitSecondsBody,
+    waiter_id: Optional[UUID] = WaiterIdBody,
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[MinimalConcurrencyLimitResponse]:
-    async with db.session_context(begin_transaction=True) as session:
-        acquired_limits, acquired = await _acquire_concurrency_slots(
-            session=session,
+    if wait_seconds > 0:
+        acquired_limits = await _acquire_concurrency_slots_in_turn(
+            db=db,
             names=names,
             slots=slots,
             mode=mode,
+            wait_seconds=wait_seconds,
+            waiter_id=waiter_id,
         )
+        acquired = True
+    else:
+        async with db.session_context(
+            begin_transaction=True, with_for_update=True
+        ) as session:
+            acquired_limits, acquired = await _acquire_concurrency_slots(
+                session=session,
+                names=names,
+                slots=slots,
+                mode=mode,
+            )
 
     if acquired:
         return [
@@ -294,15 +412,30 @@ async def bulk_increment_active_slots_with_lease(
         le=60 * 60 * 24,  # 1 day
         description="The duration of the lease in seconds.",
     ),
+    wait_seconds: float = WaitSecondsBody,
+    waiter_id: Optional[UUID] = WaiterIdBody,
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> ConcurrencyLimitWithLeaseResponse:
-    async with db.session_context(begin_transaction=True) as session:
-        acquired_limits, acquired = await _acquire_concurrency_slots(
-            session=session,
+    if wait_seconds > 0:
+        acquired_limits = await _acquire_concurrency_slots_in_turn(
+            db=db,
             names=names,
             slots=slots,
             mode=mode,
+            wait_seconds=wait_seconds,
+            waiter_id=waiter_id,
         )
+        acquired = True
+    else:
+        async with db.session_context(
+            begin_transaction=True, with_for_update=True
+        ) as session:
+            acquired_limits, acquired = await _acquire_concurrency_slots(
+                session=session,
+                names=names,
+                slots=slots,
+                mode=mode,
+            )
 
     if acquired:
         lease_storage = get_concurrency_lease_storage()
@@ -341,7 +474,9 @@ async def bulk_decrement_active_slots(
     ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[MinimalConcurrencyLimitResponse]:
-    async with db.session_context(begin_transaction=True) as session:
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
         limits = await models.concurrency_limits_v2.bulk_read_concurrency_limits(
             session=session, names=names
         )
@@ -349,13 +484,16 @@ async def bulk_decrement_active_slots(
         if not limits:
             return []
 
+        released_limit_ids = [limit.id for limit in limits if bool(limit.active)]
         await models.concurrency_limits_v2.bulk_decrement_active_slots(
             session=session,
-            concurrency_limit_ids=[limit.id for limit in limits if bool(limit.active)],
+            concurrency_limit_ids=released_limit_ids,
             slots=slots,
             occupancy_seconds=occupancy_seconds,
         )
 
+    get_slot_waiters().notify(released_limit_ids)
+
     return [
         MinimalConcurrencyLimitResponse(
             id=limit.id, name=str(limit.name), limit=limit.limit
@@ -388,6 +526,41 @@ async def bulk_decrement_active_slots_with_lease(
             occupancy_seconds=occupancy_seconds,
         )
     await lease_storage.revoke_lease(lease_id)
+    get_slot_waiters().notify(lease.resource_ids)
+
+
+@router.post("/leases/renew")
+async def renew_concurrency_leases(
+    lease_ids: List[UUID] = Body(
+        ...,
+        description="The IDs of the leases to renew.",
+        embed=True,
+    ),
+    lease_duration: float = Body(
+        300,  # 5 minutes
+        ge=60,  # 1 minute
+        le=60 * 60 * 24,  # 1 day
+        description="The duration of the leases in seconds.",
+        embed=True,
+    ),
+) -> List[UUID]:
+    """
+    Renews many leases at once, such as every lease held by a client process.
+
+    Returns the IDs of the leases that were renewed. Leases that were not found are
+    left out, so that the client can stop relying on the slots they held.
+    """
+    lease_storage = get_concurrency_lease_storage()
+    renewed_lease_ids: List[UUID] = []
+    for lease_id in dict.fromkeys(lease_ids):
+        if not await lease_storage.read_lease(lease_id):
+            continue
+        await lease_storage.renew_lease(
+            lease_id=lease_id,
+            ttl=timedelta(seconds=lease_duration),
+        )
+        renewed_lease_ids.append(lease_id)
+    return renewed_lease_ids
 
 
 @router.post("/leases/{lease_id}/renew", status_code=status.HTTP_204_NO_CONTENT)
@@ -15,6 +15,7 @@ from packaging.version import Version
 from starlette.requests import Request
 
 from prefect.server import schemas
+from prefect.server.utilities import streaming
 from prefect.settings import PREFECT_API_DEFAULT_LIMIT
 
 
@@ -100,6 +101,22 @@ class EnforceMinimumAPIVersion:
         )
 
 
+def _validate_limit(limit: Optional[int]) -> int:
+    default_limit = PREFECT_API_DEFAULT_LIMIT.value()
+    limit = limit if limit is not None else default_limit
+    if not limit >= 0:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid limit: must be greater than or equal to 0.",
+        )
+    if limit > default_limit:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid limit: must be less than or equal to {default_limit}.",
+        )
+    return limit
+
+
 def LimitBody() -> Any:
     """
     A `fastapi.Depends` factory for pulling a `limit: int` parameter from the
@@ -112,18 +129,47 @@ def LimitBody() -> Any:
             description="Defaults to PREFECT_API_DEFAULT_LIMIT if not provided.",
         ),
     ):
-        default_limit = PREFECT_API_DEFAULT_LIMIT.value()
-        limit = limit if limit is not None else default_limit
-        if not limit >= 0:
+        return _validate_limit(limit)
+
+    return Depends(get_limit)
+
+
+def accepts_ndjson(
+    accept: Optional[str] = Header(None, include_in_schema=False),
+) -> bool:
+    """
+    Whether the client has requested results streamed as newline-delimited JSON.
+    """
+    return streaming.accepts_ndjson(accept)
+
+
+def StreamableLimitBody() -> Any:
+    """
+    A `fastapi.Depends` factory for pulling an optional `limit` parameter from the
+    request body of an endpoint that can stream its results.
+
+    Streamed (`application/x-ndjson`) responses are not held in memory, so they are
+    not bound by PREFECT_API_DEFAULT_LIMIT and return every matching row when no
+    limit is given. Other requests are limited as with `LimitBody`.
+    """
+
+    def get_limit(
+        limit: Optional[int] = Body(
+            None,
+            description=(
+                "Defaults to PREFECT_API_DEFAULT_LIMIT if not provided. Responses"
+                " streamed as newline-delimited JSON are unlimited by default."
+            ),
+        ),
+        stream: bool = Depends(accepts_ndjson),
+    ) -> Optional[int]:
+        if not stream:
+            return _validate_limit(limit)
+        if limit is not None and not limit >= 0:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Invalid limit: must be greater than or equal to 0.",
             )
-        if limit > default_limit:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid limit: must be less than or equal to {default_limit}.",
-            )
         return limit
 
     return Depends(get_limit)
@@ -3,12 +3,12 @@ Routes for interacting with Deployment objects.
 """
 
 import datetime
-from typing import List, Optional
+from typing import Any, AsyncGenerator, List, Optional, Sequence
 from uuid import UUID
 
 import jsonschema.exceptions
 import sqlalchemy as sa
-from fastapi import Body, Depends, HTTPException, Path, Response, status
+from fastapi import Body, Depends, Header, HTTPException, Path, Response, status
 from starlette.background import BackgroundTasks
 
 import prefect.server.api.dependencies as dependencies
@@ -24,7 +24,9 @@ from prefect.server.exceptions import MissingVariableError, ObjectNotFoundError
 from prefect.server.models.deployments import mark_deployments_ready
 from prefect.server.models.workers import DEFAULT_AGENT_WORK_POOL_NAME
 from prefect.server.schemas.responses import DeploymentPaginationResponse
+from prefect.server.utilities.http import etag_matches, not_modified, weak_etag
 from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.streaming import ndjson_response
 from prefect.types import DateTime
 from prefect.types._datetime import now
 from prefect.utilities.schema_tools.hydration import (
@@ -391,13 +393,26 @@ async def read_deployment_by_name(
 
 @router.get("/{id:uuid}")
 async def read_deployment(
+    response: Response,
     deployment_id: UUID = Path(..., description="The deployment id", alias="id"),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> schemas.responses.DeploymentResponse:
     """
     Get a deployment by id.
+
+    Responses carry an `ETag` header; requests with a matching `If-None-Match`
+    header receive a `304 Not Modified` response without the deployment.
     """
     async with db.session_context() as session:
+        if if_none_match:
+            updated = await models.deployments.read_deployment_updated(
+                session=session, deployment_id=deployment_id
+            )
+            etag = weak_etag(deployment_id, updated)
+            if updated and etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
         deployment = await models.deployments.read_deployment(
             session=session, deployment_id=deployment_id
         )
@@ -405,6 +420,9 @@ async def read_deployment(
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Deployment not found"
             )
+        response.headers["ETag"] = weak_etag(
+            deployment.id, models.deployments.deployment_updated(deployment)
+        )
         return schemas.responses.DeploymentResponse.model_validate(
             deployment, from_attributes=True
         )
@@ -412,7 +430,7 @@ async def read_deployment(
 
 @router.post("/filter")
 async def read_deployments(
-    limit: int = dependencies.LimitBody(),
+    limit: Optional[int] = dependencies.StreamableLimitBody(),
     offset: int = Body(0, ge=0),
     flows: Optional[schemas.filters.FlowFilter] = None,
     flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
@@ -423,11 +441,41 @@ async def read_deployments(
     sort: schemas.sorting.DeploymentSort = Body(
         schemas.sorting.DeploymentSort.NAME_ASC
     ),
+    ndjson: bool = Depends(dependencies.accepts_ndjson),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.DeploymentResponse]:
     """
     Query for deployments.
+
+    Send `Accept: application/x-ndjson` to stream the results as newline-delimited
+    JSON, one deployment per line. Streamed results are unlimited unless a `limit`
+    is provided.
     """
+    if ndjson:
+
+        async def chunks() -> AsyncGenerator[Sequence[Any], None]:
+            async with db.session_context() as session:
+                async for chunk in models.deployments.stream_deployments(
+                    session=session,
+                    offset=offset,
+                    sort=sort,
+                    limit=limit,
+                    flow_filter=flows,
+                    flow_run_filter=flow_runs,
+                    task_run_filter=task_runs,
+                    deployment_filter=deployments,
+                    work_pool_filter=work_pools,
+                    work_queue_filter=work_pool_queues,
+                ):
+                    yield chunk
+
+        return ndjson_response(
+            chunks(),
+            lambda deployment: schemas.responses.DeploymentResponse.model_validate(
+                deployment, from_attributes=True
+            ),
+        )
+
     async with db.session_context() as session:
         response = await models.deployments.read_deployments(
             session=session,
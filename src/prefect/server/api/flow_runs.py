@@ -5,7 +5,18 @@ Routes for interacting with flow run objects.
 import csv
 import datetime
 import io
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import zlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+)
 from uuid import UUID
 
 import orjson
@@ -14,6 +25,7 @@ from fastapi import (
     BackgroundTasks,
     Body,
     Depends,
+    Header,
     HTTPException,
     Path,
     Query,
@@ -21,36 +33,49 @@ from fastapi import (
     status,
 )
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy.exc import IntegrityError
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.logging import get_logger
+from prefect.server.api.middleware import accepts_content_encoding
 from prefect.server.api.run_history import run_history
 from prefect.server.api.validation import validate_job_variables_for_deployment_flow_run
 from prefect.server.api.workers import WorkerLookups
 from prefect.server.database import PrefectDBInterface, provide_database_interface
-from prefect.server.exceptions import FlowRunGraphTooLarge
+from prefect.server.exceptions import FlowRunGraphTooLarge, ObjectNotFoundError
 from prefect.server.models.flow_runs import (
     DependencyResult,
     read_flow_run_graph,
+    read_flow_run_graph_delta,
 )
 from prefect.server.orchestration import dependencies as orchestration_dependencies
 from prefect.server.orchestration.policies import (
     FlowRunOrchestrationPolicy,
     TaskRunOrchestrationPolicy,
 )
-from prefect.server.schemas.graph import Graph
+from prefect.server.schemas.graph import Graph, GraphDelta
 from prefect.server.schemas.responses import (
+    FlowRunBulkDeleteResponse,
+    FlowRunCursorPaginationResponse,
+    FlowRunOrchestrationResult,
     FlowRunPaginationResponse,
     OrchestrationResult,
 )
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.http import etag_matches, not_modified, weak_etag
+from prefect.server.utilities.pagination import (
+    InvalidCursorError,
+    KeysetPosition,
+    next_cursor,
+)
+from prefect.server.utilities.server import PrefectJSONResponse, PrefectRouter
+from prefect.server.utilities.streaming import NDJSON_MEDIA_TYPE, ndjson_response
 from prefect.types import DateTime
 from prefect.types._datetime import earliest_possible_datetime, now
 from prefect.utilities import schema_tools
+from prefect.utilities.collections import batched_iterable
 
 if TYPE_CHECKING:
     import logging
@@ -59,6 +84,14 @@ logger: "logging.Logger" = get_logger("server.api")
 
 router: PrefectRouter = PrefectRouter(prefix="/flow_runs", tags=["Flow Runs"])
 
+# The maximum number of flow runs a single bulk request may update or delete
+FLOW_RUN_BULK_OPERATION_LIMIT = 1000
+
+# Bulk requests update or delete flow runs in transactions of this many flow runs,
+# so that row locks are held only briefly and completed batches are kept if a later
+# batch fails
+FLOW_RUN_BULK_OPERATION_BATCH_SIZE = 50
+
 
 @router.post("/")
 async def create_flow_run(
@@ -319,18 +352,32 @@ async def flow_run_history(
 
 @router.get("/{id:uuid}")
 async def read_flow_run(
+    response: Response,
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> schemas.responses.FlowRunResponse:
     """
     Get a flow run by id.
+
+    Responses carry an `ETag` header; requests with a matching `If-None-Match`
+    header receive a `304 Not Modified` response without the flow run.
     """
     async with db.session_context() as session:
+        if if_none_match:
+            updated = await models.flow_runs.read_flow_run_updated(
+                session=session, flow_run_id=flow_run_id
+            )
+            etag = weak_etag(flow_run_id, updated)
+            if updated and etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
         flow_run = await models.flow_runs.read_flow_run(
             session=session, flow_run_id=flow_run_id
         )
         if not flow_run:
             raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Flow run not found")
+        response.headers["ETag"] = weak_etag(flow_run.id, flow_run.updated)
         return schemas.responses.FlowRunResponse.model_validate(
             flow_run, from_attributes=True
         )
@@ -376,6 +423,30 @@ async def read_flow_run_graph_v2(
             )
 
 
+@router.get("/{id:uuid}/graph-v2/delta", tags=["Flow Run Graph"])
+async def read_flow_run_graph_v2_delta(
+    flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
+    watermark: Optional[datetime.datetime] = Query(
+        default=None,
+        description=(
+            "The watermark returned by a previous request. Only nodes that changed"
+            " after it are included."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> GraphDelta:
+    """
+    Get the tasks and subflow runs of the given flow run's graph that changed after
+    a watermark, or all of them if no watermark is given
+    """
+    async with db.session_context() as session:
+        return await read_flow_run_graph_delta(
+            session=session,
+            flow_run_id=flow_run_id,
+            watermark=watermark,
+        )
+
+
 @router.post("/{id:uuid}/resume")
 async def resume_flow_run(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
@@ -526,10 +597,10 @@ async def resume_flow_run(
         return orchestration_result
 
 
-@router.post("/filter", response_class=ORJSONResponse)
+@router.post("/filter")
 async def read_flow_runs(
     sort: schemas.sorting.FlowRunSort = Body(schemas.sorting.FlowRunSort.ID_DESC),
-    limit: int = dependencies.LimitBody(),
+    limit: Optional[int] = dependencies.StreamableLimitBody(),
     offset: int = Body(0, ge=0),
     flows: Optional[schemas.filters.FlowFilter] = None,
     flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
@@ -537,11 +608,41 @@ async def read_flow_runs(
     deployments: Optional[schemas.filters.DeploymentFilter] = None,
     work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
     work_pool_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+    ndjson: bool = Depends(dependencies.accepts_ndjson),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.FlowRunResponse]:
     """
     Query for flow runs.
+
+    Send `Accept: application/x-ndjson` to stream the results as newline-delimited
+    JSON, one flow run per line. Streamed results are unlimited unless a `limit` is
+    provided.
     """
+    if ndjson:
+
+        async def chunks() -> AsyncGenerator[Sequence[Any], None]:
+            async with db.session_context() as session:
+                async for chunk in models.flow_runs.stream_flow_runs(
+                    session=session,
+                    flow_filter=flows,
+                    flow_run_filter=flow_runs,
+                    task_run_filter=task_runs,
+                    deployment_filter=deployments,
+                    work_pool_filter=work_pools,
+                    work_queue_filter=work_pool_queues,
+                    offset=offset,
+                    limit=limit,
+                    sort=sort,
+                ):
+                    yield chunk
+
+        return ndjson_response(
+            chunks(),
+            lambda fr: schemas.responses.FlowRunResponse.model_validate(
+                fr, from_attributes=True
+            ),
+        )
+
     async with db.session_context() as session:
         db_flow_runs = await models.flow_runs.read_flow_runs(
             session=session,
@@ -556,17 +657,18 @@ async def read_flow_runs(
             sort=sort,
         )
 
-        # Instead of relying on fastapi.encoders.jsonable_encoder to convert the
-        # response to JSON, we do so more efficiently ourselves.
-        # In particular, the FastAPI encoder is very slow for large, nested objects.
+        # Instead of letting FastAPI validate and encode the response, return the
+        # validated models directly so they are serialized straight to JSON bytes.
+        # In particular, FastAPI's encoding is slow for large, nested objects.
         # See: https://github.com/tiangolo/fastapi/issues/1224
-        encoded = [
-            schemas.responses.FlowRunResponse.model_validate(
-                fr, from_attributes=True
-            ).model_dump(mode="json")
-            for fr in db_flow_runs
-        ]
-        return ORJSONResponse(content=encoded)
+        return PrefectJSONResponse(
+            content=[
+                schemas.responses.FlowRunResponse.model_validate(
+                    fr, from_attributes=True
+                )
+                for fr in db_flow_runs
+            ]
+        )
 
 
 @router.delete("/{id:uuid}", status_code=status.HTTP_204_NO_CONTENT)
@@ -586,19 +688,72 @@ async def delete_flow_run(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Flow run not found"
         )
-    background_tasks.add_task(delete_flow_run_logs, db, flow_run_id)
+    background_tasks.add_task(delete_flow_run_logs, db, [flow_run_id])
 
 
-async def delete_flow_run_logs(db: PrefectDBInterface, flow_run_id: UUID) -> None:
+async def delete_flow_run_logs(
+    db: PrefectDBInterface, flow_run_ids: List[UUID]
+) -> None:
     async with db.session_context(begin_transaction=True) as session:
         await models.logs.delete_logs(
             session=session,
             log_filter=schemas.filters.LogFilter(
-                flow_run_id=schemas.filters.LogFilterFlowRunId(any_=[flow_run_id])
+                flow_run_id=schemas.filters.LogFilterFlowRunId(any_=flow_run_ids)
             ),
         )
 
 
+@router.post("/bulk_delete")
+async def bulk_delete_flow_runs(
+    background_tasks: BackgroundTasks,
+    limit: int = Body(
+        FLOW_RUN_BULK_OPERATION_LIMIT,
+        ge=1,
+        le=FLOW_RUN_BULK_OPERATION_LIMIT,
+        description="The maximum number of flow runs to delete.",
+    ),
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_pool_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> FlowRunBulkDeleteResponse:
+    """
+    Delete the flow runs matching the given filters, up to `limit` at a time.
+
+    Flow runs are deleted in batches, each in its own transaction. Repeat the
+    request until fewer than `limit` flow runs are deleted to delete every
+    matching flow run.
+    """
+    async with db.session_context() as session:
+        flow_run_ids = await models.flow_runs.read_flow_run_ids(
+            session=session,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            work_pool_filter=work_pools,
+            work_queue_filter=work_pool_queues,
+            limit=limit,
+        )
+
+    deleted: List[UUID] = []
+    for batch in batched_iterable(flow_run_ids, FLOW_RUN_BULK_OPERATION_BATCH_SIZE):
+        async with db.session_context(begin_transaction=True) as session:
+            for flow_run_id in batch:
+                if await models.flow_runs.delete_flow_run(
+                    session=session, flow_run_id=flow_run_id
+                ):
+                    deleted.append(flow_run_id)
+
+    if deleted:
+        background_tasks.add_task(delete_flow_run_logs, db, deleted)
+
+    return FlowRunBulkDeleteResponse(deleted=deleted)
+
+
 @router.post("/{id:uuid}/set_state")
 async def set_flow_run_state(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
@@ -650,6 +805,104 @@ async def set_flow_run_state(
     return orchestration_result
 
 
+@router.post("/bulk_set_state")
+async def bulk_set_flow_run_state(
+    state: schemas.actions.StateCreate = Body(..., description="The intended state."),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transitions. If True, orchestration rules are not applied."
+        ),
+    ),
+    limit: int = Body(
+        FLOW_RUN_BULK_OPERATION_LIMIT,
+        ge=1,
+        le=FLOW_RUN_BULK_OPERATION_LIMIT,
+        description="The maximum number of flow runs to set the state of.",
+    ),
+    after: Optional[UUID] = Body(
+        None,
+        description=(
+            "Only set the state of flow runs whose id is greater than this one, to"
+            " resume after the last flow run of a previous request."
+        ),
+    ),
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_pool_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    flow_policy: type[FlowRunOrchestrationPolicy] = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
+    api_version: str = Depends(dependencies.provide_request_api_version),
+) -> List[FlowRunOrchestrationResult]:
+    """
+    Set the state of the flow runs matching the given filters, up to `limit` at a
+    time, invoking any orchestration rules.
+
+    Each state is orchestrated independently, as if it were set with
+    `POST /flow_runs/{id}/set_state`, and flow runs are updated in batches, each in
+    its own transaction. An orchestration result is returned for every matching
+    flow run, in order of id; flow runs deleted before their state could be set are
+    aborted.
+    """
+    orchestration_parameters.update({"api-version": api_version})
+
+    async with db.session_context() as session:
+        flow_run_ids = await models.flow_runs.read_flow_run_ids(
+            session=session,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            work_pool_filter=work_pools,
+            work_queue_filter=work_pool_queues,
+            limit=limit,
+            after=after,
+        )
+
+    results: List[FlowRunOrchestrationResult] = []
+    for batch in batched_iterable(flow_run_ids, FLOW_RUN_BULK_OPERATION_BATCH_SIZE):
+        async with db.session_context(
+            begin_transaction=True, with_for_update=True
+        ) as session:
+            for flow_run_id in batch:
+                try:
+                    result = await models.flow_runs.set_flow_run_state(
+                        session=session,
+                        flow_run_id=flow_run_id,
+                        state=schemas.states.State.model_validate(state),
+                        force=force,
+                        flow_policy=flow_policy,
+                        orchestration_parameters=dict(orchestration_parameters),
+                    )
+                except ObjectNotFoundError:
+                    result = OrchestrationResult(
+                        state=None,
+                        status=schemas.responses.SetStateStatus.ABORT,
+                        details=schemas.responses.StateAbortDetails(
+                            reason=f"Flow run {flow_run_id} not found"
+                        ),
+                    )
+                results.append(
+                    FlowRunOrchestrationResult(
+                        flow_run_id=flow_run_id,
+                        state=result.state,
+                        status=result.status,
+                        details=result.details,
+                    )
+                )
+
+    return results
+
+
 @router.post("/{id:uuid}/input", status_code=status.HTTP_201_CREATED)
 async def create_flow_run_input(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
@@ -756,7 +1009,7 @@ async def delete_flow_run_input(
             )
 
 
-@router.post("/paginate", response_class=ORJSONResponse)
+@router.post("/paginate")
 async def paginate_flow_runs(
     sort: schemas.sorting.FlowRunSort = Body(schemas.sorting.FlowRunSort.ID_DESC),
     limit: int = dependencies.LimitBody(),
@@ -798,14 +1051,12 @@ async def paginate_flow_runs(
             work_queue_filter=work_pool_queues,
         )
 
-        # Instead of relying on fastapi.encoders.jsonable_encoder to convert the
-        # response to JSON, we do so more efficiently ourselves.
-        # In particular, the FastAPI encoder is very slow for large, nested objects.
+        # Instead of letting FastAPI validate and encode the response, return the
+        # validated model directly so it is serialized straight to JSON bytes.
+        # In particular, FastAPI's encoding is slow for large, nested objects.
         # See: https://github.com/tiangolo/fastapi/issues/1224
         results = [
-            schemas.responses.FlowRunResponse.model_validate(
-                run, from_attributes=True
-            ).model_dump(mode="json")
+            schemas.responses.FlowRunResponse.model_validate(run, from_attributes=True)
             for run in runs
         ]
 
@@ -815,58 +1066,165 @@ async def paginate_flow_runs(
             limit=limit,
             pages=(count + limit - 1) // limit,
             page=page,
-        ).model_dump(mode="json")
+        )
 
-        return ORJSONResponse(content=response)
+        return PrefectJSONResponse(content=response)
+
+
+@router.post("/filter/cursor")
+async def read_flow_runs_with_cursor(
+    sort: schemas.sorting.FlowRunSort = Body(schemas.sorting.FlowRunSort.ID_DESC),
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor returned with the previous page of results."
+    ),
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_pool_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> FlowRunCursorPaginationResponse:
+    """
+    Query for flow runs, paginated with a cursor.
+
+    Each page resumes after the last flow run of the previous page rather than
+    skipping an offset, so reading deep pages is as fast as reading the first one.
+    The same filters and sort must be provided with every page of a query.
+    """
+    keyset = sort.as_keyset()
+    try:
+        after = keyset.decode_cursor(sort.value, cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+    async with db.session_context() as session:
+        runs = await models.flow_runs.read_flow_runs(
+            session=session,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            work_pool_filter=work_pools,
+            work_queue_filter=work_pool_queues,
+            limit=limit + 1,
+            sort=sort,
+            after=after,
+        )
+
+        results = [
+            schemas.responses.FlowRunResponse.model_validate(run, from_attributes=True)
+            for run in runs[:limit]
+        ]
+
+        response = FlowRunCursorPaginationResponse(
+            results=results,
+            limit=limit,
+            next_cursor=next_cursor(keyset, sort.value, runs, limit),
+        )
+
+        return PrefectJSONResponse(content=response)
 
 
 FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT = 1000
 
+# Rows are buffered and written to the response in chunks of at least this size
+FLOW_RUN_LOGS_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Compresses log text nearly as well as the maximum level at a fraction of the cost
+FLOW_RUN_LOGS_DOWNLOAD_COMPRESSION_LEVEL = 6
+
+FLOW_RUN_LOGS_DOWNLOAD_COLUMNS = [
+    "timestamp",
+    "level",
+    "flow_run_id",
+    "task_run_id",
+    "message",
+]
+
 
 @router.get("/{id:uuid}/logs/download")
 async def download_logs(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
+    log_format: Literal["csv", "ndjson"] = Query(
+        "csv",
+        alias="format",
+        description="Download logs as CSV or as newline-delimited JSON.",
+    ),
+    accept_encoding: Optional[str] = Header(None, include_in_schema=False),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> StreamingResponse:
     """
-    Download all flow run logs as a CSV file, collecting all logs until there are no more logs to retrieve.
+    Download all flow run logs as a CSV or newline-delimited JSON file, collecting
+    all logs until there are no more logs to retrieve.
+
+    The download is gzip-compressed as it is streamed if the client accepts gzip.
     """
     async with db.session_context() as session:
         flow_run = await models.flow_runs.read_flow_run(
             session=session, flow_run_id=flow_run_id
         )
 
-        if not flow_run:
-            raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Flow run not found")
+    if not flow_run:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Flow run not found")
 
-        async def generate():
-            data = io.StringIO()
-            csv_writer = csv.writer(data)
-            csv_writer.writerow(
-                ["timestamp", "level", "flow_run_id", "task_run_id", "message"]
+    compress = accepts_content_encoding(accept_encoding, "gzip")
+
+    async def generate() -> AsyncGenerator[bytes, None]:
+        buffer = bytearray()
+        csv_buffer = io.StringIO()
+        csv_writer = csv.writer(csv_buffer)
+
+        def write_csv_rows(rows: Iterable[Iterable[Any]]) -> None:
+            csv_writer.writerows(rows)
+            buffer.extend(csv_buffer.getvalue().encode())
+            csv_buffer.seek(0)
+            csv_buffer.truncate(0)
+
+        if log_format == "csv":
+            write_csv_rows([FLOW_RUN_LOGS_DOWNLOAD_COLUMNS])
+
+        compressor = (
+            zlib.compressobj(
+                FLOW_RUN_LOGS_DOWNLOAD_COMPRESSION_LEVEL,
+                zlib.DEFLATED,
+                # write a gzip header and trailer
+                zlib.MAX_WBITS | 16,
             )
+            if compress
+            else None
+        )
 
-            offset = 0
-            limit = FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT
+        def flush() -> bytes:
+            data = compressor.compress(buffer) if compressor else bytes(buffer)
+            buffer.clear()
+            return data
 
+        sort = schemas.sorting.LogSort.TIMESTAMP_ASC
+        keyset = sort.as_keyset()
+        after = KeysetPosition()
+
+        async with db.session_context() as session:
             while True:
                 results = await models.logs.read_logs(
                     session=session,
                     log_filter=schemas.filters.LogFilter(
                         flow_run_id={"any_": [flow_run_id]}
                     ),
-                    offset=offset,
-                    limit=limit,
-                    sort=schemas.sorting.LogSort.TIMESTAMP_ASC,
+                    limit=FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT,
+                    sort=sort,
+                    after=after,
+                    columns=FLOW_RUN_LOGS_DOWNLOAD_COLUMNS,
                 )
 
                 if not results:
                     break
 
-                offset += limit
+                after = keyset.position_of(results[-1])
 
-                for log in results:
-                    csv_writer.writerow(
+                if log_format == "csv":
+                    write_csv_rows(
                         [
                             log.timestamp,
                             log.level,
@@ -874,19 +1232,49 @@ async def download_logs(
                             log.task_run_id,
                             log.message,
                         ]
+                        for log in results
                     )
-                    data.seek(0)
-                    yield data.read()
-                    data.seek(0)
-                    data.truncate(0)
-
-        return StreamingResponse(
-            generate(),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename={flow_run.name}-logs.csv"
-            },
-        )
+                else:
+                    buffer.extend(
+                        b"\n".join(
+                            orjson.dumps(
+                                {
+                                    "timestamp": log.timestamp,
+                                    "level": log.level,
+                                    "flow_run_id": log.flow_run_id,
+                                    "task_run_id": log.task_run_id,
+                                    "message": log.message,
+                                }
+                            )
+                            for log in results
+                        )
+                    )
+                    buffer.extend(b"\n")
+
+                if len(buffer) >= FLOW_RUN_LOGS_DOWNLOAD_CHUNK_SIZE:
+                    if chunk := flush():
+                        yield chunk
+
+        chunk = flush()
+        if compressor:
+            chunk += compressor.flush()
+        if chunk:
+            yield chunk
+
+    extension, media_type = {
+        "csv": ("csv", "text/csv"),
+        "ndjson": ("ndjson", NDJSON_MEDIA_TYPE),
+    }[log_format]
+    headers = {
+        "Content-Disposition": f"attachment; filename={flow_run.name}-logs.{extension}",
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        # the response is already compressed, so the GZip middleware will pass it
+        # through untouched
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(generate(), media_type=media_type, headers=headers)
 
 
 @router.patch("/{id:uuid}/labels", status_code=status.HTTP_204_NO_CONTENT)
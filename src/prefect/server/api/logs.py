@@ -2,9 +2,9 @@
 Routes for interacting with log objects.
 """
 
-from typing import Optional, Sequence
+from typing import Any, AsyncGenerator, Optional, Sequence
 
-from fastapi import Body, Depends, WebSocket, status
+from fastapi import Body, Depends, HTTPException, WebSocket, status
 from pydantic import TypeAdapter
 from starlette.status import WS_1002_PROTOCOL_ERROR
 
@@ -15,9 +15,12 @@ from prefect.server.logs import stream
 from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
+from prefect.server.schemas.responses import LogCursorPaginationResponse
 from prefect.server.schemas.sorting import LogSort
 from prefect.server.utilities import subscriptions
+from prefect.server.utilities.pagination import InvalidCursorError, next_cursor
 from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.streaming import ndjson_response
 
 router: PrefectRouter = PrefectRouter(prefix="/logs", tags=["Logs"])
 
@@ -42,15 +45,37 @@ logs_adapter: TypeAdapter[Sequence[Log]] = TypeAdapter(Sequence[Log])
 
 @router.post("/filter")
 async def read_logs(
-    limit: int = dependencies.LimitBody(),
+    limit: Optional[int] = dependencies.StreamableLimitBody(),
     offset: int = Body(0, ge=0),
     logs: Optional[LogFilter] = None,
     sort: LogSort = Body(LogSort.TIMESTAMP_ASC),
+    ndjson: bool = Depends(dependencies.accepts_ndjson),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> Sequence[Log]:
     """
     Query for logs.
+
+    Send `Accept: application/x-ndjson` to stream the results as newline-delimited
+    JSON, one log per line. Streamed results are unlimited unless a `limit` is
+    provided.
     """
+    if ndjson:
+
+        async def chunks() -> AsyncGenerator[Sequence[Any], None]:
+            async with db.session_context() as session:
+                async for chunk in models.logs.stream_logs(
+                    session=session,
+                    log_filter=logs,
+                    offset=offset,
+                    limit=limit,
+                    sort=sort,
+                ):
+                    yield chunk
+
+        return ndjson_response(
+            chunks(), lambda log: Log.model_validate(log, from_attributes=True)
+        )
+
     async with db.session_context() as session:
         return logs_adapter.validate_python(
             await models.logs.read_logs(
@@ -59,6 +84,40 @@ async def read_logs(
         )
 
 
+@router.post("/filter/cursor")
+async def read_logs_with_cursor(
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor returned with the previous page of results."
+    ),
+    logs: Optional[LogFilter] = None,
+    sort: LogSort = Body(LogSort.TIMESTAMP_ASC),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> LogCursorPaginationResponse:
+    """
+    Query for logs, paginated with a cursor.
+
+    Each page resumes after the last log of the previous page rather than skipping
+    an offset, so reading deep pages is as fast as reading the first one. The same
+    filters and sort must be provided with every page of a query.
+    """
+    keyset = sort.as_keyset()
+    try:
+        after = keyset.decode_cursor(sort.value, cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+    async with db.session_context() as session:
+        results = await models.logs.read_logs(
+            session=session, log_filter=logs, limit=limit + 1, sort=sort, after=after
+        )
+        return LogCursorPaginationResponse(
+            results=logs_adapter.validate_python(results[:limit]),
+            limit=limit,
+            next_cursor=next_cursor(keyset, sort.value, results, limit),
+        )
+
+
 @router.websocket("/out")
 async def stream_logs_out(websocket: WebSocket) -> None:
     """Serve a WebSocket to stream live logs"""
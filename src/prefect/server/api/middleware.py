@@ -1,16 +1,38 @@
-from typing import Awaitable, Callable
+import zlib
+from typing import Any, Awaitable, Callable, Optional
 
 from fastapi import status
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from prefect import settings
 from prefect.server import models
 from prefect.server.database import provide_database_interface
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 NextMiddlewareFunction = Callable[[Request], Awaitable[Response]]
 
+# Responses with smaller bodies are sent uncompressed, since compressing them saves
+# few bytes and costs more time than it saves
+COMPRESSION_MINIMUM_SIZE = 1000
+GZIP_COMPRESSION_LEVEL = 6
+ZSTD_COMPRESSION_LEVEL = 3
+
+# Content encodings the server can produce, in order of preference; zstd is only
+# offered when the optional `zstandard` package is installed
+SUPPORTED_CONTENT_ENCODINGS: tuple[str, ...] = (
+    ("zstd", "gzip") if zstandard is not None else ("gzip",)
+)
+
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
 
 class CsrfMiddleware(BaseHTTPMiddleware):
     """
@@ -71,3 +93,170 @@ class CsrfMiddleware(BaseHTTPMiddleware):
                     )
 
         return await call_next(request)
+
+
+def _content_encoding_qualities(accept_encoding: str) -> dict[str, float]:
+    """Parse the quality value of each content coding in an `Accept-Encoding`
+    header."""
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, *params = coding.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities
+
+
+def accepts_content_encoding(accept_encoding: Optional[str], encoding: str) -> bool:
+    """
+    Whether a request's `Accept-Encoding` header accepts a content encoding, either
+    by name or through `*`, with a quality value above zero.
+    """
+    if not accept_encoding:
+        return False
+
+    qualities = _content_encoding_qualities(accept_encoding)
+    return qualities.get(encoding, qualities.get("*", 0.0)) > 0
+
+
+def negotiate_content_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Choose the content encoding for a response from a request's `Accept-Encoding`
+    header.
+
+    Returns the supported encoding with the highest quality value, preferring zstd
+    over gzip when both are equally acceptable, or `None` if the response should not
+    be compressed.
+    """
+    if not accept_encoding:
+        return None
+
+    qualities = _content_encoding_qualities(accept_encoding)
+    encoding = max(
+        SUPPORTED_CONTENT_ENCODINGS,
+        key=lambda encoding: qualities.get(encoding, qualities.get("*", 0.0)),
+    )
+    if qualities.get(encoding, qualities.get("*", 0.0)) <= 0:
+        return None
+    return encoding
+
+
+class _Compressor:
+    """
+    Incrementally compresses a response body with gzip or zstd.
+    """
+
+    def __init__(self, encoding: str) -> None:
+        self._compressor: Any
+        if encoding == "zstd":
+            assert zstandard is not None
+            self._compressor = zstandard.ZstdCompressor(
+                level=ZSTD_COMPRESSION_LEVEL
+            ).compressobj()
+            self._sync_flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        else:
+            self._compressor = zlib.compressobj(
+                GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16
+            )
+            self._sync_flush_mode = zlib.Z_SYNC_FLUSH
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """
+        Compress a chunk of the body. Chunks of a streaming body are flushed as they
+        are compressed so that clients can read them as soon as they are sent.
+        """
+        compressed = self._compressor.compress(data)
+        if final:
+            return compressed + self._compressor.flush()
+        return compressed + self._compressor.flush(self._sync_flush_mode)
+
+
+class CompressionMiddleware:
+    """
+    Middleware that compresses response bodies with the best content encoding the
+    client accepts.
+
+    zstd is preferred over gzip when the client accepts both and `zstandard` is
+    installed. Bodies smaller than `minimum_size`, event streams and responses that
+    already set a `Content-Encoding` are sent as is.
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_content_encoding(
+            Headers(scope=scope).get("accept-encoding")
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int) -> None:
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # hold the start message until the first body chunk shows whether the
+            # response will be compressed
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.compressor is None:
+            assert self.start_message is not None
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES)
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding)
+            compressed = self.compressor.compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed))
+            await self._send(self.start_message)
+            await self._send({**message, "body": compressed})
+            return
+
+        await self._send(
+            {**message, "body": self.compressor.compress(body, final=not more_body)}
+        )
@@ -4,7 +4,9 @@ Utilities for querying flow and task run history.
 
 import datetime
 import json
-from typing import TYPE_CHECKING, List, Optional
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import pydantic
 import sqlalchemy as sa
@@ -58,6 +60,39 @@ async def run_history(
             f"Unknown run type {run_type!r}. Expected 'flow_run' or 'task_run'."
         )
 
+    # read the aggregates of settled terminal runs from the rollups if the intervals
+    # line up with their buckets, leaving only the remaining runs to aggregate here
+    rollups = None
+    bucket_seconds = models.run_history_rollups.rollup_bucket_seconds(
+        history_start, history_interval
+    )
+    if bucket_seconds is not None:
+        rollup_criteria = models.run_history_rollups.rollup_filter_criteria(
+            run_type,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            work_pool_filter=work_pools,
+            work_queue_filter=work_queues,
+        )
+        if rollup_criteria is not None:
+            interval_count = min(
+                500,
+                math.ceil(
+                    (history_end - history_start).total_seconds()
+                    / history_interval.total_seconds()
+                ),
+            )
+            rollups = await models.run_history_rollups.read_run_history_rollups(
+                session,
+                run_type,
+                bucket_seconds,
+                start=history_start,
+                end=history_start + interval_count * history_interval,
+                criteria=rollup_criteria,
+            )
+
     # create a CTE for timestamp intervals
     intervals = db.queries.make_timestamp_intervals(
         history_start,
@@ -65,18 +100,22 @@ async def run_history(
         history_interval,
     ).cte("intervals")
 
+    runs_query = sa.select(
+        run_model.id,
+        run_model.expected_start_time,
+        run_model.estimated_run_time,
+        run_model.estimated_start_time_delta,
+        run_model.state_type,
+        run_model.state_name,
+    ).select_from(run_model)
+    if rollups is not None:
+        runs_query = runs_query.where(rollups.remaining_runs)
+
     # apply filters to the flow runs (and related states)
     runs = (
         await run_filter_function(
             db,
-            sa.select(
-                run_model.id,
-                run_model.expected_start_time,
-                run_model.estimated_run_time,
-                run_model.estimated_start_time_delta,
-                run_model.state_type,
-                run_model.state_name,
-            ).select_from(run_model),
+            runs_query,
             flow_filter=flows,
             flow_run_filter=flow_runs,
             task_run_filter=task_runs,
@@ -157,14 +196,55 @@ async def run_history(
 
     # issue the query
     result = await session.execute(query)
-    records = result.mappings()
+    records = [dict(r) for r in result.mappings()]
 
     # load and parse the record if the database returns JSON as strings
     if db.queries.uses_json_strings:
-        records = [dict(r) for r in records]
         for r in records:
             r["states"] = json.loads(r["states"])
 
+    if rollups is not None:
+        _add_rollup_counts(records, rollups.rows, history_start, history_interval)
+
     return pydantic.TypeAdapter(
         List[schemas.responses.HistoryResponse]
     ).validate_python(records)
+
+
+def _add_rollup_counts(
+    records: list[dict[str, Any]],
+    rollup_rows: Sequence[Any],
+    history_start: datetime.datetime,
+    history_interval: datetime.timedelta,
+) -> None:
+    """
+    Add the aggregates read from run history rollups to the states of the intervals
+    containing their buckets.
+    """
+    for row in rollup_rows:
+        index = int(
+            (row.interval_start - history_start).total_seconds()
+            // history_interval.total_seconds()
+        )
+        if index >= len(records):
+            continue
+        states: list[dict[str, Any]] = records[index]["states"]
+        state_type = row.state_type.value
+        for state in states:
+            if (
+                state["state_type"] == state_type
+                and state["state_name"] == row.state_name
+            ):
+                break
+        else:
+            state = {
+                "state_type": state_type,
+                "state_name": row.state_name,
+                "count_runs": 0,
+                "sum_estimated_run_time": 0.0,
+                "sum_estimated_lateness": 0.0,
+            }
+            states.append(state)
+        state["count_runs"] += row.count_runs
+        state["sum_estimated_run_time"] += row.sum_estimated_run_time
+        state["sum_estimated_lateness"] += row.sum_estimated_lateness
@@ -29,7 +29,7 @@ import httpx
 import sqlalchemy as sa
 import sqlalchemy.exc
 import sqlalchemy.orm.exc
-from fastapi import Depends, FastAPI, Request, Response, status
+from fastapi import Depends, FastAPI, Query, Request, Response, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -46,9 +46,11 @@ import prefect.settings
 from prefect.client.constants import SERVER_API_VERSION
 from prefect.logging import get_logger
 from prefect.server.api.dependencies import EnforceMinimumAPIVersion
+from prefect.server.concurrency.ledger import get_slot_ledger
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.services.base import RunInAllServers, Service
 from prefect.server.utilities.database import get_dialect
+from prefect.server.utilities.server import PrefectJSONResponse
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_URL,
     PREFECT_API_LOG_RETRYABLE_ERRORS,
@@ -340,13 +342,16 @@ def create_api_app(
     if cache_key in API_APP_CACHE and not ignore_cache:
         return API_APP_CACHE[cache_key]
 
-    fast_api_app_kwargs = fast_api_app_kwargs or {}
+    fast_api_app_kwargs = {
+        "default_response_class": PrefectJSONResponse,
+        **(fast_api_app_kwargs or {}),
+    }
     api_app = FastAPI(title=API_TITLE, **fast_api_app_kwargs)
 
     if logfire:
         logfire.instrument_fastapi(api_app)  # pyright: ignore
 
-    api_app.add_middleware(GZipMiddleware)
+    api_app.add_middleware(api.middleware.CompressionMiddleware)
 
     @api_app.get(health_check_path, tags=["Root"])
     async def health_check() -> bool:  # type: ignore[reportUnusedFunction]
@@ -652,9 +657,14 @@ def create_app(
             if ephemeral or webserver_only:
                 Services = RunInAllServers
 
-            async with Services.running():
-                LIFESPAN_RAN_FOR_APP.add(app)
-                yield
+            try:
+                async with Services.running():
+                    LIFESPAN_RAN_FOR_APP.add(app)
+                    yield
+            finally:
+                # write slot counts released by services as they stopped
+                if slot_ledger := get_slot_ledger():
+                    await slot_ledger.stop()
         else:
             yield
 
@@ -724,6 +734,22 @@ def create_app(
         async def metrics() -> Response:  # type: ignore[reportUnusedFunction]
             return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
+        if get_current_settings().server.profiling_enabled:
+            from prefect.server.utilities.profiling import ProfilerBusy, sample_stacks
+
+            @api_app.get("/metrics/profile")
+            async def profile(  # type: ignore[reportUnusedFunction]
+                seconds: float = Query(default=10, gt=0, le=60),
+                interval: float = Query(default=0.01, ge=0.001, le=1),
+            ) -> Response:
+                try:
+                    stacks = await sample_stacks(duration=seconds, interval=interval)
+                except ProfilerBusy as exc:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+                    )
+                return Response(content=stacks, media_type="text/plain")
+
     api_app.mount(
         "/static",
         StaticFiles(
@@ -4,20 +4,20 @@ Routes for interacting with task run objects.
 
 import asyncio
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from fastapi import (
     BackgroundTasks,
     Body,
     Depends,
+    Header,
     HTTPException,
     Path,
     Response,
     WebSocket,
     status,
 )
-from fastapi.responses import ORJSONResponse
 from starlette.websockets import WebSocketDisconnect
 
 import prefect.server.api.dependencies as dependencies
@@ -26,16 +26,21 @@ import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server.api.run_history import run_history
 from prefect.server.database import PrefectDBInterface, provide_database_interface
+from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.orchestration import dependencies as orchestration_dependencies
 from prefect.server.orchestration.core_policy import CoreTaskPolicy
 from prefect.server.orchestration.policies import TaskRunOrchestrationPolicy
 from prefect.server.schemas.responses import (
     OrchestrationResult,
+    TaskRunCursorPaginationResponse,
     TaskRunPaginationResponse,
 )
 from prefect.server.task_queue import MultiQueue, TaskQueue
 from prefect.server.utilities import subscriptions
+from prefect.server.utilities.http import etag_matches, not_modified, weak_etag
+from prefect.server.utilities.pagination import InvalidCursorError, next_cursor
 from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.streaming import ndjson_response
 from prefect.types import DateTime
 from prefect.types._datetime import now
 
@@ -46,6 +51,9 @@ logger: "logging.Logger" = get_logger("server.api")
 
 router: PrefectRouter = PrefectRouter(prefix="/task_runs", tags=["Task Runs"])
 
+# The maximum number of task runs a single bulk request may create or update
+TASK_RUN_BULK_OPERATION_LIMIT = 1000
+
 
 @router.post("/")
 async def create_task_run(
@@ -91,6 +99,49 @@ async def create_task_run(
     return new_task_run
 
 
+@router.post("/bulk")
+async def bulk_create_task_runs(
+    task_runs: List[schemas.actions.TaskRunCreate] = Body(
+        ...,
+        embed=True,
+        max_length=TASK_RUN_BULK_OPERATION_LIMIT,
+        description="The task runs to create.",
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[schemas.core.TaskRun]:
+    """
+    Create multiple task runs in a single transaction.
+
+    Each task run is created with the same semantics as `POST /task_runs/`: if a task
+    run with the same flow_run_id, task_key, and dynamic_key already exists, the
+    existing task run is returned in its place. Task runs are returned in the order
+    they were provided.
+    """
+    models_to_return = []
+    async with db.session_context(begin_transaction=True) as session:
+        for task_run_create in task_runs:
+            task_run_dict = task_run_create.model_dump()
+            if not task_run_dict.get("id"):
+                task_run_dict.pop("id", None)
+            task_run = schemas.core.TaskRun(**task_run_dict)
+
+            if not task_run.state:
+                task_run.state = schemas.states.Pending()
+
+            models_to_return.append(
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=task_run,
+                    orchestration_parameters=orchestration_parameters,
+                )
+            )
+
+    return [schemas.core.TaskRun.model_validate(model) for model in models_to_return]
+
+
 @router.patch("/{id:uuid}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_task_run(
     task_run: schemas.actions.TaskRunUpdate,
@@ -177,35 +228,75 @@ async def task_run_history(
 
 @router.get("/{id:uuid}")
 async def read_task_run(
+    response: Response,
     task_run_id: UUID = Path(..., description="The task run id", alias="id"),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> schemas.core.TaskRun:
     """
     Get a task run by id.
+
+    Responses carry an `ETag` header; requests with a matching `If-None-Match`
+    header receive a `304 Not Modified` response without the task run.
     """
     async with db.session_context() as session:
+        if if_none_match:
+            updated = await models.task_runs.read_task_run_updated(
+                session=session, task_run_id=task_run_id
+            )
+            etag = weak_etag(task_run_id, updated)
+            if updated and etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
         task_run = await models.task_runs.read_task_run(
             session=session, task_run_id=task_run_id
         )
     if not task_run:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Task not found")
+    response.headers["ETag"] = weak_etag(task_run.id, task_run.updated)
     return task_run
 
 
 @router.post("/filter")
 async def read_task_runs(
     sort: schemas.sorting.TaskRunSort = Body(schemas.sorting.TaskRunSort.ID_DESC),
-    limit: int = dependencies.LimitBody(),
+    limit: Optional[int] = dependencies.StreamableLimitBody(),
     offset: int = Body(0, ge=0),
     flows: Optional[schemas.filters.FlowFilter] = None,
     flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
     task_runs: Optional[schemas.filters.TaskRunFilter] = None,
     deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    ndjson: bool = Depends(dependencies.accepts_ndjson),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.core.TaskRun]:
     """
     Query for task runs.
+
+    Send `Accept: application/x-ndjson` to stream the results as newline-delimited
+    JSON, one task run per line. Streamed results are unlimited unless a `limit` is
+    provided.
     """
+    if ndjson:
+
+        async def chunks() -> AsyncGenerator[Sequence[Any], None]:
+            async with db.session_context() as session:
+                async for chunk in models.task_runs.stream_task_runs(
+                    session=session,
+                    flow_filter=flows,
+                    flow_run_filter=flow_runs,
+                    task_run_filter=task_runs,
+                    deployment_filter=deployments,
+                    offset=offset,
+                    limit=limit,
+                    sort=sort,
+                ):
+                    yield chunk
+
+        return ndjson_response(
+            chunks(),
+            lambda tr: schemas.core.TaskRun.model_validate(tr, from_attributes=True),
+        )
+
     async with db.session_context() as session:
         return await models.task_runs.read_task_runs(
             session=session,
@@ -219,7 +310,55 @@ async def read_task_runs(
         )
 
 
-@router.post("/paginate", response_class=ORJSONResponse)
+@router.post("/filter/cursor")
+async def read_task_runs_with_cursor(
+    sort: schemas.sorting.TaskRunSort = Body(schemas.sorting.TaskRunSort.ID_DESC),
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor returned with the previous page of results."
+    ),
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> TaskRunCursorPaginationResponse:
+    """
+    Query for task runs, paginated with a cursor.
+
+    Each page resumes after the last task run of the previous page rather than
+    skipping an offset, so reading deep pages is as fast as reading the first one.
+    The same filters and sort must be provided with every page of a query.
+    """
+    keyset = sort.as_keyset()
+    try:
+        after = keyset.decode_cursor(sort.value, cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+    async with db.session_context() as session:
+        runs = await models.task_runs.read_task_runs(
+            session=session,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            limit=limit + 1,
+            sort=sort,
+            after=after,
+        )
+
+        return TaskRunCursorPaginationResponse(
+            results=[
+                schemas.core.TaskRun.model_validate(run, from_attributes=True)
+                for run in runs[:limit]
+            ],
+            limit=limit,
+            next_cursor=next_cursor(keyset, sort.value, runs, limit),
+        )
+
+
+@router.post("/paginate")
 async def paginate_task_runs(
     sort: schemas.sorting.TaskRunSort = Body(schemas.sorting.TaskRunSort.ID_DESC),
     limit: int = dependencies.LimitBody(),
@@ -342,6 +481,71 @@ async def set_task_run_state(
     return orchestration_result
 
 
+@router.post("/bulk_set_state")
+async def bulk_set_task_run_state(
+    task_run_states: List[schemas.actions.TaskRunSetState] = Body(
+        ...,
+        embed=True,
+        max_length=TASK_RUN_BULK_OPERATION_LIMIT,
+        description="The task runs and their intended states.",
+    ),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transitions. If True, orchestration rules are not applied."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    response: Response = None,
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[OrchestrationResult]:
+    """
+    Set the states of multiple task runs, invoking any orchestration rules.
+
+    Each state is orchestrated in its own transaction, as with
+    `POST /task_runs/{id}/set_state`, and an orchestration result is returned for
+    every task run in the order they were provided. Task runs that do not exist
+    are aborted rather than failing the whole request. Responds with a 201 if any
+    new state was created.
+    """
+    right_now = now("UTC")
+
+    results: List[OrchestrationResult] = []
+    for task_run_state in task_run_states:
+        try:
+            async with db.session_context(
+                begin_transaction=True, with_for_update=True
+            ) as session:
+                result = await models.task_runs.set_task_run_state(
+                    session=session,
+                    task_run_id=task_run_state.task_run_id,
+                    state=schemas.states.State.model_validate(task_run_state.state),
+                    force=force,
+                    task_policy=CoreTaskPolicy,
+                    orchestration_parameters=dict(orchestration_parameters),
+                )
+        except ObjectNotFoundError:
+            result = OrchestrationResult(
+                state=None,
+                status=schemas.responses.SetStateStatus.ABORT,
+                details=schemas.responses.StateAbortDetails(
+                    reason=f"Task run {task_run_state.task_run_id} not found"
+                ),
+            )
+        results.append(result)
+
+    # set the 201 if a new state was created
+    if any(result.state and result.state.timestamp >= right_now for result in results):
+        response.status_code = status.HTTP_201_CREATED
+    else:
+        response.status_code = status.HTTP_200_OK
+
+    return results
+
+
 @router.websocket("/subscriptions/scheduled")
 async def scheduled_task_subscription(websocket: WebSocket) -> None:
     websocket = await subscriptions.accept_prefect_socket(websocket)
@@ -10,8 +10,10 @@ from fastapi import (
     BackgroundTasks,
     Body,
     Depends,
+    Header,
     HTTPException,
     Path,
+    Response,
     status,
 )
 from packaging.version import Version
@@ -30,6 +32,7 @@ from prefect.server.models.work_queues import (
 )
 from prefect.server.models.workers import emit_work_pool_status_event
 from prefect.server.schemas.statuses import WorkQueueStatus
+from prefect.server.utilities.http import etag_matches, not_modified, weak_etag
 from prefect.server.utilities.server import PrefectRouter
 from prefect.types import DateTime
 from prefect.types._datetime import now
@@ -209,7 +212,9 @@ async def create_work_pool(
 
 @router.get("/{name}")
 async def read_work_pool(
+    response: Response,
     work_pool_name: str = Path(..., description="The work pool name", alias="name"),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
     worker_lookups: WorkerLookups = Depends(WorkerLookups),
     db: PrefectDBInterface = Depends(provide_database_interface),
     prefect_client_version: Optional[str] = Depends(
@@ -218,15 +223,30 @@ async def read_work_pool(
 ) -> schemas.core.WorkPool:
     """
     Read a work pool by name
+
+    Responses carry an `ETag` header; requests with a matching `If-None-Match`
+    header receive a `304 Not Modified` response without the work pool.
     """
 
     async with db.session_context() as session:
+        if if_none_match:
+            updated = await models.workers.read_work_pool_updated_by_name(
+                session=session, work_pool_name=work_pool_name
+            )
+            # responses differ between client versions, see below
+            etag = weak_etag(work_pool_name, updated, prefect_client_version)
+            if updated and etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
         work_pool_id = await worker_lookups._get_work_pool_id_from_name(
             session=session, work_pool_name=work_pool_name
         )
         orm_work_pool = await models.workers.read_work_pool(
             session=session, work_pool_id=work_pool_id
         )
+        response.headers["ETag"] = weak_etag(
+            orm_work_pool.name, orm_work_pool.updated, prefect_client_version
+        )
         work_pool = schemas.core.WorkPool.model_validate(
             orm_work_pool, from_attributes=True
         )
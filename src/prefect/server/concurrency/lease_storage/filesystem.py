@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, TypedDict
-from uuid import UUID
+from typing import Any, Iterator, TypedDict
+from uuid import UUID, uuid4
 
 import anyio
+import anyio.to_thread
 
 from prefect.server.concurrency.lease_storage import (
     ConcurrencyLeaseStorage as _ConcurrencyLeaseStorage,
@@ -17,6 +24,15 @@ from prefect.server.concurrency.lease_storage import (
 from prefect.server.utilities.leasing import ResourceLease
 from prefect.settings.context import get_current_settings
 
+if sys.platform != "win32":
+    import fcntl
+
+# the journal is compacted once it holds more than this many entries and more
+# than twice as many entries as there are leases
+COMPACTION_MIN_ENTRIES = 1000
+
+_REMOVED = "-"
+
 
 class _LeaseFile(TypedDict):
     resource_ids: list[str]
@@ -25,9 +41,241 @@ class _LeaseFile(TypedDict):
     created_at: str
 
 
+class _ExpirationJournal:
+    """
+    The expiration of every lease in a storage directory.
+
+    Every change to an expiration is appended to a journal file as a
+    `<lease ID> <expiration>` line, or a `<lease ID> -` line when the lease is
+    removed, so that creating, renewing, and revoking a lease writes a single line
+    regardless of how many leases exist. The journal is read into a dictionary of
+    expirations and a heap ordered by expiration, so that expired leases are found
+    without scanning every lease. Once most of its entries are outdated, the
+    journal is compacted into a new file with one entry per lease, which starts
+    with a `# <unique ID>` header line.
+
+    Before each operation, entries appended since the journal was last read are
+    applied, so that storages in other processes sharing the directory see each
+    other's changes. A journal replaced by compaction is read again from the start;
+    journals are told apart by their first line rather than their inode, which
+    a replacing file may reuse.
+    Operations hold an exclusive lock on a `.lock` file next to the journal, so
+    that appends are never lost to a concurrent compaction. File locks are not
+    available on Windows, where a directory must only be used by one process.
+
+    Methods block on file I/O, so they are called from worker threads.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._expirations: dict[UUID, datetime] = {}
+        # may hold outdated entries, which are skipped when they reach the top
+        self._heap: list[tuple[datetime, UUID]] = []
+        self._first_line: bytes | None = None
+        self._offset = 0
+        self._entries = 0
+
+    @property
+    def _lock_path(self) -> Path:
+        return self.path.with_name(f"{self.path.name}.lock")
+
+    @property
+    def _legacy_index_path(self) -> Path:
+        return self.path.parent / "expirations.json"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            if sys.platform == "win32":
+                yield
+                return
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._lock_path, "ab") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _reset(self) -> None:
+        self._expirations.clear()
+        self._heap.clear()
+        self._first_line = None
+        self._offset = 0
+        self._entries = 0
+
+    def _apply(self, line: bytes) -> None:
+        if line.startswith(b"#"):
+            return
+        try:
+            lease_id_str, expiration_str = line.decode().split(" ", 1)
+            lease_id = UUID(lease_id_str)
+            if expiration_str == _REMOVED:
+                self._expirations.pop(lease_id, None)
+            else:
+                expiration = datetime.fromisoformat(expiration_str)
+                self._expirations[lease_id] = expiration
+                heapq.heappush(self._heap, (expiration, lease_id))
+        except (ValueError, TypeError):
+            # skip entries that were not written in full
+            return
+        self._entries += 1
+
+        if len(self._heap) > 2 * len(self._expirations) + 64:
+            self._heap = [
+                (expiration, lease_id)
+                for lease_id, expiration in self._expirations.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def _migrate_legacy_index(self) -> None:
+        """Moves the expirations of an `expirations.json` index into the journal."""
+        try:
+            index = json.loads(self._legacy_index_path.read_text())
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, ValueError):
+            index = {}
+
+        for lease_id_str, expiration_str in index.items():
+            self._apply(f"{lease_id_str} {expiration_str}".encode())
+        self._compact()
+        self._legacy_index_path.unlink(missing_ok=True)
+
+    def _sync(self) -> None:
+        """Applies the entries appended to the journal since it was last read."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            self._reset()
+            if self._legacy_index_path.exists():
+                self._migrate_legacy_index()
+            return
+
+        with f:
+            first_line = f.readline()
+            size = f.seek(0, os.SEEK_END)
+            if first_line != self._first_line or size < self._offset:
+                self._reset()
+                self._first_line = first_line
+            if size == self._offset:
+                return
+            f.seek(self._offset)
+            data = f.read()
+        # leave an entry that is still being written for the next read
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._apply(line)
+        self._offset += end
+
+    def _append(self, lease_id: UUID, expiration: datetime | None) -> None:
+        entry = f"{lease_id} {expiration.isoformat() if expiration else _REMOVED}\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(entry.encode())
+        self._sync()
+
+        if self._entries > COMPACTION_MIN_ENTRIES and self._entries > 2 * len(
+            self._expirations
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, compacted_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".compacting"
+        )
+        first_line = f"# {uuid4()}\n".encode()
+        data = (
+            first_line
+            + "".join(
+                f"{lease_id} {expiration.isoformat()}\n"
+                for lease_id, expiration in self._expirations.items()
+            ).encode()
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(compacted_path, self.path)
+        except BaseException:
+            Path(compacted_path).unlink(missing_ok=True)
+            raise
+
+        self._first_line = first_line
+        self._offset = len(data)
+        self._entries = len(self._expirations)
+
+    def set(self, lease_id: UUID, expiration: datetime) -> None:
+        with self._locked():
+            self._append(lease_id, expiration)
+
+    def renew(self, lease_id: UUID, expiration: datetime) -> None:
+        with self._locked():
+            self._sync()
+            if lease_id in self._expirations:
+                self._append(lease_id, expiration)
+
+    def remove(self, lease_id: UUID) -> None:
+        with self._locked():
+            self._sync()
+            if lease_id in self._expirations:
+                self._append(lease_id, None)
+
+    def get(self, lease_id: UUID) -> datetime | None:
+        with self._locked():
+            self._sync()
+            return self._expirations.get(lease_id)
+
+    def read_active(self, now: datetime, limit: int) -> list[UUID]:
+        with self._locked():
+            self._sync()
+            active: list[UUID] = []
+            for lease_id, expiration in self._expirations.items():
+                if len(active) >= limit:
+                    break
+                if expiration > now:
+                    active.append(lease_id)
+            return active
+
+    def read_expired(self, now: datetime, limit: int) -> list[UUID]:
+        with self._locked():
+            self._sync()
+            expired: list[tuple[datetime, UUID]] = []
+            while self._heap and len(expired) < limit:
+                expiration, lease_id = self._heap[0]
+                if expiration >= now:
+                    break
+                heapq.heappop(self._heap)
+                if self._expirations.get(lease_id) == expiration and (
+                    not expired or expired[-1] != (expiration, lease_id)
+                ):
+                    expired.append((expiration, lease_id))
+
+            # expired leases stay in the index until they are revoked
+            for entry in expired:
+                heapq.heappush(self._heap, entry)
+            return [lease_id for _, lease_id in expired]
+
+
+_journals: dict[Path, _ExpirationJournal] = {}
+
+
+def _get_journal(storage_path: Path) -> _ExpirationJournal:
+    path = storage_path.absolute() / "expirations.journal"
+    if path not in _journals:
+        _journals[path] = _ExpirationJournal(path)
+    return _journals[path]
+
+
 class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
     """
     A file-based concurrency lease storage implementation that stores leases on disk.
+
+    Each lease is stored in its own file, and the expirations of all leases are
+    recorded in an append-only journal that is shared by every storage using the
+    same directory in a process.
     """
 
     def __init__(self, storage_path: Path | None = None):
@@ -35,49 +283,10 @@ class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
         self.storage_path: Path = Path(
             storage_path or prefect_home / "concurrency_leases"
         )
+        self._journal = _get_journal(self.storage_path)
 
-    def _ensure_storage_path(self) -> None:
-        """Ensure the storage path exists, creating it if necessary."""
-        self.storage_path.mkdir(parents=True, exist_ok=True)
-
-    def _lease_file_path(self, lease_id: UUID) -> Path:
-        return self.storage_path / f"{lease_id}.json"
-
-    def _expiration_index_path(self) -> anyio.Path:
-        return anyio.Path(self.storage_path / "expirations.json")
-
-    async def _load_expiration_index(self) -> dict[str, str]:
-        """Load the expiration index from disk."""
-        expiration_file = self._expiration_index_path()
-        if not await expiration_file.exists():
-            return {}
-
-        try:
-            return json.loads(await expiration_file.read_text())
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return {}
-
-    def _save_expiration_index(self, index: dict[str, str]) -> None:
-        """Save the expiration index to disk."""
-        self._ensure_storage_path()
-        expiration_file = self._expiration_index_path()
-
-        with open(expiration_file, "w") as f:
-            json.dump(index, f)
-
-    async def _update_expiration_index(
-        self, lease_id: UUID, expiration: datetime
-    ) -> None:
-        """Update a single lease's expiration in the index."""
-        index = await self._load_expiration_index()
-        index[str(lease_id)] = expiration.isoformat()
-        self._save_expiration_index(index)
-
-    async def _remove_from_expiration_index(self, lease_id: UUID) -> None:
-        """Remove a lease from the expiration index."""
-        index = await self._load_expiration_index()
-        index.pop(str(lease_id), None)
-        self._save_expiration_index(index)
+    def _lease_file_path(self, lease_id: UUID) -> anyio.Path:
+        return anyio.Path(self.storage_path / f"{lease_id}.json")
 
     def _serialize_lease(
         self, lease: ResourceLease[ConcurrencyLimitLeaseMetadata]
@@ -119,15 +328,11 @@ class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
             resource_ids=resource_ids, metadata=metadata, expiration=expiration
         )
 
-        self._ensure_storage_path()
+        await anyio.Path(self.storage_path).mkdir(parents=True, exist_ok=True)
         lease_file = self._lease_file_path(lease.id)
-        lease_data = self._serialize_lease(lease)
-
-        with open(lease_file, "w") as f:
-            json.dump(lease_data, f)
+        await lease_file.write_text(json.dumps(self._serialize_lease(lease)))
 
-        # Update expiration index
-        await self._update_expiration_index(lease.id, expiration)
+        await anyio.to_thread.run_sync(self._journal.set, lease.id, expiration)
 
         return lease
 
@@ -136,92 +341,35 @@ class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
     ) -> ResourceLease[ConcurrencyLimitLeaseMetadata] | None:
         lease_file = self._lease_file_path(lease_id)
 
-        if not lease_file.exists():
-            return None
-
         try:
-            with open(lease_file, "r") as f:
-                lease_data = json.load(f)
-
-            lease = self._deserialize_lease(lease_data)
-
-            return lease
-        except (json.JSONDecodeError, KeyError, ValueError):
+            lease = self._deserialize_lease(json.loads(await lease_file.read_text()))
+        except FileNotFoundError:
+            await anyio.to_thread.run_sync(self._journal.remove, lease_id)
+            return None
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError):
             # Clean up corrupted lease file
-            lease_file.unlink(missing_ok=True)
-            await self._remove_from_expiration_index(lease_id)
+            await lease_file.unlink(missing_ok=True)
+            await anyio.to_thread.run_sync(self._journal.remove, lease_id)
             return None
 
-    async def renew_lease(self, lease_id: UUID, ttl: timedelta) -> None:
-        lease_file = self._lease_file_path(lease_id)
-
-        if not lease_file.exists():
-            return
-
-        try:
-            with open(lease_file, "r") as f:
-                lease_data = json.load(f)
-
-            # Update expiration time
-            new_expiration = datetime.now(timezone.utc) + ttl
-            lease_data["expiration"] = new_expiration.isoformat()
-
-            self._ensure_storage_path()
-            with open(lease_file, "w") as f:
-                json.dump(lease_data, f)
+        # renewals are only recorded in the journal
+        expiration = await anyio.to_thread.run_sync(self._journal.get, lease_id)
+        if expiration is not None:
+            lease.expiration = expiration
+        return lease
 
-            # Update expiration index
-            await self._update_expiration_index(lease_id, new_expiration)
-        except (json.JSONDecodeError, KeyError, ValueError):
-            # Clean up corrupted lease file
-            lease_file.unlink(missing_ok=True)
-            await self._remove_from_expiration_index(lease_id)
+    async def renew_lease(self, lease_id: UUID, ttl: timedelta) -> None:
+        new_expiration = datetime.now(timezone.utc) + ttl
+        await anyio.to_thread.run_sync(self._journal.renew, lease_id, new_expiration)
 
     async def revoke_lease(self, lease_id: UUID) -> None:
-        lease_file = self._lease_file_path(lease_id)
-        lease_file.unlink(missing_ok=True)
-
-        # Remove from expiration index
-        await self._remove_from_expiration_index(lease_id)
+        await anyio.to_thread.run_sync(self._journal.remove, lease_id)
+        await self._lease_file_path(lease_id).unlink(missing_ok=True)
 
     async def read_active_lease_ids(self, limit: int = 100) -> list[UUID]:
-        active_leases: list[UUID] = []
         now = datetime.now(timezone.utc)
-
-        expiration_index = await self._load_expiration_index()
-
-        for lease_id_str, expiration_str in expiration_index.items():
-            if len(active_leases) >= limit:
-                break
-
-            try:
-                lease_id = UUID(lease_id_str)
-                expiration = datetime.fromisoformat(expiration_str)
-
-                if expiration > now:
-                    active_leases.append(lease_id)
-            except (ValueError, TypeError):
-                continue
-
-        return active_leases
+        return await anyio.to_thread.run_sync(self._journal.read_active, now, limit)
 
     async def read_expired_lease_ids(self, limit: int = 100) -> list[UUID]:
-        expired_leases: list[UUID] = []
         now = datetime.now(timezone.utc)
-
-        expiration_index = await self._load_expiration_index()
-
-        for lease_id_str, expiration_str in expiration_index.items():
-            if len(expired_leases) >= limit:
-                break
-
-            try:
-                lease_id = UUID(lease_id_str)
-                expiration = datetime.fromisoformat(expiration_str)
-
-                if expiration < now:
-                    expired_leases.append(lease_id)
-            except (ValueError, TypeError):
-                continue
-
-        return expired_leases
+        return await anyio.to_thread.run_sync(self._journal.read_expired, now, limit)
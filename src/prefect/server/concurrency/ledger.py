@@ -0,0 +1,327 @@
+"""
+An in-memory ledger of the slots held on global concurrency limits.
+
+By default, every acquisition and release of slots updates the row of each limit in
+the database, which makes the rows of busy limits a point of contention. When the
+ledger is enabled, the slot counts of each limit are kept in the memory of the server
+and written to the database in the background, while the configuration of each
+limit is still read from the database.
+
+The ledger assumes that it is the only writer of slot counts, so it should only be
+enabled when a single server process, running both the API and its services, uses
+the database. Leases are unaffected: expired leases are released through the ledger
+by the repossessor like any other release.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Protocol, TypeVar
+from uuid import UUID
+
+import sqlalchemy as sa
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from prefect.logging import get_logger
+from prefect.server.database import provide_database_interface
+from prefect.server.models.concurrency_limits_v2 import (
+    MINIMUM_OCCUPANCY_SECONDS_PER_SLOT,
+    OCCUPANCY_SAMPLES_MULTIPLIER,
+)
+from prefect.settings.context import get_current_settings
+
+logger = get_logger("prefect.server.concurrency.ledger")
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class LimitLike(Protocol):
+    """The parts of a concurrency limit that the ledger reads"""
+
+    id: UUID
+    limit: int
+    active_slots: int
+    denied_slots: int
+    slot_decay_per_second: float
+    avg_slot_occupancy_seconds: float
+    updated: datetime
+
+
+@dataclass
+class LedgerEntry:
+    active_slots: int
+    denied_slots: int
+    avg_slot_occupancy_seconds: float
+    active_decayed_at: datetime
+    denied_decayed_at: datetime
+    version: int = 0
+    flushed_version: int = 0
+
+
+def _decayed(
+    slots: int, decayed_at: datetime, rate: float, now: datetime
+) -> tuple[int, datetime]:
+    """
+    Returns the number of slots left after decaying at `rate` slots per second since
+    `decayed_at`, along with the time up to which they have decayed.
+    """
+    if slots <= 0 or rate <= 0:
+        return max(slots, 0), now
+
+    decayed = math.floor(rate * (now - decayed_at).total_seconds())
+    if decayed >= slots:
+        return 0, now
+    if decayed <= 0:
+        return slots, decayed_at
+    # carry the fraction of a slot that has not decayed yet over to the next check
+    return slots - decayed, decayed_at + timedelta(seconds=decayed / rate)
+
+
+class SlotLedger:
+    """
+    Counts the active and denied slots of global concurrency limits in memory.
+
+    The ledger mirrors the updates that `prefect.server.models.concurrency_limits_v2`
+    makes to the database, including the decay of slots over time. The counts of a
+    limit are loaded from its row the first time the limit is used, and changed
+    counts are written back every `flush_interval` seconds.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._entries: dict[UUID, LedgerEntry] = {}
+        self._flusher: asyncio.Task[None] | None = None
+
+    def _entry(self, limit: LimitLike, now: datetime) -> LedgerEntry:
+        entry = self._entries.get(limit.id)
+        if entry is None:
+            entry = self._entries[limit.id] = LedgerEntry(
+                active_slots=limit.active_slots,
+                denied_slots=limit.denied_slots,
+                avg_slot_occupancy_seconds=limit.avg_slot_occupancy_seconds,
+                active_decayed_at=limit.updated,
+                denied_decayed_at=limit.updated,
+            )
+
+        entry.active_slots, entry.active_decayed_at = _decayed(
+            entry.active_slots,
+            entry.active_decayed_at,
+            limit.slot_decay_per_second,
+            now,
+        )
+        entry.denied_slots, entry.denied_decayed_at = _decayed(
+            entry.denied_slots,
+            entry.denied_decayed_at,
+            (
+                limit.slot_decay_per_second
+                if limit.slot_decay_per_second > 0
+                else 1.0 / entry.avg_slot_occupancy_seconds
+            ),
+            now,
+        )
+        return entry
+
+    def _changed(self, entry: LedgerEntry) -> None:
+        entry.version += 1
+        self._ensure_flusher()
+
+    def increment(self, limits: Sequence[LimitLike], slots: int) -> bool:
+        """
+        Takes `slots` slots on every one of the given limits if all of them have
+        enough free slots, and returns whether the slots were taken.
+        """
+        now = datetime.now(timezone.utc)
+        entries = [self._entry(limit, now) for limit in limits]
+        if any(
+            entry.active_slots + slots > limit.limit
+            for limit, entry in zip(limits, entries)
+        ):
+            return False
+
+        for entry in entries:
+            entry.active_slots += slots
+            self._changed(entry)
+        return True
+
+    def decrement(
+        self,
+        limits: Sequence[LimitLike],
+        slots: int,
+        occupancy_seconds: float | None = None,
+    ) -> dict[UUID, int]:
+        """
+        Releases `slots` slots on each of the given limits, updating the average
+        time that each slot is held if `occupancy_seconds` is given.
+
+        Returns the number of slots released on each limit, which is less than
+        `slots` for limits that had fewer active slots.
+        """
+        now = datetime.now(timezone.utc)
+        released: dict[UUID, int] = {}
+        for limit in limits:
+            entry = self._entry(limit, now)
+            released[limit.id] = min(slots, entry.active_slots)
+            entry.active_slots -= released[limit.id]
+            if occupancy_seconds:
+                # a weighted average over the last `limit * OCCUPANCY_SAMPLES_MULTIPLIER`
+                # samples, as computed by `bulk_decrement_active_slots`
+                samples = limit.limit * OCCUPANCY_SAMPLES_MULTIPLIER
+                entry.avg_slot_occupancy_seconds += (
+                    max(occupancy_seconds / slots, MINIMUM_OCCUPANCY_SECONDS_PER_SLOT)
+                    - entry.avg_slot_occupancy_seconds
+                ) / samples
+            self._changed(entry)
+        return released
+
+    def deny(self, limits: Sequence[LimitLike], slots: int) -> None:
+        """Records that `slots` slots were requested but not granted on each limit"""
+        now = datetime.now(timezone.utc)
+        for limit in limits:
+            entry = self._entry(limit, now)
+            entry.denied_slots += slots
+            self._changed(entry)
+
+    def adjust(self, slots: Mapping[UUID, int]) -> None:
+        """
+        Adds a number of slots, which may be negative, to the active slots of each
+        limit without checking them against the limit, to undo an earlier change.
+        """
+        for limit_id, limit_slots in slots.items():
+            entry = self._entries.get(limit_id)
+            if entry is None:
+                continue
+            entry.active_slots = max(entry.active_slots + limit_slots, 0)
+            self._changed(entry)
+
+    def forget(self, limit_ids: Iterable[UUID]) -> None:
+        """
+        Drops the counts of the given limits, so that they are loaded from the
+        database when next used. Used when a limit's counts are changed directly.
+        """
+        for limit_id in limit_ids:
+            self._entries.pop(limit_id, None)
+
+    def with_slot_counts(self, limit: M) -> M:
+        """
+        Returns a copy of a concurrency limit schema with the slot counts held in
+        the ledger, which may not have been written to the database yet.
+        """
+        entry = self._entries.get(getattr(limit, "id"))
+        if entry is None:
+            return limit
+
+        fields = type(limit).model_fields
+        counts = {
+            "active_slots": entry.active_slots,
+            "denied_slots": entry.denied_slots,
+            "avg_slot_occupancy_seconds": entry.avg_slot_occupancy_seconds,
+        }
+        return limit.model_copy(
+            update={name: value for name, value in counts.items() if name in fields}
+        )
+
+    async def flush(self) -> None:
+        """Writes the counts that have changed since the last flush to the database"""
+        changed = [
+            (limit_id, entry, entry.version)
+            for limit_id, entry in self._entries.items()
+            if entry.version != entry.flushed_version
+        ]
+        if not changed:
+            return
+
+        db = provide_database_interface()
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.update(db.ConcurrencyLimitV2),
+                [
+                    {
+                        "id": limit_id,
+                        "active_slots": entry.active_slots,
+                        "denied_slots": entry.denied_slots,
+                        "avg_slot_occupancy_seconds": entry.avg_slot_occupancy_seconds,
+                    }
+                    for limit_id, entry, _ in changed
+                ],
+                execution_options={"synchronize_session": False},
+            )
+
+        for _, entry, version in changed:
+            entry.flushed_version = version
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._flusher is None
+            or self._flusher.done()
+            or self._flusher.get_loop() is not loop
+        ):
+            self._flusher = loop.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to write concurrency slot counts")
+
+    async def stop(self) -> None:
+        """Stops writing counts in the background and writes any pending counts"""
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        self._flusher = None
+        await self.flush()
+
+
+_UNDO_ON_ROLLBACK = "prefect_slot_ledger_undo_on_rollback"
+
+
+def _run_undos(session: Session) -> None:
+    for undo in reversed(session.info.pop(_UNDO_ON_ROLLBACK, [])):
+        undo()
+
+
+def _discard_undos(session: Session) -> None:
+    session.info.pop(_UNDO_ON_ROLLBACK, None)
+
+
+def undo_on_rollback(session: AsyncSession, undo: Callable[[], None]) -> None:
+    """
+    Calls `undo` if the session's current transaction is rolled back, so that
+    changes to the ledger follow the transaction that made them.
+    """
+    sync_session = session.sync_session
+    if not event.contains(sync_session, "after_rollback", _run_undos):
+        event.listen(sync_session, "after_rollback", _run_undos)
+        event.listen(sync_session, "after_commit", _discard_undos)
+    sync_session.info.setdefault(_UNDO_ON_ROLLBACK, []).append(undo)
+
+
+_slot_ledger: SlotLedger | None = None
+
+
+def get_slot_ledger() -> SlotLedger | None:
+    """
+    Returns the slot ledger of this server process, or `None` if the ledger is not
+    enabled.
+    """
+    global _slot_ledger
+
+    settings = get_current_settings().server.concurrency
+    if not settings.slot_ledger_enabled:
+        return None
+    if _slot_ledger is None:
+        _slot_ledger = SlotLedger(flush_interval=settings.slot_ledger_flush_interval)
+    return _slot_ledger
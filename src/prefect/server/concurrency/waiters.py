@@ -0,0 +1,143 @@
+"""
+Queues of clients waiting to acquire slots on global concurrency limits.
+
+Clients that ask to wait for slots join a first-come, first-served queue for each of
+the limits they request, and only the client at the head of every one of its queues
+attempts to take slots from the database. Other clients wait in memory until the
+slots they are waiting on are released, rather than polling the database.
+
+Every waiter draws a ticket from a single counter, so the oldest waiter is at the
+head of all of its queues and waiters on overlapping sets of limits cannot block
+one another. A waiter whose long poll ends without slots keeps its place for a
+short grace period so that the client can poll again without losing its turn.
+
+Queues are held in the memory of each server process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+# how long a waiter keeps its place in line between long polls
+WAITER_GRACE_SECONDS = 10.0
+
+
+@dataclass
+class SlotWaiter:
+    id: UUID
+    ticket: int
+    limit_ids: frozenset[UUID]
+    expires_at: float | None = None
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
+
+
+class SlotWaiters:
+    """
+    Tracks the clients waiting on each concurrency limit, in the order they
+    arrived.
+    """
+
+    def __init__(self, grace_seconds: float = WAITER_GRACE_SECONDS):
+        self.grace_seconds = grace_seconds
+        self._tickets = itertools.count()
+        self._waiters: dict[UUID, SlotWaiter] = {}
+        self._queues: dict[UUID, dict[UUID, SlotWaiter]] = {}
+
+    def join(
+        self, limit_ids: Iterable[UUID], waiter_id: UUID | None = None
+    ) -> SlotWaiter:
+        """
+        Adds a waiter to the back of the queue of each limit, or returns the waiter
+        with the given ID if it is still waiting on the same limits.
+        """
+        limit_ids = frozenset(limit_ids)
+        self._remove_expired()
+
+        waiter = self._waiters.get(waiter_id) if waiter_id else None
+        if waiter is not None and waiter.limit_ids == limit_ids:
+            waiter.expires_at = None
+            return waiter
+        if waiter is not None:
+            self.leave(waiter)
+
+        waiter = SlotWaiter(
+            id=waiter_id or uuid4(), ticket=next(self._tickets), limit_ids=limit_ids
+        )
+        self._waiters[waiter.id] = waiter
+        for limit_id in limit_ids:
+            self._queues.setdefault(limit_id, {})[waiter.id] = waiter
+        return waiter
+
+    def is_next(self, waiter: SlotWaiter) -> bool:
+        """Returns whether the waiter is at the head of the queue of every limit"""
+        now = time.monotonic()
+        for limit_id in waiter.limit_ids:
+            for queued in self._queues.get(limit_id, {}).values():
+                if queued is waiter:
+                    break
+                if not queued.is_expired(now):
+                    return False
+        return True
+
+    async def wait(self, waiter: SlotWaiter, timeout: float) -> None:
+        """
+        Waits until slots on one of the waiter's limits are released, or until
+        `timeout` seconds have passed.
+        """
+        try:
+            await asyncio.wait_for(waiter.wakeup.wait(), timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            waiter.wakeup.clear()
+
+    def hold(self, waiter: SlotWaiter) -> None:
+        """
+        Keeps the waiter's place in line for the grace period after its long poll
+        ends without slots.
+        """
+        waiter.expires_at = time.monotonic() + self.grace_seconds
+
+    def leave(self, waiter: SlotWaiter) -> None:
+        """Removes the waiter from all of its queues and wakes the waiters behind it"""
+        if self._waiters.get(waiter.id) is not waiter:
+            return
+        del self._waiters[waiter.id]
+        for limit_id in waiter.limit_ids:
+            queue = self._queues.get(limit_id)
+            if queue is None:
+                continue
+            queue.pop(waiter.id, None)
+            if not queue:
+                del self._queues[limit_id]
+        self.notify(waiter.limit_ids)
+
+    def notify(self, limit_ids: Iterable[UUID]) -> None:
+        """Wakes the waiter at the head of the queue of each of the given limits"""
+        now = time.monotonic()
+        for limit_id in limit_ids:
+            for queued in self._queues.get(limit_id, {}).values():
+                if not queued.is_expired(now):
+                    queued.wakeup.set()
+                    break
+
+    def _remove_expired(self) -> None:
+        now = time.monotonic()
+        for waiter in [w for w in self._waiters.values() if w.is_expired(now)]:
+            self.leave(waiter)
+
+
+_slot_waiters = SlotWaiters()
+
+
+def get_slot_waiters() -> SlotWaiters:
+    """Returns the queues of clients waiting for slots in this server process"""
+    return _slot_waiters
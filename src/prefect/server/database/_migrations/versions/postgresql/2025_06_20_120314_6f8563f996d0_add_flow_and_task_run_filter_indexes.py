@@ -0,0 +1,54 @@
+"""Add indexes for common flow run and task run filters
+
+Revision ID: 6f8563f996d0
+Revises: 3b86c5ea017a
+Create Date: 2025-06-20 12:03:14.271823
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6f8563f996d0"
+down_revision = "3b86c5ea017a"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    (
+        "ix_flow_run__deployment_id_state_type_expected_start_time",
+        "flow_run (deployment_id, state_type, expected_start_time)",
+    ),
+    (
+        "ix_flow_run__state_type_expected_start_time",
+        "flow_run (state_type, expected_start_time)",
+    ),
+    (
+        "ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time",
+        "flow_run (work_queue_id, next_scheduled_start_time)"
+        " WHERE state_type = 'SCHEDULED'",
+    ),
+    ("ix_flow_run__tags_gin", "flow_run USING gin (tags)"),
+    (
+        "ix_task_run__state_type_expected_start_time",
+        "task_run (state_type, expected_start_time)",
+    ),
+    ("ix_task_run__tags_gin", "task_run USING gin (tags)"),
+]
+
+
+def upgrade():
+    # the run tables are the largest in most databases, so the indexes are built
+    # concurrently to avoid blocking writes while the migration runs
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}"
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
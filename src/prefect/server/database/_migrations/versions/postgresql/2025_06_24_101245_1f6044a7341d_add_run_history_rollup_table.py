@@ -0,0 +1,109 @@
+"""Add run_history_rollup table
+
+Revision ID: 1f6044a7341d
+Revises: 6f8563f996d0
+Create Date: 2025-06-24 10:12:45.318204
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "1f6044a7341d"
+down_revision = "6f8563f996d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_rollup",
+        sa.Column("run_type", sa.String(), nullable=False),
+        sa.Column("bucket_seconds", sa.Integer(), nullable=False),
+        sa.Column(
+            "interval_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            postgresql.ENUM(name="state_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("state_name", sa.String(), nullable=False),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=True),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "work_queue_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column("count_runs", sa.Integer(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.Column("stale", sa.Boolean(), server_default="0", nullable=False),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    op.create_index(
+        "ix_run_history_rollup__run_type_bucket_seconds_interval_start",
+        "run_history_rollup",
+        ["run_type", "bucket_seconds", "interval_start"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__flow_id"),
+        "run_history_rollup",
+        ["flow_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__work_queue_id"),
+        "run_history_rollup",
+        ["work_queue_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__updated"),
+        "run_history_rollup",
+        ["updated"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_run_history_rollup__updated"), table_name="run_history_rollup"
+    )
+    op.drop_index(
+        op.f("ix_run_history_rollup__work_queue_id"), table_name="run_history_rollup"
+    )
+    op.drop_index(
+        op.f("ix_run_history_rollup__flow_id"), table_name="run_history_rollup"
+    )
+    op.drop_index(
+        "ix_run_history_rollup__run_type_bucket_seconds_interval_start",
+        table_name="run_history_rollup",
+    )
+    op.drop_table("run_history_rollup")
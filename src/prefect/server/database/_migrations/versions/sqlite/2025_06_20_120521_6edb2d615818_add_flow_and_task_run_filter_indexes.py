@@ -0,0 +1,57 @@
+"""Add indexes for common flow run and task run filters
+
+Revision ID: 6edb2d615818
+Revises: 8bb517bae6f9
+Create Date: 2025-06-20 12:05:21.604917
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6edb2d615818"
+down_revision = "8bb517bae6f9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_flow_run__deployment_id_state_type_expected_start_time",
+        "flow_run",
+        ["deployment_id", "state_type", "expected_start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_flow_run__state_type_expected_start_time",
+        "flow_run",
+        ["state_type", "expected_start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time",
+        "flow_run",
+        ["work_queue_id", "next_scheduled_start_time"],
+        unique=False,
+        sqlite_where=sa.text("state_type = 'SCHEDULED'"),
+    )
+    op.create_index(
+        "ix_task_run__state_type_expected_start_time",
+        "task_run",
+        ["state_type", "expected_start_time"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_task_run__state_type_expected_start_time", table_name="task_run")
+    op.drop_index(
+        "ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time",
+        table_name="flow_run",
+    )
+    op.drop_index("ix_flow_run__state_type_expected_start_time", table_name="flow_run")
+    op.drop_index(
+        "ix_flow_run__deployment_id_state_type_expected_start_time",
+        table_name="flow_run",
+    )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import sqlite3
 import ssl
+import time
 import traceback
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop, get_running_loop
@@ -52,6 +53,57 @@ SQLITE_BEGIN_MODE: ContextVar[Optional[str]] = ContextVar(  # novm
     "SQLITE_BEGIN_MODE", default=None
 )
 
+
+class StatementTimer:
+    """Accumulates the time spent executing database statements."""
+
+    seconds: float
+    statements: int
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.statements = 0
+
+
+# when set, the time spent executing statements in this context is added to the timer
+STATEMENT_TIMER: ContextVar[Optional[StatementTimer]] = ContextVar(  # novm
+    "STATEMENT_TIMER", default=None
+)
+
+
+def _start_statement_timer(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[sa.engine.ExecutionContext],
+    executemany: bool,
+) -> None:
+    if context is not None and STATEMENT_TIMER.get() is not None:
+        context._prefect_statement_start = time.perf_counter()  # type: ignore[attr-defined]
+
+
+def _stop_statement_timer(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[sa.engine.ExecutionContext],
+    executemany: bool,
+) -> None:
+    timer = STATEMENT_TIMER.get()
+    started = getattr(context, "_prefect_statement_start", None)
+    if timer is not None and started is not None:
+        timer.seconds += time.perf_counter() - started
+        timer.statements += 1
+
+
+def track_statement_time(engine: AsyncEngine) -> None:
+    """Adds the time spent executing statements with `engine` to `STATEMENT_TIMER`"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _start_statement_timer)
+    event.listen(engine.sync_engine, "after_cursor_execute", _stop_statement_timer)
+
+
 _EngineCacheKey: TypeAlias = tuple[AbstractEventLoop, str, bool, Optional[float]]
 ENGINES: dict[_EngineCacheKey, AsyncEngine] = {}
 
@@ -308,6 +360,8 @@ class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
             if logfire:
                 logfire.instrument_sqlalchemy(engine)  # pyright: ignore
 
+            track_statement_time(engine)
+
             if TRACKER.active:
                 TRACKER.track_pool(engine.pool)
 
@@ -435,6 +489,8 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
             if logfire:
                 logfire.instrument_sqlalchemy(engine)  # pyright: ignore
 
+            track_statement_time(engine)
+
             if TRACKER.active:
                 TRACKER.track_pool(engine.pool)
 
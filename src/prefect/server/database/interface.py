@@ -171,6 +171,11 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """A task run state orm model"""
         return orm_models.TaskRunState
 
+    @property
+    def RunHistoryRollup(self) -> type[orm_models.RunHistoryRollup]:
+        """A run history rollup orm model"""
+        return orm_models.RunHistoryRollup
+
     @property
     def Artifact(self) -> type[orm_models.Artifact]:
         """An artifact orm model"""
@@ -639,6 +639,27 @@ class FlowRun(Run):
                 postgresql_where=cls.state_type == schemas.states.StateType.SCHEDULED,
                 sqlite_where=cls.state_type == schemas.states.StateType.SCHEDULED,
             ),
+            sa.Index(
+                "ix_flow_run__deployment_id_state_type_expected_start_time",
+                cls.deployment_id,
+                cls.state_type,
+                cls.expected_start_time,
+            ),
+            sa.Index(
+                "ix_flow_run__state_type_expected_start_time",
+                cls.state_type,
+                cls.expected_start_time,
+            ),
+            sa.Index(
+                "ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time",
+                cls.work_queue_id,
+                cls.next_scheduled_start_time,
+                postgresql_where=cls.state_type == schemas.states.StateType.SCHEDULED,
+                sqlite_where=cls.state_type == schemas.states.StateType.SCHEDULED,
+            ),
+            sa.Index("ix_flow_run__tags_gin", cls.tags, postgresql_using="gin").ddl_if(
+                dialect="postgresql"
+            ),
         )
 
 
@@ -771,9 +792,53 @@ class TaskRun(Run):
             sa.Index("trgm_ix_task_run_name", cls.name, postgresql_using="gin").ddl_if(
                 dialect="postgresql"
             ),
+            sa.Index(
+                "ix_task_run__state_type_expected_start_time",
+                cls.state_type,
+                cls.expected_start_time,
+            ),
+            sa.Index("ix_task_run__tags_gin", cls.tags, postgresql_using="gin").ddl_if(
+                dialect="postgresql"
+            ),
         )
 
 
+class RunHistoryRollup(Base):
+    """
+    SQLAlchemy model of an aggregate of flow runs or task runs in a terminal
+    state, bucketed by expected start time.
+
+    Terminal runs no longer change as time passes, so their contribution to run
+    history can be computed once and summed when history is requested. Rows are
+    kept up to date by the run history rollups service; `stale` marks buckets
+    whose runs were deleted since they were last computed.
+    """
+
+    run_type: Mapped[str]
+    bucket_seconds: Mapped[int]
+    interval_start: Mapped[DateTime]
+    state_type: Mapped[schemas.states.StateType] = mapped_column(
+        sa.Enum(schemas.states.StateType, name="state_type")
+    )
+    state_name: Mapped[str]
+    flow_id: Mapped[Optional[uuid.UUID]] = mapped_column(index=True)
+    deployment_id: Mapped[Optional[uuid.UUID]]
+    work_queue_id: Mapped[Optional[uuid.UUID]] = mapped_column(index=True)
+    count_runs: Mapped[int]
+    sum_estimated_run_time: Mapped[float]
+    sum_estimated_lateness: Mapped[float]
+    stale: Mapped[bool] = mapped_column(server_default="0", default=False)
+
+    __table_args__: Any = (
+        sa.Index(
+            "ix_run_history_rollup__run_type_bucket_seconds_interval_start",
+            "run_type",
+            "bucket_seconds",
+            "interval_start",
+        ),
+    )
+
+
 class DeploymentSchedule(Base):
     deployment_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("deployment.id", ondelete="CASCADE"), index=True
@@ -0,0 +1,233 @@
+"""
+Timing and query plans for the filter queries most commonly issued by the UI,
+workers and clients.
+
+These back the `prefect server database analyze` command, which reports the
+filter queries that are slow against the current database along with their
+`EXPLAIN` output so that missing indexes or stale planner statistics can be
+diagnosed.
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database import PrefectDBInterface, db_injector
+from prefect.server.schemas import filters, sorting
+from prefect.server.schemas.states import StateType
+from prefect.server.utilities.database import explain
+from prefect.types._datetime import DateTime
+
+# The number of rows requested by each query, matching the page sizes used by the
+# UI and workers
+QUERY_LIMIT = 200
+
+# The time window used for queries filtering on expected start times
+QUERY_WINDOW_DAYS = 7
+
+PLACEHOLDER_TAG = "prefect-query-analysis"
+
+
+@dataclass
+class FilterQueryAnalysis:
+    """
+    The time taken to run a filter query and, if captured, its query plan.
+    """
+
+    name: str
+    duration: float
+    plan: Optional[list[str]] = None
+
+
+@dataclass
+class _SampleValues:
+    """Values taken from the most recent flow run so queries match real rows."""
+
+    deployment_id: uuid.UUID
+    work_queue_id: uuid.UUID
+    tag: str
+
+
+@db_injector
+async def _sample_values(
+    db: PrefectDBInterface, session: AsyncSession
+) -> _SampleValues:
+    result = await session.execute(
+        sa.select(db.FlowRun.deployment_id, db.FlowRun.work_queue_id, db.FlowRun.tags)
+        .where(db.FlowRun.deployment_id.is_not(None))
+        .order_by(db.FlowRun.expected_start_time.desc())
+        .limit(1)
+    )
+    row = result.first()
+    if row is None:
+        return _SampleValues(uuid.uuid4(), uuid.uuid4(), PLACEHOLDER_TAG)
+    return _SampleValues(
+        deployment_id=row.deployment_id,
+        work_queue_id=row.work_queue_id or uuid.uuid4(),
+        tag=row.tags[0] if row.tags else PLACEHOLDER_TAG,
+    )
+
+
+@db_injector
+def filter_queries(
+    db: PrefectDBInterface, sample: _SampleValues
+) -> dict[str, sa.Select[Any]]:
+    """
+    The filter queries to analyze, keyed by a description of what issues them.
+
+    Queries select table columns rather than ORM entities so that timings do not
+    include loading relationships.
+    """
+    window_end = DateTime.now(datetime.timezone.utc)
+    window_start = window_end - datetime.timedelta(days=QUERY_WINDOW_DAYS)
+    active_states = [StateType.PENDING, StateType.RUNNING, StateType.SCHEDULED]
+
+    def flow_runs(
+        flow_run_filter: filters.FlowRunFilter, sort: sorting.FlowRunSort
+    ) -> sa.Select[Any]:
+        return (
+            sa.select(db.FlowRun.__table__)
+            .where(flow_run_filter.as_sql_filter())
+            .order_by(*sort.as_sql_sort())
+            .limit(QUERY_LIMIT)
+        )
+
+    def task_runs(
+        task_run_filter: filters.TaskRunFilter, sort: sorting.TaskRunSort
+    ) -> sa.Select[Any]:
+        return (
+            sa.select(db.TaskRun.__table__)
+            .where(task_run_filter.as_sql_filter())
+            .order_by(*sort.as_sql_sort())
+            .limit(QUERY_LIMIT)
+        )
+
+    return {
+        "flow runs by state and expected start time": flow_runs(
+            filters.FlowRunFilter(
+                state=filters.FlowRunFilterState(
+                    type=filters.FlowRunFilterStateType(any_=active_states)
+                ),
+                expected_start_time=filters.FlowRunFilterExpectedStartTime(
+                    after_=window_start, before_=window_end
+                ),
+            ),
+            sorting.FlowRunSort.EXPECTED_START_TIME_DESC,
+        ),
+        "flow runs by deployment, state and expected start time": flow_runs(
+            filters.FlowRunFilter(
+                deployment_id=filters.FlowRunFilterDeploymentId(
+                    any_=[sample.deployment_id]
+                ),
+                state=filters.FlowRunFilterState(
+                    type=filters.FlowRunFilterStateType(any_=active_states)
+                ),
+                expected_start_time=filters.FlowRunFilterExpectedStartTime(
+                    after_=window_start, before_=window_end
+                ),
+            ),
+            sorting.FlowRunSort.EXPECTED_START_TIME_DESC,
+        ),
+        "flow runs by tags": flow_runs(
+            filters.FlowRunFilter(tags=filters.FlowRunFilterTags(all_=[sample.tag])),
+            sorting.FlowRunSort.EXPECTED_START_TIME_DESC,
+        ),
+        "scheduled flow runs by work queue": (
+            sa.select(db.FlowRun.__table__)
+            .where(
+                db.FlowRun.work_queue_id == sample.work_queue_id,
+                db.FlowRun.state_type == StateType.SCHEDULED,
+                db.FlowRun.next_scheduled_start_time <= window_end,
+            )
+            .order_by(db.FlowRun.next_scheduled_start_time.asc())
+            .limit(QUERY_LIMIT)
+        ),
+        "task runs by state and expected start time": task_runs(
+            filters.TaskRunFilter(
+                state=filters.TaskRunFilterState(
+                    type=filters.TaskRunFilterStateType(any_=active_states)
+                ),
+                expected_start_time=filters.TaskRunFilterExpectedStartTime(
+                    after_=window_start, before_=window_end
+                ),
+            ),
+            sorting.TaskRunSort.EXPECTED_START_TIME_DESC,
+        ),
+        "task runs by tags": task_runs(
+            filters.TaskRunFilter(tags=filters.TaskRunFilterTags(all_=[sample.tag])),
+            sorting.TaskRunSort.EXPECTED_START_TIME_DESC,
+        ),
+    }
+
+
+@db_injector
+async def explain_query(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    query: sa.Select[Any],
+    analyze: bool = True,
+) -> list[str]:
+    """
+    Return the lines of the plan for a query.
+
+    On PostgreSQL, `analyze` executes the query to include actual row counts and
+    timings in the plan. SQLite only reports the steps of the plan, which are
+    indented to show how they are nested.
+    """
+    result = await session.execute(explain(query, analyze=analyze))
+    rows: Sequence[Any] = result.all()
+    if db.dialect.name != "sqlite":
+        return [row[0] for row in rows]
+
+    # `EXPLAIN QUERY PLAN` rows are (id, parent, notused, detail)
+    depths: dict[int, int] = {0: 0}
+    lines: list[str] = []
+    for id_, parent, _, detail in rows:
+        depths[id_] = depths.get(parent, 0) + 1
+        lines.append("  " * (depths[id_] - 1) + detail)
+    return lines
+
+
+async def analyze_filter_queries(
+    session: AsyncSession,
+    slow_query_threshold: float,
+    explain_all: bool = False,
+) -> list[FilterQueryAnalysis]:
+    """
+    Time each filter query, capturing the plan of any that take longer than
+    `slow_query_threshold` seconds.
+
+    Args:
+        session: a database session
+        slow_query_threshold: the duration in seconds above which a query is slow
+        explain_all: capture the plan of every query, not only slow ones
+
+    Returns:
+        the analysis of each query, in the order the queries were run
+    """
+    sample = await _sample_values(session)
+
+    analyses: list[FilterQueryAnalysis] = []
+    for name, query in filter_queries(sample).items():
+        start = time.perf_counter()
+        (await session.execute(query)).all()
+        analysis = FilterQueryAnalysis(name=name, duration=time.perf_counter() - start)
+        if explain_all or analysis.duration > slow_query_threshold:
+            analysis.plan = await explain_query(session, query)
+        analyses.append(analysis)
+    return analyses
+
+
+async def update_statistics(session: AsyncSession) -> None:
+    """
+    Refresh the statistics the query planner uses to choose indexes.
+    """
+    await session.execute(sa.text("ANALYZE"))
@@ -50,6 +50,28 @@ class FlowRunGraphV2Node(NamedTuple):
     encapsulating_ids: Optional[list[UUID]]
 
 
+class FlowRunGraphV2Change(NamedTuple):
+    kind: Literal["flow-run", "task-run"]
+    id: UUID
+    label: str
+    state_type: StateType
+    start_time: DateTime
+    end_time: Optional[DateTime]
+    parent: Optional[Union[UUID, str]]
+    has_encapsulating_task: Optional[bool]
+    task_run_updated: DateTime
+    flow_run_updated: Optional[DateTime]
+
+
+class FlowRunGraphV2Changes(NamedTuple):
+    start_time: Optional[DateTime]
+    end_time: Optional[DateTime]
+    changes: list[FlowRunGraphV2Change]
+    artifacts: dict[Optional[UUID], list[GraphArtifact]]
+    states: list[GraphState]
+    node_count: int
+
+
 ONE_HOUR = 60 * 60
 
 
@@ -401,17 +423,78 @@ class BaseQueryComponents(ABC):
 
         """
 
+    @abstractmethod
+    def _build_flow_run_graph_v2_edges_query(self) -> sa.Select[Any]:
+        """The flow run graph edges query, per database flavour
+
+        The query selects one row per task or subflow run input of the task runs of
+        a flow run, with the columns `kind`, `id`, `label`, `state_type`,
+        `start_time`, `end_time`, `parent` and `has_encapsulating_task`, and must
+        accept the following bind parameters:
+
+            flow_run_id: UUID
+
+        """
+
+    @cached_property
+    def _flow_run_graph_v2_changes_query(self) -> sa.Select[FlowRunGraphV2Change]:
+        return self._build_flow_run_graph_v2_changes_query()
+
     @db_injector
-    async def flow_run_graph_v2(
-        self,
-        db: PrefectDBInterface,
-        session: AsyncSession,
-        flow_run_id: UUID,
-        since: DateTime,
-        max_nodes: int,
-        max_artifacts: int,
-    ) -> Graph:
-        """Returns the query that selects all of the nodes and edges for a flow run graph (version 2)."""
+    def _build_flow_run_graph_v2_changes_query(
+        self, db: PrefectDBInterface
+    ) -> sa.Select[FlowRunGraphV2Change]:
+        """The rows of the flow run graph edges query for task runs, or the subflow
+        runs they wrap, that were updated after the `watermark` bind parameter"""
+        FlowRun, TaskRun = db.FlowRun, db.TaskRun
+        param_watermark = sa.bindparam("watermark", type_=Timestamp)
+
+        query = (
+            self._build_flow_run_graph_v2_edges_query()
+            .add_columns(
+                TaskRun.updated.label("task_run_updated"),
+                FlowRun.updated.label("flow_run_updated"),
+            )
+            .where(
+                sa.or_(
+                    TaskRun.updated > param_watermark,
+                    FlowRun.updated > param_watermark,
+                )
+            )
+            .order_by(None)
+        )
+        return cast(sa.Select[FlowRunGraphV2Change], query)
+
+    async def _count_flow_run_graph_nodes(
+        self, db: PrefectDBInterface, session: AsyncSession, flow_run_id: UUID
+    ) -> int:
+        """Count the task and subflow runs of a flow run graph (version 2)."""
+        FlowRun, TaskRun = db.FlowRun, db.TaskRun
+        result = await session.execute(
+            sa.select(sa.func.count())
+            .select_from(TaskRun)
+            .join(
+                FlowRun,
+                isouter=True,
+                onclause=FlowRun.parent_task_run_id == TaskRun.id,
+            )
+            .where(
+                TaskRun.flow_run_id == flow_run_id,
+                TaskRun.state_type != StateType.PENDING,
+                sa.func.coalesce(
+                    FlowRun.start_time,
+                    FlowRun.expected_start_time,
+                    TaskRun.start_time,
+                    TaskRun.expected_start_time,
+                ).is_not(None),
+            )
+        )
+        return result.scalar_one()
+
+    async def _get_flow_run_graph_bounds(
+        self, db: PrefectDBInterface, session: AsyncSession, flow_run_id: UUID
+    ) -> tuple[Optional[DateTime], Optional[DateTime]]:
+        """Get the start and end time of a flow run for a flow run graph."""
         FlowRun = db.FlowRun
         result = await session.execute(
             sa.select(
@@ -422,10 +505,25 @@ class BaseQueryComponents(ABC):
             ).where(FlowRun.id == flow_run_id)
         )
         try:
-            start_time, end_time = result.t.one()
+            return result.t.one()
         except NoResultFound:
             raise ObjectNotFoundError(f"Flow run {flow_run_id} not found")
 
+    @db_injector
+    async def flow_run_graph_v2(
+        self,
+        db: PrefectDBInterface,
+        session: AsyncSession,
+        flow_run_id: UUID,
+        since: DateTime,
+        max_nodes: int,
+        max_artifacts: int,
+    ) -> Graph:
+        """Returns the query that selects all of the nodes and edges for a flow run graph (version 2)."""
+        start_time, end_time = await self._get_flow_run_graph_bounds(
+            db, session, flow_run_id
+        )
+
         query = self._flow_run_graph_v2_query
         results = await session.execute(
             query,
@@ -481,6 +579,43 @@ class BaseQueryComponents(ABC):
             states=graph_states,
         )
 
+    @db_injector
+    async def flow_run_graph_v2_changes(
+        self,
+        db: PrefectDBInterface,
+        session: AsyncSession,
+        flow_run_id: UUID,
+        watermark: DateTime,
+        max_artifacts: int,
+    ) -> FlowRunGraphV2Changes:
+        """Returns the edges of the task and subflow runs of a flow run graph (version
+        2) that were updated after `watermark`, along with the flow run's current
+        artifacts, states, and number of nodes."""
+        start_time, end_time = await self._get_flow_run_graph_bounds(
+            db, session, flow_run_id
+        )
+
+        results = await session.execute(
+            self._flow_run_graph_v2_changes_query,
+            params=dict(flow_run_id=flow_run_id, watermark=watermark),
+        )
+        changes = [FlowRunGraphV2Change(*row) for row in results.t]
+
+        graph_artifacts = await self._get_flow_run_graph_artifacts(
+            db, session, flow_run_id, max_artifacts
+        )
+        graph_states = await self._get_flow_run_graph_states(session, flow_run_id)
+        node_count = await self._count_flow_run_graph_nodes(db, session, flow_run_id)
+
+        return FlowRunGraphV2Changes(
+            start_time=start_time,
+            end_time=end_time,
+            changes=changes,
+            artifacts=graph_artifacts,
+            states=graph_states,
+            node_count=node_count,
+        )
+
     async def _get_flow_run_graph_artifacts(
         self,
         db: PrefectDBInterface,
@@ -617,18 +752,14 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
         return "postgres/get-runs-from-worker-queues.sql.jinja"
 
     @db_injector
-    def _build_flow_run_graph_v2_query(
+    def _build_flow_run_graph_v2_edges_query(
         self, db: PrefectDBInterface
-    ) -> sa.Select[FlowRunGraphV2Node]:
-        """Postgresql version of the V2 FlowRun graph data query
-
-        This SQLA query is built just once and then cached per DB interface
+    ) -> sa.Select[Any]:
+        """Postgresql version of the V2 FlowRun graph edges query, selecting one row
+        for each task or subflow run input of the flow run's task runs
 
         """
-        # the parameters this query takes as inputs
         param_flow_run_id = sa.bindparam("flow_run_id", type_=UUIDTypeDecorator)
-        param_since = sa.bindparam("since", type_=Timestamp)
-        param_max_nodes = sa.bindparam("max_nodes", type_=sa.Integer)
 
         Flow, FlowRun, TaskRun = db.Flow, db.FlowRun, db.TaskRun
         input = sa.func.jsonb_each(TaskRun.task_inputs).table_valued(
@@ -639,7 +770,7 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
             .table_valued(sa.column("value", postgresql.JSONB()))
             .render_derived(name="argument")
         )
-        edges = (
+        return (
             sa.select(
                 sa.case((FlowRun.id.is_not(None), "flow-run"), else_="task-run").label(
                     "kind"
@@ -694,7 +825,22 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
             # -- the order here is important to speed up building the two sets of
             # -- edges in the with_parents and with_children CTEs below
             .order_by(sa.func.coalesce(FlowRun.id, TaskRun.id))
-        ).cte("edges")
+        )
+
+    @db_injector
+    def _build_flow_run_graph_v2_query(
+        self, db: PrefectDBInterface
+    ) -> sa.Select[FlowRunGraphV2Node]:
+        """Postgresql version of the V2 FlowRun graph data query
+
+        This SQLA query is built just once and then cached per DB interface
+
+        """
+        # the parameters this query takes as inputs
+        param_since = sa.bindparam("since", type_=Timestamp)
+        param_max_nodes = sa.bindparam("max_nodes", type_=sa.Integer)
+
+        edges = self._build_flow_run_graph_v2_edges_query().cte("edges")
         children, parents = edges.alias("children"), edges.alias("parents")
         with_encapsulating = (
             sa.select(
@@ -939,18 +1085,14 @@ class AioSqliteQueryComponents(BaseQueryComponents):
         return "sqlite/get-runs-from-worker-queues.sql.jinja"
 
     @db_injector
-    def _build_flow_run_graph_v2_query(
+    def _build_flow_run_graph_v2_edges_query(
         self, db: PrefectDBInterface
-    ) -> sa.Select[FlowRunGraphV2Node]:
-        """Postgresql version of the V2 FlowRun graph data query
-
-        This SQLA query is built just once and then cached per DB interface
+    ) -> sa.Select[Any]:
+        """SQLite version of the V2 FlowRun graph edges query, selecting one row
+        for each task or subflow run input of the flow run's task runs
 
         """
-        # the parameters this query takes as inputs
         param_flow_run_id = sa.bindparam("flow_run_id", type_=UUIDTypeDecorator)
-        param_since = sa.bindparam("since", type_=Timestamp)
-        param_max_nodes = sa.bindparam("max_nodes", type_=sa.Integer)
 
         Flow, FlowRun, TaskRun = db.Flow, db.FlowRun, db.TaskRun
         input = sa.func.json_each(TaskRun.task_inputs).table_valued(
@@ -959,7 +1101,7 @@ class AioSqliteQueryComponents(BaseQueryComponents):
         argument = sa.func.json_each(
             input.c.value, type_=postgresql.JSON()
         ).table_valued("key", sa.column("value", postgresql.JSON()), name="argument")
-        edges = (
+        return (
             sa.select(
                 sa.case((FlowRun.id.is_not(None), "flow-run"), else_="task-run").label(
                     "kind"
@@ -1012,7 +1154,22 @@ class AioSqliteQueryComponents(BaseQueryComponents):
             # -- the order here is important to speed up building the two sets of
             # -- edges in the with_parents and with_children CTEs below
             .order_by(sa.func.coalesce(FlowRun.id, TaskRun.id))
-        ).cte("edges")
+        )
+
+    @db_injector
+    def _build_flow_run_graph_v2_query(
+        self, db: PrefectDBInterface
+    ) -> sa.Select[FlowRunGraphV2Node]:
+        """SQLite version of the V2 FlowRun graph data query
+
+        This SQLA query is built just once and then cached per DB interface
+
+        """
+        # the parameters this query takes as inputs
+        param_since = sa.bindparam("since", type_=Timestamp)
+        param_max_nodes = sa.bindparam("max_nodes", type_=sa.Integer)
+
+        edges = self._build_flow_run_graph_v2_edges_query().cte("edges")
         children, parents = edges.alias("children"), edges.alias("parents")
         with_encapsulating = (
             sa.select(
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, NoReturn
 from prefect.logging import get_logger
 from prefect.server.events import actions
 from prefect.server.services.base import RunInAllServers, Service
+from prefect.server.services.metrics import instrument_handler
 from prefect.server.utilities.messaging import Consumer, create_consumer
 from prefect.server.utilities.messaging._consumer_names import (
     generate_unique_consumer_name,
@@ -35,7 +36,9 @@ class Actions(RunInAllServers, Service):
         )
 
         async with actions.consumer() as handler:
-            self.consumer_task = asyncio.create_task(self.consumer.run(handler))
+            self.consumer_task = asyncio.create_task(
+                self.consumer.run(instrument_handler(self.name, handler))
+            )
             logger.debug("Actions started")
 
             try:
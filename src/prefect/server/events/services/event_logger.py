@@ -8,6 +8,7 @@ import rich
 from prefect.logging import get_logger
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.services.base import RunInAllServers, Service
+from prefect.server.services.metrics import instrument_handler
 from prefect.server.utilities.messaging import Consumer, Message, create_consumer
 from prefect.server.utilities.messaging._consumer_names import (
     generate_unique_consumer_name,
@@ -55,7 +56,9 @@ class EventLogger(RunInAllServers, Service):
             )
             console.file.flush()
 
-        self.consumer_task = asyncio.create_task(self.consumer.run(handler))
+        self.consumer_task = asyncio.create_task(
+            self.consumer.run(instrument_handler(self.name, handler))
+        )
         logger.debug("Event logger started")
 
         try:
@@ -18,6 +18,7 @@ from prefect.server.database import provide_database_interface
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.events.storage.database import write_events
 from prefect.server.services.base import RunInAllServers, Service
+from prefect.server.services.metrics import instrument_handler
 from prefect.server.utilities.messaging import (
     Consumer,
     Message,
@@ -117,7 +118,9 @@ class EventPersister(RunInAllServers, Service):
                 seconds=PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL.value()
             ),
         ) as handler:
-            self.consumer_task = asyncio.create_task(self.consumer.run(handler))
+            self.consumer_task = asyncio.create_task(
+                self.consumer.run(instrument_handler(self.name, handler))
+            )
             logger.debug("Event persister started")
             self.started_event.set()
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, NoReturn, Optional
 from prefect.logging import get_logger
 from prefect.server.events import triggers
 from prefect.server.services.base import LoopService, RunInAllServers, Service
+from prefect.server.services.metrics import instrument_handler
 from prefect.server.utilities.messaging import Consumer, create_consumer
 from prefect.server.utilities.messaging._consumer_names import (
     generate_unique_consumer_name,
@@ -41,7 +42,9 @@ class ReactiveTriggers(RunInAllServers, Service):
         )
 
         async with triggers.consumer() as handler:
-            self.consumer_task = asyncio.create_task(self.consumer.run(handler))
+            self.consumer_task = asyncio.create_task(
+                self.consumer.run(instrument_handler(self.name, handler))
+            )
             logger.debug("Reactive triggers started")
 
             try:
@@ -17,8 +17,19 @@ class InvalidTokenError(ValueError):
 
 
 def to_page_token(
-    filter: "EventFilter", count: int, page_size: int, current_offset: int
+    filter: "EventFilter",
+    count: int,
+    page_size: int,
+    current_offset: int,
+    after: Optional[str] = None,
 ) -> Optional[str]:
+    """
+    Encode a token for the page following the one at `current_offset`.
+
+    `after` is an optional keyset cursor for the last event of the current page.
+    When present, the next page resumes after that event instead of skipping
+    `offset` events.
+    """
     if current_offset + page_size >= count:
         return None
 
@@ -29,12 +40,15 @@ def to_page_token(
                 "count": count,
                 "page_size": page_size,
                 "offset": current_offset + page_size,
+                "after": after,
             }
         ).encode()
     ).decode()
 
 
-def from_page_token(page_token: str) -> Tuple["EventFilter", int, int, int]:
+def from_page_token(
+    page_token: str,
+) -> Tuple["EventFilter", int, int, int, Optional[str]]:
     from prefect.server.events.filters import EventFilter
 
     try:
@@ -50,6 +64,7 @@ def from_page_token(page_token: str) -> Tuple["EventFilter", int, int, int]:
         parameters["count"],
         parameters["page_size"],
         parameters["offset"],
+        parameters.get("after"),
     )
 
 
@@ -1,3 +1,4 @@
+import datetime
 from typing import TYPE_CHECKING, Any, Generator, Optional, Sequence
 
 import pydantic
@@ -16,11 +17,17 @@ from prefect.server.events.filters import EventFilter, EventOrder
 from prefect.server.events.schemas.events import EventCount, ReceivedEvent
 from prefect.server.events.storage import (
     INTERACTIVE_PAGE_SIZE,
+    InvalidTokenError,
     from_page_token,
     process_time_based_counts,
     to_page_token,
 )
 from prefect.server.utilities.database import get_dialect
+from prefect.server.utilities.pagination import (
+    InvalidCursorError,
+    Keyset,
+    KeysetPosition,
+)
 from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
 
 if TYPE_CHECKING:
@@ -44,6 +51,33 @@ def build_distinct_queries(
     return []
 
 
+@db_injector
+def events_keyset(
+    db: PrefectDBInterface,
+    events_filter: EventFilter,
+    columns: Optional[Any] = None,
+) -> Keyset:
+    """
+    The keyset used to order and page through events, optionally over the
+    `occurred` and `id` columns of a subquery rather than the events table.
+    """
+    columns = columns if columns is not None else db.Event
+    return Keyset(
+        id=columns.id,
+        key=columns.occurred,
+        key_type=datetime.datetime,
+        key_of=lambda event: event.occurred,
+        descending=events_filter.order == EventOrder.DESC,
+    )
+
+
+def _page_cursor(events_filter: EventFilter, page: Sequence[Any]) -> Optional[str]:
+    if not page:
+        return None
+    keyset = events_keyset(events_filter)
+    return keyset.encode_cursor(events_filter.order.value, keyset.position_of(page[-1]))
+
+
 async def query_events(
     session: AsyncSession,
     filter: EventFilter,
@@ -53,7 +87,9 @@ async def query_events(
     count = await raw_count_events(session, filter)
     page = await read_events(session, filter, limit=page_size, offset=0)
     events = [ReceivedEvent.model_validate(e, from_attributes=True) for e in page]
-    page_token = to_page_token(filter, count, page_size, 0)
+    page_token = to_page_token(
+        filter, count, page_size, 0, after=_page_cursor(filter, page)
+    )
     return events, count, page_token
 
 
@@ -62,10 +98,21 @@ async def query_next_page(
     page_token: str,
 ) -> tuple[list[ReceivedEvent], int, Optional[str]]:
     assert isinstance(session, AsyncSession)
-    filter, count, page_size, offset = from_page_token(page_token)
-    page = await read_events(session, filter, limit=page_size, offset=offset)
+    filter, count, page_size, offset, cursor = from_page_token(page_token)
+    if cursor is not None:
+        try:
+            after = events_keyset(filter).decode_cursor(filter.order.value, cursor)
+        except InvalidCursorError as exc:
+            raise InvalidTokenError("Unable to parse page token") from exc
+        page = await read_events(session, filter, limit=page_size, after=after)
+    else:
+        # page tokens issued before keyset pagination was introduced only carry
+        # an offset
+        page = await read_events(session, filter, limit=page_size, offset=offset)
     events = [ReceivedEvent.model_validate(e, from_attributes=True) for e in page]
-    next_token = to_page_token(filter, count, page_size, offset)
+    next_token = to_page_token(
+        filter, count, page_size, offset, after=_page_cursor(filter, page)
+    )
     return events, count, next_token
 
 
@@ -133,6 +180,7 @@ async def read_events(
     events_filter: EventFilter,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    after: Optional[KeysetPosition] = None,
 ) -> Sequence["ORMEvent"]:
     """
     Read events from the Postgres database.
@@ -142,12 +190,15 @@ async def read_events(
         filter: filter criteria for events.
         limit: limit for the query.
         offset: offset for the query.
+        after: if provided, only read events ordered after this position.
 
     Returns:
         A list of events ORM objects.
     """
     # Always order by occurred timestamp, with placeholder for order direction
     order = sa.desc if events_filter.order == EventOrder.DESC else sa.asc
+    # Ties on the occurred timestamp are broken by id so that pages are stable
+    after = after or KeysetPosition()
 
     # Check if distinct fields are provided
     if distinct_fields := build_distinct_queries(events_filter):
@@ -174,16 +225,18 @@ async def read_events(
         # Create the final query from the subquery, filtering to get only rows with row_number = 1
         select_events_query = sa.select(aliased_table).where(subquery.c.row_number == 1)
 
-        # Order by the occurred timestamp
-        select_events_query = select_events_query.order_by(order(subquery.c.occurred))
+        select_events_query = events_keyset(events_filter, subquery.c).apply(
+            select_events_query, after
+        )
 
     else:
         # If no distinct fields are provided, create a query for all events
         select_events_query = sa.select(db.Event).where(
             sa.and_(*events_filter.build_where_clauses())
         )
-        # Order by the occurred timestamp
-        select_events_query = select_events_query.order_by(order(db.Event.occurred))
+        select_events_query = events_keyset(events_filter).apply(
+            select_events_query, after
+        )
 
     if limit is not None:
         limit = max(0, min(limit, events_filter.logical_limit))
@@ -17,6 +17,7 @@ from prefect.logging import get_logger
 from prefect.server.events.filters import EventFilter
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.services.base import RunInAllServers, Service
+from prefect.server.services.metrics import instrument_handler
 from prefect.server.utilities import messaging
 from prefect.settings.context import get_current_settings
 from prefect.settings.models.server.services import ServicesBaseSetting
@@ -175,5 +176,5 @@ async def run_distributor(started: asyncio.Event) -> NoReturn:
         async with distributor() as handler:
             consumer = messaging.create_consumer(**create_consumer_kwargs)
             await consumer.run(
-                handler=handler,
+                handler=instrument_handler("Distributor", handler),
             )
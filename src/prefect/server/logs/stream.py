@@ -18,6 +18,7 @@ from prefect.logging import get_logger
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
 from prefect.server.services.base import RunInAllServers, Service
+from prefect.server.services.metrics import instrument_handler
 from prefect.server.utilities import messaging
 from prefect.settings.context import get_current_settings
 from prefect.settings.models.server.services import ServicesBaseSetting
@@ -260,7 +261,7 @@ async def run_distributor(started: asyncio.Event) -> NoReturn:
         async with distributor() as handler:
             consumer = messaging.create_consumer(**create_consumer_kwargs)
             await consumer.run(
-                handler=handler,
+                handler=instrument_handler("LogDistributor", handler),
             )
 
     # This should never be reached due to the infinite nature of consumer.run()
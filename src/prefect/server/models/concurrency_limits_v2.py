@@ -1,4 +1,4 @@
-from typing import List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Union
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -8,6 +8,9 @@ from sqlalchemy.sql.elements import ColumnElement
 import prefect.server.schemas as schemas
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 
+if TYPE_CHECKING:
+    from prefect.server.concurrency.ledger import SlotLedger
+
 
 def active_slots_after_decay(db: PrefectDBInterface) -> ColumnElement[float]:
     # Active slots will decay at a rate of `slot_decay_per_second` per second.
@@ -58,6 +61,32 @@ OCCUPANCY_SAMPLES_MULTIPLIER = 2
 MINIMUM_OCCUPANCY_SECONDS_PER_SLOT = 0.1
 
 
+def _slot_ledger() -> "Optional[SlotLedger]":
+    # imported here because the ledger shares this module's occupancy constants
+    from prefect.server.concurrency.ledger import get_slot_ledger
+
+    return get_slot_ledger()
+
+
+def _undo_on_rollback(session: AsyncSession, undo: Callable[[], None]) -> None:
+    from prefect.server.concurrency.ledger import undo_on_rollback
+
+    undo_on_rollback(session, undo)
+
+
+@db_injector
+async def _read_active_concurrency_limits(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    concurrency_limit_ids: List[UUID],
+) -> List[orm_models.ConcurrencyLimitV2]:
+    query = sa.select(db.ConcurrencyLimitV2).where(
+        db.ConcurrencyLimitV2.id.in_(concurrency_limit_ids),
+        db.ConcurrencyLimitV2.active == True,  # noqa
+    )
+    return list((await session.execute(query)).scalars().all())
+
+
 @db_injector
 async def create_concurrency_limit(
     db: PrefectDBInterface,
@@ -141,6 +170,13 @@ async def update_concurrency_limit(
         .values(**concurrency_limit.model_dump(exclude_unset=True))
     )
 
+    ledger = _slot_ledger()
+    if ledger is not None and concurrency_limit.model_fields_set & {
+        "active_slots",
+        "denied_slots",
+    }:
+        ledger.forget([current_concurrency_limit.id])
+
     return result.rowcount > 0
 
 
@@ -161,6 +197,12 @@ async def delete_concurrency_limit(
     )
     query = sa.delete(db.ConcurrencyLimitV2).where(where)
 
+    if ledger := _slot_ledger():
+        query = query.returning(db.ConcurrencyLimitV2.id)
+        deleted_ids = list((await session.execute(query)).scalars().all())
+        ledger.forget(deleted_ids)
+        return len(deleted_ids) > 0
+
     result = await session.execute(query)
     return result.rowcount > 0
 
@@ -187,6 +229,20 @@ async def bulk_increment_active_slots(
     concurrency_limit_ids: List[UUID],
     slots: int,
 ) -> bool:
+    if ledger := _slot_ledger():
+        limits = await _read_active_concurrency_limits(session, concurrency_limit_ids)
+        if len(limits) != len(concurrency_limit_ids):
+            return False
+        if not ledger.increment(limits, slots):
+            return False
+        _undo_on_rollback(
+            session,
+            lambda: ledger.adjust(
+                {limit_id: -slots for limit_id in concurrency_limit_ids}
+            ),
+        )
+        return True
+
     active_slots = active_slots_after_decay(db)
     denied_slots = denied_slots_after_decay(db)
 
@@ -217,6 +273,12 @@ async def bulk_decrement_active_slots(
     slots: int,
     occupancy_seconds: Optional[float] = None,
 ) -> bool:
+    if ledger := _slot_ledger():
+        limits = await _read_active_concurrency_limits(session, concurrency_limit_ids)
+        released = ledger.decrement(limits, slots, occupancy_seconds=occupancy_seconds)
+        _undo_on_rollback(session, lambda: ledger.adjust(released))
+        return len(limits) == len(concurrency_limit_ids)
+
     query = (
         sa.update(db.ConcurrencyLimitV2)
         .where(
@@ -264,6 +326,11 @@ async def bulk_update_denied_slots(
     concurrency_limit_ids: List[UUID],
     slots: int,
 ) -> bool:
+    if ledger := _slot_ledger():
+        limits = await _read_active_concurrency_limits(session, concurrency_limit_ids)
+        ledger.deny(limits, slots)
+        return len(limits) == len(concurrency_limit_ids)
+
     query = (
         sa.update(db.ConcurrencyLimitV2)
         .where(
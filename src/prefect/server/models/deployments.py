@@ -5,13 +5,18 @@ Intended for internal use by the Prefect REST API.
 
 from __future__ import annotations
 
+import bisect
 import datetime
 import logging
-from collections.abc import Iterable, Sequence
+import threading
+from collections.abc import AsyncGenerator, Iterable, Sequence
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
 from uuid import UUID
+from zoneinfo import ZoneInfo
 
 import sqlalchemy as sa
+from cachetools import LRUCache
 from sqlalchemy import delete, or_, select
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,6 +30,7 @@ from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models.events import deployment_status_event
 from prefect.server.schemas.statuses import DeploymentStatus
+from prefect.server.utilities.streaming import STREAMING_CHUNK_SIZE, stream_scalars
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MAX_RUNS,
     PREFECT_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME,
@@ -32,6 +38,7 @@ from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MIN_SCHEDULED_TIME,
 )
 from prefect.types._datetime import DateTime, now
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
 
 T = TypeVar("T", bound=tuple[Any, ...])
 
@@ -366,6 +373,56 @@ async def read_deployment(
     return await session.get(db.Deployment, deployment_id)
 
 
+@db_injector
+async def read_deployment_updated(
+    db: PrefectDBInterface, session: AsyncSession, deployment_id: UUID
+) -> Optional[DateTime]:
+    """Reads when a deployment, its schedules or its concurrency limit were last
+    updated, without loading the deployment.
+
+    Args:
+        session: A database session
+        deployment_id: a deployment id
+
+    Returns:
+        DateTime: the latest `updated` timestamp, or None if the deployment
+            doesn't exist
+    """
+    schedules_updated = (
+        sa.select(sa.func.max(db.DeploymentSchedule.updated))
+        .where(db.DeploymentSchedule.deployment_id == db.Deployment.id)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        sa.select(
+            db.Deployment.updated,
+            sa.type_coerce(schedules_updated, db.Deployment.updated.type),
+            db.ConcurrencyLimitV2.updated,
+        )
+        .outerjoin(
+            db.ConcurrencyLimitV2,
+            db.ConcurrencyLimitV2.id == db.Deployment.concurrency_limit_id,
+        )
+        .where(db.Deployment.id == deployment_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return max(updated for updated in row if updated is not None)
+
+
+def deployment_updated(deployment: orm_models.Deployment) -> DateTime:
+    """
+    The time a loaded deployment, its schedules or its concurrency limit were last
+    updated, matching `read_deployment_updated`.
+    """
+    timestamps = [deployment.updated]
+    timestamps.extend(schedule.updated for schedule in deployment.schedules)
+    if deployment.global_concurrency_limit:
+        timestamps.append(deployment.global_concurrency_limit.updated)
+    return max(timestamps)
+
+
 @db_injector
 async def read_deployment_by_name(
     db: PrefectDBInterface, session: AsyncSession, name: str, flow_name: str
@@ -458,6 +515,39 @@ async def _apply_deployment_filters(
     return query
 
 
+async def _read_deployments_query(
+    db: PrefectDBInterface,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
+    sort: schemas.sorting.DeploymentSort = schemas.sorting.DeploymentSort.NAME_ASC,
+) -> sa.Select[tuple[orm_models.Deployment]]:
+    query = select(db.Deployment).order_by(*sort.as_sql_sort())
+
+    query = await _apply_deployment_filters(
+        db,
+        query=query,
+        flow_filter=flow_filter,
+        flow_run_filter=flow_run_filter,
+        task_run_filter=task_run_filter,
+        deployment_filter=deployment_filter,
+        work_pool_filter=work_pool_filter,
+        work_queue_filter=work_queue_filter,
+    )
+
+    if offset is not None:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query
+
+
 @db_injector
 async def read_deployments(
     db: PrefectDBInterface,
@@ -490,29 +580,58 @@ async def read_deployments(
     Returns:
         list[orm_models.Deployment]: deployments
     """
-
-    query = select(db.Deployment).order_by(*sort.as_sql_sort())
-
-    query = await _apply_deployment_filters(
+    query = await _read_deployments_query(
         db,
-        query=query,
+        offset=offset,
+        limit=limit,
         flow_filter=flow_filter,
         flow_run_filter=flow_run_filter,
         task_run_filter=task_run_filter,
         deployment_filter=deployment_filter,
         work_pool_filter=work_pool_filter,
         work_queue_filter=work_queue_filter,
+        sort=sort,
     )
-
-    if offset is not None:
-        query = query.offset(offset)
-    if limit is not None:
-        query = query.limit(limit)
-
     result = await session.execute(query)
     return result.scalars().unique().all()
 
 
+@db_injector
+async def stream_deployments(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
+    sort: schemas.sorting.DeploymentSort = schemas.sorting.DeploymentSort.NAME_ASC,
+    chunk_size: int = STREAMING_CHUNK_SIZE,
+) -> AsyncGenerator[Sequence[orm_models.Deployment], None]:
+    """
+    Read deployments with a server-side cursor, yielding them in chunks.
+
+    Accepts the same filters as `read_deployments`.
+    """
+    query = await _read_deployments_query(
+        db,
+        offset=offset,
+        limit=limit,
+        flow_filter=flow_filter,
+        flow_run_filter=flow_run_filter,
+        task_run_filter=task_run_filter,
+        deployment_filter=deployment_filter,
+        work_pool_filter=work_pool_filter,
+        work_queue_filter=work_queue_filter,
+        sort=sort,
+    )
+    async for chunk in stream_scalars(session, query, chunk_size=chunk_size):
+        yield chunk
+
+
 @db_injector
 async def count_deployments(
     db: PrefectDBInterface,
@@ -730,17 +849,28 @@ async def _generate_scheduled_flow_runs(
     )
 
     for deployment_schedule in active_deployment_schedules:
-        dates: list[DateTime] = []
-
-        # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
-        for dt in deployment_schedule.schedule._get_dates_generator(
-            n=max_runs, start=start_time, end=end_time
-        ):
-            dates.append(dt)
-
-            # at any point, if we satisfy both of the minimums, we can stop
-            if len(dates) >= min_runs and dt >= (start_time + min_time):
-                break
+        dates = _read_schedule_horizon(
+            deployment_schedule.id,
+            deployment_schedule.schedule,
+            start_time=start_time,
+            end_time=end_time,
+            min_time=min_time,
+            min_runs=min_runs,
+            max_runs=max_runs,
+        )
+        if dates is None:
+            # computing dates can take a while for complex schedules, so it is done
+            # in a worker thread to keep the event loop responsive
+            dates = await run_sync_in_worker_thread(
+                _schedule_dates,
+                deployment_schedule.schedule,
+                start_time=start_time,
+                end_time=end_time,
+                min_time=min_time,
+                min_runs=min_runs,
+                max_runs=max_runs,
+                schedule_id=deployment_schedule.id,
+            )
 
         tags = deployment.tags
         if auto_scheduled:
@@ -792,6 +922,192 @@ async def _generate_scheduled_flow_runs(
     return runs
 
 
+def _schedule_dates(
+    schedule: schemas.schedules.SCHEDULE_TYPES,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+    schedule_id: Optional[UUID] = None,
+) -> list[DateTime]:
+    """
+    The dates of a schedule to create runs for, following the rules described in
+    `_generate_scheduled_flow_runs`.
+
+    If a `schedule_id` is given, every date up to `max_runs` and `end_time` is
+    computed and remembered as the schedule's horizon, so later calls can read
+    their dates from it with `_read_schedule_horizon` rather than computing them
+    again.
+    """
+    if schedule_id is None or max_runs > SCHEDULE_HORIZON_MAX_RUNS:
+        dates: list[DateTime] = []
+
+        # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
+        for dt in schedule._get_dates_generator(
+            n=max_runs, start=start_time, end=end_time
+        ):
+            dates.append(dt)
+
+            # at any point, if we satisfy both of the minimums, we can stop
+            if len(dates) >= min_runs and dt >= (start_time + min_time):
+                break
+
+        return dates
+
+    horizon = _ScheduleHorizon(
+        schedule=schedule,
+        start=start_time,
+        end=end_time,
+        dates=schedule._get_dates_batch(n=max_runs, start=start_time, end=end_time),
+        max_runs=max_runs,
+        stable_until=_utc_offset_stable_until(schedule.timezone, start_time, end_time),
+    )
+    with _schedule_horizons_lock:
+        _schedule_horizons[schedule_id] = horizon
+
+    selected = horizon.select(start_time, end_time, min_time, min_runs, max_runs)
+    if TYPE_CHECKING:
+        assert selected is not None
+    return selected
+
+
+# The number of deployment schedules whose upcoming dates are kept in memory, so
+# that the scheduler doesn't compute the dates of unchanged schedules every loop
+SCHEDULE_HORIZON_CACHE_SIZE = 10_000
+
+# Schedules are only remembered when at most this many runs are scheduled at once,
+# well below the number of candidate dates schedules check, so that a horizon
+# holding fewer than `max_runs` dates always ends at its `end`
+SCHEDULE_HORIZON_MAX_RUNS = schemas.schedules.MAX_ITERATIONS // 2
+
+
+@dataclass
+class _ScheduleHorizon:
+    """The dates of a schedule between `start` and its horizon"""
+
+    schedule: schemas.schedules.SCHEDULE_TYPES
+    start: datetime.datetime
+    end: datetime.datetime
+    dates: list[DateTime]
+    max_runs: int
+    # schedules generate different dates around a change of UTC offset depending
+    # on where they start, so windows starting later than `start` are only read
+    # from the horizon up to the first change
+    stable_until: datetime.datetime
+    stable_count: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        # the dates up to `stable_until` are in order, so they can be searched
+        self.stable_count = 0
+        for dt in self.dates:
+            if dt > self.stable_until:
+                break
+            self.stable_count += 1
+
+    @property
+    def horizon(self) -> datetime.datetime:
+        """Every date of the schedule from `start` up to this time is in `dates`"""
+        if len(self.dates) < self.max_runs:
+            return self.end
+        return self.dates[-1] if self.dates else self.start
+
+    def select(
+        self,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        min_time: datetime.timedelta,
+        min_runs: int,
+        max_runs: int,
+    ) -> Optional[list[DateTime]]:
+        """
+        The dates `_schedule_dates` would compute for this window, or `None` if
+        they can't be determined from this horizon.
+        """
+        if start_time < self.start:
+            return None
+
+        dates: list[DateTime] = []
+        covered_until: Optional[datetime.datetime] = None
+        first = 0
+        if start_time > self.start:
+            first = bisect.bisect_left(self.dates, start_time, 0, self.stable_count)
+
+        for dt in self.dates[first:]:
+            if dt > end_time:
+                covered_until = end_time
+                break
+
+            dates.append(dt)
+            if len(dates) >= max_runs or (
+                len(dates) >= min_runs and dt >= (start_time + min_time)
+            ):
+                covered_until = dt
+                break
+        else:
+            if end_time <= self.horizon:
+                covered_until = end_time
+
+        if covered_until is None:
+            return None
+        if start_time > self.start and covered_until > self.stable_until:
+            return None
+        return dates
+
+
+def _utc_offset_stable_until(
+    timezone: Optional[str], start: datetime.datetime, end: datetime.datetime
+) -> datetime.datetime:
+    """
+    The latest time, checked daily up to `end`, before which the UTC offset of a
+    timezone is the same as at `start`, or `start` itself if the offset changed
+    during the day before it
+    """
+    tz = ZoneInfo(timezone or "UTC")
+    offset = start.astimezone(tz).utcoffset()
+
+    stable_until = start
+    if (start - datetime.timedelta(days=1)).astimezone(tz).utcoffset() != offset:
+        return stable_until
+
+    while stable_until < end:
+        next_check = min(stable_until + datetime.timedelta(days=1), end)
+        if next_check.astimezone(tz).utcoffset() != offset:
+            break
+        stable_until = next_check
+    return stable_until
+
+
+_schedule_horizons: LRUCache[UUID, _ScheduleHorizon] = LRUCache(
+    maxsize=SCHEDULE_HORIZON_CACHE_SIZE
+)
+# dates are computed in worker threads
+_schedule_horizons_lock = threading.Lock()
+
+
+def _read_schedule_horizon(
+    schedule_id: UUID,
+    schedule: schemas.schedules.SCHEDULE_TYPES,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+) -> Optional[list[DateTime]]:
+    """
+    The dates of a schedule to create runs for, read from the horizon remembered by
+    `_schedule_dates`, or `None` if the schedule has changed since or its horizon
+    doesn't cover the window.
+    """
+    with _schedule_horizons_lock:
+        horizon = _schedule_horizons.get(schedule_id)
+
+    if horizon is None or horizon.schedule != schedule:
+        return None
+
+    return horizon.select(start_time, end_time, min_time, min_runs, max_runs)
+
+
 @db_injector
 async def _insert_scheduled_flow_runs(
     db: PrefectDBInterface, session: AsyncSession, runs: list[dict[str, Any]]
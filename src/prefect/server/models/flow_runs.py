@@ -5,12 +5,19 @@ Intended for internal use by the Prefect REST API.
 
 import contextlib
 import datetime
+import time
+from collections import defaultdict
+from dataclasses import dataclass
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Dict,
+    Iterable,
     List,
+    Literal,
+    MutableMapping,
     Optional,
     Sequence,
     Tuple,
@@ -22,6 +29,7 @@ from typing import (
 from uuid import UUID
 
 import sqlalchemy as sa
+from cachetools import TTLCache
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only, selectinload
@@ -31,18 +39,36 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.logging.loggers import get_logger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
+from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
-from prefect.server.orchestration.core_policy import MinimalFlowPolicy
+from prefect.server.models.events import (
+    TRUNCATE_STATE_MESSAGES_AT,
+    flow_run_state_change_event,
+    truncated_to,
+)
+from prefect.server.orchestration.core_policy import (
+    MarkLateRunsPolicy,
+    MinimalFlowPolicy,
+)
 from prefect.server.orchestration.global_policy import GlobalFlowPolicy
 from prefect.server.orchestration.policies import (
     FlowRunOrchestrationPolicy,
 )
 from prefect.server.orchestration.rules import FlowOrchestrationContext
 from prefect.server.schemas.core import TaskRunResult
-from prefect.server.schemas.graph import Graph
+from prefect.server.schemas.graph import (
+    Edge,
+    Graph,
+    GraphArtifact,
+    GraphDelta,
+    GraphState,
+    Node,
+)
 from prefect.server.schemas.responses import OrchestrationResult
 from prefect.server.schemas.states import State
+from prefect.server.utilities.pagination import KeysetPosition
 from prefect.server.utilities.schemas import PrefectBaseModel
+from prefect.server.utilities.streaming import STREAMING_CHUNK_SIZE, stream_scalars
 from prefect.settings import (
     PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS,
     PREFECT_API_MAX_FLOW_RUN_GRAPH_NODES,
@@ -53,6 +79,11 @@ from prefect.types._datetime import DateTime, earliest_possible_datetime, now
 if TYPE_CHECKING:
     import logging
 
+    from prefect.server.database.query_components import (
+        FlowRunGraphV2Change,
+        FlowRunGraphV2Changes,
+    )
+
 logger: "logging.Logger" = get_logger("flow_runs")
 
 
@@ -206,6 +237,25 @@ async def read_flow_run(
     return result.scalar()
 
 
+@db_injector
+async def read_flow_run_updated(
+    db: PrefectDBInterface, session: AsyncSession, flow_run_id: UUID
+) -> Optional[DateTime]:
+    """
+    Reads when a flow run was last updated, without loading the flow run.
+
+    Args:
+        session: A database session
+        flow_run_id: a flow run id
+
+    Returns:
+        DateTime: the flow run's `updated` timestamp, or None if it doesn't exist
+    """
+    return await session.scalar(
+        sa.select(db.FlowRun.updated).where(db.FlowRun.id == flow_run_id)
+    )
+
+
 async def _apply_flow_run_filters(
     db: PrefectDBInterface,
     query: Select[T],
@@ -279,44 +329,73 @@ async def _apply_flow_run_filters(
 
 
 @db_injector
-async def read_flow_runs(
+async def read_flow_run_ids(
     db: PrefectDBInterface,
     session: AsyncSession,
-    columns: Optional[list[str]] = None,
     flow_filter: Optional[schemas.filters.FlowFilter] = None,
     flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
     task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
     deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
     work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
     work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
-    offset: Optional[int] = None,
     limit: Optional[int] = None,
-    sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
-) -> Sequence[orm_models.FlowRun]:
+    after: Optional[UUID] = None,
+) -> list[UUID]:
     """
-    Read flow runs.
+    Read the ids of flow runs, without loading the flow runs themselves.
 
     Args:
         session: a database session
-        columns: a list of the flow run ORM columns to load, for performance
         flow_filter: only select flow runs whose flows match these filters
         flow_run_filter: only select flow runs match these filters
         task_run_filter: only select flow runs whose task runs match these filters
         deployment_filter: only select flow runs whose deployments match these filters
-        offset: Query offset
         limit: Query limit
-        sort: Query sort
+        after: only select flow runs whose id is greater than this one
 
     Returns:
-        List[orm_models.FlowRun]: flow runs
+        list[UUID]: flow run ids, ordered by id
     """
-    query = (
-        select(db.FlowRun)
-        .order_by(*sort.as_sql_sort())
-        .options(
-            selectinload(db.FlowRun.work_queue).selectinload(db.WorkQueue.work_pool)
-        )
+    query = await _apply_flow_run_filters(
+        db,
+        select(db.FlowRun.id).order_by(db.FlowRun.id),
+        flow_filter=flow_filter,
+        flow_run_filter=flow_run_filter,
+        task_run_filter=task_run_filter,
+        deployment_filter=deployment_filter,
+        work_pool_filter=work_pool_filter,
+        work_queue_filter=work_queue_filter,
     )
+    if after is not None:
+        query = query.where(db.FlowRun.id > after)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
+    return list(result.scalars().all())
+
+
+async def _read_flow_runs_query(
+    db: PrefectDBInterface,
+    columns: Optional[list[str]] = None,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
+    after: Optional[KeysetPosition] = None,
+) -> sa.Select[tuple[orm_models.FlowRun]]:
+    query = select(db.FlowRun).options(
+        selectinload(db.FlowRun.work_queue).selectinload(db.WorkQueue.work_pool)
+    )
+    if after is not None:
+        query = sort.as_keyset().apply(query, after)
+    else:
+        query = query.order_by(*sort.as_sql_sort())
 
     if columns:
         query = query.options(load_only(*columns))
@@ -338,10 +417,99 @@ async def read_flow_runs(
     if limit is not None:
         query = query.limit(limit)
 
+    return query
+
+
+@db_injector
+async def read_flow_runs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    columns: Optional[list[str]] = None,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
+    after: Optional[KeysetPosition] = None,
+) -> Sequence[orm_models.FlowRun]:
+    """
+    Read flow runs.
+
+    Args:
+        session: a database session
+        columns: a list of the flow run ORM columns to load, for performance
+        flow_filter: only select flow runs whose flows match these filters
+        flow_run_filter: only select flow runs match these filters
+        task_run_filter: only select flow runs whose task runs match these filters
+        deployment_filter: only select flow runs whose deployments match these filters
+        offset: Query offset
+        limit: Query limit
+        sort: Query sort
+        after: if provided, order flow runs for keyset pagination and only select
+            flow runs after this position
+
+    Returns:
+        List[orm_models.FlowRun]: flow runs
+    """
+    query = await _read_flow_runs_query(
+        db,
+        columns=columns,
+        flow_filter=flow_filter,
+        flow_run_filter=flow_run_filter,
+        task_run_filter=task_run_filter,
+        deployment_filter=deployment_filter,
+        work_pool_filter=work_pool_filter,
+        work_queue_filter=work_queue_filter,
+        offset=offset,
+        limit=limit,
+        sort=sort,
+        after=after,
+    )
     result = await session.execute(query)
     return result.scalars().unique().all()
 
 
+@db_injector
+async def stream_flow_runs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
+    chunk_size: int = STREAMING_CHUNK_SIZE,
+) -> AsyncGenerator[Sequence[orm_models.FlowRun], None]:
+    """
+    Read flow runs with a server-side cursor, yielding them in chunks.
+
+    Accepts the same filters as `read_flow_runs`. Only one chunk of flow runs is
+    held in memory at a time, which makes this suitable for large result sets.
+    """
+    query = await _read_flow_runs_query(
+        db,
+        flow_filter=flow_filter,
+        flow_run_filter=flow_run_filter,
+        task_run_filter=task_run_filter,
+        deployment_filter=deployment_filter,
+        work_pool_filter=work_pool_filter,
+        work_queue_filter=work_queue_filter,
+        offset=offset,
+        limit=limit,
+        sort=sort,
+    )
+    async for chunk in stream_scalars(session, query, chunk_size=chunk_size):
+        yield chunk
+
+
 async def cleanup_flow_run_concurrency_slots(
     session: AsyncSession,
     flow_run: orm_models.FlowRun,
@@ -496,6 +664,10 @@ async def delete_flow_run(
     if deployment_id:
         await cleanup_flow_run_concurrency_slots(session=session, flow_run=flow_run)
 
+    await models.run_history_rollups.mark_run_history_rollups_stale(
+        session, flow_run_ids=[flow_run_id]
+    )
+
     # Delete the flow run
     result = await session.execute(
         delete(db.FlowRun).where(db.FlowRun.id == flow_run_id)
@@ -549,6 +721,13 @@ async def set_flow_run_state(
     proposed_state_type = state.type if state else None
     intended_transition = (initial_state_type, proposed_state_type)
 
+    if initial_state_type in schemas.states.TERMINAL_STATES:
+        # leaving a terminal state, or being rescheduled, moves the run out of the
+        # rollup bucket it was counted in
+        await models.run_history_rollups.mark_run_history_rollups_stale(
+            session, flow_run_ids=[flow_run_id]
+        )
+
     if force or flow_policy is None:
         flow_policy = MinimalFlowPolicy
 
@@ -582,6 +761,8 @@ async def set_flow_run_state(
     if context.orchestration_error is not None:
         raise context.orchestration_error
 
+    invalidate_flow_run_graph_cache(flow_run_id)
+
     result = OrchestrationResult(
         state=context.validated_state,
         status=context.response_status,
@@ -591,6 +772,115 @@ async def set_flow_run_state(
     return result
 
 
+@db_injector
+async def mark_flow_runs_late(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run_ids: Sequence[UUID],
+) -> List[UUID]:
+    """
+    Transitions scheduled flow runs to a `Late` state in bulk.
+
+    This has the same effect as calling `set_flow_run_state` with a `Late` state and
+    the `MarkLateRunsPolicy` for each run, but the runs are locked, updated, and given
+    their new states in a single round of queries. The policy only rejects runs that
+    are no longer scheduled, which are skipped, and the global transforms only copy
+    fields of the new state onto the run, so neither needs a full orchestration
+    context. Subflow runs also set the state of their parent task run, so they are
+    still orchestrated one at a time.
+
+    Args:
+        session: a database session
+        flow_run_ids: the ids of the flow runs to mark as late
+
+    Returns:
+        List[UUID]: the ids of the flow runs that were marked as late
+    """
+    if not flow_run_ids:
+        return []
+
+    result = await session.execute(
+        select(db.FlowRun)
+        .where(
+            db.FlowRun.id.in_(flow_run_ids),
+            db.FlowRun.state_type == schemas.states.StateType.SCHEDULED,
+        )
+        .order_by(db.FlowRun.id)
+        # Lock the rows to prevent orchestration race conditions
+        .with_for_update()
+    )
+    runs = result.scalars().all()
+
+    marked: List[UUID] = []
+    transitions: List[
+        Tuple[orm_models.FlowRun, Optional[State], schemas.states.State]
+    ] = []
+
+    for run in runs:
+        if run.parent_task_run_id is not None:
+            orchestration_result = await set_flow_run_state(
+                session=session,
+                flow_run_id=run.id,
+                state=schemas.states.Late(scheduled_time=run.next_scheduled_start_time),
+                flow_policy=MarkLateRunsPolicy,  # type: ignore
+            )
+            if orchestration_result.status == schemas.responses.SetStateStatus.ACCEPT:
+                marked.append(run.id)
+            continue
+
+        initial_state = run.state.as_state() if run.state else None
+        late_state = schemas.states.Late(scheduled_time=run.next_scheduled_start_time)
+        late_state.state_details.flow_run_id = run.id
+
+        state_payload = late_state.model_dump_for_orm()
+        state_payload.pop("data", None)
+        orm_state = db.FlowRunState(flow_run_id=run.id, **state_payload)
+        session.add(orm_state)
+        run.set_state(orm_state)
+
+        run.state_type = late_state.type
+        run.state_name = late_state.name
+        run.state_timestamp = late_state.timestamp
+        run.next_scheduled_start_time = late_state.state_details.scheduled_time
+        if not run.expected_start_time:
+            run.expected_start_time = late_state.state_details.scheduled_time
+
+        transitions.append((run, initial_state, late_state))
+        marked.append(run.id)
+
+    if not transitions:
+        return marked
+
+    await session.flush()
+
+    async with PrefectServerEventsClient() as events:
+        for run, initial_state, late_state in transitions:
+            invalidate_flow_run_graph_cache(run.id)
+
+            # Guard against passing large state payloads to arq
+            if initial_state:
+                initial_state.message = truncated_to(
+                    TRUNCATE_STATE_MESSAGES_AT, initial_state.message
+                )
+            late_state.message = truncated_to(
+                TRUNCATE_STATE_MESSAGES_AT, late_state.message
+            )
+
+            await events.emit(
+                await flow_run_state_change_event(
+                    session=session,
+                    occurred=late_state.timestamp,
+                    flow_run=run,
+                    initial_state_id=initial_state.id if initial_state else None,
+                    initial_state=initial_state,
+                    validated_state_id=late_state.id,
+                    validated_state=late_state,
+                )
+            )
+
+    return marked
+
+
 @db_injector
 async def read_flow_run_graph(
     db: PrefectDBInterface,
@@ -612,6 +902,319 @@ async def read_flow_run_graph(
     )
 
 
+# The number of flow runs whose graphs are kept in memory to serve graph deltas
+FLOW_RUN_GRAPH_CACHE_SIZE = 20
+
+# How long a cached flow run graph is kept before being rebuilt from scratch
+FLOW_RUN_GRAPH_CACHE_TTL = datetime.timedelta(minutes=10)
+
+# How long a cached flow run graph is served without checking the database for
+# changes, which bounds how late task run state changes written by other server
+# processes are picked up
+FLOW_RUN_GRAPH_CACHE_RECHECK = datetime.timedelta(seconds=5)
+
+# How far before the latest change it has seen a cached flow run graph reads task
+# runs again, to pick up changes from transactions that committed out of order
+FLOW_RUN_GRAPH_CACHE_LOOKBACK = datetime.timedelta(seconds=5)
+
+
+@dataclass
+class _CachedGraphNode:
+    kind: Literal["flow-run", "task-run"]
+    label: str
+    state_type: schemas.states.StateType
+    start_time: DateTime
+    end_time: Optional[DateTime]
+    parents: Tuple[UUID, ...]
+    encapsulating: Tuple[UUID, ...]
+    changed: DateTime
+
+    def same_as(self, other: "_CachedGraphNode") -> bool:
+        return (
+            self.kind,
+            self.label,
+            self.state_type,
+            self.start_time,
+            self.end_time,
+            self.parents,
+            self.encapsulating,
+        ) == (
+            other.kind,
+            other.label,
+            other.state_type,
+            other.start_time,
+            other.end_time,
+            other.parents,
+            other.encapsulating,
+        )
+
+
+class _CachedFlowRunGraph:
+    """
+    The nodes of a flow run graph, kept up to date by applying the task runs that
+    changed since it was last refreshed.
+
+    Every node records when it last changed, either because its own task or subflow
+    run was updated or because an edge to it was added or removed. Change times
+    are derived from the `updated` timestamps of task and subflow runs, but always
+    increase so that a node that changes is returned to every client whose
+    watermark was issued before the change.
+    """
+
+    def __init__(self) -> None:
+        # the latest change time of any node, or the latest watermark a client
+        # has presented
+        self.watermark: DateTime = earliest_possible_datetime()
+        self.reset()
+        self.stale = True
+        self.refreshed_at = 0.0
+
+    def reset(self) -> None:
+        """Drop every node, so that the graph is rebuilt by applying all of its task
+        and subflow runs. Change times keep increasing across resets."""
+        self.nodes: Dict[UUID, _CachedGraphNode] = {}
+        # the nodes referencing each run as a parent or encapsulating task, whether
+        # or not that run is in the graph yet
+        self.children: Dict[UUID, set[UUID]] = defaultdict(set)
+        self.encapsulated: Dict[UUID, set[UUID]] = defaultdict(set)
+        self.artifacts: Dict[Optional[UUID], List[GraphArtifact]] = {}
+        self.states: List[GraphState] = []
+        self.start_time: Optional[DateTime] = None
+        self.end_time: Optional[DateTime] = None
+        # the latest `updated` timestamp of the task and subflow runs read so far
+        self.updated: Optional[DateTime] = None
+
+    def needs_refresh(self) -> bool:
+        return (
+            self.stale
+            or time.monotonic() - self.refreshed_at
+            > FLOW_RUN_GRAPH_CACHE_RECHECK.total_seconds()
+        )
+
+    def _next_change(self, timestamp: DateTime) -> DateTime:
+        self.watermark = max(
+            timestamp, self.watermark + datetime.timedelta(microseconds=1)
+        )
+        return self.watermark
+
+    def apply(self, changes: "FlowRunGraphV2Changes") -> None:
+        """Apply the task and subflow runs that changed since the last refresh."""
+        self.start_time, self.end_time = changes.start_time, changes.end_time
+        self.states = changes.states
+
+        rows_by_id: Dict[UUID, List["FlowRunGraphV2Change"]] = defaultdict(list)
+        for row in changes.changes:
+            rows_by_id[row.id].append(row)
+
+        updated_by_id: Dict[UUID, DateTime] = {}
+        for id, (row, *_) in rows_by_id.items():
+            updated_by_id[id] = max(
+                row.task_run_updated, row.flow_run_updated or row.task_run_updated
+            )
+        for id in sorted(updated_by_id, key=updated_by_id.__getitem__):
+            self._apply_node(id, rows_by_id[id], updated_by_id[id])
+
+        if updated_by_id:
+            latest = max(updated_by_id.values())
+            self.updated = latest if self.updated is None else max(self.updated, latest)
+
+        artifacts = changes.artifacts
+        changed_artifacts = [
+            id
+            for id in set(artifacts) | set(self.artifacts)
+            if id in self.nodes and artifacts.get(id) != self.artifacts.get(id)
+        ]
+        if changed_artifacts:
+            changed = self._next_change(now("UTC"))
+            for id in changed_artifacts:
+                self.nodes[id].changed = changed
+        self.artifacts = artifacts
+
+    def _apply_node(
+        self, id: UUID, rows: List["FlowRunGraphV2Change"], updated: DateTime
+    ) -> None:
+        parents: Dict[UUID, None] = {}
+        encapsulating: Dict[UUID, None] = {}
+        for row in rows:
+            if row.parent is None:
+                continue
+            try:
+                parent = (
+                    row.parent if isinstance(row.parent, UUID) else UUID(row.parent)
+                )
+            except ValueError:
+                continue
+            if row.has_encapsulating_task:
+                encapsulating[parent] = None
+            else:
+                parents[parent] = None
+
+        row = rows[0]
+        node = _CachedGraphNode(
+            kind=row.kind,
+            label=row.label,
+            state_type=row.state_type,
+            start_time=row.start_time,
+            end_time=row.end_time,
+            parents=tuple(parents),
+            encapsulating=tuple(encapsulating),
+            changed=self.watermark,
+        )
+
+        existing = self.nodes.get(id)
+        if existing is not None and existing.same_as(node):
+            return
+
+        # nodes whose edges to this one were added or removed have changed too
+        if existing is None:
+            affected = self.children[id] | self.encapsulated[id] | set(node.parents)
+            old_parents: tuple[UUID, ...] = ()
+            old_encapsulating: tuple[UUID, ...] = ()
+        else:
+            affected = set(existing.parents) ^ set(node.parents)
+            old_parents, old_encapsulating = existing.parents, existing.encapsulating
+
+        for parent in old_parents:
+            self.children[parent].discard(id)
+        for parent in old_encapsulating:
+            self.encapsulated[parent].discard(id)
+        for parent in node.parents:
+            self.children[parent].add(id)
+        for parent in node.encapsulating:
+            self.encapsulated[parent].add(id)
+
+        node.changed = self._next_change(updated)
+        self.nodes[id] = node
+        for other in affected:
+            if other in self.nodes:
+                self.nodes[other].changed = node.changed
+
+    def _by_start_time(self, ids: Iterable[UUID]) -> List[Edge]:
+        present = [id for id in ids if id in self.nodes]
+        present.sort(key=lambda id: self.nodes[id].start_time)
+        return [Edge(id=id) for id in present]
+
+    def _node(self, id: UUID) -> Node:
+        node = self.nodes[id]
+        return Node(
+            kind=node.kind,
+            id=id,
+            label=node.label,
+            state_type=node.state_type,
+            start_time=node.start_time,
+            end_time=node.end_time,
+            parents=self._by_start_time(node.parents),
+            children=self._by_start_time(sorted(self.children[id])),
+            encapsulating=self._by_start_time(node.encapsulating),
+            artifacts=self.artifacts.get(id, []),
+        )
+
+    def delta(self, watermark: Optional[DateTime], max_nodes: int) -> GraphDelta:
+        """The nodes that changed after a watermark, paged in the order they changed."""
+        if watermark is not None and watermark > self.watermark:
+            # later changes must be returned to this client, even if it got its
+            # watermark from another server or a previous version of this graph
+            self.watermark = watermark
+
+        changed = sorted(
+            (node.changed, id)
+            for id, node in self.nodes.items()
+            if watermark is None or node.changed > watermark
+        )
+        has_more = len(changed) > max_nodes
+        if has_more:
+            # nodes that changed together can only be returned together
+            next_watermark = changed[max_nodes - 1][0]
+            changed = [(c, id) for c, id in changed if c <= next_watermark]
+        else:
+            next_watermark = self.watermark
+
+        # return each page in the same order as full graphs
+        nodes = sorted(
+            ((id, self._node(id)) for _, id in changed),
+            key=lambda item: (
+                item[1].start_time,
+                item[1].end_time is None,
+                item[1].end_time,
+            ),
+        )
+        return GraphDelta(
+            start_time=self.start_time,
+            end_time=self.end_time,
+            root_node_ids=[id for id, node in nodes if not node.parents],
+            nodes=nodes,
+            artifacts=self.artifacts.get(None, []),
+            states=self.states,
+            watermark=next_watermark,
+            has_more=has_more,
+        )
+
+
+_flow_run_graph_cache: MutableMapping[UUID, _CachedFlowRunGraph] = TTLCache(
+    maxsize=FLOW_RUN_GRAPH_CACHE_SIZE,
+    ttl=FLOW_RUN_GRAPH_CACHE_TTL.total_seconds(),
+)
+
+
+def invalidate_flow_run_graph_cache(flow_run_id: Optional[UUID]) -> None:
+    """Mark the cached graph of a flow run, if any, as needing a refresh."""
+    if flow_run_id is not None and (cached := _flow_run_graph_cache.get(flow_run_id)):
+        cached.stale = True
+
+
+@db_injector
+async def read_flow_run_graph_delta(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run_id: UUID,
+    watermark: Optional[datetime.datetime] = None,
+) -> GraphDelta:
+    """Given a flow run, return the nodes of its graph that changed after a
+    `watermark` returned by a previous call, or all of its nodes if no watermark is
+    provided.
+
+    Graphs are cached per flow run and refreshed from the task runs updated since
+    they were last read, so following a large flow run only reads the task runs
+    that changed. At most `PREFECT_API_MAX_FLOW_RUN_GRAPH_NODES` nodes are returned
+    at a time; if `has_more` is set, more nodes can be read immediately with the
+    returned watermark."""
+    if isinstance(watermark, str):
+        watermark = DateTime.fromisoformat(watermark)
+
+    cached = _flow_run_graph_cache.get(flow_run_id)
+    if cached is None or cached.needs_refresh():
+        cached = cached or _CachedFlowRunGraph()
+        refreshed_at, since = time.monotonic(), earliest_possible_datetime()
+        if cached.updated is not None:
+            since = cached.updated - FLOW_RUN_GRAPH_CACHE_LOOKBACK
+        cached.stale = False
+
+        changes = await db.queries.flow_run_graph_v2_changes(
+            session=session,
+            flow_run_id=flow_run_id,
+            watermark=since,
+            max_artifacts=PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS.value(),
+        )
+        cached.apply(changes)
+        if len(cached.nodes) > changes.node_count:
+            # deleted task runs leave no rows behind to apply, so the graph is
+            # rebuilt to drop their nodes
+            cached.reset()
+            changes = await db.queries.flow_run_graph_v2_changes(
+                session=session,
+                flow_run_id=flow_run_id,
+                watermark=earliest_possible_datetime(),
+                max_artifacts=PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS.value(),
+            )
+            cached.apply(changes)
+        cached.refreshed_at = refreshed_at
+        _flow_run_graph_cache[flow_run_id] = cached
+
+    return cached.delta(
+        watermark=watermark, max_nodes=PREFECT_API_MAX_FLOW_RUN_GRAPH_NODES.value()
+    )
+
+
 async def with_system_labels_for_flow_run(
     session: AsyncSession,
     flow_run: Union[schemas.core.FlowRun, schemas.actions.FlowRunCreate],
@@ -11,6 +11,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 
@@ -285,6 +286,7 @@ async def delete_flow(
     Returns:
         bool: whether or not the flow was deleted
     """
+    await models.run_history_rollups.delete_flow_run_history_rollups(session, flow_id)
 
     result = await session.execute(delete(db.Flow).where(db.Flow.id == flow_id))
     return result.rowcount > 0
@@ -3,16 +3,26 @@ Functions for interacting with log ORM objects.
 Intended for internal use by the Prefect REST API.
 """
 
-from typing import TYPE_CHECKING, Generator, Optional, Sequence, Tuple
-
-from sqlalchemy import delete, select
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Generator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy import Select, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 from prefect.server.logs import messaging
 from prefect.server.schemas.actions import LogCreate
+from prefect.server.utilities.pagination import KeysetPosition
+from prefect.server.utilities.streaming import STREAMING_CHUNK_SIZE, stream_scalars
 from prefect.utilities.collections import batched_iterable
 
 # We have a limit of 32,767 parameters at a time for a single query...
@@ -70,6 +80,30 @@ async def create_logs(
             raise
 
 
+def _read_logs_query(
+    db: PrefectDBInterface,
+    log_filter: Optional[schemas.filters.LogFilter],
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    after: Optional[KeysetPosition] = None,
+    columns: Optional[list[str]] = None,
+) -> Select[tuple[orm_models.Log]]:
+    query = select(db.Log)
+    if columns:
+        query = query.options(load_only(*(getattr(db.Log, c) for c in columns)))
+    if after is not None:
+        query = sort.as_keyset().apply(query, after)
+    else:
+        query = query.order_by(*sort.as_sql_sort())
+    query = query.offset(offset).limit(limit)
+
+    if log_filter:
+        query = query.where(log_filter.as_sql_filter())
+
+    return query
+
+
 @db_injector
 async def read_logs(
     db: PrefectDBInterface,
@@ -78,6 +112,8 @@ async def read_logs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    after: Optional[KeysetPosition] = None,
+    columns: Optional[list[str]] = None,
 ) -> Sequence[orm_models.Log]:
     """
     Read logs.
@@ -89,19 +125,48 @@ async def read_logs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        after: if provided, order logs for keyset pagination and only select logs
+            after this position
+        columns: a list of the log ORM columns to load, for performance
 
     Returns:
         List[orm_models.Log]: the matching logs
     """
-    query = select(db.Log).order_by(*sort.as_sql_sort()).offset(offset).limit(limit)
-
-    if log_filter:
-        query = query.where(log_filter.as_sql_filter())
-
+    query = _read_logs_query(
+        db,
+        log_filter=log_filter,
+        offset=offset,
+        limit=limit,
+        sort=sort,
+        after=after,
+        columns=columns,
+    )
     result = await session.execute(query)
     return result.scalars().unique().all()
 
 
+@db_injector
+async def stream_logs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    log_filter: Optional[schemas.filters.LogFilter],
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    chunk_size: int = STREAMING_CHUNK_SIZE,
+) -> AsyncGenerator[Sequence[orm_models.Log], None]:
+    """
+    Read logs with a server-side cursor, yielding them in chunks.
+
+    Accepts the same filters as `read_logs`.
+    """
+    query = _read_logs_query(
+        db, log_filter=log_filter, offset=offset, limit=limit, sort=sort
+    )
+    async for chunk in stream_scalars(session, query, chunk_size=chunk_size):
+        yield chunk
+
+
 @db_injector
 async def delete_logs(
     db: PrefectDBInterface,
@@ -0,0 +1,686 @@
+"""
+Functions for maintaining and reading run history rollups.
+
+Run history aggregates runs by state into intervals of their expected start time.
+Runs in a terminal state no longer change as time passes, so their aggregates are
+stored in the `run_history_rollup` table in per-minute and per-hour buckets by
+state, flow, deployment and work queue. A run history request whose intervals line
+up with a bucket size sums the stored buckets and only aggregates the remaining
+runs (those that are not terminal, or that changed since the rollups were last
+refreshed) from the run tables.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.visitors import iterate, replacement_traverse
+
+import prefect.server.models as models
+import prefect.server.schemas as schemas
+from prefect.server.database import PrefectDBInterface, db_injector
+
+RunType = Literal["flow_run", "task_run"]
+TimeRange = tuple[datetime.datetime, datetime.datetime]
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+# bucket sizes that are maintained, largest first
+ROLLUP_BUCKET_SECONDS = (HOUR, MINUTE)
+
+WATERMARK_CONFIGURATION_KEY = "run_history_rollups"
+
+# rollups are not used for a request if the runs that must be aggregated from the
+# run tables cannot be described by this many time ranges
+MAX_UNSETTLED_RANGES = 50
+
+TERMINAL_STATES = list(schemas.states.TERMINAL_STATES)
+
+# the columns of the run tables that have an equivalent on the rollup table, by run
+# type; filters that reference any other column cannot be served from rollups
+_ROLLUP_COLUMNS: dict[RunType, dict[tuple[str, str], str]] = {
+    "flow_run": {
+        ("flow_run", "state_type"): "state_type",
+        ("flow_run", "state_name"): "state_name",
+        ("flow_run", "flow_id"): "flow_id",
+        ("flow_run", "deployment_id"): "deployment_id",
+        ("flow_run", "work_queue_id"): "work_queue_id",
+    },
+    "task_run": {
+        ("task_run", "state_type"): "state_type",
+        ("task_run", "state_name"): "state_name",
+        ("flow_run", "flow_id"): "flow_id",
+        ("flow_run", "deployment_id"): "deployment_id",
+        ("flow_run", "work_queue_id"): "work_queue_id",
+    },
+}
+
+
+def floor_to_bucket(
+    timestamp: datetime.datetime, bucket_seconds: int
+) -> datetime.datetime:
+    """The start of the bucket containing a timestamp."""
+    seconds = int(timestamp.timestamp())
+    return datetime.datetime.fromtimestamp(
+        seconds - seconds % bucket_seconds, tz=datetime.timezone.utc
+    )
+
+
+def bucket_ranges(
+    bucket_starts: Iterable[datetime.datetime], bucket_seconds: int
+) -> list[TimeRange]:
+    """
+    Merge buckets into the fewest contiguous time ranges, splitting ranges at hour
+    boundaries so that each can be refreshed independently.
+    """
+    size = datetime.timedelta(seconds=bucket_seconds)
+    ranges: list[TimeRange] = []
+    for start in sorted(set(bucket_starts)):
+        if (
+            ranges
+            and ranges[-1][1] == start
+            and floor_to_bucket(ranges[-1][0], HOUR) == floor_to_bucket(start, HOUR)
+        ):
+            ranges[-1] = (ranges[-1][0], start + size)
+        else:
+            ranges.append((start, start + size))
+    return ranges
+
+
+def rollup_bucket_seconds(
+    history_start: datetime.datetime, history_interval: datetime.timedelta
+) -> Optional[int]:
+    """
+    The largest bucket size that history intervals starting at `history_start` can
+    be composed from, or `None` if the intervals do not align with any bucket.
+    """
+    for bucket_seconds in ROLLUP_BUCKET_SECONDS:
+        if (
+            history_start.microsecond == 0
+            and int(history_start.timestamp()) % bucket_seconds == 0
+            and history_interval % datetime.timedelta(seconds=bucket_seconds)
+            == datetime.timedelta(0)
+        ):
+            return bucket_seconds
+    return None
+
+
+def _run_model(db: PrefectDBInterface, run_type: RunType) -> Any:
+    return db.FlowRun if run_type == "flow_run" else db.TaskRun
+
+
+@db_injector
+async def read_rollup_watermark(
+    db: PrefectDBInterface, session: AsyncSession, run_type: RunType
+) -> Optional[datetime.datetime]:
+    """
+    Read the time after which changes to runs may not be reflected in the rollups,
+    or `None` if the rollups have never been built.
+    """
+    # read through the session rather than the cached configuration so that
+    # watermarks written by the service in another process are seen
+    value = await session.scalar(
+        sa.select(db.Configuration.value).where(
+            db.Configuration.key == WATERMARK_CONFIGURATION_KEY
+        )
+    )
+    if not value or run_type not in value:
+        return None
+    return datetime.datetime.fromisoformat(value[run_type])
+
+
+@db_injector
+async def write_rollup_watermark(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    watermark: datetime.datetime,
+) -> None:
+    value = await session.scalar(
+        sa.select(db.Configuration.value).where(
+            db.Configuration.key == WATERMARK_CONFIGURATION_KEY
+        )
+    )
+    await models.configuration.write_configuration(
+        session=session,
+        configuration=schemas.core.Configuration(
+            key=WATERMARK_CONFIGURATION_KEY,
+            value={**(value or {}), run_type: watermark.isoformat()},
+        ),
+    )
+
+
+@db_injector
+async def read_backfill_ranges(
+    db: PrefectDBInterface, session: AsyncSession, run_type: RunType
+) -> list[TimeRange]:
+    """
+    The hour-long ranges covering every terminal run, used to build the rollups for
+    the first time.
+    """
+    run = _run_model(db, run_type)
+    result = await session.execute(
+        sa.select(
+            sa.func.min(run.expected_start_time), sa.func.max(run.expected_start_time)
+        ).where(run.state_type.in_(TERMINAL_STATES))
+    )
+    earliest, latest = result.one()
+    if earliest is None or latest is None:
+        return []
+
+    hour = datetime.timedelta(seconds=HOUR)
+    ranges: list[TimeRange] = []
+    start = floor_to_bucket(earliest, HOUR)
+    while start <= latest:
+        ranges.append((start, start + hour))
+        start += hour
+    return ranges
+
+
+@db_injector
+async def read_unsettled_rollup_ranges(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    bucket_seconds: int,
+    updated_since: datetime.datetime,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+) -> list[TimeRange]:
+    """
+    The ranges of buckets whose rollups may not reflect the run tables, because
+    runs in them changed since `updated_since` or were deleted.
+
+    Args:
+        session: a database session
+        run_type: the type of run
+        bucket_seconds: the size of the buckets to return
+        updated_since: the rollup watermark
+        start: if provided, only buckets at or after this time are returned
+        end: if provided, only buckets before this time are returned
+    """
+    run = _run_model(db, run_type)
+    rollup = db.RunHistoryRollup
+
+    changed = sa.select(run.expected_start_time).where(
+        run.updated >= updated_since, run.expected_start_time.is_not(None)
+    )
+    stale = sa.select(rollup.interval_start).where(
+        rollup.run_type == run_type,
+        rollup.bucket_seconds == bucket_seconds,
+        rollup.stale.is_(True),
+    )
+    if start is not None:
+        changed = changed.where(run.expected_start_time >= start)
+        stale = stale.where(rollup.interval_start >= start)
+    if end is not None:
+        changed = changed.where(run.expected_start_time < end)
+        stale = stale.where(rollup.interval_start < end)
+
+    buckets = {
+        floor_to_bucket(timestamp, bucket_seconds)
+        for timestamp in (await session.scalars(changed.distinct())).all()
+    }
+    buckets.update((await session.scalars(stale.distinct())).all())
+    return bucket_ranges(buckets, bucket_seconds)
+
+
+def _terminal_runs_query(
+    db: PrefectDBInterface,
+    run_type: RunType,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> sa.Select[Any]:
+    run = _run_model(db, run_type)
+    columns = [
+        run.expected_start_time,
+        run.state_type,
+        run.state_name,
+        run.total_run_time,
+        run.start_time,
+    ]
+    if run_type == "flow_run":
+        query = sa.select(
+            *columns, run.flow_id, run.deployment_id, run.work_queue_id
+        ).select_from(run)
+    else:
+        query = (
+            sa.select(
+                *columns,
+                db.FlowRun.flow_id,
+                db.FlowRun.deployment_id,
+                db.FlowRun.work_queue_id,
+            )
+            .select_from(run)
+            .outerjoin(db.FlowRun, db.FlowRun.id == run.flow_run_id)
+        )
+    return query.where(
+        run.state_type.in_(TERMINAL_STATES),
+        run.expected_start_time >= start,
+        run.expected_start_time < end,
+    )
+
+
+@db_injector
+async def refresh_run_history_rollups(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    ranges: Sequence[TimeRange],
+) -> None:
+    """
+    Recompute the minute buckets in the given ranges from the run tables, and the
+    hour buckets containing them from the minute buckets.
+
+    Ranges must start and end on minute boundaries.
+    """
+    rollup = db.RunHistoryRollup
+    totals: dict[tuple[Any, ...], list[Any]] = defaultdict(lambda: [0, 0.0, 0.0, False])
+
+    for start, end in ranges:
+        await session.execute(
+            sa.delete(rollup).where(
+                rollup.run_type == run_type,
+                rollup.bucket_seconds == MINUTE,
+                rollup.interval_start >= start,
+                rollup.interval_start < end,
+            )
+        )
+        result = await session.execute(_terminal_runs_query(db, run_type, start, end))
+        for row in result:
+            lateness = (
+                (row.start_time - row.expected_start_time).total_seconds()
+                if row.start_time and row.start_time > row.expected_start_time
+                else 0.0
+            )
+            total = totals[
+                (
+                    floor_to_bucket(row.expected_start_time, MINUTE),
+                    row.state_type,
+                    row.state_name,
+                    row.flow_id,
+                    row.deployment_id,
+                    row.work_queue_id,
+                )
+            ]
+            total[0] += 1
+            total[1] += max(row.total_run_time.total_seconds(), 0.0)
+            total[2] += lateness
+
+    await _insert_rollups(db, session, run_type, MINUTE, totals)
+
+    # rebuild the hour buckets from the minute buckets they contain
+    hours = bucket_ranges({floor_to_bucket(start, HOUR) for start, _ in ranges}, HOUR)
+    totals.clear()
+    for start, end in hours:
+        await session.execute(
+            sa.delete(rollup).where(
+                rollup.run_type == run_type,
+                rollup.bucket_seconds == HOUR,
+                rollup.interval_start >= start,
+                rollup.interval_start < end,
+            )
+        )
+        result = await session.execute(
+            sa.select(rollup).where(
+                rollup.run_type == run_type,
+                rollup.bucket_seconds == MINUTE,
+                rollup.interval_start >= start,
+                rollup.interval_start < end,
+            )
+        )
+        for minute in result.scalars():
+            total = totals[
+                (
+                    floor_to_bucket(minute.interval_start, HOUR),
+                    minute.state_type,
+                    minute.state_name,
+                    minute.flow_id,
+                    minute.deployment_id,
+                    minute.work_queue_id,
+                )
+            ]
+            total[0] += minute.count_runs
+            total[1] += minute.sum_estimated_run_time
+            total[2] += minute.sum_estimated_lateness
+            # minute buckets marked stale since they were read for this refresh
+            # keep the hour stale until they are refreshed themselves
+            total[3] = total[3] or minute.stale
+
+    await _insert_rollups(db, session, run_type, HOUR, totals)
+
+
+async def _insert_rollups(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    bucket_seconds: int,
+    totals: dict[tuple[Any, ...], list[Any]],
+) -> None:
+    if not totals:
+        return
+    await session.execute(
+        sa.insert(db.RunHistoryRollup),
+        [
+            dict(
+                run_type=run_type,
+                bucket_seconds=bucket_seconds,
+                interval_start=interval_start,
+                state_type=state_type,
+                state_name=state_name,
+                flow_id=flow_id,
+                deployment_id=deployment_id,
+                work_queue_id=work_queue_id,
+                count_runs=count_runs,
+                sum_estimated_run_time=sum_estimated_run_time,
+                sum_estimated_lateness=sum_estimated_lateness,
+                stale=stale,
+            )
+            for (
+                interval_start,
+                state_type,
+                state_name,
+                flow_id,
+                deployment_id,
+                work_queue_id,
+            ), (
+                count_runs,
+                sum_estimated_run_time,
+                sum_estimated_lateness,
+                stale,
+            ) in totals.items()
+        ],
+    )
+
+
+@db_injector
+async def mark_run_history_rollups_stale(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run_ids: Sequence[UUID] = (),
+    task_run_ids: Sequence[UUID] = (),
+) -> None:
+    """
+    Mark the buckets containing terminal runs that are about to be deleted or to
+    leave their terminal state as stale, so they are read from the run tables until
+    they are recomputed. The buckets of a flow run's task runs are marked as well,
+    as they are deleted with it.
+    """
+    expected_start_times: dict[RunType, Any] = {}
+    if flow_run_ids:
+        expected_start_times["flow_run"] = sa.select(
+            db.FlowRun.expected_start_time
+        ).where(
+            db.FlowRun.id.in_(flow_run_ids),
+            db.FlowRun.state_type.in_(TERMINAL_STATES),
+        )
+    if flow_run_ids or task_run_ids:
+        expected_start_times["task_run"] = sa.select(
+            db.TaskRun.expected_start_time
+        ).where(
+            sa.or_(
+                db.TaskRun.id.in_(task_run_ids),
+                db.TaskRun.flow_run_id.in_(flow_run_ids),
+            ),
+            db.TaskRun.state_type.in_(TERMINAL_STATES),
+        )
+
+    rollup = db.RunHistoryRollup
+    for run_type, query in expected_start_times.items():
+        timestamps = [
+            timestamp
+            for timestamp in (await session.scalars(query.distinct())).all()
+            if timestamp is not None
+        ]
+        if not timestamps:
+            continue
+        await session.execute(
+            sa.update(rollup)
+            .where(
+                rollup.run_type == run_type,
+                sa.or_(
+                    *(
+                        sa.and_(
+                            rollup.bucket_seconds == bucket_seconds,
+                            rollup.interval_start.in_(
+                                {
+                                    floor_to_bucket(timestamp, bucket_seconds)
+                                    for timestamp in timestamps
+                                }
+                            ),
+                        )
+                        for bucket_seconds in ROLLUP_BUCKET_SECONDS
+                    )
+                ),
+            )
+            .values(stale=True)
+            .execution_options(synchronize_session=False)
+        )
+
+
+@db_injector
+async def delete_flow_run_history_rollups(
+    db: PrefectDBInterface, session: AsyncSession, flow_id: UUID
+) -> None:
+    """
+    Delete the rollups of a flow's runs, for when the flow and all of its runs are
+    deleted.
+    """
+    await session.execute(
+        sa.delete(db.RunHistoryRollup).where(db.RunHistoryRollup.flow_id == flow_id)
+    )
+
+
+@db_injector
+async def clear_run_history_rollup_work_queues(
+    db: PrefectDBInterface, session: AsyncSession, work_queue_ids: Sequence[UUID]
+) -> None:
+    """
+    Clear the work queue of rollups, for when work queues are deleted and their
+    runs' work queues are cleared.
+    """
+    await session.execute(
+        sa.update(db.RunHistoryRollup)
+        .where(db.RunHistoryRollup.work_queue_id.in_(work_queue_ids))
+        .values(work_queue_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _adapt_to_rollup(
+    db: PrefectDBInterface, run_type: RunType, criteria: sa.ColumnElement[bool]
+) -> Optional[sa.ColumnElement[bool]]:
+    """
+    Rewrite run filter criteria against the rollup table, or return `None` if the
+    criteria reference columns or subqueries that the rollup table cannot answer.
+    """
+    columns = _ROLLUP_COLUMNS[run_type]
+    for element in iterate(criteria):
+        if isinstance(element, (sa.SelectBase, sa.ScalarSelect, sa.Exists)):
+            return None
+        if isinstance(element, sa.Column) and element.table is not None:
+            if (element.table.name, element.name) not in columns:
+                return None
+
+    def replace(element: Any) -> Any:
+        if isinstance(element, sa.Column) and element.table is not None:
+            return getattr(
+                db.RunHistoryRollup, columns[(element.table.name, element.name)]
+            )
+        return None
+
+    return replacement_traverse(criteria, {}, replace)
+
+
+@db_injector
+def rollup_filter_criteria(
+    db: PrefectDBInterface,
+    run_type: RunType,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
+) -> Optional[list[sa.ColumnElement[bool]]]:
+    """
+    Translate run history filters into criteria on the rollup table, matching the
+    runs selected by `_apply_flow_run_filters` or `_apply_task_run_filters`.
+
+    Returns `None` if the filters cannot be answered from the rollup table.
+    """
+    rollup = db.RunHistoryRollup
+    criteria: list[sa.ColumnElement[bool]] = []
+
+    run_filter = flow_run_filter if run_type == "flow_run" else task_run_filter
+    if run_filter is not None:
+        adapted = _adapt_to_rollup(db, run_type, run_filter.as_sql_filter())
+        if adapted is None:
+            return None
+        criteria.append(adapted)
+
+    if run_type == "flow_run":
+        # flow runs are only filtered by their task runs with an `EXISTS` that the
+        # rollups cannot answer
+        if task_run_filter is not None:
+            return None
+    elif any(
+        filter_ is not None
+        for filter_ in (
+            flow_filter,
+            flow_run_filter,
+            deployment_filter,
+            work_pool_filter,
+            work_queue_filter,
+        )
+    ):
+        # task runs filtered by anything about their flow run must have one
+        criteria.append(rollup.flow_id.is_not(None))
+        if flow_run_filter is not None:
+            adapted = _adapt_to_rollup(db, run_type, flow_run_filter.as_sql_filter())
+            if adapted is None:
+                return None
+            criteria.append(adapted)
+
+    if flow_filter is not None:
+        criteria.append(
+            rollup.flow_id.in_(sa.select(db.Flow.id).where(flow_filter.as_sql_filter()))
+        )
+    if deployment_filter is not None:
+        criteria.append(
+            rollup.deployment_id.in_(
+                sa.select(db.Deployment.id).where(deployment_filter.as_sql_filter())
+            )
+        )
+    if work_queue_filter is not None:
+        criteria.append(
+            rollup.work_queue_id.in_(
+                sa.select(db.WorkQueue.id).where(work_queue_filter.as_sql_filter())
+            )
+        )
+    if work_pool_filter is not None:
+        criteria.append(
+            rollup.work_queue_id.in_(
+                sa.select(db.WorkQueue.id)
+                .join(db.WorkPool, db.WorkPool.id == db.WorkQueue.work_pool_id)
+                .where(work_pool_filter.as_sql_filter())
+            )
+        )
+    return criteria
+
+
+@dataclass
+class RunHistoryRollupCounts:
+    """
+    Aggregates read from the rollup table, and the criteria selecting the runs
+    that they do not account for.
+    """
+
+    rows: Sequence[Any]
+    remaining_runs: sa.ColumnElement[bool]
+
+
+@db_injector
+async def read_run_history_rollups(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    bucket_seconds: int,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    criteria: Sequence[sa.ColumnElement[bool]],
+) -> Optional[RunHistoryRollupCounts]:
+    """
+    Read the aggregates of settled terminal runs in `[start, end)` by bucket and
+    state.
+
+    Returns `None` if the rollups have not been built or too much of the range is
+    unsettled for the rollups to help.
+    """
+    watermark = await read_rollup_watermark(session, run_type)
+    if watermark is None:
+        return None
+
+    unsettled = await read_unsettled_rollup_ranges(
+        session,
+        run_type,
+        bucket_seconds,
+        updated_since=watermark,
+        start=start,
+        end=end,
+    )
+    if len(unsettled) > MAX_UNSETTLED_RANGES:
+        return None
+
+    rollup = db.RunHistoryRollup
+    result = await session.execute(
+        sa.select(
+            rollup.interval_start,
+            rollup.state_type,
+            rollup.state_name,
+            sa.func.sum(rollup.count_runs).label("count_runs"),
+            sa.func.sum(rollup.sum_estimated_run_time).label("sum_estimated_run_time"),
+            sa.func.sum(rollup.sum_estimated_lateness).label("sum_estimated_lateness"),
+        )
+        .where(
+            rollup.run_type == run_type,
+            rollup.bucket_seconds == bucket_seconds,
+            rollup.interval_start >= start,
+            rollup.interval_start < end,
+            *criteria,
+            *(
+                sa.not_(
+                    sa.and_(
+                        rollup.interval_start >= range_start,
+                        rollup.interval_start < range_end,
+                    )
+                )
+                for range_start, range_end in unsettled
+            ),
+        )
+        .group_by(rollup.interval_start, rollup.state_type, rollup.state_name)
+    )
+
+    run = _run_model(db, run_type)
+    return RunHistoryRollupCounts(
+        rows=result.all(),
+        remaining_runs=sa.or_(
+            run.state_type.is_(None),
+            run.state_type.not_in(TERMINAL_STATES),
+            *(
+                sa.and_(
+                    run.expected_start_time >= range_start,
+                    run.expected_start_time < range_end,
+                )
+                for range_start, range_end in unsettled
+            ),
+        ),
+    )
@@ -7,6 +7,7 @@ import contextlib
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Dict,
     Optional,
     Sequence,
@@ -37,7 +38,9 @@ from prefect.server.orchestration.policies import (
 )
 from prefect.server.orchestration.rules import TaskOrchestrationContext
 from prefect.server.schemas.responses import OrchestrationResult
-from prefect.types._datetime import now
+from prefect.server.utilities.pagination import KeysetPosition
+from prefect.server.utilities.streaming import STREAMING_CHUNK_SIZE, stream_scalars
+from prefect.types._datetime import DateTime, now
 
 if TYPE_CHECKING:
     import logging
@@ -195,6 +198,25 @@ async def read_task_run(
     return model
 
 
+@db_injector
+async def read_task_run_updated(
+    db: PrefectDBInterface, session: AsyncSession, task_run_id: UUID
+) -> Optional[DateTime]:
+    """
+    Read when a task run was last updated, without loading the task run.
+
+    Args:
+        session: a database session
+        task_run_id: the task run id
+
+    Returns:
+        DateTime: the task run's `updated` timestamp, or None if it doesn't exist
+    """
+    return await session.scalar(
+        sa.select(db.TaskRun.updated).where(db.TaskRun.id == task_run_id)
+    )
+
+
 @db_injector
 async def read_task_run_with_flow_run_name(
     db: PrefectDBInterface, session: AsyncSession, task_run_id: UUID
@@ -306,6 +328,41 @@ async def _apply_task_run_filters(
     return query
 
 
+async def _read_task_runs_query(
+    db: PrefectDBInterface,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: schemas.sorting.TaskRunSort = schemas.sorting.TaskRunSort.ID_DESC,
+    after: Optional[KeysetPosition] = None,
+) -> sa.Select[tuple[orm_models.TaskRun]]:
+    query = select(db.TaskRun)
+    if after is not None:
+        query = sort.as_keyset().apply(query, after)
+    else:
+        query = query.order_by(*sort.as_sql_sort())
+
+    query = await _apply_task_run_filters(
+        db,
+        query,
+        flow_filter=flow_filter,
+        flow_run_filter=flow_run_filter,
+        task_run_filter=task_run_filter,
+        deployment_filter=deployment_filter,
+    )
+
+    if offset is not None:
+        query = query.offset(offset)
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query
+
+
 @db_injector
 async def read_task_runs(
     db: PrefectDBInterface,
@@ -317,6 +374,7 @@ async def read_task_runs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.TaskRunSort = schemas.sorting.TaskRunSort.ID_DESC,
+    after: Optional[KeysetPosition] = None,
 ) -> Sequence[orm_models.TaskRun]:
     """
     Read task runs.
@@ -330,33 +388,61 @@ async def read_task_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        after: if provided, order task runs for keyset pagination and only select
+            task runs after this position
 
     Returns:
         List[orm_models.TaskRun]: the task runs
     """
-
-    query = select(db.TaskRun).order_by(*sort.as_sql_sort())
-
-    query = await _apply_task_run_filters(
+    query = await _read_task_runs_query(
         db,
-        query,
         flow_filter=flow_filter,
         flow_run_filter=flow_run_filter,
         task_run_filter=task_run_filter,
         deployment_filter=deployment_filter,
+        offset=offset,
+        limit=limit,
+        sort=sort,
+        after=after,
     )
 
-    if offset is not None:
-        query = query.offset(offset)
-
-    if limit is not None:
-        query = query.limit(limit)
-
     logger.debug(f"In read_task_runs, query generated is:\n{query}")
     result = await session.execute(query)
     return result.scalars().unique().all()
 
 
+@db_injector
+async def stream_task_runs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: schemas.sorting.TaskRunSort = schemas.sorting.TaskRunSort.ID_DESC,
+    chunk_size: int = STREAMING_CHUNK_SIZE,
+) -> AsyncGenerator[Sequence[orm_models.TaskRun], None]:
+    """
+    Read task runs with a server-side cursor, yielding them in chunks.
+
+    Accepts the same filters as `read_task_runs`.
+    """
+    query = await _read_task_runs_query(
+        db,
+        flow_filter=flow_filter,
+        flow_run_filter=flow_run_filter,
+        task_run_filter=task_run_filter,
+        deployment_filter=deployment_filter,
+        offset=offset,
+        limit=limit,
+        sort=sort,
+    )
+    async for chunk in stream_scalars(session, query, chunk_size=chunk_size):
+        yield chunk
+
+
 @db_injector
 async def count_task_runs(
     db: PrefectDBInterface,
@@ -455,6 +541,9 @@ async def delete_task_run(
     Returns:
         bool: whether or not the task run was deleted
     """
+    await models.run_history_rollups.mark_run_history_rollups_stale(
+        session, task_run_ids=[task_run_id]
+    )
 
     result = await session.execute(
         delete(db.TaskRun).where(db.TaskRun.id == task_run_id)
@@ -502,6 +591,13 @@ async def set_task_run_state(
     proposed_state_type = state.type if state else None
     intended_transition = (initial_state_type, proposed_state_type)
 
+    if initial_state_type in schemas.states.TERMINAL_STATES:
+        # leaving a terminal state, or being rescheduled, moves the run out of the
+        # rollup bucket it was counted in
+        await models.run_history_rollups.mark_run_history_rollups_stale(
+            session, task_run_ids=[task_run_id]
+        )
+
     if state.state_details.deferred:
         task_policy = BackgroundTaskPolicy  # CoreTaskPolicy + prevent `Running` -> `Running` transition
     elif force or task_policy is None:
@@ -537,6 +633,8 @@ async def set_task_run_state(
     if context.orchestration_error is not None:
         raise context.orchestration_error
 
+    models.flow_runs.invalidate_flow_run_graph_cache(run.flow_run_id)
+
     result = OrchestrationResult(
         state=context.validated_state,
         status=context.response_status,
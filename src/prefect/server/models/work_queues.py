@@ -298,6 +298,10 @@ async def delete_work_queue(
     Returns:
         bool: whether or not the WorkQueue was deleted
     """
+    await models.run_history_rollups.clear_run_history_rollup_work_queues(
+        session, [work_queue_id]
+    )
+
     result = await session.execute(
         delete(db.WorkQueue).where(db.WorkQueue.id == work_queue_id)
     )
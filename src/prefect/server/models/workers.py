@@ -19,6 +19,7 @@ import sqlalchemy as sa
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect._internal.uuid7 import uuid7
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
@@ -123,6 +124,25 @@ async def read_work_pool_by_name(
     return result.scalar()
 
 
+@db_injector
+async def read_work_pool_updated_by_name(
+    db: PrefectDBInterface, session: AsyncSession, work_pool_name: str
+) -> Optional[DateTime]:
+    """
+    Reads when a WorkPool was last updated by name, without loading the WorkPool.
+
+    Args:
+        session (AsyncSession): A database session
+        work_pool_name (str): a WorkPool name
+
+    Returns:
+        DateTime: the WorkPool's `updated` timestamp, or None if it doesn't exist
+    """
+    return await session.scalar(
+        sa.select(db.WorkPool.updated).where(db.WorkPool.name == work_pool_name)
+    )
+
+
 @db_injector
 async def read_work_pools(
     db: PrefectDBInterface,
@@ -282,6 +302,12 @@ async def delete_work_pool(
     Returns:
         bool: whether or not the WorkPool was deleted
     """
+    work_queue_ids = await session.scalars(
+        select(db.WorkQueue.id).where(db.WorkQueue.work_pool_id == work_pool_id)
+    )
+    await models.run_history_rollups.clear_run_history_rollup_work_queues(
+        session, work_queue_ids.all()
+    )
 
     result = await session.execute(
         delete(db.WorkPool).where(db.WorkPool.id == work_pool_id)
@@ -14,7 +14,7 @@ mechanism to configure and observe exactly what logic will fire against a transi
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Union
+from typing import Any, Generic, TypeVar, Union
 
 from prefect.server.database import orm_models
 from prefect.server.orchestration.rules import (
@@ -26,6 +26,10 @@ from prefect.server.schemas import core, states
 T = TypeVar("T", bound=orm_models.Run)
 RP = TypeVar("RP", bound=Union[core.FlowRunPolicy, core.TaskRunPolicy])
 
+# the rules of each policy that govern a transition, keyed by the policy, its
+# `priority` function, and the transition
+_compiled_transition_rules: dict[tuple[Any, ...], tuple[type[Any], ...]] = {}
+
 
 class BaseOrchestrationPolicy(ABC, Generic[T, RP]):
     """
@@ -55,15 +59,19 @@ class BaseOrchestrationPolicy(ABC, Generic[T, RP]):
     ) -> list[type[BaseUniversalTransform[T, RP] | BaseOrchestrationRule[T, RP]]]:
         """
         Returns rules in policy that are valid for the specified state transition.
+
+        The rules for each transition are selected once per policy and reused.
         """
 
-        transition_rules: list[
-            type[BaseUniversalTransform[T, RP] | BaseOrchestrationRule[T, RP]]
-        ] = []
-        for rule in cls.priority():
-            if from_state in rule.FROM_STATES and to_state in rule.TO_STATES:
-                transition_rules.append(rule)
-        return transition_rules
+        key = (cls, cls.priority, from_state, to_state)
+        transition_rules = _compiled_transition_rules.get(key)
+        if transition_rules is None:
+            transition_rules = _compiled_transition_rules[key] = tuple(
+                rule
+                for rule in cls.priority()
+                if from_state in rule.FROM_STATES and to_state in rule.TO_STATES
+            )
+        return list(transition_rules)
 
 
 class TaskRunOrchestrationPolicy(
@@ -647,8 +647,9 @@ class BaseOrchestrationRule(
             pass
         else:
             try:
-                entry_context = self.context.entry_context()
-                await self.before_transition(*entry_context)
+                if self._defines_hook("before_transition"):
+                    entry_context = self.context.entry_context()
+                    await self.before_transition(*entry_context)
                 self.context.rule_signature.append(str(self.__class__))
             except Exception as before_transition_error:
                 reason = (
@@ -684,15 +685,26 @@ class BaseOrchestrationRule(
         any side-effects produced by `self.before_transition`.
         """
 
-        exit_context = self.context.exit_context()
         if await self.invalid():
             pass
         elif await self.fizzled():
-            await self.cleanup(*exit_context)
+            if self._defines_hook("cleanup"):
+                await self.cleanup(*self.context.exit_context())
         else:
-            await self.after_transition(*exit_context)
+            if self._defines_hook("after_transition"):
+                await self.after_transition(*self.context.exit_context())
             self.context.finalization_signature.append(str(self.__class__))
 
+    def _defines_hook(self, name: str) -> bool:
+        """
+        Determines if this rule implements the given hook, so that copies of the
+        context are only made for hooks that can use them.
+        """
+        hook = getattr(self, name)
+        return getattr(hook, "__func__", None) is not getattr(
+            BaseOrchestrationRule, name
+        )
+
     async def before_transition(
         self,
         initial_state: Optional[states.State],
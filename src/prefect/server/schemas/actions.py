@@ -522,6 +522,15 @@ class TaskRunCreate(ActionBaseModel):
         return validate_cache_key_length(cache_key)
 
 
+class TaskRunSetState(ActionBaseModel):
+    """Data used by the Prefect REST API to set the state of a task run in bulk"""
+
+    task_run_id: UUID = Field(
+        default=..., description="The id of the task run to set the state of."
+    )
+    state: StateCreate = Field(default=..., description="The intended state.")
+
+
 class TaskRunUpdate(ActionBaseModel):
     """Data used by the Prefect REST API to update a task run"""
 
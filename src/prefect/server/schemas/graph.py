@@ -46,3 +46,13 @@ class Graph(PrefectBaseModel):
     nodes: List[Tuple[UUID, Node]]
     artifacts: List[GraphArtifact]
     states: List[GraphState]
+
+
+class GraphDelta(Graph):
+    """
+    The nodes of a flow run graph that changed after a watermark. `root_node_ids`
+    lists the changed nodes that have no parents.
+    """
+
+    watermark: DateTime
+    has_more: bool
@@ -164,6 +164,22 @@ class OrchestrationResult(PrefectBaseModel):
     details: StateResponseDetails
 
 
+class FlowRunOrchestrationResult(OrchestrationResult):
+    """
+    The output of state orchestration for one of several flow runs.
+    """
+
+    flow_run_id: UUID
+
+
+class FlowRunBulkDeleteResponse(PrefectBaseModel):
+    """
+    The flow runs deleted by a bulk delete request.
+    """
+
+    deleted: list[UUID] = Field(description="The ids of the deleted flow runs.")
+
+
 class WorkerFlowRunResponse(PrefectBaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
 
@@ -652,6 +668,33 @@ class DeploymentPaginationResponse(BaseModel):
     page: int
 
 
+class FlowRunCursorPaginationResponse(BaseModel):
+    results: list[FlowRunResponse]
+    limit: int
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="A cursor for the next page of results, if there are any.",
+    )
+
+
+class TaskRunCursorPaginationResponse(BaseModel):
+    results: list[schemas.core.TaskRun]
+    limit: int
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="A cursor for the next page of results, if there are any.",
+    )
+
+
+class LogCursorPaginationResponse(BaseModel):
+    results: list[schemas.core.Log]
+    limit: int
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="A cursor for the next page of results, if there are any.",
+    )
+
+
 class SchemaValuePropertyError(BaseModel):
     property: str
     errors: List["SchemaValueError"]
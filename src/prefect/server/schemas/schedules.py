@@ -6,10 +6,14 @@ from __future__ import annotations
 
 import datetime
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import (
     Annotated,
     Any,
+    Callable,
     ClassVar,
+    FrozenSet,
     Generator,
     List,
     Optional,
@@ -29,7 +33,7 @@ from prefect._internal.schemas.validators import (
     validate_cron_string,
     validate_rrule_string,
 )
-from prefect._vendor.croniter import croniter
+from prefect._vendor.croniter import CroniterBadDateError, croniter
 from prefect.server.utilities.schemas.bases import PrefectBaseModel
 from prefect.types import DateTime, TimeZone
 from prefect.types._datetime import create_datetime_instance, now
@@ -68,6 +72,130 @@ def _prepare_scheduling_start_and_end(
     return start, end
 
 
+# timezones whose UTC offset never changes, in which adding days to a date is the
+# same as adding the equivalent number of seconds
+FIXED_OFFSET_TIMEZONES = frozenset(
+    {"UTC", "Etc/UTC", "GMT", "Etc/GMT", "UCT", "Etc/UCT", "Universal", "Zulu"}
+)
+
+
+def _as_utc(dt: datetime.datetime) -> datetime.datetime:
+    """The same instant as a timezone-aware datetime in UTC, without `pendulum`'s
+    arithmetic overrides."""
+    utc = dt.astimezone(datetime.timezone.utc)
+    return datetime.datetime(
+        utc.year,
+        utc.month,
+        utc.day,
+        utc.hour,
+        utc.minute,
+        utc.second,
+        utc.microsecond,
+        tzinfo=datetime.timezone.utc,
+    )
+
+
+def _is_fixed_offset_timezone(timezone: Optional[str]) -> bool:
+    return (
+        not timezone
+        or timezone in FIXED_OFFSET_TIMEZONES
+        or timezone.startswith("Etc/GMT")
+    )
+
+
+@dataclass(frozen=True)
+class _CompiledCron:
+    """
+    The fields of a cron expression expanded into the sets of values they match,
+    used to step through the times the expression matches without `croniter`'s
+    per-date overhead.
+    """
+
+    minutes: Tuple[int, ...]
+    hours: Tuple[int, ...]
+    # `None` for fields that match every value
+    days: Optional[FrozenSet[int]]
+    months: Optional[FrozenSet[int]]
+    weekdays: Optional[FrozenSet[int]]
+    day_or: bool
+
+    def matches_day(self, day: datetime.date) -> bool:
+        in_days = self.days is None or day.day in self.days
+        # cron counts weekdays from Sunday (0) rather than Monday
+        in_weekdays = self.weekdays is None or (day.weekday() + 1) % 7 in self.weekdays
+
+        # like cron, when both fields are restricted, a day matching either of them
+        # matches unless `day_or` is disabled
+        if self.day_or and self.days is not None and self.weekdays is not None:
+            return in_days or in_weekdays
+        return in_days and in_weekdays
+
+    def times_after(
+        self, start: datetime.datetime
+    ) -> Generator[datetime.datetime, None, None]:
+        """
+        Yields the naive times matching the expression after `start`, in order, the
+        same way successive calls to `croniter.get_next` would.
+        """
+        first = start.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        day = first.date()
+        # like `croniter`, give up when no time matches for 50 years
+        give_up = day + datetime.timedelta(days=366 * 50)
+
+        while day <= give_up:
+            if self.months is not None and day.month not in self.months:
+                day = (day.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+                continue
+
+            if self.matches_day(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        time = datetime.datetime(
+                            day.year, day.month, day.day, hour, minute
+                        )
+                        if time >= first:
+                            give_up = day + datetime.timedelta(days=366 * 50)
+                            yield time
+
+            day += datetime.timedelta(days=1)
+
+        raise CroniterBadDateError("failed to find next date")
+
+
+@lru_cache(maxsize=1024)
+def _compile_cron(cron: str, day_or: bool) -> Optional[_CompiledCron]:
+    """
+    Compiles a cron expression, or returns `None` if it uses features that only
+    `croniter` supports, such as seconds, `L`, or `#`.
+    """
+    try:
+        expanded, nth_weekday_of_month = croniter.expand(cron)
+    except Exception:
+        return None
+
+    if len(expanded) != 5 or nth_weekday_of_month:
+        return None
+
+    fields: list[Optional[Tuple[int, ...]]] = []
+    for values in expanded:
+        if values == ["*"]:
+            fields.append(None)
+        elif all(isinstance(value, int) for value in values):
+            fields.append(tuple(sorted(set(values))))
+        else:
+            return None
+
+    minutes, hours, days, months, weekdays = fields
+    return _CompiledCron(
+        minutes=minutes or tuple(range(60)),
+        hours=hours or tuple(range(24)),
+        days=frozenset(days) if days is not None else None,
+        months=frozenset(months) if months is not None else None,
+        weekdays=frozenset(weekdays) if weekdays is not None else None,
+        day_or=day_or,
+    )
+
+
 class IntervalSchedule(PrefectBaseModel):
     """
     A schedule formed by adding `interval` increments to an `anchor_date`. If no
@@ -298,6 +426,74 @@ class IntervalSchedule(PrefectBaseModel):
 
                 next_date = next_date.add(days=interval_days, seconds=interval_seconds)
 
+    def _get_dates_batch(
+        self,
+        n: Optional[int] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> List[DateTime]:
+        """Retrieves all the dates `_get_dates_generator` would generate at once.
+        For schedules in fixed-offset timezones, where every interval is the same
+        length in UTC, the dates are computed with UTC arithmetic rather than
+        stepped through one at a time.
+
+        Args:
+            n (Optional[int]): The number of dates to generate
+            start (Optional[datetime.datetime]): The first returned date will be on or
+                after this date. Defaults to None.  If a timezone-naive datetime is
+                provided, it is assumed to be in the schedule's timezone.
+            end (Optional[datetime.datetime]): The maximum scheduled date to return. If
+                a timezone-naive datetime is provided, it is assumed to be in the
+                schedule's timezone.
+
+        Returns:
+            List[DateTime]: a list of dates
+        """
+        if sys.version_info >= (3, 13) or not _is_fixed_offset_timezone(self.timezone):
+            return list(self._get_dates_generator(n=n, start=start, end=end))
+
+        if n is None:
+            n = MAX_ITERATIONS if end is not None else 1
+
+        if start is None:
+            start = now("UTC")
+        anchor_tz = self.anchor_date.in_tz(self.timezone)
+        start, end = _prepare_scheduling_start_and_end(start, end, self.timezone)
+
+        offset = (start - anchor_tz).total_seconds() / self.interval.total_seconds()
+        first = anchor_tz.add(seconds=self.interval.total_seconds() * int(offset))
+        while first < start:
+            first = first.add(seconds=self.interval.total_seconds())
+
+        # intervals never produce duplicate dates without DST, so the generator's
+        # limit on attempts is a limit on the number of dates
+        count = min(n, MAX_ITERATIONS + 2)
+        first_utc = _as_utc(first)
+        if end is not None:
+            if first > end:
+                return []
+            count = min(count, (_as_utc(end) - first_utc) // self.interval + 1)
+
+        date_type, tz = type(first), first.tz
+
+        dates: List[DateTime] = []
+        for i in range(count):
+            local = tz.convert(first_utc + self.interval * i)
+            dates.append(
+                date_type(
+                    local.year,
+                    local.month,
+                    local.day,
+                    local.hour,
+                    local.minute,
+                    local.second,
+                    local.microsecond,
+                    tzinfo=tz,
+                    fold=local.fold,
+                )
+            )
+        return dates
+
 
 class CronSchedule(PrefectBaseModel):
     """
@@ -388,6 +584,52 @@ class CronSchedule(PrefectBaseModel):
         Returns:
             List[DateTime]: a list of dates
         """
+        return self._iter_dates(n, start, end, self._croniter_times)
+
+    def _get_dates_batch(
+        self,
+        n: Optional[int] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> List[DateTime]:
+        """Retrieves all the dates `_get_dates_generator` would generate at once,
+        stepping through the cron expression's precompiled fields rather than
+        `croniter` when the expression only uses plain five-field syntax.
+
+        Args:
+            n (int): The number of dates to generate
+            start (datetime.datetime, optional): The first returned date will be on or
+                after this date. Defaults to the current date. If a timezone-naive
+                datetime is provided, it is assumed to be in the schedule's timezone.
+            end (datetime.datetime, optional): No returned date will exceed this date.
+                If a timezone-naive datetime is provided, it is assumed to be in the
+                schedule's timezone.
+
+        Returns:
+            List[DateTime]: a list of dates
+        """
+        compiled = _compile_cron(self.cron, self.day_or)
+        if compiled is None:
+            return list(self._get_dates_generator(n=n, start=start, end=end))
+
+        return list(self._iter_dates(n, start, end, compiled.times_after))
+
+    def _croniter_times(
+        self, start: datetime.datetime
+    ) -> Generator[datetime.datetime, None, None]:
+        cron = croniter(self.cron, start, day_or=self.day_or)  # type: ignore
+        while True:
+            yield cron.get_next(datetime.datetime)
+
+    def _iter_dates(
+        self,
+        n: Optional[int],
+        start: Optional[datetime.datetime],
+        end: Optional[datetime.datetime],
+        times_after: Callable[
+            [datetime.datetime], Generator[datetime.datetime, None, None]
+        ],
+    ) -> Generator[DateTime, None, None]:
         if start is None:
             start = now("UTC")
 
@@ -431,18 +673,16 @@ class CronSchedule(PrefectBaseModel):
                     microsecond=start.microsecond,
                 )
             )
-            start_naive_tz = start.naive()
+            start_naive_tz = start_localized.replace(tzinfo=None)
 
-        cron = croniter(self.cron, start_naive_tz, day_or=self.day_or)  # type: ignore
         dates = set()
         counter = 0
 
-        while True:
-            # croniter does not handle DST properly when the start time is
-            # in and around when the actual shift occurs. To work around this,
-            # we use the naive start time to get the next cron date delta, then
-            # add that time to the original scheduling anchor.
-            next_time = cron.get_next(datetime.datetime)
+        # croniter does not handle DST properly when the start time is
+        # in and around when the actual shift occurs. To work around this,
+        # we use the naive start time to get the next cron date delta, then
+        # add that time to the original scheduling anchor.
+        for next_time in times_after(start_naive_tz):
             delta = next_time - start_naive_tz
             if sys.version_info >= (3, 13):
                 from whenever import ZonedDateTime
@@ -699,5 +939,27 @@ class RRuleSchedule(PrefectBaseModel):
 
             counter += 1
 
+    def _get_dates_batch(
+        self,
+        n: Optional[int] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> List[DateTime]:
+        """Retrieves all the dates `_get_dates_generator` would generate at once.
+
+        Args:
+            n (int): The number of dates to generate
+            start (datetime.datetime, optional): The first returned date will be on or
+                after this date. Defaults to the current date. If a timezone-naive
+                datetime is provided, it is assumed to be in the schedule's timezone.
+            end (datetime.datetime, optional): No returned date will exceed this date.
+                If a timezone-naive datetime is provided, it is assumed to be in the
+                schedule's timezone.
+
+        Returns:
+            List[DateTime]: a list of dates
+        """
+        return list(self._get_dates_generator(n=n, start=start, end=end))
+
 
 SCHEDULE_TYPES = Union[IntervalSchedule, CronSchedule, RRuleSchedule]
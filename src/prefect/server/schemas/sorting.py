@@ -2,12 +2,14 @@
 Schemas for sorting Prefect REST API objects.
 """
 
+import datetime
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 import sqlalchemy as sa
 
 from prefect.server.utilities.database import db_injector
+from prefect.server.utilities.pagination import Keyset
 from prefect.utilities.collections import AutoEnum
 
 if TYPE_CHECKING:
@@ -57,6 +59,70 @@ class FlowRunSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    @db_injector
+    def as_keyset(self, db: "PrefectDBInterface") -> Keyset:
+        """Return the keyset used to paginate flow runs with a cursor"""
+        run = db.FlowRun
+        keyset_mapping: dict[str, Keyset] = {
+            "ID_DESC": Keyset(id=run.id, descending=True),
+            "START_TIME_ASC": Keyset(
+                id=run.id,
+                key=sa.func.coalesce(run.start_time, run.expected_start_time),
+                key_type=datetime.datetime,
+                key_of=lambda r: r.start_time or r.expected_start_time,
+                nullable=True,
+            ),
+            "START_TIME_DESC": Keyset(
+                id=run.id,
+                key=sa.func.coalesce(run.start_time, run.expected_start_time),
+                key_type=datetime.datetime,
+                key_of=lambda r: r.start_time or r.expected_start_time,
+                descending=True,
+                nullable=True,
+            ),
+            "EXPECTED_START_TIME_ASC": Keyset(
+                id=run.id,
+                key=run.expected_start_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.expected_start_time,
+                nullable=True,
+            ),
+            "EXPECTED_START_TIME_DESC": Keyset(
+                id=run.id,
+                key=run.expected_start_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.expected_start_time,
+                descending=True,
+                nullable=True,
+            ),
+            "NAME_ASC": Keyset(
+                id=run.id, key=run.name, key_type=str, key_of=lambda r: r.name
+            ),
+            "NAME_DESC": Keyset(
+                id=run.id,
+                key=run.name,
+                key_type=str,
+                key_of=lambda r: r.name,
+                descending=True,
+            ),
+            "NEXT_SCHEDULED_START_TIME_ASC": Keyset(
+                id=run.id,
+                key=run.next_scheduled_start_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.next_scheduled_start_time,
+                nullable=True,
+            ),
+            "END_TIME_DESC": Keyset(
+                id=run.id,
+                key=run.end_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.end_time,
+                descending=True,
+                nullable=True,
+            ),
+        }
+        return keyset_mapping[self.value]
+
 
 class TaskRunSort(AutoEnum):
     """Defines task run sorting options."""
@@ -85,6 +151,55 @@ class TaskRunSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    @db_injector
+    def as_keyset(self, db: "PrefectDBInterface") -> Keyset:
+        """Return the keyset used to paginate task runs with a cursor"""
+        run = db.TaskRun
+        keyset_mapping: dict[str, Keyset] = {
+            "ID_DESC": Keyset(id=run.id, descending=True),
+            "EXPECTED_START_TIME_ASC": Keyset(
+                id=run.id,
+                key=run.expected_start_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.expected_start_time,
+                nullable=True,
+            ),
+            "EXPECTED_START_TIME_DESC": Keyset(
+                id=run.id,
+                key=run.expected_start_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.expected_start_time,
+                descending=True,
+                nullable=True,
+            ),
+            "NAME_ASC": Keyset(
+                id=run.id, key=run.name, key_type=str, key_of=lambda r: r.name
+            ),
+            "NAME_DESC": Keyset(
+                id=run.id,
+                key=run.name,
+                key_type=str,
+                key_of=lambda r: r.name,
+                descending=True,
+            ),
+            "NEXT_SCHEDULED_START_TIME_ASC": Keyset(
+                id=run.id,
+                key=run.next_scheduled_start_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.next_scheduled_start_time,
+                nullable=True,
+            ),
+            "END_TIME_DESC": Keyset(
+                id=run.id,
+                key=run.end_time,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.end_time,
+                descending=True,
+                nullable=True,
+            ),
+        }
+        return keyset_mapping[self.value]
+
 
 class LogSort(AutoEnum):
     """Defines log sorting options."""
@@ -101,6 +216,26 @@ class LogSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    @db_injector
+    def as_keyset(self, db: "PrefectDBInterface") -> Keyset:
+        """Return the keyset used to paginate logs with a cursor"""
+        keyset_mapping: dict[str, Keyset] = {
+            "TIMESTAMP_ASC": Keyset(
+                id=db.Log.id,
+                key=db.Log.timestamp,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.timestamp,
+            ),
+            "TIMESTAMP_DESC": Keyset(
+                id=db.Log.id,
+                key=db.Log.timestamp,
+                key_type=datetime.datetime,
+                key_of=lambda r: r.timestamp,
+                descending=True,
+            ),
+        }
+        return keyset_mapping[self.value]
+
 
 class FlowSort(AutoEnum):
     """Defines flow sorting options."""
@@ -5,17 +5,28 @@ import asyncio
 import inspect
 import signal
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
-from datetime import timedelta
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timedelta
 from logging import Logger
 from operator import methodcaller
 from types import ModuleType
-from typing import Any, AsyncGenerator, List, NoReturn, Optional, Sequence, overload
+from typing import (
+    Any,
+    AsyncGenerator,
+    ClassVar,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    overload,
+)
 
 import anyio
 from typing_extensions import Self
 
 from prefect.logging.loggers import get_logger
+from prefect.server.services import metrics
+from prefect.server.utilities import messaging
 from prefect.settings import PREFECT_API_LOG_RETRYABLE_ERRORS
 from prefect.settings.models.root import canonical_environment_prefix
 from prefect.settings.models.server.services import ServicesBaseSetting
@@ -43,6 +54,7 @@ def _known_service_modules() -> list[ModuleType]:
         late_runs,
         pause_expirations,
         repossessor,
+        run_history_rollups,
         scheduler,
         task_run_recorder,
         telemetry,
@@ -55,6 +67,7 @@ def _known_service_modules() -> list[ModuleType]:
         late_runs,
         pause_expirations,
         repossessor,
+        run_history_rollups,
         scheduler,
         task_run_recorder,
         telemetry,
@@ -147,6 +160,10 @@ class Service(ABC):
         self.name = self.__class__.__name__
         self.logger = get_logger(f"server.services.{self.name.lower()}")
 
+    def record_items_processed(self, count: int = 1) -> None:
+        """Records that the service processed `count` items, such as runs"""
+        metrics.record_items_processed(self.name, count)
+
 
 class RunInAllServers(Service, abc.ABC):
     """
@@ -165,10 +182,22 @@ class LoopService(Service, abc.ABC):
     This class makes it straightforward to design and integrate them. Users only need to
     define the `run_once` coroutine to describe the behavior of the service on each
     loop.
+
+    Services may also be woken before their next scheduled run, either by calling
+    `wake` or by listing the names of the events that signal new work in
+    `wakeup_events`, in which case `loop_seconds` is the longest the service waits
+    between runs.
     """
 
     loop_seconds = 60
 
+    # names of events that wake the service before its next scheduled run
+    wakeup_events: ClassVar[frozenset[str]] = frozenset()
+
+    # how long to wait after a wakeup event before running, so that the change that
+    # emitted the event is committed and bursts of events are handled in one run
+    wakeup_delay_seconds: ClassVar[float] = 1
+
     def __init__(
         self, loop_seconds: Optional[float] = None, handle_signals: bool = False
     ):
@@ -188,6 +217,12 @@ class LoopService(Service, abc.ABC):
         )
         self._is_running: bool = False  # flag for whether the service is running
 
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._wake_now: bool = False  # flag for whether to run without waiting
+        self._wake_at: Optional[datetime] = None  # earliest requested next run
+        self._wakeup_listener: Optional[asyncio.Task[None]] = None
+        self._wakeup_subscription: AsyncExitStack = AsyncExitStack()
+
         if handle_signals:
             _register_signal(signal.SIGINT, self._stop)
             _register_signal(signal.SIGTERM, self._stop)
@@ -200,10 +235,14 @@ class LoopService(Service, abc.ABC):
         self._is_running = True
         self.logger.debug(f"Starting {self.name}")
 
+        if self.wakeup_events:
+            await self._start_wakeup_listener()
+
     async def _on_stop(self) -> None:
         """
         Called after running the service
         """
+        await self._stop_wakeup_listener()
         self._is_running = False
         self.logger.debug(f"Stopped {self.name}")
 
@@ -239,7 +278,8 @@ class LoopService(Service, abc.ABC):
 
             try:
                 self.logger.debug(f"About to run {self.name}...")
-                await self.run_once()
+                with metrics.observe_iteration(self.name):
+                    await self.run_once()
 
             except asyncio.CancelledError:
                 self.logger.info(f"Received cancellation signal for {self.name}")
@@ -282,12 +322,80 @@ class LoopService(Service, abc.ABC):
             )
             self.logger.debug(f"Finished running {self.name}. Next run at {next_run}")
 
-            # check the `_should_stop` flag every 1 seconds until the next run time is reached
-            while now("UTC") < next_run and not self._should_stop:
-                await asyncio.sleep(min(1, (next_run - now("UTC")).total_seconds()))
+            await self._wait_for_next_run(next_run)
 
         await self._on_stop()
 
+    def wake(self, at: Optional[datetime] = None) -> None:
+        """
+        Requests that the service runs before its next scheduled run.
+
+        Args:
+            at (datetime, optional): when to run. If not provided or in the past,
+                the service runs as soon as it finishes its current loop. Only the
+                earliest requested time is kept, and requests that are not due by the
+                next run are dropped, so services should request them on every loop.
+        """
+        if at is None or at <= now("UTC"):
+            self._wake_now = True
+        elif self._wake_at is None or at < self._wake_at:
+            self._wake_at = at
+        else:
+            return
+        self._wakeup.set()
+
+    async def _wait_for_next_run(self, next_run: datetime) -> None:
+        """
+        Waits until `next_run`, returning early if the service is stopped or woken.
+        """
+        while not self._should_stop and not self._wake_now:
+            deadline = (
+                next_run if self._wake_at is None else min(next_run, self._wake_at)
+            )
+            remaining = (deadline - now("UTC")).total_seconds()
+            if remaining <= 0:
+                break
+
+            self._wakeup.clear()
+            with anyio.move_on_after(remaining):
+                await self._wakeup.wait()
+
+        self._wake_now = False
+        self._wake_at = None
+
+    async def _start_wakeup_listener(self) -> None:
+        """
+        Subscribes to the events topic so that `wakeup_events` wake the service.
+        """
+        try:
+            consumer_kwargs = await self._wakeup_subscription.enter_async_context(
+                messaging.ephemeral_subscription(topic="events")
+            )
+            consumer = messaging.create_consumer(**consumer_kwargs)
+        except Exception:
+            self.logger.warning(
+                f"Could not subscribe {self.name} to events, it will only run every"
+                f" {self.loop_seconds} seconds.",
+                exc_info=True,
+            )
+            await self._wakeup_subscription.aclose()
+            return
+
+        self._wakeup_listener = asyncio.create_task(
+            consumer.run(self._handle_wakeup_message)
+        )
+
+    async def _stop_wakeup_listener(self) -> None:
+        if self._wakeup_listener is not None:
+            self._wakeup_listener.cancel()
+            await asyncio.gather(self._wakeup_listener, return_exceptions=True)
+            self._wakeup_listener = None
+        await self._wakeup_subscription.aclose()
+
+    async def _handle_wakeup_message(self, message: messaging.Message) -> None:
+        if message.attributes.get("event") in self.wakeup_events:
+            self.wake(at=now("UTC") + timedelta(seconds=self.wakeup_delay_seconds))
+
     async def stop(self, block: bool = True) -> None:
         """
         Gracefully stops a running LoopService and optionally blocks until the
@@ -324,6 +432,7 @@ class LoopService(Service, abc.ABC):
         arguments so it can be used as a signal handler.
         """
         self._should_stop = True
+        self._wakeup.set()
 
     @abstractmethod
     async def run_once(self) -> None:
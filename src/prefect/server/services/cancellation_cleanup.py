@@ -28,6 +28,8 @@ class CancellationCleanup(LoopService):
     Cancels tasks and subflows of flow runs that have been cancelled
     """
 
+    wakeup_events = frozenset({"prefect.flow-run.Cancelled"})
+
     @classmethod
     def service_settings(cls) -> ServicesBaseSetting:
         return get_current_settings().server.services.cancellation_cleanup
@@ -80,6 +82,7 @@ class CancellationCleanup(LoopService):
             for run in flow_runs:
                 await self._cancel_child_runs(db=db, flow_run=run)
                 high_water_mark = run.id
+            self.record_items_processed(len(flow_runs))
 
             # if no relevant flows were found, exit the loop
             if len(flow_runs) < self.batch_size:
@@ -126,6 +129,7 @@ class CancellationCleanup(LoopService):
             for subflow_run in subflow_runs:
                 await self._cancel_subflow(db=db, flow_run=subflow_run)
                 high_water_mark = max(high_water_mark, subflow_run.id)
+            self.record_items_processed(len(subflow_runs))
 
             # if no relevant flows were found, exit the loop
             if len(subflow_runs) < self.batch_size:
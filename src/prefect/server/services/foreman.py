@@ -130,6 +130,7 @@ class Foreman(LoopService):
             )
 
         if result.rowcount:
+            self.record_items_processed(result.rowcount)
             self.logger.info(f"Marked {result.rowcount} workers as offline.")
 
     @db_injector
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -66,6 +66,7 @@ class MarkLateRuns(LoopService):
 
         - Querying for flow runs in a scheduled state that are Scheduled to start in the past
         - For any runs past the "late" threshold, setting the flow run state to a new `Late` state
+          in bulk for each batch of runs
         """
         scheduled_to_start_before = now("UTC") - datetime.timedelta(
             seconds=self.mark_late_after.total_seconds()
@@ -80,9 +81,9 @@ class MarkLateRuns(LoopService):
                 result = await session.execute(query)
                 runs = result.all()
 
-                # mark each run as late
-                for run in runs:
-                    await self._mark_flow_run_as_late(session=session, flow_run=run)
+                # mark the whole batch as late at once
+                await self._mark_flow_runs_as_late(session=session, flow_runs=runs)
+                self.record_items_processed(len(runs))
 
                 # if no runs were found, exit the loop
                 if len(runs) < self.batch_size:
@@ -137,6 +138,27 @@ class MarkLateRuns(LoopService):
         except ObjectNotFoundError:
             return  # flow run was deleted, ignore it
 
+    async def _mark_flow_runs_as_late(
+        self,
+        session: AsyncSession,
+        flow_runs: Sequence[sa.Row[tuple["UUID", DateTime | None]]],
+    ) -> None:
+        """
+        Mark a batch of flow runs as late.
+
+        Runs that were deleted or left their scheduled state since they were
+        selected are skipped. If `_mark_flow_run_as_late` is overridden, each run
+        is marked with it instead. Pass-through method for overrides.
+        """
+        if type(self)._mark_flow_run_as_late is not MarkLateRuns._mark_flow_run_as_late:
+            for flow_run in flow_runs:
+                await self._mark_flow_run_as_late(session=session, flow_run=flow_run)
+            return
+
+        await models.flow_runs.mark_flow_runs_late(
+            session=session, flow_run_ids=[flow_run.id for flow_run in flow_runs]
+        )
+
 
 if __name__ == "__main__":
     asyncio.run(MarkLateRuns(handle_signals=True).start())
@@ -0,0 +1,121 @@
+"""
+Prometheus metrics describing the work done by server services.
+
+Each iteration of a service, which is one loop of a `LoopService` or one message
+handled by a consuming service, is timed and split into the time spent executing
+database statements and the time spent in Python.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from prometheus_client import Counter, Histogram
+
+from prefect.server.database.configurations import STATEMENT_TIMER, StatementTimer
+from prefect.server.utilities.messaging import Message, MessageHandler, StopConsumer
+
+# loop services may take minutes to run, so extend the default buckets
+ITERATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    float("inf"),
+)
+
+SERVICE_ITERATION_DURATION = Histogram(
+    "prefect_server_service_iteration_duration_seconds",
+    "The time taken by one iteration of a server service",
+    labelnames=["service"],
+    buckets=ITERATION_BUCKETS,
+)
+SERVICE_ITERATION_DATABASE_DURATION = Histogram(
+    "prefect_server_service_iteration_database_seconds",
+    "The time spent executing database statements in one iteration of a server service",
+    labelnames=["service"],
+    buckets=ITERATION_BUCKETS,
+)
+SERVICE_ITERATION_PYTHON_DURATION = Histogram(
+    "prefect_server_service_iteration_python_seconds",
+    "The time spent outside of database statements in one iteration of a server service",
+    labelnames=["service"],
+    buckets=ITERATION_BUCKETS,
+)
+SERVICE_ITERATION_ERRORS = Counter(
+    "prefect_server_service_iteration_errors",
+    "The number of iterations of a server service that raised an error",
+    labelnames=["service"],
+)
+SERVICE_DATABASE_STATEMENTS = Counter(
+    "prefect_server_service_database_statements",
+    "The number of database statements executed by a server service",
+    labelnames=["service"],
+)
+SERVICE_ITEMS_PROCESSED = Counter(
+    "prefect_server_service_items_processed",
+    "The number of items, such as runs or messages, processed by a server service",
+    labelnames=["service"],
+)
+
+
+@contextmanager
+def observe_iteration(service: str) -> Iterator[StatementTimer]:
+    """
+    Records the duration of one iteration of a service, along with how much of it
+    was spent executing database statements.
+    """
+    timer = StatementTimer()
+    token = STATEMENT_TIMER.set(timer)
+    start = time.perf_counter()
+    try:
+        yield timer
+    except StopConsumer:
+        raise
+    except Exception:
+        SERVICE_ITERATION_ERRORS.labels(service).inc()
+        raise
+    finally:
+        STATEMENT_TIMER.reset(token)
+        elapsed = time.perf_counter() - start
+        database_seconds = min(timer.seconds, elapsed)
+
+        SERVICE_ITERATION_DURATION.labels(service).observe(elapsed)
+        SERVICE_ITERATION_DATABASE_DURATION.labels(service).observe(database_seconds)
+        SERVICE_ITERATION_PYTHON_DURATION.labels(service).observe(
+            elapsed - database_seconds
+        )
+        SERVICE_DATABASE_STATEMENTS.labels(service).inc(timer.statements)
+
+
+def record_items_processed(service: str, count: int = 1) -> None:
+    """Records that a service processed `count` items"""
+    if count > 0:
+        SERVICE_ITEMS_PROCESSED.labels(service).inc(count)
+
+
+def instrument_handler(service: str, handler: MessageHandler) -> MessageHandler:
+    """
+    Wraps the message handler of a consuming service so that each message handled
+    is recorded as one iteration of the service.
+    """
+
+    async def instrumented_handler(message: Message) -> None:
+        with observe_iteration(service):
+            await handler(message)
+        record_items_processed(service)
+
+    return instrumented_handler
@@ -25,6 +25,8 @@ class FailExpiredPauses(LoopService):
     Fails flow runs that have been paused and never resumed
     """
 
+    wakeup_events = frozenset({"prefect.flow-run.Paused", "prefect.flow-run.Suspended"})
+
     @classmethod
     def service_settings(cls) -> ServicesBaseSetting:
         return get_current_settings().server.services.pause_expirations
@@ -64,6 +66,8 @@ class FailExpiredPauses(LoopService):
                 # mark each run as failed
                 for run in runs:
                     await self._mark_flow_run_as_failed(session=session, flow_run=run)
+                    self._wake_at_pause_timeout(run)
+                self.record_items_processed(len(runs))
 
                 # if no runs were found, exit the loop
                 if len(runs) < self.batch_size:
@@ -91,6 +95,17 @@ class FailExpiredPauses(LoopService):
                 force=True,
             )
 
+    def _wake_at_pause_timeout(self, flow_run: FlowRun) -> None:
+        """
+        Schedules the next run for when the pause of a flow run expires, so that it
+        is failed on time rather than at the next loop.
+        """
+        pause_timeout = (
+            flow_run.state.state_details.pause_timeout if flow_run.state else None
+        )
+        if pause_timeout is not None and pause_timeout > now("UTC"):
+            self.wake(at=pause_timeout)
+
 
 if __name__ == "__main__":
     asyncio.run(FailExpiredPauses(handle_signals=True).start())
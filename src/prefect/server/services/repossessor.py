@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
+from uuid import UUID
 
 from prefect.server.concurrency.lease_storage import (
     ConcurrencyLeaseStorage,
     get_concurrency_lease_storage,
 )
+from prefect.server.concurrency.waiters import get_slot_waiters
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.models.concurrency_limits_v2 import bulk_decrement_active_slots
 from prefect.server.services.base import LoopService
@@ -35,6 +37,7 @@ class Repossessor(LoopService):
         if expired_lease_ids:
             self.logger.info(f"Revoking {len(expired_lease_ids)} expired leases")
 
+        released_limit_ids: set[UUID] = set()
         db = provide_database_interface()
         async with db.session_context() as session:
             for expired_lease_id in expired_lease_ids:
@@ -59,3 +62,7 @@ class Repossessor(LoopService):
                     occupancy_seconds=occupancy_seconds,
                 )
                 await self.concurrency_lease_storage.revoke_lease(expired_lease_id)
+                released_limit_ids.update(expired_lease.resource_ids)
+                self.record_items_processed()
+
+        get_slot_waiters().notify(released_limit_ids)
@@ -0,0 +1,94 @@
+"""
+The RunHistoryRollups service. Responsible for keeping the run history rollups up
+to date with the runs they aggregate.
+"""
+
+import datetime
+from typing import Any, Optional
+
+from prefect.server.database import PrefectDBInterface
+from prefect.server.database.dependencies import db_injector
+from prefect.server.models import run_history_rollups
+from prefect.server.models.run_history_rollups import RunType
+from prefect.server.services.base import LoopService
+from prefect.settings.context import get_current_settings
+from prefect.settings.models.server.services import ServicesBaseSetting
+from prefect.types._datetime import now
+from prefect.utilities.collections import batched_iterable
+
+# runs are considered changed if they were updated this long before the previous
+# refresh started, so that changes committed by slow transactions are not missed
+REFRESH_OVERLAP = datetime.timedelta(seconds=60)
+
+
+class RunHistoryRollups(LoopService):
+    """
+    Refreshes the run history rollups of buckets containing runs that changed or
+    were deleted since the previous refresh, building them from every run the
+    first time it runs.
+    """
+
+    @classmethod
+    def service_settings(cls) -> ServicesBaseSetting:
+        return get_current_settings().server.services.run_history_rollups
+
+    def __init__(self, loop_seconds: Optional[float] = None, **kwargs: Any):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or get_current_settings().server.services.run_history_rollups.loop_seconds,
+            **kwargs,
+        )
+
+        # refresh this many ranges of buckets in each transaction
+        self.batch_size = 24
+
+    @db_injector
+    async def run_once(self, db: PrefectDBInterface) -> None:
+        """
+        Refresh the flow run and task run history rollups by:
+
+        - Finding the ranges of minute buckets containing runs updated since the
+          watermark, or every terminal run if there is no watermark yet
+        - Recomputing the rollups in those ranges in batches
+        - Advancing the watermark to the start of this refresh
+        """
+        run_types: tuple[RunType, ...] = ("flow_run", "task_run")
+        for run_type in run_types:
+            await self._refresh(db, run_type)
+
+    async def _refresh(self, db: PrefectDBInterface, run_type: RunType) -> None:
+        refresh_start = now("UTC")
+
+        async with db.session_context() as session:
+            watermark = await run_history_rollups.read_rollup_watermark(
+                session, run_type
+            )
+            if watermark is None:
+                ranges = await run_history_rollups.read_backfill_ranges(
+                    session, run_type
+                )
+            else:
+                ranges = await run_history_rollups.read_unsettled_rollup_ranges(
+                    session,
+                    run_type,
+                    run_history_rollups.MINUTE,
+                    updated_since=watermark,
+                )
+
+        for batch in batched_iterable(ranges, self.batch_size):
+            async with db.session_context(begin_transaction=True) as session:
+                await run_history_rollups.refresh_run_history_rollups(
+                    session, run_type, batch
+                )
+            self.record_items_processed(len(batch))
+
+        async with db.session_context(begin_transaction=True) as session:
+            await run_history_rollups.write_rollup_watermark(
+                session, run_type, refresh_start - REFRESH_OVERLAP
+            )
+
+        if ranges:
+            self.logger.info(
+                f"Refreshed {run_type.replace('_', ' ')} history rollups in "
+                f"{len(ranges)} time ranges."
+            )
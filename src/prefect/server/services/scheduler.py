@@ -9,6 +9,7 @@ import datetime
 from typing import Any, Sequence
 from uuid import UUID
 
+import anyio
 import sqlalchemy as sa
 
 import prefect.server.models as models
@@ -31,8 +32,14 @@ from prefect.types._datetime import now
 from prefect.utilities.collections import batched_iterable
 
 
-class TryAgain(Exception):
-    """Internal control-flow exception used to retry the Scheduler's main loop"""
+def deployment_shard(deployment_id: UUID, shard_count: int) -> int:
+    """
+    The shard a deployment belongs to when deployments are split between
+    `shard_count` scheduler instances.
+    """
+    # deployment IDs are random, so their low bits already spread deployments
+    # evenly between shards
+    return deployment_id.int % shard_count
 
 
 class Scheduler(LoopService):
@@ -71,6 +78,10 @@ class Scheduler(LoopService):
         self.insert_batch_size: int = (
             PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE.value()
         )
+        settings = get_current_settings().server.services.scheduler
+        self.concurrency: int = settings.concurrency
+        self.shard_count: int = settings.shard_count
+        self.shard_index: int = settings.shard_index
 
     @db_injector
     async def run_once(self, db: PrefectDBInterface) -> None:
@@ -78,9 +89,13 @@ class Scheduler(LoopService):
         Schedule flow runs by:
 
         - Querying for deployments with active schedules
-        - Generating the next set of flow runs based on each deployments schedule
+        - Generating the next set of flow runs based on each deployments schedule,
+          for up to `concurrency` deployments at a time
         - Inserting all scheduled flow runs into the database
 
+        When `shard_count` is greater than one, only deployments in this instance's
+        shard are scheduled.
+
         All inserted flow runs are committed to the database at the termination of the
         loop.
         """
@@ -98,13 +113,15 @@ class Scheduler(LoopService):
                 result = await session.execute(query)
                 deployment_ids = result.scalars().unique().all()
 
-                # collect runs across all deployments
-                try:
-                    runs_to_insert = await self._collect_flow_runs(
-                        session=session, deployment_ids=deployment_ids
-                    )
-                except TryAgain:
-                    continue
+            # collect runs across all deployments in this shard
+            runs_to_insert = await self._collect_flow_runs(
+                deployment_ids=[
+                    deployment_id
+                    for deployment_id in deployment_ids
+                    if deployment_shard(deployment_id, self.shard_count)
+                    == self.shard_index
+                ]
+            )
 
             # bulk insert the runs based on batch size setting
             for batch in batched_iterable(runs_to_insert, self.insert_batch_size):
@@ -121,6 +138,7 @@ class Scheduler(LoopService):
                 # record the last deployment ID
                 last_id = deployment_ids[-1]
 
+        self.record_items_processed(total_inserted_runs)
         self.logger.info(f"Scheduled {total_inserted_runs} runs.")
 
     @db_injector
@@ -190,50 +208,48 @@ class Scheduler(LoopService):
 
     async def _collect_flow_runs(
         self,
-        session: sa.orm.Session,
         deployment_ids: Sequence[UUID],
     ) -> list[dict[str, Any]]:
         runs_to_insert: list[dict[str, Any]] = []
-        for deployment_id in deployment_ids:
+        limiter = anyio.CapacityLimiter(self.concurrency)
+
+        async def collect(deployment_id: UUID) -> None:
+            async with limiter:
+                runs_to_insert.extend(
+                    await self._collect_deployment_flow_runs(deployment_id)
+                )
+
+        async with anyio.create_task_group() as tg:
+            for deployment_id in deployment_ids:
+                tg.start_soon(collect, deployment_id)
+
+        return runs_to_insert
+
+    @db_injector
+    async def _collect_deployment_flow_runs(
+        self, db: PrefectDBInterface, deployment_id: UUID
+    ) -> list[dict[str, Any]]:
+        # each deployment gets its own session so that deployments can be read
+        # concurrently, and so that a database error for one deployment does not
+        # affect the others
+        async with db.session_context(begin_transaction=False) as session:
             right_now = now("UTC")
             # guard against erroneously configured schedules
             try:
-                runs_to_insert.extend(
-                    await self._generate_scheduled_flow_runs(
-                        session=session,
-                        deployment_id=deployment_id,
-                        start_time=right_now,
-                        end_time=right_now + self.max_scheduled_time,
-                        min_time=self.min_scheduled_time,
-                        min_runs=self.min_runs,
-                        max_runs=self.max_runs,
-                    )
+                return await self._generate_scheduled_flow_runs(
+                    session=session,
+                    deployment_id=deployment_id,
+                    start_time=right_now,
+                    end_time=right_now + self.max_scheduled_time,
+                    min_time=self.min_scheduled_time,
+                    min_runs=self.min_runs,
+                    max_runs=self.max_runs,
                 )
             except Exception:
                 self.logger.exception(
                     f"Error scheduling deployment {deployment_id!r}.",
                 )
-            finally:
-                connection = await session.connection()
-                if connection.invalidated:
-                    # If the error we handled above was the kind of database error that
-                    # causes underlying transaction to rollback and the connection to
-                    # become invalidated, rollback this session.  Errors that may cause
-                    # this are connection drops, database restarts, and things of the
-                    # sort.
-                    #
-                    # This rollback _does not rollback a transaction_, since that has
-                    # actually already happened due to the error above.  It brings the
-                    # Python session in sync with underlying connection so that when we
-                    # exec the outer with block, the context manager will not attempt to
-                    # commit the session.
-                    #
-                    # Then, raise TryAgain to break out of these nested loops, back to
-                    # the outer loop, where we'll begin a new transaction with
-                    # session.begin() in the next loop iteration.
-                    await session.rollback()
-                    raise TryAgain()
-        return runs_to_insert
+                return []
 
     @db_injector
     async def _generate_scheduled_flow_runs(
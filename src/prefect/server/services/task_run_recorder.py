@@ -8,6 +8,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.logging import get_logger
+from prefect.server import models
 from prefect.server.database import (
     PrefectDBInterface,
     db_injector,
@@ -18,6 +19,7 @@ from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.schemas.core import TaskRun
 from prefect.server.schemas.states import State
 from prefect.server.services.base import RunInAllServers, Service
+from prefect.server.services.metrics import instrument_handler
 from prefect.server.utilities.messaging import (
     Consumer,
     Message,
@@ -145,6 +147,8 @@ async def record_task_run_event(event: ReceivedEvent) -> None:
 
         await session.commit()
 
+    models.flow_runs.invalidate_flow_run_graph_cache(task_run.flow_run_id)
+
     logger.debug(
         "Recorded task run state change",
         extra={
@@ -222,7 +226,9 @@ class TaskRunRecorder(RunInAllServers, Service):
         )
 
         async with consumer() as handler:
-            self.consumer_task = asyncio.create_task(self.consumer.run(handler))
+            self.consumer_task = asyncio.create_task(
+                self.consumer.run(instrument_handler(self.name, handler))
+            )
             self.metrics_task = asyncio.create_task(log_metrics_periodically())
 
             logger.debug("TaskRunRecorder started")
@@ -724,6 +724,47 @@ def sqlite_greatest_as_max(
     return compiler.process(sa.func.max(*element.clauses), **kwargs)
 
 
+class explain(sa.Executable, sa.ClauseElement):
+    """
+    Platform-independent `EXPLAIN` of a statement, returning one row per line of
+    the query plan.
+
+    When `analyze` is set, PostgreSQL executes the statement and reports actual row
+    counts and timings. SQLite cannot report timings, so it always returns the
+    output of `EXPLAIN QUERY PLAN`.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: sa.ClauseElement, analyze: bool = False) -> None:
+        self.statement = statement
+        self.analyze = analyze
+
+
+def _compile_explained_statement(
+    element: explain, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    # the explained statement is compiled on its own, with its parameters rendered
+    # inline, so that its columns do not become the columns of the plan's rows
+    statement = element.statement.compile(
+        dialect=compiler.dialect, compile_kwargs={"literal_binds": True}
+    )
+    return compiler.process(sa.text(str(statement).replace(":", r"\:")), **kwargs)
+
+
+@compiles(explain, "postgresql")
+def explain_postgresql(element: explain, compiler: SQLCompiler, **kwargs: Any) -> str:
+    options = "(ANALYZE, BUFFERS) " if element.analyze else ""
+    statement = _compile_explained_statement(element, compiler, **kwargs)
+    return f"EXPLAIN {options}{statement}"
+
+
+@compiles(explain, "sqlite")
+def explain_sqlite(element: explain, compiler: SQLCompiler, **kwargs: Any) -> str:
+    statement = _compile_explained_statement(element, compiler, **kwargs)
+    return f"EXPLAIN QUERY PLAN {statement}"
+
+
 def get_dialect(obj: Union[str, Session, sa.Engine]) -> type[sa.Dialect]:
     """
     Get the dialect of a session, engine, or connection url.
@@ -1,3 +1,11 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+import prefect
+
+
 def should_redact_header(key: str) -> bool:
     """Indicates whether an HTTP header is sensitive or noisy and should be redacted
     from events and templates."""
@@ -16,3 +24,38 @@ def should_redact_header(key: str) -> bool:
         return True
 
     return False
+
+
+def weak_etag(*parts: Any) -> str:
+    """A weak entity tag identifying one version of a resource, for example its id
+    and `updated` timestamp.
+
+    Tags are weak because responses may include values derived at request time,
+    such as estimated run times, which don't change what version of the resource
+    they describe. The server version is included so that responses from a
+    different release are never treated as unchanged.
+    """
+    key = ":".join(str(part) for part in (prefect.__version__, *parts))
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Indicates whether an `If-None-Match` header matches an entity tag, using the
+    weak comparison that applies to conditional `GET` requests."""
+    if not if_none_match:
+        return False
+
+    def opaque_tag(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(
+        tag.strip() == "*" or opaque_tag(tag) == opaque_tag(etag)
+        for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """A `304 Not Modified` response for a resource matching an `If-None-Match`
+    header."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,171 @@
+"""
+Utilities for keyset (cursor-based) pagination of database queries.
+
+Keyset pagination resumes a query after the sort key and id of the last row that was
+returned rather than skipping an offset, so reading any page costs the same
+regardless of how deep into the results it is.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar
+from uuid import UUID
+
+import pydantic
+import sqlalchemy as sa
+
+SelectT = TypeVar("SelectT", bound=sa.Select[Any])
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class KeysetPosition:
+    """
+    A position in a keyset-paginated query.
+
+    `values` holds the sort key and id of the last row of the previous page, or is
+    `None` to request the first page.
+    """
+
+    values: Optional[tuple[Any, ...]] = None
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """
+    Describes how to order and resume a query for keyset pagination.
+
+    Rows are ordered by `key` and then by `id` to break ties, both in the same
+    direction. Rows with a null `key` are always ordered last so that positions can
+    be compared the same way on every database. A keyset without a `key` orders by
+    `id` alone.
+    """
+
+    id: sa.ColumnElement[Any]
+    key: Optional[sa.ColumnElement[Any]] = None
+    key_type: Any = None
+    key_of: Optional[Callable[[Any], Any]] = None
+    descending: bool = False
+    nullable: bool = False
+
+    def order_by(self) -> list[sa.ColumnElement[Any]]:
+        direction = sa.desc if self.descending else sa.asc
+        if self.key is None:
+            return [direction(self.id)]
+        key = direction(self.key)
+        if self.nullable:
+            key = key.nulls_last()
+        return [key, direction(self.id)]
+
+    def after(self, values: tuple[Any, ...]) -> sa.ColumnElement[bool]:
+        """
+        A clause selecting the rows that are ordered after the given position.
+        """
+
+        def follows(column: Any, value: Any) -> sa.ColumnElement[bool]:
+            return column < value if self.descending else column > value
+
+        if self.key is None:
+            (id_value,) = values
+            return follows(self.id, id_value)
+
+        key_value, id_value = values
+        if not self.nullable:
+            # bind the position with the column types so values are stored and
+            # compared in the same format as the columns
+            return follows(
+                sa.tuple_(self.key, self.id),
+                sa.tuple_(
+                    sa.literal(key_value, type_=self.key.type),
+                    sa.literal(id_value, type_=self.id.type),
+                ),
+            )
+        if key_value is None:
+            return sa.and_(self.key.is_(None), follows(self.id, id_value))
+        return sa.or_(
+            follows(self.key, key_value),
+            sa.and_(self.key == key_value, follows(self.id, id_value)),
+            self.key.is_(None),
+        )
+
+    def apply(self, query: SelectT, position: KeysetPosition) -> SelectT:
+        """
+        Order a query for keyset pagination, starting after the given position.
+        """
+        query = query.order_by(*self.order_by())
+        if position.values is not None:
+            query = query.where(self.after(position.values))
+        return query
+
+    def position_of(self, row: Any) -> KeysetPosition:
+        """
+        The position immediately after a row returned by a keyset-ordered query.
+        """
+        if self.key is None:
+            return KeysetPosition(values=(row.id,))
+        assert self.key_of is not None
+        return KeysetPosition(values=(self.key_of(row), row.id))
+
+    def _values_adapter(self) -> pydantic.TypeAdapter[Any]:
+        if self.key is None:
+            return pydantic.TypeAdapter(tuple[UUID])
+        return pydantic.TypeAdapter(tuple[Optional[self.key_type], UUID])
+
+    def encode_cursor(self, sort: str, position: KeysetPosition) -> str:
+        """
+        Encode a position as an opaque cursor for the given sort.
+        """
+        values = self._values_adapter().dump_python(position.values, mode="json")
+        return (
+            base64.urlsafe_b64encode(
+                json.dumps({"sort": sort, "values": values}).encode()
+            )
+            .decode()
+            .rstrip("=")
+        )
+
+    def decode_cursor(self, sort: str, cursor: Optional[str]) -> KeysetPosition:
+        """
+        Decode a cursor produced by `encode_cursor` for the same sort. A missing
+        cursor decodes to the position of the first page.
+
+        Raises:
+            InvalidCursorError: if the cursor is malformed or was produced for a
+                different sort
+        """
+        if cursor is None:
+            return KeysetPosition()
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values = self._values_adapter().validate_python(data["values"])
+        except Exception as exc:
+            raise InvalidCursorError("Unable to parse pagination cursor") from exc
+
+        if data.get("sort") != sort:
+            raise InvalidCursorError(
+                f"Pagination cursor was created for sort {data.get('sort')!r},"
+                f" not {sort!r}"
+            )
+        return KeysetPosition(values=values)
+
+
+def next_cursor(
+    keyset: Keyset, sort: str, rows: Sequence[Any], limit: int
+) -> Optional[str]:
+    """
+    The cursor for the page following `rows`, or `None` if there are no more rows.
+
+    Queries should fetch `limit + 1` rows so that the final page can be detected
+    without an additional query; the extra row is not returned to callers.
+    """
+    if len(rows) <= limit or limit == 0:
+        return None
+    return keyset.encode_cursor(sort, keyset.position_of(rows[limit - 1]))
@@ -0,0 +1,78 @@
+"""
+A sampling profiler for inspecting where a running server spends its time.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+import anyio.to_thread
+
+# only one profile is collected at a time, since each one samples every thread
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profile is requested while another one is being collected."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = os.path.relpath(code.co_filename) if code.co_filename else "?"
+    if filename.startswith(".."):
+        filename = code.co_filename
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _collapsed_stack(thread_name: str, frame: FrameType | None) -> str:
+    labels: list[str] = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+def _sample_stacks(duration: float, interval: float) -> Counter[str]:
+    sampler_id = threading.get_ident()
+    stacks: Counter[str] = Counter()
+
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():  # type: ignore[reportPrivateUsage]
+            if thread_id == sampler_id:
+                continue
+            thread_name = thread_names.get(thread_id, str(thread_id))
+            stacks[_collapsed_stack(thread_name, frame)] += 1
+        time.sleep(interval)
+
+    return stacks
+
+
+async def sample_stacks(duration: float, interval: float = 0.01) -> str:
+    """
+    Samples the Python stack of every thread in the process, other than the
+    sampler's own, every `interval` seconds for `duration` seconds.
+
+    Sampling runs in a worker thread so that the event loop, where the API and the
+    server services run, is sampled while it does its usual work.
+
+    Returns:
+        str: the sampled stacks in the collapsed format read by flame graph tools,
+            one `thread;outermost frame;...;innermost frame count` line per stack
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already being collected")
+
+    try:
+        stacks = await anyio.to_thread.run_sync(_sample_stacks, duration, interval)
+    finally:
+        _profile_lock.release()
+
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
@@ -6,8 +6,11 @@ from collections.abc import Coroutine, Sequence
 from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING, Any, Callable, get_type_hints
 
+import pydantic_core
 from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
+from pydantic import BaseModel
 from starlette.routing import BaseRoute
 from starlette.routing import Route as StarletteRoute
 
@@ -27,6 +30,27 @@ def method_paths_from_routes(routes: Sequence[BaseRoute]) -> set[str]:
     return method_paths
 
 
+class PrefectJSONResponse(ORJSONResponse):
+    """
+    The default response class for Prefect REST API routes.
+
+    Content is encoded with orjson rather than the standard library's `json`
+    module. Pydantic models, and lists of them, are serialized straight to JSON
+    bytes by their compiled serializers instead of being converted to dictionaries
+    first, so endpoints that build their own responses can return validated models
+    directly.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel) or (
+            isinstance(content, list)
+            and content
+            and all(isinstance(item, BaseModel) for item in content)
+        ):
+            return pydantic_core.to_json(content)
+        return super().render(content)
+
+
 class PrefectAPIRoute(APIRoute):
     """
     A FastAPIRoute class which attaches an async stack to requests that exits before
@@ -63,6 +87,7 @@ class PrefectRouter(APIRouter):
 
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("route_class", PrefectAPIRoute)
+        kwargs.setdefault("default_response_class", PrefectJSONResponse)
         super().__init__(**kwargs)
 
     def add_api_route(
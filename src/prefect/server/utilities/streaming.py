@@ -0,0 +1,71 @@
+"""
+Utilities for streaming query results as newline-delimited JSON (NDJSON).
+
+Filter endpoints normally validate every row, build a list and encode it as a single
+JSON array, so the whole result is held in memory several times over before the
+first byte is sent. When a client sends `Accept: application/x-ndjson`, those
+endpoints instead read rows from a server-side cursor in chunks and write one JSON
+object per line as each chunk is read.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Sequence
+from typing import Any, Optional, TypeVar
+
+import sqlalchemy as sa
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# The number of rows fetched from the database cursor, validated and written to the
+# response at a time
+STREAMING_CHUNK_SIZE = 500
+
+
+def accepts_ndjson(accept: Optional[str]) -> bool:
+    """
+    Whether an `Accept` header requests newline-delimited JSON.
+    """
+    if not accept:
+        return False
+    return any(
+        media_range.split(";", 1)[0].strip().lower() == NDJSON_MEDIA_TYPE
+        for media_range in accept.split(",")
+    )
+
+
+async def stream_scalars(
+    session: AsyncSession,
+    query: sa.Select[tuple[T]],
+    chunk_size: int = STREAMING_CHUNK_SIZE,
+) -> AsyncGenerator[Sequence[T], None]:
+    """
+    Execute a query with a server-side cursor, yielding its rows in chunks.
+    """
+    result = await session.stream_scalars(query.execution_options(yield_per=chunk_size))
+    async for chunk in result.partitions():
+        yield chunk
+
+
+def ndjson_response(
+    chunks: AsyncIterable[Sequence[T]],
+    to_model: Callable[[T], BaseModel],
+    headers: Optional[dict[str, Any]] = None,
+) -> StreamingResponse:
+    """
+    Stream chunks of rows as newline-delimited JSON, converting each row to a
+    response model as its chunk is written.
+    """
+
+    async def generate() -> AsyncGenerator[bytes, None]:
+        async for chunk in chunks:
+            yield "".join(
+                to_model(row).model_dump_json() + "\n" for row in chunk
+            ).encode()
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
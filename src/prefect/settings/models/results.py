@@ -8,7 +8,7 @@ from pydantic_settings import SettingsConfigDict
 
 from prefect.settings.base import PrefectBaseSettings, build_settings_config
 
-from ._defaults import default_local_storage_path
+from ._defaults import default_local_result_cache_path, default_local_storage_path
 
 
 class ResultsSettings(PrefectBaseSettings):
@@ -47,3 +47,25 @@ class ResultsSettings(PrefectBaseSettings):
             "prefect_local_storage_path",
         ),
     )
+
+    memory_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="The maximum estimated size, in bytes, of result records cached in memory by each process. Set to 0 to disable in-memory caching.",
+    )
+
+    local_cache_enabled: bool = Field(
+        default=False,
+        description="If `True`, result records read from or written to remote result storage are also cached on local disk and shared by all processes on the host.",
+    )
+
+    local_cache_path: Path = Field(
+        default_factory=default_local_result_cache_path,
+        description="The directory used for the local disk result cache. Defaults to $PREFECT_HOME/result_cache.",
+    )
+
+    local_cache_max_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        ge=0,
+        description="The maximum size, in bytes, of the local disk result cache. Least recently used records are evicted first.",
+    )
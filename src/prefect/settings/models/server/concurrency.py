@@ -15,3 +15,20 @@ class ServerConcurrencySettings(PrefectBaseSettings):
         default="prefect.server.concurrency.lease_storage.memory",
         description="The module to use for storing concurrency limit leases.",
     )
+
+    slot_ledger_enabled: bool = Field(
+        default=False,
+        description=(
+            "Whether to count the slots held on global concurrency limits in the "
+            "memory of the server and write the counts to the database in the "
+            "background, instead of updating the database on every acquisition and "
+            "release. Only enable this when a single server process, running both "
+            "the API and its services, uses the database."
+        ),
+    )
+
+    slot_ledger_flush_interval: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="The number of seconds between writes of the slot counts held in memory to the database.",
+    )
@@ -58,6 +58,14 @@ class ServerSettings(PrefectBaseSettings):
         ),
     )
 
+    profiling_enabled: bool = Field(
+        default=False,
+        description="""
+        Whether or not to expose a sampling profiler of the server process at
+        `/api/metrics/profile`. Requires Prometheus metrics to be enabled.
+        """,
+    )
+
     log_retryable_errors: bool = Field(
         default=False,
         description="If `True`, log retryable errors in the API and it's services.",
@@ -1,8 +1,9 @@
 from datetime import timedelta
 from typing import ClassVar
 
-from pydantic import AliasChoices, AliasPath, Field
+from pydantic import AliasChoices, AliasPath, Field, model_validator
 from pydantic_settings import SettingsConfigDict
+from typing_extensions import Self
 
 from prefect.settings.base import PrefectBaseSettings, build_settings_config
 
@@ -372,6 +373,44 @@ class ServerServicesSchedulerSettings(ServicesBaseSetting):
         """,
     )
 
+    concurrency: int = Field(
+        default=5,
+        ge=1,
+        description="""
+        The number of deployments the scheduler will generate runs for at the same
+        time. Each deployment uses its own database connection, so this should not
+        exceed the size of the database connection pool. Defaults to `5`.
+        """,
+    )
+
+    shard_count: int = Field(
+        default=1,
+        ge=1,
+        description="""
+        The number of scheduler instances that split deployments between them. Each
+        deployment is scheduled by the instance whose `shard_index` matches a hash of
+        the deployment's ID. Defaults to `1`.
+        """,
+    )
+
+    shard_index: int = Field(
+        default=0,
+        ge=0,
+        description="""
+        The shard of deployments this scheduler instance schedules, from `0` to
+        `shard_count - 1`. Defaults to `0`.
+        """,
+    )
+
+    @model_validator(mode="after")
+    def validate_shard_index(self) -> Self:
+        if self.shard_index >= self.shard_count:
+            raise ValueError(
+                f"shard_index must be less than shard_count ({self.shard_count}), "
+                f"got {self.shard_index}"
+            )
+        return self
+
 
 class ServerServicesPauseExpirationsSettings(ServicesBaseSetting):
     """
@@ -429,6 +468,26 @@ class ServerServicesRepossessorSettings(ServicesBaseSetting):
     )
 
 
+class ServerServicesRunHistoryRollupsSettings(ServicesBaseSetting):
+    """
+    Settings for controlling the run history rollups service
+    """
+
+    model_config: ClassVar[SettingsConfigDict] = build_settings_config(
+        ("server", "services", "run_history_rollups")
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Whether or not to start the run history rollups service in the server application. If disabled, run history is always aggregated from the run tables.",
+    )
+
+    loop_seconds: float = Field(
+        default=60,
+        description="The run history rollups service will refresh rollups of changed runs this often. Defaults to `60`.",
+    )
+
+
 class ServerServicesTaskRunRecorderSettings(ServicesBaseSetting):
     """
     Settings for controlling the task run recorder service
@@ -536,6 +595,10 @@ class ServerServicesSettings(PrefectBaseSettings):
         default_factory=ServerServicesRepossessorSettings,
         description="Settings for controlling the repossessor service",
     )
+    run_history_rollups: ServerServicesRunHistoryRollupsSettings = Field(
+        default_factory=ServerServicesRunHistoryRollupsSettings,
+        description="Settings for controlling the run history rollups service",
+    )
     task_run_recorder: ServerServicesTaskRunRecorderSettings = Field(
         default_factory=ServerServicesTaskRunRecorderSettings,
         description="Settings for controlling the task run recorder service",
@@ -23,6 +23,12 @@ class TasksRunnerSettings(PrefectBaseSettings):
         ),
     )
 
+    process_pool_max_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of worker processes for ProcessPoolTaskRunner. Defaults to the number of CPUs.",
+    )
+
 
 class TasksSchedulingSettings(PrefectBaseSettings):
     model_config: ClassVar[SettingsConfigDict] = build_settings_config(
@@ -99,6 +99,7 @@ from prefect.utilities.engine import (
     link_state_to_task_run_result,
     resolve_to_final_result,
 )
+from prefect.utilities.hashing import HashMemo, get_hash_memo, use_hash_memo
 from prefect.utilities.math import clamped_poisson_interval
 from prefect.utilities.timeout import timeout, timeout_async
 
@@ -133,6 +134,8 @@ class BaseTaskRunEngine(Generic[P, R]):
     _task_name_set: bool = False
     _last_event: Optional[PrefectEvent] = None
     _telemetry: RunTelemetry = field(default_factory=RunTelemetry)
+    # the hash memo of the `map` call that submitted this run, if any
+    _hash_memo: Optional[HashMemo] = None
 
     def __post_init__(self) -> None:
         if self.parameters is None:
@@ -167,11 +170,12 @@ class BaseTaskRunEngine(Generic[P, R]):
             try:
                 if not task_run_context:
                     raise ValueError("Task run context is not set")
-                key = self.task.cache_policy.compute_key(
-                    task_ctx=task_run_context,
-                    inputs=self.parameters or {},
-                    flow_parameters=parameters or {},
-                )
+                with use_hash_memo(self._hash_memo):
+                    key = self.task.cache_policy.compute_key(
+                        task_ctx=task_run_context,
+                        inputs=self.parameters or {},
+                        flow_parameters=parameters or {},
+                    )
             except Exception:
                 self.logger.exception(
                     "Error encountered when computing cache key - result will not be persisted.",
@@ -630,6 +634,11 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
             raise ValueError("Task run is not set")
 
         with ExitStack() as stack:
+            # the hash memo of a `map` call only applies to this run's cache key,
+            # not to the tasks it calls
+            if (hash_memo := get_hash_memo()) is not None:
+                self._hash_memo = hash_memo
+            stack.enter_context(use_hash_memo(None))
             if log_prints := should_log_prints(self.task):
                 stack.enter_context(patch_print())
             if self.task.persist_result is not None:
@@ -1215,6 +1224,11 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
             raise ValueError("Task run is not set")
 
         with ExitStack() as stack:
+            # the hash memo of a `map` call only applies to this run's cache key,
+            # not to the tasks it calls
+            if (hash_memo := get_hash_memo()) is not None:
+                self._hash_memo = hash_memo
+            stack.enter_context(use_hash_memo(None))
             if log_prints := should_log_prints(self.task):
                 stack.enter_context(patch_print())
             if self.task.persist_result is not None:
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import math
+import multiprocessing
+import os
 import sys
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
-from contextvars import copy_context
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from contextvars import ContextVar, copy_context
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -28,18 +33,23 @@ from prefect.futures import (
     PrefectFutureList,
 )
 from prefect.logging.loggers import get_logger, get_run_logger
-from prefect.settings import PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS
+from prefect.settings import (
+    PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
+    PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS,
+)
 from prefect.utilities.annotations import allow_failure, quote, unmapped
 from prefect.utilities.callables import (
     collapse_variadic_parameters,
     explode_variadic_parameter,
     get_parameter_defaults,
 )
-from prefect.utilities.collections import isiterable
+from prefect.utilities.collections import isiterable, visit_collection
+from prefect.utilities.hashing import hash_memo
 
 if TYPE_CHECKING:
     import logging
 
+    from prefect.context import AsyncClientContext
     from prefect.tasks import Task
 
 P = ParamSpec("P")
@@ -126,6 +136,39 @@ class TaskRunner(abc.ABC, Generic[F]):
                 "The task runner must be started before submitting work."
             )
 
+        task_inputs, static_parameters, call_parameters_list = (
+            self._expand_map_parameters(task, parameters)
+        )
+
+        futures: list[PrefectFuture[Any]] = []
+        # Static parameters are shared by every child, so their cache key hashes
+        # are memoized for the children submitted here
+        with hash_memo(static_parameters.values()):
+            for call_parameters in call_parameters_list:
+                futures.append(
+                    self.submit(
+                        task=task,
+                        parameters=call_parameters,
+                        wait_for=wait_for,
+                        dependencies=task_inputs,
+                    )
+                )
+
+        return PrefectFutureList(futures)
+
+    def _expand_map_parameters(
+        self,
+        task: "Task[P, R]",
+        parameters: dict[str, Any | unmapped[Any] | allow_failure[Any]],
+    ) -> tuple[dict[str, set[RunInput]], dict[str, Any], list[dict[str, Any]]]:
+        """
+        Expand the parameters of a `map` call into the parameters of each mapped
+        task run.
+
+        Returns the upstream task run inputs of the top-level parameters and the
+        static parameters, which are shared by every mapped task run, and the
+        parameters of each mapped task run.
+        """
         from prefect.utilities.engine import (
             collect_task_run_inputs_sync,
             resolve_inputs_sync,
@@ -180,7 +223,7 @@ class TaskRunner(abc.ABC, Generic[F]):
 
         map_length = list(lengths)[0]
 
-        futures: list[PrefectFuture[Any]] = []
+        call_parameters_list: list[dict[str, Any]] = []
         for i in range(map_length):
             call_parameters: dict[str, Any] = {
                 key: value[i] for key, value in iterable_parameters.items()
@@ -199,18 +242,11 @@ class TaskRunner(abc.ABC, Generic[F]):
                 call_parameters[key] = annotation.rewrap(call_parameters[key])
 
             # Collapse any previously exploded kwargs
-            call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
-
-            futures.append(
-                self.submit(
-                    task=task,
-                    parameters=call_parameters,
-                    wait_for=wait_for,
-                    dependencies=task_inputs,
-                )
+            call_parameters_list.append(
+                collapse_variadic_parameters(task.fn, call_parameters)
             )
 
-        return PrefectFutureList(futures)
+        return task_inputs, static_parameters, call_parameters_list
 
     def __enter__(self) -> Self:
         if self._started:
@@ -225,6 +261,67 @@ class TaskRunner(abc.ABC, Generic[F]):
         self._started = False
 
 
+class _WorkerEventLoop:
+    """
+    A long-lived event loop and Prefect client owned by a single worker thread.
+
+    Async tasks submitted to a `ThreadPoolTaskRunner` are run on the event loop of
+    the worker thread that picks them up, so the loop and the client's connection
+    pool are reused across task runs instead of being created for each one.
+    """
+
+    def __init__(self):
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self.client_context: "AsyncClientContext | None" = None
+        self._client_settings: tuple[Any, ...] | None = None
+
+    def run(self, coro: Coroutine[Any, Any, R]) -> R:
+        asyncio.set_event_loop(self.loop)
+        return self.loop.run_until_complete(coro)
+
+    async def use_shared_client(self) -> None:
+        """
+        Make the shared client available to `get_client` for the current task.
+
+        The client is created on first use and reused for subsequent task runs as long
+        as the API settings in the task's context match those it was created with.
+        """
+        from prefect.context import AsyncClientContext
+        from prefect.settings import (
+            PREFECT_API_AUTH_STRING,
+            PREFECT_API_KEY,
+            PREFECT_API_URL,
+        )
+
+        settings = (
+            PREFECT_API_URL.value(),
+            PREFECT_API_KEY.value(),
+            PREFECT_API_AUTH_STRING.value(),
+        )
+        if self.client_context is None:
+            client_context = AsyncClientContext()
+            await client_context.client.__aenter__()
+            await client_context.client.raise_for_api_version_mismatch()
+            self.client_context = client_context
+            self._client_settings = settings
+        elif settings != self._client_settings:
+            return
+
+        # Tasks run with a copy of the submitting context so this only affects the
+        # current task
+        AsyncClientContext.__var__.set(self.client_context)
+
+    def close(self) -> None:
+        try:
+            if self.client_context is not None:
+                self.loop.run_until_complete(
+                    self.client_context.client.__aexit__(None, None, None)
+                )
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            self.loop.close()
+
+
 class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
     """
     A task runner that executes tasks in a separate thread pool.
@@ -252,6 +349,11 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
             else max_workers
         )
         self._cancel_events: dict[uuid.UUID, threading.Event] = {}
+        # Per-thread event loops are created once the runner is started so that
+        # unstarted runners remain picklable
+        self._worker_local: threading.local | None = None
+        self._worker_event_loops: list[_WorkerEventLoop] = []
+        self._worker_event_loops_lock: threading.Lock | None = None
 
     def duplicate(self) -> "ThreadPoolTaskRunner[R]":
         return type(self)(max_workers=self._max_workers)
@@ -303,7 +405,7 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
             )
 
         from prefect.context import FlowRunContext
-        from prefect.task_engine import run_task_async, run_task_sync
+        from prefect.task_engine import run_task_sync
 
         task_run_id = uuid7()
         cancel_event = threading.Event()
@@ -329,12 +431,10 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
         )
 
         if task.isasync:
-            # TODO: Explore possibly using a long-lived thread with an event loop
-            # for better performance
             future = self._executor.submit(
                 context.run,
-                asyncio.run,
-                run_task_async(**submit_kwargs),
+                self._run_async_task,
+                submit_kwargs,
             )
         else:
             future = self._executor.submit(
@@ -347,6 +447,38 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
         )
         return prefect_future
 
+    def _run_async_task(self, submit_kwargs: dict[str, Any]) -> Any:
+        """
+        Run an async task on the calling worker thread's long-lived event loop.
+        """
+        from prefect.task_engine import run_task_async
+
+        assert self._worker_local is not None and self._worker_event_loops_lock
+        worker = getattr(self._worker_local, "event_loop", None)
+        if worker is None:
+            worker = _WorkerEventLoop()
+            self._worker_local.event_loop = worker
+            with self._worker_event_loops_lock:
+                self._worker_event_loops.append(worker)
+
+        async def run() -> Any:
+            await worker.use_shared_client()
+            return await run_task_async(**submit_kwargs)
+
+        return worker.run(run())
+
+    def _close_worker_event_loops(self) -> None:
+        # Worker threads have exited by the time this is called, so their loops are
+        # no longer running and can be closed from here
+        worker_event_loops, self._worker_event_loops = self._worker_event_loops, []
+        self._worker_local = None
+        self._worker_event_loops_lock = None
+        for worker in worker_event_loops:
+            try:
+                worker.close()
+            except Exception:
+                self.logger.debug("Failed to close worker event loop", exc_info=True)
+
     @overload
     def map(
         self,
@@ -379,10 +511,13 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
         if self._executor is not None:
             self._executor.shutdown(cancel_futures=True)
             self._executor = None
+        self._close_worker_event_loops()
 
     def __enter__(self) -> Self:
         super().__enter__()
         self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._worker_local = threading.local()
+        self._worker_event_loops_lock = threading.Lock()
         return self
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
@@ -390,6 +525,7 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
         if self._executor is not None:
             self._executor.shutdown(cancel_futures=True)
             self._executor = None
+        self._close_worker_event_loops()
         super().__exit__(exc_type, exc_value, traceback)
 
     def __eq__(self, value: object) -> bool:
@@ -402,6 +538,446 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
 ConcurrentTaskRunner = ThreadPoolTaskRunner
 
 
+class _ProcessPoolTaskRun:
+    """
+    A task run waiting to be shipped to a `ProcessPoolTaskRunner` worker process.
+    """
+
+    def __init__(
+        self,
+        task_run_id: uuid.UUID,
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None,
+        dependencies: dict[str, set[RunInput]] | None,
+        asset_context: dict[str, Any],
+    ):
+        self.task_run_id = task_run_id
+        self.parameters = parameters
+        self.wait_for: list[Any] | None = list(wait_for) if wait_for else None
+        self.dependencies = dependencies
+        self.asset_context = asset_context
+        self.future: Future[Any] = Future()
+
+    def upstream_futures(self) -> list[PrefectFuture[Any]]:
+        futures: list[PrefectFuture[Any]] = []
+
+        def collect(expr: Any) -> Any:
+            if isinstance(expr, PrefectFuture):
+                futures.append(expr)
+            return expr
+
+        visit_collection(self.parameters, visit_fn=collect, return_data=False)
+        visit_collection(self.wait_for, visit_fn=collect, return_data=False)
+        return futures
+
+    def payload(self) -> tuple[Any, ...]:
+        # Futures cannot be sent to another process, so upstream futures are
+        # exchanged for their final states which the task engine resolves in the
+        # same way
+        def to_state(expr: Any) -> Any:
+            if isinstance(expr, PrefectFuture):
+                return expr.state
+            return expr
+
+        return (
+            self.task_run_id,
+            visit_collection(self.parameters, visit_fn=to_state, return_data=True),
+            visit_collection(self.wait_for, visit_fn=to_state, return_data=True),
+            self.dependencies,
+            self.asset_context,
+        )
+
+
+def _run_task_runs_in_process(payload: bytes) -> list[bytes]:
+    """
+    Run a chunk of task runs in a `ProcessPoolTaskRunner` worker process.
+
+    The task and the serialized context are shipped once per chunk, and the context
+    and a client are set up once for every task run in it. Final states are returned
+    cloudpickled since they may hold results that the standard library pickler cannot
+    handle.
+    """
+    import cloudpickle
+
+    from prefect.context import SettingsContext, SyncClientContext, hydrated_context
+    from prefect.states import Crashed
+    from prefect.task_engine import run_task_async, run_task_sync
+
+    task, context, task_runs = cloudpickle.loads(payload)
+
+    states: list[bytes] = []
+    with ExitStack() as stack:
+        # Settings are entered first so the client is created for the flow's API
+        if settings_context := context.get("settings_context"):
+            stack.enter_context(SettingsContext(**settings_context))
+        client_context = stack.enter_context(SyncClientContext.get_or_create())
+        stack.enter_context(
+            hydrated_context(
+                dict(context, settings_context={}), client=client_context.client
+            )
+        )
+        event_loop = _WorkerEventLoop() if task.isasync else None
+        if event_loop is not None:
+            stack.callback(event_loop.close)
+
+        for task_run_id, parameters, wait_for, dependencies, asset_context in task_runs:
+            run_task_kwargs: dict[str, Any] = dict(
+                task=task,
+                task_run_id=task_run_id,
+                parameters=parameters,
+                wait_for=wait_for,
+                dependencies=dependencies,
+                context=dict(asset_context=asset_context),
+                return_type="state",
+            )
+            if event_loop is not None:
+
+                async def run() -> Any:
+                    assert event_loop is not None
+                    await event_loop.use_shared_client()
+                    return await run_task_async(**run_task_kwargs)
+
+                state = event_loop.run(run())
+            else:
+                state = run_task_sync(**run_task_kwargs)
+
+            try:
+                states.append(cloudpickle.dumps(state))
+            except Exception as exc:
+                states.append(
+                    cloudpickle.dumps(
+                        Crashed(
+                            message=(
+                                f"Task run {task_run_id} finished with state"
+                                f" {state.type.value} but the state could not be"
+                                f" returned to the flow: {exc!r}"
+                            )
+                        )
+                    )
+                )
+    return states
+
+
+_process_pool_map_batch: ContextVar[list[_ProcessPoolTaskRun] | None] = ContextVar(
+    "process_pool_map_batch", default=None
+)
+
+
+class ProcessPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
+    """
+    A task runner that executes tasks in a pool of worker processes.
+
+    Tasks are cloudpickled along with the current settings and run context and are
+    run by the task engine in a worker process, so CPU-bound Python tasks are not
+    limited by the GIL of the flow's process. Worker processes are started with the
+    `spawn` method and report task run states to the API directly.
+
+    Mapped task runs are shipped to the workers in chunks so the task and the run
+    context are pickled once per chunk rather than once per task run.
+
+    Attributes:
+        max_workers: The maximum number of processes to use for executing tasks.
+            Defaults to `PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS` or the number
+            of CPUs.
+        chunksize: The number of mapped task runs to send to a worker process at a
+            time. Defaults to splitting each `map` call into roughly four chunks per
+            worker.
+
+    Note:
+        Task functions, parameters and results must be serializable with cloudpickle.
+        Upstream futures are resolved in the flow's process before their downstream
+        task runs are sent to a worker.
+
+    Examples:
+        ```python
+        from prefect import flow, task
+        from prefect.task_runners import ProcessPoolTaskRunner
+
+        @task
+        def fib(n: int) -> int:
+            return n if n < 2 else fib.fn(n - 1) + fib.fn(n - 2)
+
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=4))
+        def my_flow():
+            return fib.map(range(25)).result()
+        ```
+    """
+
+    def __init__(self, max_workers: int | None = None, chunksize: int | None = None):
+        super().__init__()
+        self._max_workers: int = (
+            (
+                PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS.value()
+                or os.cpu_count()
+                or 1
+            )
+            if max_workers is None
+            else max_workers
+        )
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be greater than 0")
+        self._chunksize = chunksize
+        self._executor: ProcessPoolExecutor | None = None
+        self._dispatcher: ThreadPoolExecutor | None = None
+        self._api_url: str | None = None
+
+    def duplicate(self) -> "ProcessPoolTaskRunner[R]":
+        return type(self)(max_workers=self._max_workers, chunksize=self._chunksize)
+
+    @overload
+    def submit(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[RunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]: ...
+
+    @overload
+    def submit(
+        self,
+        task: "Task[Any, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[RunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]: ...
+
+    def submit(
+        self,
+        task: "Task[P, R | Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[RunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]:
+        """
+        Submit a task to the task run engine running in a worker process.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A future object that can be used to wait for the task to complete and
+            retrieve the result.
+        """
+        if not self._started:
+            raise RuntimeError("Task runner is not started")
+
+        from prefect.context import AssetContext, FlowRunContext
+        from prefect.utilities.engine import collect_task_run_inputs_sync
+
+        flow_run_ctx = FlowRunContext.get()
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+        else:
+            self.logger.debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+
+        task_run_id = uuid7()
+        task_inputs = {
+            k: collect_task_run_inputs_sync(v) for k, v in parameters.items()
+        }
+        task_run = _ProcessPoolTaskRun(
+            task_run_id=task_run_id,
+            parameters=parameters,
+            wait_for=wait_for,
+            dependencies=dependencies,
+            asset_context=AssetContext.from_task_and_inputs(
+                task=task,
+                task_run_id=task_run_id,
+                task_inputs=task_inputs,
+                copy_to_child_ctx=True,
+            ).serialize(),
+        )
+
+        batch = _process_pool_map_batch.get()
+        if batch is not None:
+            # Mapped task runs are sent to the workers in chunks once `map` has
+            # submitted all of them
+            batch.append(task_run)
+        else:
+            self._dispatch(task, self._serialize_context(), [task_run])
+
+        return PrefectConcurrentFuture(
+            task_run_id=task_run_id, wrapped_future=task_run.future
+        )
+
+    @overload
+    def map(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]: ...
+
+    @overload
+    def map(
+        self,
+        task: "Task[Any, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]: ...
+
+    def map(
+        self,
+        task: "Task[P, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
+        batch: list[_ProcessPoolTaskRun] = []
+        token = _process_pool_map_batch.set(batch)
+        try:
+            futures = super().map(task, parameters, wait_for)
+        finally:
+            _process_pool_map_batch.reset(token)
+
+        chunksize = self._chunksize or max(
+            1, math.ceil(len(batch) / (self._max_workers * 4))
+        )
+        context = self._serialize_context()
+        for start in range(0, len(batch), chunksize):
+            self._dispatch(task, context, batch[start : start + chunksize])
+        return futures
+
+    def _serialize_context(self) -> dict[str, Any]:
+        """
+        Serialize the current context for worker processes.
+
+        Worker processes cannot use an ephemeral API running in this process, so they
+        are pointed at the API URL of this process's client when none is configured.
+        """
+        from prefect.client.orchestration import get_client
+        from prefect.context import FlowRunContext, serialize_context
+        from prefect.settings import PREFECT_API_URL, temporary_settings
+
+        if PREFECT_API_URL.value():
+            return serialize_context()
+
+        if self._api_url is None:
+            flow_run_ctx = FlowRunContext.get()
+            client = flow_run_ctx.client if flow_run_ctx else get_client()
+            self._api_url = str(client.api_url)
+        with temporary_settings(updates={PREFECT_API_URL: self._api_url}):
+            return serialize_context()
+
+    def _dispatch(
+        self,
+        task: "Task[Any, Any]",
+        context: dict[str, Any],
+        task_runs: list[_ProcessPoolTaskRun],
+    ) -> None:
+        upstream_futures = [
+            future for task_run in task_runs for future in task_run.upstream_futures()
+        ]
+        if not upstream_futures:
+            self._send_to_workers(task, context, task_runs)
+            return
+
+        if self._dispatcher is None:
+            self._dispatcher = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="ProcessPoolTaskRunnerDispatcher",
+            )
+        self._dispatcher.submit(
+            self._send_to_workers_when_ready,
+            task,
+            context,
+            task_runs,
+            upstream_futures,
+        )
+
+    def _send_to_workers_when_ready(
+        self,
+        task: "Task[Any, Any]",
+        context: dict[str, Any],
+        task_runs: list[_ProcessPoolTaskRun],
+        upstream_futures: list[PrefectFuture[Any]],
+    ) -> None:
+        try:
+            for future in upstream_futures:
+                future.wait()
+            self._send_to_workers(task, context, task_runs)
+        except BaseException as exc:
+            for task_run in task_runs:
+                if not task_run.future.done():
+                    task_run.future.set_exception(exc)
+
+    def _send_to_workers(
+        self,
+        task: "Task[Any, Any]",
+        context: dict[str, Any],
+        task_runs: list[_ProcessPoolTaskRun],
+    ) -> None:
+        import cloudpickle
+
+        if self._executor is None:
+            # Processes are started lazily so runners entered only to hydrate a
+            # context in a worker process do not start pools of their own
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        payload = cloudpickle.dumps(
+            (task, context, [task_run.payload() for task_run in task_runs])
+        )
+        executor_future = self._executor.submit(_run_task_runs_in_process, payload)
+        executor_future.add_done_callback(partial(self._resolve_task_runs, task_runs))
+
+    @staticmethod
+    def _resolve_task_runs(
+        task_runs: list[_ProcessPoolTaskRun], executor_future: Future[list[bytes]]
+    ) -> None:
+        import cloudpickle
+
+        from prefect.states import exception_to_crashed_state
+        from prefect.utilities.asyncutils import run_coro_as_sync
+
+        if executor_future.cancelled():
+            for task_run in task_runs:
+                task_run.future.cancel()
+            return
+
+        try:
+            states = [cloudpickle.loads(state) for state in executor_future.result()]
+        except BaseException as exc:
+            # The worker process died or the payload could not be loaded
+            crashed = run_coro_as_sync(exception_to_crashed_state(exc))
+            states = [crashed] * len(task_runs)
+
+        for task_run, state in zip(task_runs, states):
+            if not task_run.future.done():
+                task_run.future.set_result(state)
+
+    def cancel_all(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=False, cancel_futures=True)
+            self._dispatcher = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=True)
+            self._dispatcher = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        super().__exit__(exc_type, exc_value, traceback)
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ProcessPoolTaskRunner):
+            return False
+        return (
+            self._max_workers == value._max_workers
+            and self._chunksize == value._chunksize
+        )
+
+
 class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture[R]]):
     def __init__(self):
         super().__init__()
@@ -486,4 +1062,34 @@ class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture[R]]):
         parameters: dict[str, Any],
         wait_for: Iterable[PrefectFuture[Any]] | None = None,
     ) -> PrefectFutureList[PrefectDistributedFuture[R]]:
-        return super().map(task, parameters, wait_for)
+        """
+        Submit multiple tasks for execution by Prefect task workers.
+
+        The mapped task runs are created with the API in bulk, in chunks, rather than
+        with a request per task run.
+        """
+        if not self._started:
+            raise RuntimeError(
+                "The task runner must be started before submitting work."
+            )
+        from prefect.context import FlowRunContext
+
+        task_inputs, _, call_parameters_list = self._expand_map_parameters(
+            task, parameters
+        )
+
+        flow_run_ctx = FlowRunContext.get()
+        message = (
+            f"Submitting {len(call_parameters_list)} runs of task {task.name} for"
+            " execution by Prefect task workers..."
+        )
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).info(message)
+        else:
+            self.logger.info(message)
+
+        return PrefectFutureList(
+            task._apply_async_many(
+                call_parameters_list, wait_for=wait_for, dependencies=task_inputs
+            )
+        )
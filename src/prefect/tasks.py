@@ -92,6 +92,9 @@ P = ParamSpec("P")  # The parameters of the task
 
 NUM_CHARS_DYNAMIC_KEY = 8
 
+# The number of deferred task runs created with each bulk API request when mapping
+BULK_CREATE_CHUNK_SIZE = 500
+
 logger: "logging.Logger" = get_logger("tasks")
 
 FutureOrResult: TypeAlias = Union[PrefectFuture[T], T]
@@ -852,97 +855,169 @@ class Task(Generic[P, R]):
         extra_task_inputs: Optional[dict[str, set[RunInput]]] = None,
         deferred: bool = False,
     ) -> TaskRun:
-        from prefect.utilities._engine import dynamic_key_for_task_run
-        from prefect.utilities.engine import collect_task_run_inputs_sync
+        if flow_run_context is None:
+            flow_run_context = FlowRunContext.get()
+        if parent_task_run_context is None:
+            parent_task_run_context = TaskRunContext.get()
+        if client is None:
+            client = get_client()
+
+        async with client:
+            task_run_kwargs = await self._prepare_run(
+                parameters=parameters or {},
+                flow_run_context=flow_run_context,
+                parent_task_run_context=parent_task_run_context,
+                wait_for=wait_for,
+                extra_task_inputs=extra_task_inputs,
+                deferred=deferred,
+            )
+
+            # create the task run
+            task_run = client.create_task_run(task=self, id=id, **task_run_kwargs)
+            # the new engine uses sync clients but old engines use async clients
+            if inspect.isawaitable(task_run):
+                task_run = await task_run
+
+            return task_run
+
+    async def create_runs(
+        self,
+        parameters: list[dict[str, Any]],
+        client: Optional["PrefectClient"] = None,
+        ids: Optional[list[UUID]] = None,
+        flow_run_context: Optional[FlowRunContext] = None,
+        parent_task_run_context: Optional[TaskRunContext] = None,
+        wait_for: Optional[OneOrManyFutureOrResult[Any]] = None,
+        extra_task_inputs: Optional[dict[str, set[RunInput]]] = None,
+        deferred: bool = False,
+    ) -> list[TaskRun]:
+        """
+        Create a task run for each set of parameters in a single API request.
+
+        Behaves like calling `create_run` once per set of parameters, with `ids`
+        optionally providing the ID of each task run.
+        """
+        from prefect.client.orchestration import build_task_run_create
 
         if flow_run_context is None:
             flow_run_context = FlowRunContext.get()
         if parent_task_run_context is None:
             parent_task_run_context = TaskRunContext.get()
-        if parameters is None:
-            parameters = {}
         if client is None:
             client = get_client()
+        if ids is not None and len(ids) != len(parameters):
+            raise ValueError("`ids` must have the same length as `parameters`")
 
         async with client:
-            if not flow_run_context:
-                dynamic_key = f"{self.task_key}-{str(uuid4().hex)}"
-                task_run_name = self.name
-            else:
-                dynamic_key = dynamic_key_for_task_run(
-                    context=flow_run_context, task=self
+            task_run_creates = [
+                build_task_run_create(
+                    task=self,
+                    id=ids[i] if ids is not None else None,
+                    **await self._prepare_run(
+                        parameters=call_parameters,
+                        flow_run_context=flow_run_context,
+                        parent_task_run_context=parent_task_run_context,
+                        wait_for=wait_for,
+                        extra_task_inputs=extra_task_inputs,
+                        deferred=deferred,
+                    ),
                 )
-                task_run_name = f"{self.name}-{dynamic_key}"
+                for i, call_parameters in enumerate(parameters)
+            ]
 
-            if deferred:
-                state = Scheduled()
-                state.state_details.deferred = True
-            else:
-                state = Pending()
+            task_runs = client.create_task_runs(task_run_creates)
+            # the new engine uses sync clients but old engines use async clients
+            if inspect.isawaitable(task_runs):
+                task_runs = await task_runs
 
-            # store parameters for background tasks so that task worker
-            # can retrieve them at runtime
-            if deferred and (parameters or wait_for):
-                from prefect.task_worker import store_parameters
+            return task_runs
 
-                parameters_id = uuid4()
-                state.state_details.task_parameters_id = parameters_id
+    async def _prepare_run(
+        self,
+        parameters: dict[str, Any],
+        flow_run_context: Optional[FlowRunContext],
+        parent_task_run_context: Optional[TaskRunContext],
+        wait_for: Optional[OneOrManyFutureOrResult[Any]],
+        extra_task_inputs: Optional[dict[str, set[RunInput]]],
+        deferred: bool,
+    ) -> dict[str, Any]:
+        """
+        Compute the name, initial state and inputs of a new task run, storing its
+        parameters for deferred runs.
 
-                # TODO: Improve use of result storage for parameter storage / reference
-                self.persist_result = True
+        Returns the keyword arguments used to create the task run with the API.
+        """
+        from prefect.utilities._engine import dynamic_key_for_task_run
+        from prefect.utilities.engine import collect_task_run_inputs_sync
 
-                store = await ResultStore(
-                    result_storage=await get_or_create_default_task_scheduling_storage()
-                ).update_for_task(self)
-                context = serialize_context()
-                data: dict[str, Any] = {"context": context}
-                if parameters:
-                    data["parameters"] = parameters
-                if wait_for:
-                    data["wait_for"] = wait_for
-                await store_parameters(store, parameters_id, data)
+        if not flow_run_context:
+            dynamic_key = f"{self.task_key}-{str(uuid4().hex)}"
+            task_run_name = self.name
+        else:
+            dynamic_key = dynamic_key_for_task_run(context=flow_run_context, task=self)
+            task_run_name = f"{self.name}-{dynamic_key}"
 
-            # collect task inputs
-            task_inputs = {
-                k: collect_task_run_inputs_sync(v) for k, v in parameters.items()
-            }
+        if deferred:
+            state = Scheduled()
+            state.state_details.deferred = True
+        else:
+            state = Pending()
+
+        # store parameters for background tasks so that task worker
+        # can retrieve them at runtime
+        if deferred and (parameters or wait_for):
+            from prefect.task_worker import store_parameters
+
+            parameters_id = uuid4()
+            state.state_details.task_parameters_id = parameters_id
+
+            # TODO: Improve use of result storage for parameter storage / reference
+            self.persist_result = True
+
+            store = await ResultStore(
+                result_storage=await get_or_create_default_task_scheduling_storage()
+            ).update_for_task(self)
+            context = serialize_context()
+            data: dict[str, Any] = {"context": context}
+            if parameters:
+                data["parameters"] = parameters
+            if wait_for:
+                data["wait_for"] = wait_for
+            await store_parameters(store, parameters_id, data)
 
-            # collect all parent dependencies
-            if task_parents := _infer_parent_task_runs(
-                flow_run_context=flow_run_context,
-                task_run_context=parent_task_run_context,
-                parameters=parameters,
-            ):
-                task_inputs["__parents__"] = task_parents
+        # collect task inputs
+        task_inputs = {
+            k: collect_task_run_inputs_sync(v) for k, v in parameters.items()
+        }
 
-            # check wait for dependencies
-            if wait_for:
-                task_inputs["wait_for"] = collect_task_run_inputs_sync(wait_for)
+        # collect all parent dependencies
+        if task_parents := _infer_parent_task_runs(
+            flow_run_context=flow_run_context,
+            task_run_context=parent_task_run_context,
+            parameters=parameters,
+        ):
+            task_inputs["__parents__"] = task_parents
 
-            # Join extra task inputs
-            for k, extras in (extra_task_inputs or {}).items():
-                task_inputs[k] = task_inputs[k].union(extras)
+        # check wait for dependencies
+        if wait_for:
+            task_inputs["wait_for"] = collect_task_run_inputs_sync(wait_for)
 
-            # create the task run
-            task_run = client.create_task_run(
-                task=self,
-                name=task_run_name,
-                flow_run_id=(
-                    getattr(flow_run_context.flow_run, "id", None)
-                    if flow_run_context and flow_run_context.flow_run
-                    else None
-                ),
-                dynamic_key=str(dynamic_key),
-                id=id,
-                state=state,
-                task_inputs=task_inputs,
-                extra_tags=TagsContext.get().current_tags,
-            )
-            # the new engine uses sync clients but old engines use async clients
-            if inspect.isawaitable(task_run):
-                task_run = await task_run
+        # Join extra task inputs
+        for k, extras in (extra_task_inputs or {}).items():
+            task_inputs[k] = task_inputs[k].union(extras)
 
-            return task_run
+        return dict(
+            name=task_run_name,
+            flow_run_id=(
+                getattr(flow_run_context.flow_run, "id", None)
+                if flow_run_context and flow_run_context.flow_run
+                else None
+            ),
+            dynamic_key=str(dynamic_key),
+            state=state,
+            task_inputs=task_inputs,
+            extra_tags=TagsContext.get().current_tags,
+        )
 
     async def create_local_run(
         self,
@@ -1541,10 +1616,7 @@ class Task(Generic[P, R]):
 
         if deferred:
             parameters_list = expand_mapping_parameters(self.fn, parameters)
-            futures = [
-                self.apply_async(kwargs=parameters, wait_for=wait_for)
-                for parameters in parameters_list
-            ]
+            futures = self._apply_async_many(parameters_list, wait_for=wait_for)
         elif task_runner := getattr(flow_run_context, "task_runner", None):
             assert isinstance(task_runner, TaskRunner)
             futures = task_runner.map(self, parameters, wait_for)
@@ -1680,6 +1752,46 @@ class Task(Generic[P, R]):
 
         return PrefectDistributedFuture(task_run_id=task_run.id)
 
+    def _apply_async_many(
+        self,
+        parameters: list[dict[str, Any]],
+        wait_for: Optional[Iterable[PrefectFuture[R]]] = None,
+        dependencies: Optional[dict[str, set[RunInput]]] = None,
+    ) -> list[PrefectDistributedFuture[R]]:
+        """
+        Create a pending task run for each set of parameters for task workers to
+        execute, creating the task runs with the API in chunks of
+        `BULK_CREATE_CHUNK_SIZE`.
+        """
+        from prefect.utilities.engine import emit_task_run_state_change_event
+
+        futures: list[PrefectDistributedFuture[R]] = []
+        for start in range(0, len(parameters), BULK_CREATE_CHUNK_SIZE):
+            task_runs: list[TaskRun] = run_coro_as_sync(
+                self.create_runs(
+                    parameters=[
+                        get_call_parameters(self.fn, (), call_parameters)
+                        for call_parameters in parameters[
+                            start : start + BULK_CREATE_CHUNK_SIZE
+                        ]
+                    ],
+                    deferred=True,
+                    wait_for=wait_for,
+                    extra_task_inputs=dependencies,
+                )
+            )  # type: ignore
+
+            for task_run in task_runs:
+                # emit a `SCHEDULED` event for the task run
+                emit_task_run_state_change_event(
+                    task_run=task_run,
+                    initial_state=None,
+                    validated_state=task_run.state,
+                )
+                futures.append(PrefectDistributedFuture(task_run_id=task_run.id))
+
+        return futures
+
     def delay(self, *args: P.args, **kwargs: P.kwargs) -> PrefectDistributedFuture[R]:
         """
         An alias for `apply_async` with simpler calling semantics.
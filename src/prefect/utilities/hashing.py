@@ -1,7 +1,10 @@
 import hashlib
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Generator, Iterable, Optional, Union
 
 import cloudpickle  # type: ignore  # no stubs available
 
@@ -66,26 +69,298 @@ def hash_objects(
     Raises:
         HashError: If objects cannot be hashed and raise_on_failure is True
     """
+    try:
+        return stable_hash(_serialize_for_hash((args, kwargs)), hash_algo=hash_algo)
+    except HashError:
+        if raise_on_failure:
+            raise
+    return None
+
+
+def _serialize_for_hash(obj: Any) -> bytes:
+    """
+    Serialize an object to bytes for hashing by dumping to JSON or, failing that,
+    serializing with cloudpickle.
+
+    Raises:
+        HashError: If the object cannot be serialized
+    """
     json_error = None
     pickle_error = None
 
     try:
         serializer = JSONSerializer(dumps_kwargs={"sort_keys": True})
-        return stable_hash(serializer.dumps((args, kwargs)), hash_algo=hash_algo)
+        return serializer.dumps(obj)
     except Exception as e:
         json_error = str(e)
 
     try:
-        return stable_hash(cloudpickle.dumps((args, kwargs)), hash_algo=hash_algo)  # type: ignore[reportUnknownMemberType]
+        return cloudpickle.dumps(obj)  # type: ignore[reportUnknownMemberType]
     except Exception as e:
         pickle_error = str(e)
 
-    if raise_on_failure:
-        msg = (
-            "Unable to create hash - objects could not be serialized.\n"
-            f"  JSON error: {json_error}\n"
-            f"  Pickle error: {pickle_error}"
-        )
-        raise HashError(msg)
+    msg = (
+        "Unable to create hash - objects could not be serialized.\n"
+        f"  JSON error: {json_error}\n"
+        f"  Pickle error: {pickle_error}"
+    )
+    raise HashError(msg)
 
-    return None
+
+class _CannotWalk(Exception):
+    """
+    Raised when an object's structure cannot be walked, e.g. it contains a cycle.
+    """
+
+
+class HashMemo:
+    """
+    Memoizes the structural hashes of a fixed set of objects by identity.
+
+    Only the objects the memo is created with are memoized, e.g. the static
+    parameters of a `map` call, which are passed as is to every child; any other
+    object is hashed every time it is seen. The objects are held by the memo so that
+    their ids cannot be reused while it is alive, and are assumed not to be mutated
+    while it is in use.
+    """
+
+    def __init__(self, objects: Iterable[Any] = ()) -> None:
+        self._objects: dict[int, Any] = {id(obj): obj for obj in objects}
+        self._digests: dict[int, str] = {}
+
+    def _holds(self, obj: Any) -> bool:
+        return id(obj) in self._objects and self._objects[id(obj)] is obj
+
+    def get(self, obj: Any) -> Optional[str]:
+        if not self._holds(obj):
+            return None
+        return self._digests.get(id(obj))
+
+    def set(self, obj: Any, digest: str) -> None:
+        if self._holds(obj):
+            self._digests[id(obj)] = digest
+
+
+_hash_memo: ContextVar[Optional[HashMemo]] = ContextVar("hash_memo", default=None)
+
+
+@contextmanager
+def hash_memo(objects: Iterable[Any] = ()) -> Generator[HashMemo, None, None]:
+    """
+    Enable a `HashMemo` of the given objects for `structural_hash` within the
+    current context.
+
+    Context copied from within this block, e.g. by task runners when submitting
+    tasks, retains the memo. Task runs take it out of their context when they
+    start and only use it to compute their own cache key, so it never applies to
+    the tasks they call.
+    """
+    memo = HashMemo(objects)
+    with use_hash_memo(memo):
+        yield memo
+
+
+@contextmanager
+def use_hash_memo(memo: Optional[HashMemo]) -> Generator[None, None, None]:
+    """
+    Use the given hash memo, or none, within the current context.
+    """
+    token = _hash_memo.set(memo)
+    try:
+        yield
+    finally:
+        _hash_memo.reset(token)
+
+
+def get_hash_memo() -> Optional[HashMemo]:
+    """
+    Get the hash memo enabled in the current context, if any.
+    """
+    return _hash_memo.get()
+
+
+class StructuralHasher:
+    """
+    Incrementally hashes objects by walking their structure.
+
+    Unlike `hash_objects`, inputs are never serialized as a whole; each value is fed
+    to the hash as it is visited. Strings, bytes, numbers, NumPy arrays and pandas
+    objects are hashed directly from their contents and dictionaries and sets are
+    hashed independently of their ordering. Any other value is serialized on its own
+    with JSON or cloudpickle, as in `hash_objects`.
+
+    Args:
+        hash_algo: Hash algorithm from hashlib to use.
+    """
+
+    def __init__(self, hash_algo: Callable[..., Any] = _md5):
+        self._hash_algo = hash_algo
+        self._hash = hash_algo()
+
+    def update(self, obj: Any) -> None:
+        """
+        Feed an object into the hash.
+
+        Raises:
+            HashError: If the object, or a value it contains, cannot be hashed
+        """
+        try:
+            self._update(self._hash, obj, set())
+        except (_CannotWalk, RecursionError):
+            content = _serialize_for_hash(obj)
+            self._hash.update(b"o%d:" % len(content))
+            self._hash.update(content)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _update(self, h: Any, obj: Any, path: set[int]) -> None:
+        obj_type = type(obj)
+
+        if obj is None:
+            h.update(b"N")
+        elif obj_type is bool:
+            h.update(b"T" if obj else b"F")
+        elif obj_type is int:
+            h.update(b"i%d;" % obj)
+        elif obj_type is float:
+            h.update(b"f" + repr(obj).encode() + b";")
+        elif obj_type is str:
+            encoded = obj.encode()
+            h.update(b"s%d:" % len(encoded))
+            h.update(encoded)
+        elif obj_type is bytes or obj_type is bytearray:
+            h.update(b"b%d:" % len(obj))
+            h.update(obj)
+        elif obj_type is memoryview:
+            h.update(b"b%d:" % obj.nbytes)
+            h.update(obj if obj.c_contiguous else obj.tobytes())
+        elif obj_type in (list, tuple, dict, set, frozenset):
+            if id(obj) in path:
+                raise _CannotWalk("Cannot hash self-referencing collections")
+            path.add(id(obj))
+            self._update_collection(h, obj, path)
+            path.discard(id(obj))
+        elif _is_numpy_array(obj):
+            self._update_numpy_array(h, obj, path)
+        elif _is_pandas_object(obj):
+            self._update_pandas_object(h, obj, path)
+        else:
+            content = _serialize_for_hash(obj)
+            h.update(b"o%d:" % len(content))
+            h.update(content)
+
+    def _update_collection(self, h: Any, obj: Any, path: set[int]) -> None:
+        if isinstance(obj, (list, tuple)):
+            h.update(b"%s%d[" % (b"l" if isinstance(obj, list) else b"t", len(obj)))
+            for item in obj:
+                self._update(h, item, path)
+            h.update(b"]")
+            return
+
+        # Mappings and sets are unordered, so each item is hashed on its own and the
+        # sorted item digests are fed in instead
+        digests: list[bytes] = []
+        items = obj.items() if isinstance(obj, dict) else ((item,) for item in obj)
+        for item in items:
+            item_hash = self._hash_algo()
+            for part in item:
+                self._update(item_hash, part, path)
+            digests.append(item_hash.digest())
+        digests.sort()
+        h.update(b"%s%d{" % (b"d" if isinstance(obj, dict) else b"S", len(digests)))
+        for digest in digests:
+            h.update(digest)
+        h.update(b"}")
+
+    def _update_numpy_array(self, h: Any, obj: Any, path: set[int]) -> None:
+        h.update(b"A" + obj.dtype.str.encode() + repr(obj.shape).encode())
+        if obj.dtype.hasobject:
+            self._update(h, obj.tolist(), path)
+        elif obj.flags.c_contiguous:
+            h.update(obj.data)
+        else:
+            import numpy as np
+
+            h.update(np.ascontiguousarray(obj).data)
+
+    def _update_pandas_object(self, h: Any, obj: Any, path: set[int]) -> None:
+        import pandas as pd  # pyright: ignore
+
+        hash_pandas_object = pd.util.hash_pandas_object  # pyright: ignore
+        try:
+            if isinstance(obj, pd.DataFrame):
+                h.update(b"D" + repr(obj.shape).encode())
+                self._update_numpy_array(
+                    h, hash_pandas_object(obj.index).to_numpy(), path
+                )
+                for column in sorted(obj.columns, key=repr):
+                    self._update(h, column, path)
+                    series = obj[column]
+                    h.update(str(series.dtype).encode())
+                    self._update_numpy_array(
+                        h, hash_pandas_object(series, index=False).to_numpy(), path
+                    )
+            elif isinstance(obj, pd.Series):
+                h.update(b"P")
+                self._update(h, obj.name, path)
+                h.update(str(obj.dtype).encode())
+                self._update_numpy_array(
+                    h, hash_pandas_object(obj, index=True).to_numpy(), path
+                )
+            else:
+                h.update(b"I" + str(obj.dtype).encode())
+                self._update_numpy_array(h, hash_pandas_object(obj).to_numpy(), path)
+        except TypeError:
+            # Object columns can contain unhashable values such as lists
+            content = _serialize_for_hash(obj)
+            h.update(b"o%d:" % len(content))
+            h.update(content)
+
+
+_SCALAR_TYPES: set[type] = {type(None), bool, int, float}
+
+
+def _is_numpy_array(obj: Any) -> bool:
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def _is_pandas_object(obj: Any) -> bool:
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(
+        obj, (pandas.DataFrame, pandas.Series, pandas.Index)
+    )
+
+
+def structural_hash(
+    obj: Any,
+    hash_algo: Callable[..., Any] = _md5,
+    memo: Optional[HashMemo] = None,
+) -> str:
+    """
+    Hash an object incrementally with a `StructuralHasher`.
+
+    Args:
+        obj: The object to hash
+        hash_algo: Hash algorithm from hashlib to use
+        memo: An optional `HashMemo` to look up and store the hash by object identity
+
+    Returns:
+        A hex hash
+
+    Raises:
+        HashError: If the object cannot be hashed
+    """
+    if type(obj) in _SCALAR_TYPES:
+        memo = None
+    if memo is not None and (digest := memo.get(obj)) is not None:
+        return digest
+
+    hasher = StructuralHasher(hash_algo=hash_algo)
+    hasher.update(obj)
+    digest = hasher.hexdigest()
+
+    if memo is not None:
+        memo.set(obj, digest)
+    return digest
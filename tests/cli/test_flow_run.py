@@ -447,6 +447,169 @@ class TestCancelFlowRun:
         )
 
 
+class TestBulkCancelFlowRuns:
+    async def test_cancels_matching_flow_runs(
+        self,
+        prefect_client: PrefectClient,
+        scheduled_flow_run: FlowRun,
+        running_flow_run: FlowRun,
+        completed_flow_run: FlowRun,
+    ):
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=["flow-run", "bulk-cancel", "--flow-name", "hello"],
+            user_input="y",
+            expected_code=0,
+            expected_output_contains=("Scheduled 1 of 1 flow run(s) for cancellation."),
+        )
+
+        scheduled = await prefect_client.read_flow_run(scheduled_flow_run.id)
+        assert scheduled.state.type == StateType.CANCELLED
+
+        running = await prefect_client.read_flow_run(running_flow_run.id)
+        assert running.state.type == StateType.RUNNING
+
+        completed = await prefect_client.read_flow_run(completed_flow_run.id)
+        assert completed.state.type == StateType.COMPLETED
+
+    async def test_reports_flow_runs_that_cannot_be_cancelled(
+        self, prefect_client: PrefectClient, completed_flow_run: FlowRun
+    ):
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=[
+                "flow-run",
+                "bulk-cancel",
+                "--flow-name",
+                "hello",
+                "--state-type",
+                "COMPLETED",
+            ],
+            user_input="y",
+            expected_code=0,
+            expected_output_contains=[
+                f"Flow run '{completed_flow_run.id}' was unable to be cancelled.",
+                "Scheduled 0 of 1 flow run(s) for cancellation.",
+            ],
+        )
+
+    async def test_pages_through_flow_runs(
+        self, prefect_client: PrefectClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("prefect.cli.flow_run.BULK_OPERATION_PAGE_SIZE", 2)
+        flow_runs = [
+            await prefect_client.create_flow_run(
+                flow=goodbye_flow, state=Running(), tags=["bulk"]
+            )
+            for _ in range(5)
+        ]
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=["flow-run", "bulk-cancel", "--tag", "bulk", "--limit", "4"],
+            user_input="y",
+            expected_code=0,
+            expected_output_contains=("Scheduled 4 of 4 flow run(s) for cancellation."),
+        )
+
+        states = [
+            (await prefect_client.read_flow_run(flow_run.id)).state.type
+            for flow_run in flow_runs
+        ]
+        assert states.count(StateType.CANCELLING) == 4
+        assert states.count(StateType.RUNNING) == 1
+
+    async def test_pages_through_flow_runs_that_cannot_be_cancelled(
+        self, prefect_client: PrefectClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("prefect.cli.flow_run.BULK_OPERATION_PAGE_SIZE", 2)
+        for _ in range(5):
+            await prefect_client.create_flow_run(
+                flow=goodbye_flow, state=Completed(), tags=["bulk"]
+            )
+
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=[
+                "flow-run",
+                "bulk-cancel",
+                "--tag",
+                "bulk",
+                "--state-type",
+                "COMPLETED",
+            ],
+            user_input="y",
+            expected_code=0,
+            expected_output_contains="Scheduled 0 of 5 flow run(s) for cancellation.",
+        )
+
+    def test_requires_a_filter(self):
+        invoke_and_assert(
+            ["flow-run", "bulk-cancel"],
+            expected_code=1,
+            expected_output_contains="Provide at least one filter",
+        )
+
+
+class TestBulkDeleteFlowRuns:
+    async def test_deletes_matching_flow_runs(
+        self,
+        prefect_client: PrefectClient,
+        scheduled_flow_run: FlowRun,
+        completed_flow_run: FlowRun,
+        running_flow_run: FlowRun,
+    ):
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=[
+                "flow-run",
+                "bulk-delete",
+                "--flow-name",
+                "hello",
+                "--state-type",
+                "COMPLETED",
+            ],
+            user_input="y",
+            expected_code=0,
+            expected_output_contains="Successfully deleted 1 flow run(s).",
+        )
+
+        await assert_flow_run_is_deleted(prefect_client, completed_flow_run.id)
+        await prefect_client.read_flow_run(scheduled_flow_run.id)
+        await prefect_client.read_flow_run(running_flow_run.id)
+
+    async def test_pages_through_flow_runs(
+        self, prefect_client: PrefectClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("prefect.cli.flow_run.BULK_OPERATION_PAGE_SIZE", 2)
+        for _ in range(5):
+            await prefect_client.create_flow_run(flow=goodbye_flow, tags=["bulk"])
+
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=["flow-run", "bulk-delete", "--tag", "bulk"],
+            user_input="y",
+            expected_code=0,
+            expected_output_contains="Successfully deleted 5 flow run(s).",
+        )
+
+        assert await prefect_client.read_flow_runs() == []
+
+    def test_no_matching_flow_runs(self):
+        invoke_and_assert(
+            ["flow-run", "bulk-delete", "--tag", "missing"],
+            user_input="y",
+            expected_code=0,
+            expected_output_contains="No flow runs found.",
+        )
+
+    def test_requires_a_filter(self):
+        invoke_and_assert(
+            ["flow-run", "bulk-delete"],
+            expected_code=1,
+            expected_output_contains="Provide at least one filter",
+        )
+
+
 @pytest.fixture()
 def flow_run_factory(
     prefect_client: PrefectClient,
@@ -0,0 +1,30 @@
+from prefect.testing.cli import invoke_and_assert
+
+
+def test_analyze_reports_queries_within_threshold():
+    invoke_and_assert(
+        [
+            "server",
+            "database",
+            "analyze",
+            "--threshold",
+            "60000",
+            "--no-update-statistics",
+        ],
+        expected_output_contains=[
+            "flow runs by state and expected start time",
+            "All queries completed within 60000.0ms.",
+        ],
+        expected_code=0,
+    )
+
+
+def test_analyze_shows_plans_of_slow_queries():
+    invoke_and_assert(
+        ["server", "database", "analyze", "--threshold", "0"],
+        expected_output_contains=[
+            "scheduled flow runs by work queue",
+            "6 of 6 queries took longer than 0.0ms.",
+        ],
+        expected_code=1,
+    )
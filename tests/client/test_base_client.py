@@ -1,3 +1,4 @@
+import gzip
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator, Dict, List, Tuple
@@ -12,6 +13,7 @@ import prefect
 import prefect.client
 import prefect.client.constants
 from prefect.client.base import (
+    ConditionalRequestCache,
     PrefectHttpxAsyncClient,
     PrefectResponse,
     ServerType,
@@ -513,6 +515,25 @@ class TestPrefectHttpxAsyncClient:
             )
         assert isinstance(response, PrefectResponse)
 
+    async def test_prefect_httpx_client_preserves_unread_response_streams(self):
+        async def lines():
+            yield b'{"a": 1}\n'
+            yield b'{"b": 2}\n'
+
+        def handler(request: Request) -> Response:
+            return Response(status.HTTP_200_OK, content=lines())
+
+        client = PrefectHttpxAsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            request = client.build_request("POST", "http://fake.url/fake/route")
+            response = await client.send(request, stream=True)
+            assert isinstance(response, PrefectResponse)
+            assert [line async for line in response.aiter_lines()] == [
+                '{"a": 1}',
+                '{"b": 2}',
+            ]
+            await response.aclose()
+
     async def test_prefect_httpx_client_raises_prefect_http_status_error(
         self, monkeypatch
     ):
@@ -586,6 +607,111 @@ async def mocked_csrf_client(
         yield client, send
 
 
+class TestConditionalRequests:
+    @pytest.fixture
+    def server(self):
+        """A fake server for a resource tagged with its current version"""
+
+        class Server:
+            version = 1
+            requests: List[Request] = []
+
+            def handler(self, request: Request) -> Response:
+                self.requests.append(request)
+                etag = f'W/"{self.version}"'
+                if request.headers.get("If-None-Match") == etag:
+                    return Response(
+                        status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                    )
+                return Response(
+                    status.HTTP_200_OK,
+                    json={"version": self.version},
+                    headers={"ETag": etag},
+                )
+
+        server = Server()
+        server.requests = []
+        return server
+
+    async def test_revalidates_cached_responses(self, server):
+        client = PrefectHttpxAsyncClient(transport=httpx.MockTransport(server.handler))
+        async with client:
+            first = await client.get("http://fake.url/flow_runs/1")
+            second = await client.get("http://fake.url/flow_runs/1")
+
+        assert "If-None-Match" not in server.requests[0].headers
+        assert server.requests[1].headers["If-None-Match"] == 'W/"1"'
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert second.json() == {"version": 1}
+        assert isinstance(second, PrefectResponse)
+
+    async def test_replaces_changed_responses(self, server):
+        client = PrefectHttpxAsyncClient(transport=httpx.MockTransport(server.handler))
+        async with client:
+            await client.get("http://fake.url/flow_runs/1")
+            server.version = 2
+            changed = await client.get("http://fake.url/flow_runs/1")
+            cached = await client.get("http://fake.url/flow_runs/1")
+
+        assert changed.json() == cached.json() == {"version": 2}
+        assert server.requests[2].headers["If-None-Match"] == 'W/"2"'
+
+    async def test_caches_decoded_content(self):
+        body = b'{"compressed": true}'
+
+        def handler(request: Request) -> Response:
+            if request.headers.get("If-None-Match") == '"1"':
+                return Response(status.HTTP_304_NOT_MODIFIED, headers={"ETag": '"1"'})
+            return Response(
+                status.HTTP_200_OK,
+                content=gzip.compress(body),
+                headers={"ETag": '"1"', "Content-Encoding": "gzip"},
+            )
+
+        client = PrefectHttpxAsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            await client.get("http://fake.url/deployments/1")
+            response = await client.get("http://fake.url/deployments/1")
+
+        assert response.json() == {"compressed": True}
+
+    async def test_does_not_cache_untagged_responses(self):
+        requests: List[Request] = []
+
+        def handler(request: Request) -> Response:
+            requests.append(request)
+            return Response(status.HTTP_200_OK, json={})
+
+        client = PrefectHttpxAsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            await client.get("http://fake.url/flows/1")
+            await client.get("http://fake.url/flows/1")
+
+        assert all("If-None-Match" not in request.headers for request in requests)
+
+    async def test_does_not_cache_streamed_responses(self, server):
+        client = PrefectHttpxAsyncClient(transport=httpx.MockTransport(server.handler))
+        async with client:
+            for _ in range(2):
+                request = client.build_request("GET", "http://fake.url/flow_runs/1")
+                response = await client.send(request, stream=True)
+                await response.aclose()
+
+        assert all(
+            "If-None-Match" not in request.headers for request in server.requests
+        )
+
+    async def test_evicts_least_recently_used_responses(self, server):
+        client = PrefectHttpxAsyncClient(transport=httpx.MockTransport(server.handler))
+        client.conditional_request_cache = ConditionalRequestCache(maxsize=1)
+        async with client:
+            await client.get("http://fake.url/flow_runs/1")
+            await client.get("http://fake.url/flow_runs/2")
+            await client.get("http://fake.url/flow_runs/1")
+
+        assert "If-None-Match" not in server.requests[2].headers
+
+
 class TestCsrfSupport:
     async def test_no_csrf_headers_not_change_request(self):
         async with mocked_csrf_client(responses=[RESPONSE_200]) as (client, send):
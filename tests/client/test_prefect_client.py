@@ -29,6 +29,7 @@ from prefect.client.orchestration import (
     PrefectClient,
     ServerType,
     SyncPrefectClient,
+    build_task_run_create,
     get_client,
 )
 from prefect.client.schemas.actions import (
@@ -79,6 +80,7 @@ from prefect.server.database.orm_models import WorkPool
 from prefect.settings import (
     PREFECT_API_AUTH_STRING,
     PREFECT_API_DATABASE_MIGRATE_ON_START,
+    PREFECT_API_DEFAULT_LIMIT,
     PREFECT_API_KEY,
     PREFECT_API_SSL_CERT_FILE,
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
@@ -840,6 +842,22 @@ async def test_read_deployment_by_any_tag(
         assert len(deployment_responses) == 0
 
 
+async def test_iter_deployments(prefect_client):
+    @flow
+    def test_flow():
+        pass
+
+    flow_id = await prefect_client.create_flow(test_flow)
+    deployment_ids = {
+        await prefect_client.create_deployment(flow_id=flow_id, name=f"deployment-{i}")
+        for i in range(3)
+    }
+
+    deployments = [deployment async for deployment in prefect_client.iter_deployments()]
+    assert all(isinstance(d, DeploymentResponse) for d in deployments)
+    assert {d.id for d in deployments} == deployment_ids
+
+
 async def test_read_deployments_with_id_not_any_filter(prefect_client):
     """Test the DeploymentFilterId.not_any_ filter for pagination use case."""
 
@@ -1049,6 +1067,60 @@ async def test_read_flow_runs_without_filter(prefect_client):
     assert {flow_run.id for flow_run in flow_runs} == {fr_id_1, fr_id_2}
 
 
+async def test_read_flow_runs_page(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run_ids = {(await prefect_client.create_flow_run(foo)).id for _ in range(3)}
+
+    page = await prefect_client.read_flow_runs_page(limit=2)
+    assert len(page.results) == 2
+    assert all(isinstance(run, client_schemas.FlowRun) for run in page.results)
+    assert page.next_cursor is not None
+
+    next_page = await prefect_client.read_flow_runs_page(
+        limit=2, cursor=page.next_cursor
+    )
+    assert len(next_page.results) == 1
+    assert next_page.next_cursor is None
+    assert {run.id for run in page.results + next_page.results} == flow_run_ids
+
+
+async def test_iter_flow_runs(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run_ids = {(await prefect_client.create_flow_run(foo)).id for _ in range(3)}
+
+    with temporary_settings({PREFECT_API_DEFAULT_LIMIT: 2}):
+        flow_runs = [run async for run in prefect_client.iter_flow_runs()]
+
+    assert all(isinstance(run, client_schemas.FlowRun) for run in flow_runs)
+    assert {run.id for run in flow_runs} == flow_run_ids
+
+
+async def test_iter_flow_runs_applies_limit_and_filters(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run_ids = [
+        (await prefect_client.create_flow_run(foo, tags=["iter"])).id for _ in range(3)
+    ]
+    await prefect_client.create_flow_run(foo)
+
+    flow_runs = [
+        run
+        async for run in prefect_client.iter_flow_runs(
+            flow_run_filter=FlowRunFilter(tags=dict(all_=["iter"])), limit=2
+        )
+    ]
+    assert len(flow_runs) == 2
+    assert {run.id for run in flow_runs} <= set(flow_run_ids)
+
+
 async def test_read_flow_runs_with_filtering(prefect_client):
     @flow
     def foo():
@@ -1409,6 +1481,70 @@ async def test_set_then_read_task_run_state(prefect_client: PrefectClient):
     assert run.state.message == "Test!"
 
 
+async def test_create_task_runs_in_bulk(prefect_client: PrefectClient):
+    @flow
+    def foo():
+        pass
+
+    @task(tags=["a"])
+    def bar():
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    task_runs = await prefect_client.create_task_runs(
+        [
+            build_task_run_create(bar, flow_run_id=flow_run.id, dynamic_key=str(i))
+            for i in range(3)
+        ]
+    )
+    assert [task_run.dynamic_key for task_run in task_runs] == ["0", "1", "2"]
+    assert all(task_run.tags == ["a"] for task_run in task_runs)
+
+    run = await prefect_client.read_task_run(task_runs[1].id)
+    assert run.flow_run_id == flow_run.id
+
+
+async def test_read_task_runs_page(prefect_client):
+    @task
+    def bar():
+        pass
+
+    task_run_ids = {
+        (
+            await prefect_client.create_task_run(
+                bar, flow_run_id=None, dynamic_key=str(i)
+            )
+        ).id
+        for i in range(3)
+    }
+
+    page = await prefect_client.read_task_runs_page(limit=2)
+    next_page = await prefect_client.read_task_runs_page(
+        limit=2, cursor=page.next_cursor
+    )
+    assert next_page.next_cursor is None
+    assert {run.id for run in page.results + next_page.results} == task_run_ids
+
+
+async def test_iter_task_runs(prefect_client):
+    @task
+    def bar():
+        pass
+
+    task_run_ids = {
+        (
+            await prefect_client.create_task_run(
+                bar, flow_run_id=None, dynamic_key=str(i)
+            )
+        ).id
+        for i in range(3)
+    }
+
+    task_runs = [run async for run in prefect_client.iter_task_runs()]
+    assert all(isinstance(run, TaskRun) for run in task_runs)
+    assert {run.id for run in task_runs} == task_run_ids
+
+
 async def test_create_then_read_autonomous_task_runs(prefect_client: PrefectClient):
     @task
     def foo():
@@ -1465,6 +1601,58 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_read_logs_page(prefect_client):
+    flow_run_id = uuid4()
+    await prefect_client.create_logs(
+        [
+            LogCreate(
+                name="prefect.flow_runs",
+                level=20,
+                message=f"Log {i}",
+                timestamp=now(),
+                flow_run_id=flow_run_id,
+            )
+            for i in range(3)
+        ]
+    )
+
+    log_filter = LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+    page = await prefect_client.read_logs_page(log_filter=log_filter, limit=2)
+    next_page = await prefect_client.read_logs_page(
+        log_filter=log_filter, limit=2, cursor=page.next_cursor
+    )
+    assert next_page.next_cursor is None
+    assert sorted(log.message for log in page.results + next_page.results) == [
+        "Log 0",
+        "Log 1",
+        "Log 2",
+    ]
+
+
+async def test_iter_logs(prefect_client):
+    flow_run_id = uuid4()
+    await prefect_client.create_logs(
+        [
+            LogCreate(
+                name="prefect.flow_runs",
+                level=20,
+                message=f"Log {i}",
+                timestamp=now(),
+                flow_run_id=flow_run_id,
+            )
+            for i in range(3)
+        ]
+    )
+
+    logs = [
+        log
+        async for log in prefect_client.iter_logs(
+            log_filter=LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+        )
+    ]
+    assert sorted(log.message for log in logs) == ["Log 0", "Log 1", "Log 2"]
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
@@ -5,6 +5,7 @@ from httpx import Response
 
 from prefect.client.schemas.responses import MinimalConcurrencyLimitResponse
 from prefect.concurrency._asyncio import aacquire_concurrency_slots
+from prefect.concurrency.services import LONG_POLL_SECONDS
 
 
 async def test_calls_increment_client_method():
@@ -28,6 +29,8 @@ async def test_calls_increment_client_method():
             names=["test-1", "test-2"],
             slots=1,
             mode="concurrency",
+            wait_seconds=LONG_POLL_SECONDS,
+            waiter_id=None,
         )
 
 
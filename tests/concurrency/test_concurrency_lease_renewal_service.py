@@ -0,0 +1,127 @@
+import asyncio
+import time
+import uuid
+from unittest import mock
+
+import pytest
+from httpx import HTTPStatusError, Request, Response
+
+from prefect.client.orchestration import get_client
+from prefect.concurrency.services import ConcurrencyLeaseRenewalService
+
+LEASE_DURATION = 0.4
+
+
+@pytest.fixture
+async def mocked_client(test_database_connection_url):
+    async with get_client() as client:
+        with (
+            mock.patch.object(client, "renew_concurrency_leases", autospec=True),
+            mock.patch.object(client, "renew_concurrency_lease", autospec=True),
+        ):
+
+            class ClientWrapper:
+                def __init__(self, client):
+                    self.client = client
+
+                async def __aenter__(self):
+                    return self.client
+
+                async def __aexit__(self, *args):
+                    pass
+
+            wrapped_client = ClientWrapper(client)
+            with mock.patch(
+                "prefect.concurrency.services.get_client", lambda: wrapped_client
+            ):
+                yield wrapped_client
+
+
+def renewed(lease_ids: list[uuid.UUID]) -> Response:
+    return Response(200, json=[str(lease_id) for lease_id in lease_ids])
+
+
+async def test_renews_leases_together(mocked_client):
+    mocked_method = mocked_client.client.renew_concurrency_leases
+    mocked_method.side_effect = lambda lease_ids, lease_duration: renewed(lease_ids)
+
+    service = ConcurrencyLeaseRenewalService.instance()
+    first_lease_id, second_lease_id = uuid.uuid4(), uuid.uuid4()
+    now = time.monotonic()
+    futures = [
+        service.maintain(first_lease_id, LEASE_DURATION, acquired_at=now),
+        # due shortly after the first lease, so it is renewed along with it
+        service.maintain(second_lease_id, LEASE_DURATION, acquired_at=now + 0.05),
+    ]
+
+    await asyncio.sleep(LEASE_DURATION * 0.75 + 0.1)
+    await service.drain()
+
+    mocked_method.assert_called_once_with(
+        lease_ids=[first_lease_id, second_lease_id], lease_duration=LEASE_DURATION
+    )
+    assert not any(future.done() for future in futures)
+
+
+async def test_fails_leases_that_were_not_renewed(mocked_client):
+    mocked_client.client.renew_concurrency_leases.return_value = renewed([])
+
+    service = ConcurrencyLeaseRenewalService.instance()
+    future = service.maintain(uuid.uuid4(), LEASE_DURATION, time.monotonic())
+
+    with pytest.raises(RuntimeError, match="not found"):
+        await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+    await service.drain()
+
+
+async def test_fails_leases_when_renewal_fails(mocked_client):
+    error = HTTPStatusError(
+        "Server error",
+        request=Request("post", "/"),
+        response=Response(500),
+    )
+    mocked_client.client.renew_concurrency_leases.side_effect = error
+
+    service = ConcurrencyLeaseRenewalService.instance()
+    future = service.maintain(uuid.uuid4(), LEASE_DURATION, time.monotonic())
+
+    with pytest.raises(HTTPStatusError):
+        await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+    await service.drain()
+
+
+async def test_renews_leases_one_at_a_time_without_bulk_renewal(mocked_client):
+    mocked_client.client.renew_concurrency_leases.side_effect = HTTPStatusError(
+        "Not found",
+        request=Request("post", "/"),
+        response=Response(404),
+    )
+    mocked_method = mocked_client.client.renew_concurrency_lease
+    mocked_method.return_value = Response(204)
+
+    service = ConcurrencyLeaseRenewalService.instance()
+    lease_id = uuid.uuid4()
+    future = service.maintain(lease_id, LEASE_DURATION, time.monotonic())
+
+    await asyncio.sleep(LEASE_DURATION * 0.75 + 0.1)
+    await service.drain()
+
+    mocked_method.assert_called_once_with(
+        lease_id=lease_id, lease_duration=LEASE_DURATION
+    )
+    assert not future.done()
+
+
+async def test_stops_renewing_released_leases(mocked_client):
+    mocked_method = mocked_client.client.renew_concurrency_leases
+    mocked_method.side_effect = lambda lease_ids, lease_duration: renewed(lease_ids)
+
+    service = ConcurrencyLeaseRenewalService.instance()
+    lease_id = uuid.uuid4()
+    service.maintain(lease_id, LEASE_DURATION, time.monotonic())
+    service.release(lease_id, LEASE_DURATION)
+
+    await asyncio.sleep(LEASE_DURATION * 0.75 + 0.1)
+    await service.drain()
+
+    mocked_method.assert_not_called()
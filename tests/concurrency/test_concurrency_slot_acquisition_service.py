@@ -1,11 +1,15 @@
 import asyncio
+import uuid
 from unittest import mock
 
 import pytest
 from httpx import HTTPStatusError, Request, Response
 
 from prefect.client.orchestration import get_client
-from prefect.concurrency.services import ConcurrencySlotAcquisitionService
+from prefect.concurrency.services import (
+    LONG_POLL_SECONDS,
+    ConcurrencySlotAcquisitionService,
+)
 
 
 @pytest.fixture
@@ -50,6 +54,8 @@ async def test_returns_successful_response(mocked_client):
         names=expected_names,
         slots=expected_slots,
         mode=expected_mode,
+        wait_seconds=LONG_POLL_SECONDS,
+        waiter_id=None,
     )
 
 
@@ -115,3 +121,52 @@ async def test_basic_exception_returns_exception(mocked_client):
         await asyncio.wrap_future(future)
 
     assert info.value == exc
+
+
+async def test_long_polls_with_waiter_id_from_previous_attempt(mocked_client):
+    waiter_id = uuid.uuid4()
+    responses = [
+        HTTPStatusError(
+            "Limit is locked",
+            request=Request("get", "/"),
+            response=Response(
+                423,
+                headers={
+                    "Retry-After": "0",
+                    "Prefect-Concurrency-Waiter-Id": str(waiter_id),
+                },
+            ),
+        ),
+        Response(200),
+    ]
+
+    mocked_client.client.increment_concurrency_slots.side_effect = responses
+
+    limit_names = sorted(["api", "database"])
+    service = ConcurrencySlotAcquisitionService.instance(frozenset(limit_names))
+
+    future = service.send((1, "concurrency", None, None))
+    await service.drain()
+    returned_response = await asyncio.wrap_future(future)
+    assert returned_response == responses[1]
+
+    calls = mocked_client.client.increment_concurrency_slots.call_args_list
+    assert [call.kwargs["wait_seconds"] for call in calls] == [
+        LONG_POLL_SECONDS,
+        LONG_POLL_SECONDS,
+    ]
+    assert [call.kwargs["waiter_id"] for call in calls] == [None, waiter_id]
+
+
+async def test_does_not_long_poll_when_retries_are_limited(mocked_client):
+    mocked_client.client.increment_concurrency_slots.return_value = Response(200)
+
+    limit_names = sorted(["api", "database"])
+    service = ConcurrencySlotAcquisitionService.instance(frozenset(limit_names))
+
+    future = service.send((1, "concurrency", None, 0))
+    await service.drain()
+    await asyncio.wrap_future(future)
+
+    call = mocked_client.client.increment_concurrency_slots.call_args
+    assert call.kwargs["wait_seconds"] is None
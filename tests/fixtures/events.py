@@ -30,6 +30,10 @@ def workspace_events_client(
         "prefect.server.models.deployments.PrefectServerEventsClient",
         AssertingEventsClient,
     )
+    monkeypatch.setattr(
+        "prefect.server.models.flow_runs.PrefectServerEventsClient",
+        AssertingEventsClient,
+    )
 
 
 @pytest.fixture(scope="session", autouse=True)
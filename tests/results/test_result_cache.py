@@ -0,0 +1,220 @@
+import os
+import uuid
+
+import pytest
+
+from prefect._result_cache import (
+    LocalDiskResultCache,
+    ResultRecordCache,
+    estimate_size,
+)
+from prefect.filesystems import SMB, LocalFileSystem, RemoteFileSystem
+from prefect.results import ResultRecord, ResultStore, default_cache
+from prefect.settings import (
+    PREFECT_RESULTS_LOCAL_CACHE_ENABLED,
+    PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES,
+    PREFECT_RESULTS_LOCAL_CACHE_PATH,
+    PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES,
+    temporary_settings,
+)
+
+
+def make_record(obj, key="key"):
+    store = ResultStore(result_storage=RemoteFileSystem(basepath="memory://cache"))
+    return store.create_result_record(obj, key=key)
+
+
+@pytest.fixture
+def remote_storage():
+    return RemoteFileSystem(basepath=f"memory://results-{uuid.uuid4().hex}")
+
+
+class TestEstimateSize:
+    def test_counts_container_contents(self):
+        assert estimate_size(["a" * 1000, "b" * 1000]) > 2000
+
+    def test_counts_shared_references_once(self):
+        value = "a" * 10_000
+        assert estimate_size([value, value]) < 2 * estimate_size(value)
+
+    def test_uses_buffer_size_when_available(self):
+        np = pytest.importorskip("numpy")
+        assert estimate_size(np.zeros(100_000, dtype="uint8")) >= 100_000
+
+
+class TestMemoryTier:
+    def test_evicts_by_size(self):
+        cache = ResultRecordCache(max_bytes=25_000)
+        cache.put("a", make_record("a" * 10_000))
+        cache.put("b", make_record("b" * 10_000))
+        cache.put("c", make_record("c" * 10_000))
+
+        assert "a" not in cache
+        assert "b" in cache and "c" in cache
+        assert cache.stats["memory"].evictions == 1
+
+    def test_skips_records_larger_than_the_cache(self):
+        cache = ResultRecordCache(max_bytes=1_000)
+        cache.put("a", make_record("a" * 10_000))
+
+        assert "a" not in cache
+
+    def test_counts_hits_and_misses(self):
+        cache = ResultRecordCache(max_bytes=1_000_000)
+        record = make_record("test")
+        cache.put("a", record)
+
+        assert cache.lookup("a") is record
+        assert cache.lookup("b") is None
+        assert cache.stats["memory"].hits == 1
+        assert cache.stats["memory"].misses == 1
+
+    def test_zero_max_bytes_disables_caching(self):
+        cache = ResultRecordCache(max_bytes=0)
+        cache.put("a", make_record("test"))
+        assert "a" not in cache
+
+
+class TestDiskTier:
+    def test_round_trip(self, tmp_path):
+        disk = LocalDiskResultCache(tmp_path, max_bytes=1_000_000)
+        disk.put("key", b"content")
+
+        assert disk.get("key") == b"content"
+        assert disk.get("missing") is None
+        assert disk.stats.hits == 1
+        assert disk.stats.misses == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        disk = LocalDiskResultCache(tmp_path, max_bytes=250)
+        disk.put("a", b"a" * 100)
+        disk.put("b", b"b" * 100)
+        # make `a` the most recently used entry
+        entry = disk._entry_path("a")
+        stat = disk._entry_path("b").stat()
+        os.utime(entry, (stat.st_atime + 10, stat.st_mtime + 10))
+        disk.put("c", b"c" * 100)
+
+        assert disk.get("a") is not None
+        assert disk.get("b") is None
+        assert disk.get("c") is not None
+        assert disk.stats.evictions == 1
+
+    def test_entries_are_shared_between_instances(self, tmp_path):
+        LocalDiskResultCache(tmp_path, max_bytes=1_000_000).put("key", b"content")
+        assert LocalDiskResultCache(tmp_path, max_bytes=1_000_000).get("key") == (
+            b"content"
+        )
+
+    def test_bound_is_shared_between_instances(self, tmp_path):
+        # separate instances stand in for separate processes sharing the directory
+        first = LocalDiskResultCache(tmp_path, max_bytes=250)
+        second = LocalDiskResultCache(tmp_path, max_bytes=250)
+        first.put("a", b"a" * 100)
+        second.put("b", b"b" * 100)
+        first.put("c", b"c" * 100)
+
+        assert first.stats.evictions == 1
+        assert first._disk_usage() == 200
+        assert first._read_usage() == 200
+
+    def test_recomputes_missing_usage(self, tmp_path):
+        disk = LocalDiskResultCache(tmp_path, max_bytes=1_000_000)
+        disk.put("a", b"a" * 100)
+        disk._usage_path.unlink()
+        disk.put("b", b"b" * 50)
+        disk.put("b", b"b" * 20)
+
+        assert disk._read_usage() == 120
+
+    def test_promotes_disk_hits_to_memory(self, tmp_path):
+        disk = LocalDiskResultCache(tmp_path, max_bytes=1_000_000)
+        record = make_record({"foo": "bar"})
+        ResultRecordCache(max_bytes=1_000_000, disk_cache=disk).put(
+            "key", record, disk_key="key"
+        )
+
+        cache = ResultRecordCache(max_bytes=1_000_000, disk_cache=disk)
+        loaded = cache.lookup("key", disk_key="key")
+
+        assert isinstance(loaded, ResultRecord)
+        assert loaded.result == {"foo": "bar"}
+        assert "key" in cache
+        assert cache.stats["memory"].misses == 1
+        assert cache.stats["disk"].hits == 1
+
+
+class TestResultStoreIntegration:
+    def test_default_cache_uses_settings(self, tmp_path):
+        with temporary_settings(
+            {
+                PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES: 1234,
+                PREFECT_RESULTS_LOCAL_CACHE_ENABLED: True,
+                PREFECT_RESULTS_LOCAL_CACHE_PATH: tmp_path,
+                PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES: 5678,
+            }
+        ):
+            cache = default_cache()
+
+        assert isinstance(cache, ResultRecordCache)
+        assert cache.maxsize == 1234
+        assert cache.disk_cache is not None
+        assert cache.disk_cache.path == tmp_path
+        assert cache.disk_cache.max_bytes == 5678
+
+    def test_default_cache_has_no_disk_tier_by_default(self):
+        assert default_cache().disk_cache is None
+
+    async def test_reads_from_disk_cache_across_stores(self, tmp_path, remote_storage):
+        disk = LocalDiskResultCache(tmp_path, max_bytes=1_000_000)
+        writer = ResultStore(
+            result_storage=remote_storage,
+            cache=ResultRecordCache(max_bytes=1_000_000, disk_cache=disk),
+        )
+        await writer.awrite(obj={"foo": "bar"}, key="my-key")
+
+        # remove the result from the remote storage to prove it is read from disk
+        remote_storage.filesystem.rm(remote_storage._resolve_path("my-key"))
+
+        reader = ResultStore(
+            result_storage=remote_storage,
+            cache=ResultRecordCache(max_bytes=1_000_000, disk_cache=disk),
+        )
+        record = await reader.aread("my-key")
+
+        assert record.result == {"foo": "bar"}
+        assert reader.cache.stats["disk"].hits == 1
+
+    def test_namespaces_unsaved_storage_by_configuration(self):
+        def disk_key(basepath):
+            store = ResultStore(result_storage=RemoteFileSystem(basepath=basepath))
+            return store._disk_cache_key("my-key")
+
+        assert disk_key("memory://first") == disk_key("memory://first")
+        assert disk_key("memory://first") != disk_key("memory://second")
+
+    def test_namespaces_unsaved_storage_by_credentials(self):
+        def disk_key(password):
+            store = ResultStore(
+                result_storage=SMB(
+                    share_path="/share",
+                    smb_host="localhost",
+                    smb_username="user",
+                    smb_password=password,
+                )
+            )
+            return store._disk_cache_key("my-key")
+
+        assert disk_key("first") == disk_key("first")
+        assert disk_key("first") != disk_key("second")
+        assert "first" not in disk_key("first")
+
+    async def test_does_not_cache_local_storage_on_disk(self, tmp_path):
+        disk = LocalDiskResultCache(tmp_path / "cache", max_bytes=1_000_000)
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=str(tmp_path / "storage")),
+            cache=ResultRecordCache(max_bytes=1_000_000, disk_cache=disk),
+        )
+        await store.awrite(obj={"foo": "bar"}, key="my-key")
+
+        assert not (tmp_path / "cache").exists()
@@ -178,6 +178,64 @@ class TestReadLogs:
         assert api_logs[0].message == "Black flag ahead, captain!"
 
 
+class TestReadLogsWithCursor:
+    @pytest.fixture()
+    async def many_logs(self, client, flow_run_id):
+        logs = [
+            LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message=f"Log {i}",
+                # share timestamps between logs to exercise tie-breaking by id
+                timestamp=NOW + timedelta(seconds=i // 2),
+                flow_run_id=flow_run_id,
+            ).model_dump(mode="json")
+            for i in range(7)
+        ]
+        await client.post(CREATE_LOGS_URL, json=logs)
+        return logs
+
+    @pytest.mark.parametrize("sort", ["TIMESTAMP_ASC", "TIMESTAMP_DESC"])
+    async def test_read_logs_with_cursor(self, client, many_logs, sort):
+        messages = []
+        cursor = None
+        while True:
+            response = await client.post(
+                f"{READ_LOGS_URL}/cursor",
+                json={"limit": 3, "sort": sort, "cursor": cursor},
+            )
+            assert response.status_code == 200, response.text
+            messages.extend(log["message"] for log in response.json()["results"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        assert sorted(messages) == sorted(log["message"] for log in many_logs)
+        seconds = [int(message.split()[-1]) // 2 for message in messages]
+        assert seconds == sorted(seconds, reverse=sort == "TIMESTAMP_DESC")
+
+    async def test_read_logs_with_invalid_cursor(self, client):
+        response = await client.post(
+            f"{READ_LOGS_URL}/cursor", json={"cursor": "not-a-cursor"}
+        )
+        assert response.status_code == 422
+
+    async def test_read_logs_as_ndjson(self, client, many_logs):
+        response = await client.post(
+            READ_LOGS_URL,
+            json={"offset": 1, "limit": 5},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        streamed = [
+            Log.model_validate_json(line) for line in response.text.splitlines()
+        ]
+        expected = await client.post(READ_LOGS_URL, json={"offset": 1, "limit": 5})
+        assert [log.model_dump(mode="json") for log in streamed] == expected.json()
+
+
 class TestLogSchemaConversionAPI:
     """Test the API endpoint converts LogCreate to Log objects for messaging"""
 
@@ -1,14 +1,21 @@
+import gzip
 from datetime import datetime, timedelta, timezone
 
 import httpx
 import pytest
 import sqlalchemy as sa
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Response, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from httpx import ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.server import models, schemas
-from prefect.server.api.middleware import CsrfMiddleware
+from prefect.server.api.middleware import (
+    CompressionMiddleware,
+    CsrfMiddleware,
+    accepts_content_encoding,
+    negotiate_content_encoding,
+)
 from prefect.server.database import PrefectDBInterface
 from prefect.settings import (
     PREFECT_SERVER_CSRF_PROTECTION_ENABLED,
@@ -150,3 +157,152 @@ async def test_csrf_pass_through_enabled_valid_headers(
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"message": "Hello World"}
+
+
+compression_app = FastAPI()
+compression_app.add_middleware(CompressionMiddleware)
+
+LARGE_BODY = "prefect " * 1000
+
+
+@compression_app.get("/small")
+async def small():
+    return PlainTextResponse("small")
+
+
+@compression_app.get("/large")
+async def large():
+    return PlainTextResponse(LARGE_BODY)
+
+
+@compression_app.get("/stream")
+async def stream():
+    async def generate():
+        for _ in range(10):
+            yield LARGE_BODY
+
+    return StreamingResponse(generate(), media_type="text/plain")
+
+
+@compression_app.get("/encoded")
+async def encoded():
+    return Response(
+        gzip.compress(LARGE_BODY.encode()),
+        media_type="text/plain",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+
+@pytest.fixture
+async def compression_client():
+    transport = ASGITransport(app=compression_app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://test"
+    ) as async_client:
+        yield async_client
+
+
+async def test_compression_compresses_large_responses(
+    compression_client: httpx.AsyncClient,
+):
+    response = await compression_client.get(
+        "/large", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(LARGE_BODY)
+    assert response.text == LARGE_BODY
+
+
+async def test_compression_skips_small_responses(
+    compression_client: httpx.AsyncClient,
+):
+    response = await compression_client.get(
+        "/small", headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "small"
+
+
+async def test_compression_skips_clients_without_supported_encodings(
+    compression_client: httpx.AsyncClient,
+):
+    response = await compression_client.get(
+        "/large", headers={"Accept-Encoding": "identity"}
+    )
+    assert "Content-Encoding" not in response.headers
+    assert response.text == LARGE_BODY
+
+
+async def test_compression_compresses_streaming_responses(
+    compression_client: httpx.AsyncClient,
+):
+    response = await compression_client.get(
+        "/stream", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert response.text == LARGE_BODY * 10
+
+
+async def test_compression_does_not_compress_encoded_responses(
+    compression_client: httpx.AsyncClient,
+):
+    response = await compression_client.get(
+        "/encoded", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.text == LARGE_BODY
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br", "gzip"),
+        ("gzip, zstd", "zstd"),
+        ("zstd;q=0.5, gzip", "gzip"),
+        ("zstd;q=0, gzip;q=0", None),
+        ("*", "zstd"),
+        ("*, zstd;q=0", "gzip"),
+        ("GZIP;q=invalid, zstd", "zstd"),
+    ],
+)
+def test_negotiate_content_encoding(
+    monkeypatch: pytest.MonkeyPatch, accept_encoding: str, expected: str
+):
+    monkeypatch.setattr(
+        "prefect.server.api.middleware.SUPPORTED_CONTENT_ENCODINGS", ("zstd", "gzip")
+    )
+    assert negotiate_content_encoding(accept_encoding) == expected
+
+
+def test_negotiate_content_encoding_without_zstandard(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        "prefect.server.api.middleware.SUPPORTED_CONTENT_ENCODINGS", ("gzip",)
+    )
+    assert negotiate_content_encoding("zstd, gzip;q=0.5") == "gzip"
+    assert negotiate_content_encoding("zstd") is None
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, False),
+        ("identity", False),
+        ("gzip", True),
+        ("deflate, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.0, zstd", False),
+        ("*", True),
+        ("*, gzip;q=0", False),
+    ],
+)
+def test_accepts_content_encoding(accept_encoding: str, expected: bool):
+    assert accepts_content_encoding(accept_encoding, "gzip") is expected
@@ -1,12 +1,17 @@
 import json
+import sys
 import tempfile
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 
-from prefect.server.concurrency.lease_storage import ConcurrencyLimitLeaseMetadata
+from prefect.server.concurrency.lease_storage import (
+    ConcurrencyLimitLeaseMetadata,
+    filesystem,
+)
 from prefect.server.concurrency.lease_storage.filesystem import (
     ConcurrencyLeaseStorage,
 )
@@ -152,64 +157,45 @@ class TestFilesystemConcurrencyLeaseStorage:
         self, storage: ConcurrencyLeaseStorage, sample_resource_ids: list[UUID]
     ):
         ttl = timedelta(minutes=5)
-        await storage.create_lease(sample_resource_ids, ttl)
-
-        # Get the lease ID and original expiration (excluding expiration index)
-        lease_files = [
-            f
-            for f in storage.storage_path.glob("*.json")
-            if f.name != "expirations.json"
-        ]
-        lease_id = UUID(lease_files[0].stem)
-
-        with open(lease_files[0], "r") as f:
-            original_data = json.load(f)
-        original_expiration = datetime.fromisoformat(original_data["expiration"])
+        lease = await storage.create_lease(sample_resource_ids, ttl)
 
         # Renew the lease
         new_ttl = timedelta(minutes=10)
-        await storage.renew_lease(lease_id, new_ttl)
+        await storage.renew_lease(lease.id, new_ttl)
 
         # Check that expiration was updated
-        with open(lease_files[0], "r") as f:
-            updated_data = json.load(f)
-        new_expiration = datetime.fromisoformat(updated_data["expiration"])
-
-        assert new_expiration > original_expiration
+        renewed_lease = await storage.read_lease(lease.id)
+        assert renewed_lease is not None
+        assert renewed_lease.expiration > lease.expiration
 
     async def test_renew_lease_non_existing(self, storage: ConcurrencyLeaseStorage):
         non_existing_id = uuid4()
         # Should not raise an exception
         await storage.renew_lease(non_existing_id, timedelta(minutes=5))
 
-    async def test_renew_lease_corrupted_file(
+        assert await storage.read_active_lease_ids() == []
+
+    async def test_renew_lease_does_not_restore_revoked_lease(
         self, storage: ConcurrencyLeaseStorage, sample_resource_ids: list[UUID]
     ):
-        # Create a valid lease first
-        ttl = timedelta(minutes=5)
-        await storage.create_lease(sample_resource_ids, ttl)
+        lease = await storage.create_lease(sample_resource_ids, timedelta(seconds=-1))
+        await storage.revoke_lease(lease.id)
 
-        # Get the lease ID and corrupt the file (excluding expiration index)
-        lease_files = [
-            f
-            for f in storage.storage_path.glob("*.json")
-            if f.name != "expirations.json"
-        ]
-        lease_id = UUID(lease_files[0].stem)
+        await storage.renew_lease(lease.id, timedelta(minutes=5))
 
-        with open(lease_files[0], "w") as f:
-            f.write("invalid json content")
+        assert await storage.read_lease(lease.id) is None
+        assert await storage.read_active_lease_ids() == []
 
-        # Renewing should clean up the corrupted file
-        await storage.renew_lease(lease_id, timedelta(minutes=10))
+    async def test_renew_lease_expired(
+        self, storage: ConcurrencyLeaseStorage, sample_resource_ids: list[UUID]
+    ):
+        lease = await storage.create_lease(sample_resource_ids, timedelta(seconds=-1))
+        assert await storage.read_expired_lease_ids() == [lease.id]
 
-        # File should be cleaned up (excluding expiration index)
-        lease_files = [
-            f
-            for f in storage.storage_path.glob("*.json")
-            if f.name != "expirations.json"
-        ]
-        assert len(lease_files) == 0
+        await storage.renew_lease(lease.id, timedelta(minutes=5))
+
+        assert await storage.read_expired_lease_ids() == []
+        assert await storage.read_active_lease_ids() == [lease.id]
 
     async def test_revoke_lease(
         self, storage: ConcurrencyLeaseStorage, sample_resource_ids: list[UUID]
@@ -352,3 +338,112 @@ class TestFilesystemConcurrencyLeaseStorage:
             read_lease = await storage.read_lease(lease_id)
             assert read_lease is not None
             assert read_lease.resource_ids == sample_resource_ids
+
+    async def test_read_expired_lease_ids_in_expiration_order(
+        self, storage: ConcurrencyLeaseStorage, sample_resource_ids: list[UUID]
+    ):
+        leases = [
+            await storage.create_lease(sample_resource_ids, timedelta(seconds=-seconds))
+            for seconds in (1, 3, 2)
+        ]
+
+        expired_ids = await storage.read_expired_lease_ids(limit=2)
+        assert expired_ids == [leases[1].id, leases[2].id]
+
+        # reading expired leases does not remove them
+        assert await storage.read_expired_lease_ids() == [
+            leases[1].id,
+            leases[2].id,
+            leases[0].id,
+        ]
+
+    async def test_leases_are_shared_between_storages(
+        self, temp_dir: Path, sample_resource_ids: list[UUID]
+    ):
+        storage = ConcurrencyLeaseStorage(storage_path=temp_dir)
+        lease = await storage.create_lease(sample_resource_ids, timedelta(seconds=-1))
+
+        other_storage = ConcurrencyLeaseStorage(storage_path=temp_dir)
+        assert await other_storage.read_expired_lease_ids() == [lease.id]
+
+    async def test_reads_journal_written_by_another_process(
+        self, temp_dir: Path, sample_resource_ids: list[UUID]
+    ):
+        storage = ConcurrencyLeaseStorage(storage_path=temp_dir)
+        lease = await storage.create_lease(sample_resource_ids, timedelta(minutes=5))
+
+        # a storage in another process has its own copy of the index
+        other_journal = filesystem._ExpirationJournal(storage._journal.path)
+        other_journal.remove(lease.id)
+
+        assert await storage.read_active_lease_ids() == []
+
+    async def test_compacts_journal(
+        self,
+        storage: ConcurrencyLeaseStorage,
+        sample_resource_ids: list[UUID],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(filesystem, "COMPACTION_MIN_ENTRIES", 10)
+
+        kept = await storage.create_lease(sample_resource_ids, timedelta(seconds=-1))
+        for _ in range(10):
+            lease = await storage.create_lease(
+                sample_resource_ids, timedelta(minutes=5)
+            )
+            await storage.revoke_lease(lease.id)
+
+        journal = storage._journal.path.read_text().splitlines()
+        assert len(journal) < 10
+        assert await storage.read_expired_lease_ids() == [kept.id]
+
+        # the compacted journal is read from the start by other processes
+        other_journal = filesystem._ExpirationJournal(storage._journal.path)
+        assert other_journal.read_expired(datetime.now(timezone.utc), 100) == [kept.id]
+
+    @pytest.mark.skipif(
+        sys.platform == "win32", reason="Journals are not locked on Windows"
+    )
+    def test_concurrent_journals_do_not_lose_entries(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(filesystem, "COMPACTION_MIN_ENTRIES", 10)
+        path = temp_dir / "expirations.journal"
+        expiration = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        # separate journals stand in for storages in separate processes, which
+        # only share the journal and lock files
+        def churn(kept_ids: list[UUID]) -> None:
+            journal = filesystem._ExpirationJournal(path)
+            for _ in range(50):
+                kept_id = uuid4()
+                journal.set(kept_id, expiration)
+                kept_ids.append(kept_id)
+                revoked_id = uuid4()
+                journal.set(revoked_id, expiration)
+                journal.remove(revoked_id)
+
+        kept_ids: list[UUID] = []
+        threads = [threading.Thread(target=churn, args=(kept_ids,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        journal = filesystem._ExpirationJournal(path)
+        expired = journal.read_expired(datetime.now(timezone.utc), 1000)
+        assert sorted(expired) == sorted(kept_ids)
+        assert list(temp_dir.glob("*.compacting")) == []
+
+    async def test_migrates_expiration_index(
+        self, temp_dir: Path, sample_resource_ids: list[UUID]
+    ):
+        expired_id = uuid4()
+        expiration = datetime.now(timezone.utc) - timedelta(seconds=1)
+        (temp_dir / "expirations.json").write_text(
+            json.dumps({str(expired_id): expiration.isoformat()})
+        )
+
+        storage = ConcurrencyLeaseStorage(storage_path=temp_dir)
+        assert await storage.read_expired_lease_ids() == [expired_id]
+        assert not (temp_dir / "expirations.json").exists()
@@ -0,0 +1,260 @@
+from datetime import timedelta
+from typing import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.concurrency.ledger as ledger_module
+from prefect.server.concurrency.ledger import SlotLedger, get_slot_ledger
+from prefect.server.models.concurrency_limits_v2 import (
+    bulk_decrement_active_slots,
+    bulk_increment_active_slots,
+    bulk_update_denied_slots,
+    create_concurrency_limit,
+    read_concurrency_limit,
+    update_concurrency_limit,
+)
+from prefect.server.schemas.actions import ConcurrencyLimitV2Update
+from prefect.server.schemas.core import ConcurrencyLimitV2
+from prefect.settings import (
+    PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_ENABLED,
+    PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_FLUSH_INTERVAL,
+    temporary_settings,
+)
+
+
+@pytest.fixture
+async def slot_ledger(
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[SlotLedger, None]:
+    monkeypatch.setattr(ledger_module, "_slot_ledger", None)
+    with temporary_settings(
+        {
+            PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_ENABLED: True,
+            # flushed explicitly by the tests
+            PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_FLUSH_INTERVAL: 3600,
+        }
+    ):
+        slot_ledger = get_slot_ledger()
+        assert slot_ledger
+        yield slot_ledger
+        await slot_ledger.stop()
+
+
+async def _create_limit(session: AsyncSession, **kwargs) -> ConcurrencyLimitV2:
+    concurrency_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(**kwargs),
+    )
+    await session.commit()
+    return ConcurrencyLimitV2.model_validate(concurrency_limit, from_attributes=True)
+
+
+@pytest.fixture
+async def concurrency_limit(session: AsyncSession) -> ConcurrencyLimitV2:
+    return await _create_limit(session, name="ledger_limit", limit=2)
+
+
+async def _read(session: AsyncSession, limit: ConcurrencyLimitV2) -> ConcurrencyLimitV2:
+    session.expire_all()
+    model = await read_concurrency_limit(session, concurrency_limit_id=limit.id)
+    assert model
+    return ConcurrencyLimitV2.model_validate(model, from_attributes=True)
+
+
+def test_ledger_is_disabled_by_default():
+    assert get_slot_ledger() is None
+
+
+async def test_counts_slots_in_memory_until_flushed(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 1)
+    await session.commit()
+
+    assert (await _read(session, concurrency_limit)).active_slots == 0
+    assert slot_ledger.with_slot_counts(concurrency_limit).active_slots == 1
+
+    await slot_ledger.flush()
+
+    assert (await _read(session, concurrency_limit)).active_slots == 1
+
+
+async def test_denies_slots_beyond_the_limit(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 2)
+    assert not await bulk_increment_active_slots(session, [concurrency_limit.id], 1)
+
+    assert await bulk_decrement_active_slots(session, [concurrency_limit.id], 1)
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 1)
+
+
+async def test_denies_slots_when_any_limit_is_full(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    full_limit = await _create_limit(
+        session, name="full_ledger_limit", limit=1, active_slots=1
+    )
+
+    assert not await bulk_increment_active_slots(
+        session, [concurrency_limit.id, full_limit.id], 1
+    )
+    assert slot_ledger.with_slot_counts(concurrency_limit).active_slots == 0
+
+
+async def test_rollback_undoes_increment(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 1)
+    await session.rollback()
+
+    assert slot_ledger.with_slot_counts(concurrency_limit).active_slots == 0
+
+
+async def test_rollback_undoes_decrement(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 2)
+    await session.commit()
+
+    assert await bulk_decrement_active_slots(session, [concurrency_limit.id], 1)
+    await session.rollback()
+
+    assert slot_ledger.with_slot_counts(concurrency_limit).active_slots == 2
+
+
+async def test_rollback_undoes_only_the_released_slots(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 1)
+    await session.commit()
+
+    # releasing more slots than are active only releases the active ones
+    assert await bulk_decrement_active_slots(session, [concurrency_limit.id], 2)
+    assert slot_ledger.with_slot_counts(concurrency_limit).active_slots == 0
+    await session.rollback()
+
+    assert slot_ledger.with_slot_counts(concurrency_limit).active_slots == 1
+
+
+async def test_slots_decay(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+):
+    limit = await _create_limit(
+        session, name="decaying_ledger_limit", limit=10, slot_decay_per_second=1.0
+    )
+    assert await bulk_increment_active_slots(session, [limit.id], 10)
+    assert not await bulk_increment_active_slots(session, [limit.id], 1)
+
+    slot_ledger._entries[limit.id].active_decayed_at -= timedelta(seconds=3.5)
+
+    assert await bulk_increment_active_slots(session, [limit.id], 3)
+    assert not await bulk_increment_active_slots(session, [limit.id], 1)
+
+
+async def test_matches_database_updates(
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The ledger writes the same counts as updating the database directly"""
+    direct = await _create_limit(session, name="direct", limit=5)
+    ledgered = await _create_limit(session, name="ledgered", limit=5)
+
+    async def run(limit: ConcurrencyLimitV2):
+        assert await bulk_increment_active_slots(session, [limit.id], 3)
+        assert not await bulk_increment_active_slots(session, [limit.id], 3)
+        assert await bulk_update_denied_slots(session, [limit.id], 3)
+        assert await bulk_decrement_active_slots(
+            session, [limit.id], 2, occupancy_seconds=9.0
+        )
+        await session.commit()
+
+    await run(direct)
+
+    monkeypatch.setattr(ledger_module, "_slot_ledger", None)
+    with temporary_settings(
+        {
+            PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_ENABLED: True,
+            PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_FLUSH_INTERVAL: 3600,
+        }
+    ):
+        slot_ledger = get_slot_ledger()
+        assert slot_ledger
+        await run(ledgered)
+        await slot_ledger.stop()
+
+    direct = await _read(session, direct)
+    ledgered = await _read(session, ledgered)
+    assert ledgered.active_slots == direct.active_slots == 1
+    assert ledgered.denied_slots == direct.denied_slots == 3
+    assert ledgered.avg_slot_occupancy_seconds == pytest.approx(
+        direct.avg_slot_occupancy_seconds
+    )
+
+
+async def test_setting_slots_directly_replaces_counts(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 2)
+    await session.commit()
+
+    assert await update_concurrency_limit(
+        session,
+        concurrency_limit=ConcurrencyLimitV2Update(active_slots=0),
+        concurrency_limit_id=concurrency_limit.id,
+    )
+    await session.commit()
+
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 2)
+
+
+async def test_stop_flushes_counts(
+    slot_ledger: SlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(session, [concurrency_limit.id], 2)
+    await session.commit()
+
+    await slot_ledger.stop()
+
+    assert (await _read(session, concurrency_limit)).active_slots == 2
+
+
+async def test_api_reads_counts_from_ledger(
+    slot_ledger: SlotLedger,
+    client: AsyncClient,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    response = await client.post(
+        "/v2/concurrency_limits/increment",
+        json={"names": [concurrency_limit.name], "slots": 2},
+    )
+    assert response.status_code == 200, response.text
+
+    response = await client.get(f"/v2/concurrency_limits/{concurrency_limit.id}")
+    assert response.status_code == 200, response.text
+    assert response.json()["active_slots"] == 2
+
+    response = await client.post(
+        "/v2/concurrency_limits/increment",
+        json={"names": [concurrency_limit.name], "slots": 1},
+    )
+    assert response.status_code == 423
@@ -0,0 +1,85 @@
+import asyncio
+from uuid import uuid4
+
+from prefect.server.concurrency.waiters import SlotWaiters
+
+
+def test_first_waiter_is_next():
+    waiters = SlotWaiters()
+    limit_id = uuid4()
+
+    first = waiters.join([limit_id])
+    second = waiters.join([limit_id])
+
+    assert waiters.is_next(first)
+    assert not waiters.is_next(second)
+
+
+def test_oldest_waiter_is_next_across_overlapping_limits():
+    waiters = SlotWaiters()
+    a, b = uuid4(), uuid4()
+
+    on_a = waiters.join([a])
+    on_both = waiters.join([a, b])
+    on_b = waiters.join([b])
+
+    assert waiters.is_next(on_a)
+    assert not waiters.is_next(on_both)
+    assert not waiters.is_next(on_b)
+
+    waiters.leave(on_a)
+
+    assert waiters.is_next(on_both)
+    assert not waiters.is_next(on_b)
+
+
+def test_rejoining_keeps_place_in_line():
+    waiters = SlotWaiters()
+    limit_id = uuid4()
+
+    first = waiters.join([limit_id])
+    waiters.hold(first)
+    second = waiters.join([limit_id])
+
+    assert waiters.join([limit_id], waiter_id=first.id) is first
+    assert waiters.is_next(first)
+    assert not waiters.is_next(second)
+
+
+def test_held_waiter_loses_place_after_grace_period():
+    waiters = SlotWaiters(grace_seconds=0)
+    limit_id = uuid4()
+
+    first = waiters.join([limit_id])
+    waiters.hold(first)
+    second = waiters.join([limit_id])
+
+    assert waiters.is_next(second)
+    assert waiters.join([limit_id], waiter_id=first.id) is not first
+
+
+async def test_notify_wakes_head_of_queue():
+    waiters = SlotWaiters()
+    limit_id = uuid4()
+
+    first = waiters.join([limit_id])
+    second = waiters.join([limit_id])
+
+    waiters.notify([limit_id])
+
+    assert first.wakeup.is_set()
+    assert not second.wakeup.is_set()
+    await asyncio.wait_for(waiters.wait(first, timeout=10), timeout=1)
+    assert not first.wakeup.is_set()
+
+
+async def test_leaving_wakes_next_waiter():
+    waiters = SlotWaiters()
+    limit_id = uuid4()
+
+    first = waiters.join([limit_id])
+    second = waiters.join([limit_id])
+
+    waiters.leave(first)
+
+    assert second.wakeup.is_set()
@@ -108,6 +108,8 @@ async def test_injecting_really_dumb_query_components():
 
         def _build_flow_run_graph_v2_query(self): ...
 
+        def _build_flow_run_graph_v2_edges_query(self): ...
+
         async def flow_run_graph_v2(
             self,
             session: AsyncSession,
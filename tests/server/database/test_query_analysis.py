@@ -0,0 +1,92 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database import PrefectDBInterface
+from prefect.server.database.query_analysis import (
+    FilterQueryAnalysis,
+    _SampleValues,
+    analyze_filter_queries,
+    explain_query,
+    filter_queries,
+    update_statistics,
+)
+
+
+@pytest.fixture
+async def sample(session: AsyncSession, deployment, work_queue_1) -> _SampleValues:
+    return _SampleValues(
+        deployment_id=deployment.id,
+        work_queue_id=work_queue_1.id,
+        tag="test",
+    )
+
+
+async def test_explain_query_returns_plan(session: AsyncSession, sample: _SampleValues):
+    for query in filter_queries(sample).values():
+        plan = await explain_query(session, query)
+        assert plan
+        assert all(isinstance(line, str) for line in plan)
+
+
+async def test_explain_query_with_colons_in_values(
+    session: AsyncSession, sample: _SampleValues
+):
+    sample.tag = "env:prod :name"
+    for query in filter_queries(sample).values():
+        assert await explain_query(session, query)
+
+
+async def test_filter_queries_use_new_indexes_on_sqlite(
+    db: PrefectDBInterface, session: AsyncSession, sample: _SampleValues
+):
+    if db.dialect.name != "sqlite":
+        pytest.skip("Postgres may prefer a sequential scan of a small table")
+
+    queries = filter_queries(sample)
+    expected_indexes = {
+        "flow runs by deployment, state and expected start time": (
+            "ix_flow_run__deployment_id_state_type_expected_start_time"
+        ),
+        "scheduled flow runs by work queue": (
+            "ix_flow_run__scheduled_work_queue_id_next_scheduled_start_time"
+        ),
+        "task runs by state and expected start time": (
+            "ix_task_run__state_type_expected_start_time"
+        ),
+    }
+    for name, index in expected_indexes.items():
+        plan = await explain_query(session, queries[name])
+        assert index in "\n".join(plan)
+
+
+async def test_analyze_filter_queries_explains_slow_queries(
+    session: AsyncSession, flow_run
+):
+    analyses = await analyze_filter_queries(session, slow_query_threshold=0)
+
+    assert [analysis.name for analysis in analyses] == list(
+        filter_queries(_SampleValues(flow_run.id, flow_run.id, "test"))
+    )
+    for analysis in analyses:
+        assert isinstance(analysis, FilterQueryAnalysis)
+        assert analysis.duration > 0
+        assert analysis.plan
+
+
+async def test_analyze_filter_queries_skips_fast_queries(session: AsyncSession):
+    analyses = await analyze_filter_queries(session, slow_query_threshold=60)
+
+    assert analyses
+    assert all(analysis.plan is None for analysis in analyses)
+
+
+async def test_analyze_filter_queries_explain_all(session: AsyncSession):
+    analyses = await analyze_filter_queries(
+        session, slow_query_threshold=60, explain_all=True
+    )
+
+    assert all(analysis.plan for analysis in analyses)
+
+
+async def test_update_statistics(session: AsyncSession):
+    await update_statistics(session)
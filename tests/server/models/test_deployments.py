@@ -1293,6 +1293,197 @@ class TestScheduledRuns:
             assert "auto-scheduled" in scheduled_run.tags
 
 
+class TestScheduleHorizons:
+    @pytest.fixture
+    def schedule(self):
+        return schemas.schedules.CronSchedule(
+            cron="*/10 * * * *", timezone="America/New_York"
+        )
+
+    @pytest.fixture
+    def batches(self, monkeypatch: pytest.MonkeyPatch) -> List[datetime.datetime]:
+        """Records the start of every batch of dates computed for a cron schedule"""
+        starts: List[datetime.datetime] = []
+        get_dates_batch = schemas.schedules.CronSchedule._get_dates_batch
+
+        def spy(self, n=None, start=None, end=None):
+            starts.append(start)
+            return get_dates_batch(self, n=n, start=start, end=end)
+
+        monkeypatch.setattr(schemas.schedules.CronSchedule, "_get_dates_batch", spy)
+        return starts
+
+    def schedule_dates(self, schedule, start_time, schedule_id=None, **kwargs):
+        window = dict(
+            end_time=start_time + datetime.timedelta(days=2),
+            min_time=datetime.timedelta(hours=1),
+            min_runs=3,
+            max_runs=100,
+        )
+        window.update(kwargs)
+        dates = models.deployments._schedule_dates(
+            schedule, start_time=start_time, **window
+        )
+        if schedule_id is None:
+            return dates
+
+        remembered = models.deployments._read_schedule_horizon(
+            schedule_id, schedule, start_time=start_time, **window
+        )
+        if remembered is None:
+            remembered = models.deployments._schedule_dates(
+                schedule, start_time=start_time, schedule_id=schedule_id, **window
+            )
+        assert remembered == dates
+        return remembered
+
+    def test_later_windows_are_read_from_the_horizon(self, schedule, batches):
+        schedule_id = uuid4()
+        start = datetime.datetime(2024, 6, 1, 20, tzinfo=datetime.timezone.utc)
+
+        for minutes in range(0, 12 * 60, 7):
+            self.schedule_dates(
+                schedule, start + datetime.timedelta(minutes=minutes), schedule_id
+            )
+
+        # 100 dates every 10 minutes cover the first 16 hours
+        assert batches == [start]
+
+    def test_windows_past_utc_offset_changes_are_computed_again(
+        self, schedule, batches
+    ):
+        schedule_id = uuid4()
+        # America/New_York sets its clocks back at 2024-11-03 06:00 UTC
+        start = datetime.datetime(2024, 11, 2, 20, tzinfo=datetime.timezone.utc)
+
+        for minutes in range(0, 12 * 60, 7):
+            self.schedule_dates(
+                schedule, start + datetime.timedelta(minutes=minutes), schedule_id
+            )
+
+        assert len(batches) > 1
+        assert batches[0] == start
+
+    def test_windows_past_the_horizon_are_computed_again(self, schedule, batches):
+        schedule_id = uuid4()
+        start = datetime.datetime(2024, 6, 1, 20, tzinfo=datetime.timezone.utc)
+
+        self.schedule_dates(schedule, start, schedule_id)
+        self.schedule_dates(schedule, start + datetime.timedelta(hours=16), schedule_id)
+        self.schedule_dates(schedule, start + datetime.timedelta(hours=20), schedule_id)
+
+        assert batches == [start, start + datetime.timedelta(hours=16)]
+
+    def test_earlier_windows_are_computed_again(self, schedule, batches):
+        schedule_id = uuid4()
+        start = datetime.datetime(2024, 6, 1, 20, tzinfo=datetime.timezone.utc)
+
+        self.schedule_dates(schedule, start, schedule_id)
+        self.schedule_dates(
+            schedule, start - datetime.timedelta(minutes=1), schedule_id
+        )
+
+        assert batches == [start, start - datetime.timedelta(minutes=1)]
+
+    def test_changed_schedules_are_computed_again(self, schedule, batches):
+        schedule_id = uuid4()
+        start = datetime.datetime(2024, 6, 1, 20, tzinfo=datetime.timezone.utc)
+        changed = schemas.schedules.CronSchedule(
+            cron="*/15 * * * *", timezone="America/New_York"
+        )
+
+        self.schedule_dates(schedule, start, schedule_id)
+        dates = self.schedule_dates(changed, start, schedule_id)
+
+        assert batches == [start, start]
+        assert dates[1] - dates[0] == datetime.timedelta(minutes=15)
+
+    @pytest.mark.parametrize(
+        "window",
+        [
+            dict(min_runs=0, min_time=datetime.timedelta(0)),
+            dict(min_runs=200, max_runs=150),
+            dict(min_runs=20, min_time=datetime.timedelta(days=3)),
+            dict(end_time_offset=datetime.timedelta(minutes=5)),
+            dict(end_time_offset=datetime.timedelta(days=30), max_runs=400),
+        ],
+    )
+    def test_horizons_match_the_schedule(self, window):
+        schedule_id = uuid4()
+        start = datetime.datetime(2024, 3, 9, 20, tzinfo=datetime.timezone.utc)
+        schedule = schemas.schedules.CronSchedule(
+            cron="0 * * * *", timezone="America/New_York"
+        )
+        end_time_offset = window.pop("end_time_offset", datetime.timedelta(days=10))
+
+        for minutes in range(0, 3 * 24 * 60, 97):
+            start_time = start + datetime.timedelta(minutes=minutes)
+            self.schedule_dates(
+                schedule,
+                start_time,
+                schedule_id,
+                end_time=start_time + end_time_offset,
+                **window,
+            )
+
+    def test_large_max_runs_are_not_remembered(self, schedule, batches):
+        schedule_id = uuid4()
+        start = datetime.datetime(2024, 6, 1, 20, tzinfo=datetime.timezone.utc)
+
+        models.deployments._schedule_dates(
+            schedule,
+            start_time=start,
+            end_time=start + datetime.timedelta(days=30),
+            min_time=datetime.timedelta(hours=1),
+            min_runs=3,
+            max_runs=1000,
+            schedule_id=schedule_id,
+        )
+
+        assert batches == []
+        assert (
+            models.deployments._read_schedule_horizon(
+                schedule_id,
+                schedule,
+                start_time=start,
+                end_time=start + datetime.timedelta(days=30),
+                min_time=datetime.timedelta(hours=1),
+                min_runs=3,
+                max_runs=1000,
+            )
+            is None
+        )
+
+    async def test_schedule_runs_remembers_horizons(self, session, flow, batches):
+        deployment = await models.deployments.create_deployment(
+            session=session,
+            deployment=schemas.core.Deployment(
+                name="My Deployment",
+                flow_id=flow.id,
+                schedules=[
+                    schemas.core.DeploymentSchedule(
+                        schedule=schemas.schedules.CronSchedule(cron="0 * * * *"),
+                        active=True,
+                    )
+                ],
+            ),
+        )
+        start_time = datetime.datetime(2100, 1, 1, 0, 30, tzinfo=datetime.timezone.utc)
+
+        first = await models.deployments.schedule_runs(
+            session, deployment_id=deployment.id, start_time=start_time
+        )
+        second = await models.deployments.schedule_runs(
+            session,
+            deployment_id=deployment.id,
+            start_time=start_time + datetime.timedelta(minutes=1),
+        )
+
+        assert len(first) == 3
+        assert second == []
+        assert batches == [start_time]
+
+
 class TestUpdateDeployment:
     async def test_updating_deployment_creates_associated_work_queue(
         self,
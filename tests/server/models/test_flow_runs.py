@@ -1226,6 +1226,55 @@ class TestReadFlowRuns:
                 r.state_type
 
 
+class TestStreamFlowRuns:
+    async def test_streams_flow_runs_in_chunks(self, flow, session):
+        flow_runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(flow_id=flow.id, name=f"fr{i}"),
+            )
+            for i in range(5)
+        ]
+        await session.commit()
+
+        chunks = [
+            chunk
+            async for chunk in models.flow_runs.stream_flow_runs(
+                session=session,
+                sort=schemas.sorting.FlowRunSort.NAME_ASC,
+                chunk_size=2,
+            )
+        ]
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [run.id for chunk in chunks for run in chunk] == [
+            run.id for run in flow_runs
+        ]
+
+    async def test_streams_filtered_flow_runs(self, flow, session):
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(flow_id=flow.id, tags=["streamed"]),
+        )
+        await models.flow_runs.create_flow_run(
+            session=session, flow_run=schemas.core.FlowRun(flow_id=flow.id)
+        )
+        await session.commit()
+
+        streamed = [
+            run
+            async for chunk in models.flow_runs.stream_flow_runs(
+                session=session,
+                flow_run_filter=schemas.filters.FlowRunFilter(
+                    tags=dict(all_=["streamed"])
+                ),
+            )
+            for run in chunk
+        ]
+
+        assert [run.id for run in streamed] == [flow_run.id]
+
+
 class TestReadFlowRunTaskRunDependencies:
     async def test_read_task_run_dependencies(self, flow_run, session):
         task_run_1 = await models.task_runs.create_task_run(
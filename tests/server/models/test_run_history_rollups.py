@@ -0,0 +1,411 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.api.run_history import run_history
+from prefect.server.database import provide_database_interface
+from prefect.server.models.run_history_rollups import (
+    HOUR,
+    MINUTE,
+    WATERMARK_CONFIGURATION_KEY,
+    bucket_ranges,
+    read_rollup_watermark,
+    read_unsettled_rollup_ranges,
+    refresh_run_history_rollups,
+    rollup_bucket_seconds,
+    rollup_filter_criteria,
+)
+from prefect.server.services.run_history_rollups import RunHistoryRollups
+
+BASE = datetime(2025, 6, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def rollup_work_queue(session, work_pool):
+    work_queue = await models.workers.create_work_queue(
+        session=session,
+        work_pool_id=work_pool.id,
+        work_queue=schemas.actions.WorkQueueCreate(name="rollups"),
+    )
+    await session.commit()
+    return work_queue
+
+
+async def create_finished_flow_run(session, flow_id, expected_start_time, **kwargs):
+    """
+    Create a flow run expected to start at the given time that started 5 seconds
+    late and ran for a minute.
+    """
+    flow_run = await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(
+            flow_id=flow_id,
+            state=schemas.states.Scheduled(scheduled_time=expected_start_time),
+            **kwargs,
+        ),
+    )
+    await models.flow_runs.set_flow_run_state(
+        session=session,
+        flow_run_id=flow_run.id,
+        state=schemas.states.Running(
+            timestamp=expected_start_time + timedelta(seconds=5)
+        ),
+        force=True,
+    )
+    await models.flow_runs.set_flow_run_state(
+        session=session,
+        flow_run_id=flow_run.id,
+        state=schemas.states.Completed(
+            timestamp=expected_start_time + timedelta(seconds=65)
+        ),
+        force=True,
+    )
+    return flow_run
+
+
+@pytest.fixture
+async def runs(session, flow, rollup_work_queue):
+    flow_runs = []
+    for i in range(12):
+        expected_start_time = BASE + timedelta(minutes=17 * i, seconds=13)
+        flow_runs.append(
+            await create_finished_flow_run(
+                session,
+                flow.id,
+                expected_start_time,
+                work_queue_id=rollup_work_queue.id if i % 2 else None,
+            )
+        )
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=schemas.states.Failed(timestamp=expected_start_time),
+            ),
+        )
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=schemas.states.Running(timestamp=expected_start_time),
+            ),
+        )
+
+    for i in range(10):
+        await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_runs[i].id,
+                task_key="task",
+                dynamic_key=str(i),
+                state=schemas.states.Completed(
+                    timestamp=BASE + timedelta(minutes=23 * i, seconds=41)
+                ),
+            ),
+        )
+    await session.commit()
+    return flow_runs
+
+
+async def read_history(session, run_type, interval=timedelta(hours=1), **filters):
+    histories = await run_history(
+        session=session,
+        run_type=run_type,
+        history_start=BASE - timedelta(hours=1),
+        history_end=BASE + timedelta(hours=5),
+        history_interval=interval,
+        **filters,
+    )
+    return [
+        (
+            history.interval_start,
+            sorted(
+                (
+                    state.state_type,
+                    state.state_name,
+                    state.count_runs,
+                    round(state.sum_estimated_run_time.total_seconds(), 3),
+                    round(state.sum_estimated_lateness.total_seconds(), 3),
+                )
+                for state in history.states
+                # running runs have estimates that increase with time
+                if state.state_type != schemas.states.StateType.RUNNING
+            ),
+        )
+        for history in histories
+    ]
+
+
+async def count_rollups(session, **criteria):
+    db = provide_database_interface()
+    return await session.scalar(
+        sa.select(sa.func.count())
+        .select_from(db.RunHistoryRollup)
+        .filter_by(**criteria)
+    )
+
+
+class TestBuckets:
+    @pytest.mark.parametrize(
+        "start,interval,expected",
+        [
+            (BASE, timedelta(days=1), HOUR),
+            (BASE, timedelta(hours=1), HOUR),
+            (BASE, timedelta(minutes=15), MINUTE),
+            (BASE + timedelta(minutes=1), timedelta(hours=1), MINUTE),
+            (BASE + timedelta(seconds=1), timedelta(hours=1), None),
+            (BASE, timedelta(seconds=90), None),
+            (BASE + timedelta(microseconds=1), timedelta(hours=1), None),
+        ],
+    )
+    def test_rollup_bucket_seconds(self, start, interval, expected):
+        assert rollup_bucket_seconds(start, interval) == expected
+
+    def test_bucket_ranges_merges_contiguous_buckets_within_an_hour(self):
+        minute = timedelta(minutes=1)
+        buckets = [
+            BASE + timedelta(minutes=58),
+            BASE + timedelta(minutes=59),
+            BASE + timedelta(minutes=60),
+            BASE + timedelta(minutes=62),
+            BASE + timedelta(minutes=58),
+        ]
+        assert bucket_ranges(buckets, MINUTE) == [
+            (BASE + timedelta(minutes=58), BASE + timedelta(minutes=59) + minute),
+            (BASE + timedelta(minutes=60), BASE + timedelta(minutes=60) + minute),
+            (BASE + timedelta(minutes=62), BASE + timedelta(minutes=62) + minute),
+        ]
+
+
+class TestRefreshRunHistoryRollups:
+    async def test_aggregates_terminal_runs_by_minute_and_hour(self, db, session, flow):
+        for seconds in (3, 20):
+            await create_finished_flow_run(
+                session, flow.id, BASE + timedelta(seconds=seconds)
+            )
+        await create_finished_flow_run(session, flow.id, BASE + timedelta(minutes=30))
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=schemas.states.Running(timestamp=BASE),
+            ),
+        )
+
+        await refresh_run_history_rollups(
+            session, "flow_run", [(BASE, BASE + timedelta(hours=1))]
+        )
+
+        rollups = (
+            await session.scalars(
+                sa.select(db.RunHistoryRollup).order_by(
+                    db.RunHistoryRollup.bucket_seconds,
+                    db.RunHistoryRollup.interval_start,
+                )
+            )
+        ).all()
+        assert [
+            (
+                rollup.bucket_seconds,
+                rollup.interval_start,
+                rollup.state_type,
+                rollup.count_runs,
+                rollup.sum_estimated_run_time,
+                rollup.sum_estimated_lateness,
+            )
+            for rollup in rollups
+        ] == [
+            (MINUTE, BASE, schemas.states.StateType.COMPLETED, 2, 120.0, 10.0),
+            (
+                MINUTE,
+                BASE + timedelta(minutes=30),
+                schemas.states.StateType.COMPLETED,
+                1,
+                60.0,
+                5.0,
+            ),
+            (HOUR, BASE, schemas.states.StateType.COMPLETED, 3, 180.0, 15.0),
+        ]
+        assert all(rollup.flow_id == flow.id for rollup in rollups)
+
+    async def test_refresh_replaces_existing_rollups(self, session, flow):
+        await create_finished_flow_run(session, flow.id, BASE)
+        ranges = [(BASE, BASE + timedelta(minutes=1))]
+
+        await refresh_run_history_rollups(session, "flow_run", ranges)
+        await refresh_run_history_rollups(session, "flow_run", ranges)
+
+        assert await count_rollups(session, bucket_seconds=MINUTE) == 1
+        assert await count_rollups(session, bucket_seconds=HOUR) == 1
+
+
+class TestRollupFilterCriteria:
+    def test_no_filters(self):
+        assert rollup_filter_criteria("flow_run") == []
+
+    def test_supported_run_filters(self):
+        assert (
+            rollup_filter_criteria(
+                "flow_run",
+                flow_run_filter=schemas.filters.FlowRunFilter(
+                    state=schemas.filters.FlowRunFilterState(
+                        type=schemas.filters.FlowRunFilterStateType(
+                            any_=[schemas.states.StateType.COMPLETED]
+                        )
+                    )
+                ),
+            )
+            is not None
+        )
+
+    @pytest.mark.parametrize(
+        "flow_run_filter",
+        [
+            schemas.filters.FlowRunFilter(
+                tags=schemas.filters.FlowRunFilterTags(all_=["a"])
+            ),
+            schemas.filters.FlowRunFilter(
+                start_time=schemas.filters.FlowRunFilterStartTime(after_=BASE)
+            ),
+            schemas.filters.FlowRunFilter(
+                parent_task_run_id=schemas.filters.FlowRunFilterParentTaskRunId(
+                    is_null_=True
+                )
+            ),
+        ],
+    )
+    def test_unsupported_run_filters(self, flow_run_filter):
+        assert (
+            rollup_filter_criteria("flow_run", flow_run_filter=flow_run_filter) is None
+        )
+
+    def test_flow_runs_filtered_by_task_runs_are_unsupported(self):
+        assert (
+            rollup_filter_criteria(
+                "flow_run", task_run_filter=schemas.filters.TaskRunFilter()
+            )
+            is None
+        )
+
+    def test_task_run_state_filters_of_flow_runs_are_unsupported(self):
+        assert (
+            rollup_filter_criteria(
+                "task_run",
+                flow_run_filter=schemas.filters.FlowRunFilter(
+                    state=schemas.filters.FlowRunFilterState(
+                        type=schemas.filters.FlowRunFilterStateType(
+                            any_=[schemas.states.StateType.COMPLETED]
+                        )
+                    )
+                ),
+            )
+            is None
+        )
+
+
+class TestRunHistoryFromRollups:
+    @pytest.fixture(autouse=True)
+    def no_refresh_overlap(self, monkeypatch):
+        # runs created by the tests are all updated within the overlap, which would
+        # leave every bucket unsettled
+        monkeypatch.setattr(
+            "prefect.server.services.run_history_rollups.REFRESH_OVERLAP",
+            timedelta(0),
+        )
+
+    @pytest.mark.parametrize("run_type", ["flow_run", "task_run"])
+    @pytest.mark.parametrize(
+        "interval",
+        [timedelta(hours=1), timedelta(minutes=15), timedelta(hours=2)],
+    )
+    async def test_history_matches_run_tables(self, session, runs, run_type, interval):
+        expected = await read_history(session, run_type, interval)
+
+        await RunHistoryRollups().start(loops=1)
+
+        watermark = await read_rollup_watermark(session, run_type)
+        assert watermark is not None
+        assert await count_rollups(session, run_type=run_type) > 0
+        assert (
+            await read_unsettled_rollup_ranges(
+                session, run_type, MINUTE, updated_since=watermark
+            )
+            == []
+        )
+        assert await read_history(session, run_type, interval) == expected
+
+    async def test_history_with_filters_matches_run_tables(
+        self, session, runs, flow, rollup_work_queue, work_pool
+    ):
+        flow_filter = dict(
+            flows=schemas.filters.FlowFilter(name=dict(any_=[flow.name]))
+        )
+        work_pool_filter = dict(
+            work_pools=schemas.filters.WorkPoolFilter(name=dict(any_=[work_pool.name]))
+        )
+        work_queue_filter = dict(
+            work_queues=schemas.filters.WorkQueueFilter(
+                id=dict(any_=[rollup_work_queue.id])
+            )
+        )
+        state_filter = dict(
+            flow_runs=schemas.filters.FlowRunFilter(
+                state=dict(type=dict(any_=[schemas.states.StateType.FAILED]))
+            )
+        )
+        requests = [
+            ("flow_run", flow_filter),
+            ("flow_run", work_pool_filter),
+            ("flow_run", work_queue_filter),
+            ("flow_run", state_filter),
+            ("task_run", flow_filter),
+            ("task_run", work_queue_filter),
+        ]
+        expected = [
+            await read_history(session, run_type, **filter_)
+            for run_type, filter_ in requests
+        ]
+
+        await RunHistoryRollups().start(loops=1)
+
+        assert [
+            await read_history(session, run_type, **filter_)
+            for run_type, filter_ in requests
+        ] == expected
+
+    async def test_history_reflects_changes_before_refresh(
+        self, db, session, runs, flow
+    ):
+        await RunHistoryRollups().start(loops=1)
+
+        await create_finished_flow_run(session, flow.id, BASE + timedelta(minutes=2))
+        await models.flow_runs.delete_flow_run(session, runs[3].id)
+        await models.flow_runs.set_flow_run_state(
+            session,
+            runs[5].id,
+            schemas.states.Scheduled(scheduled_time=BASE + timedelta(hours=3)),
+            force=True,
+        )
+        await session.commit()
+
+        flow_run_history = await read_history(session, "flow_run")
+        task_run_history = await read_history(session, "task_run")
+
+        # without a watermark, history is read from the run tables alone
+        await session.execute(
+            sa.delete(db.Configuration).where(
+                db.Configuration.key == WATERMARK_CONFIGURATION_KEY
+            )
+        )
+        await session.commit()
+        expected_flow_runs = await read_history(session, "flow_run")
+        expected_task_runs = await read_history(session, "task_run")
+        assert flow_run_history == expected_flow_runs
+        assert task_run_history == expected_task_runs
+
+        await RunHistoryRollups().start(loops=1)
+
+        assert await read_history(session, "flow_run") == expected_flow_runs
+        assert await read_history(session, "task_run") == expected_task_runs
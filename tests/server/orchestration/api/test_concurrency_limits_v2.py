@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -10,12 +11,14 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.client import schemas as client_schemas
+from prefect.server.api.concurrency_limits_v2 import WAITER_ID_HEADER
 from prefect.server.api.server import create_app
 from prefect.server.concurrency.lease_storage import (
     ConcurrencyLimitLeaseMetadata,
     get_concurrency_lease_storage,
 )
 from prefect.server.concurrency.lease_storage.filesystem import ConcurrencyLeaseStorage
+from prefect.server.concurrency.waiters import SlotWaiter, SlotWaiters
 from prefect.server.database import PrefectDBInterface
 from prefect.server.models.concurrency_limits_v2 import (
     bulk_update_denied_slots,
@@ -777,3 +780,228 @@ async def test_renew_concurrency_lease_not_found(
         json={"lease_duration": 600},
     )
     assert response.status_code == 404, response.text
+
+
+async def test_renew_concurrency_leases(
+    expiring_concurrency_lease: ResourceLease[ConcurrencyLimitLeaseMetadata],
+    concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+):
+    lease_storage = get_concurrency_lease_storage()
+    other_lease = await lease_storage.create_lease(
+        resource_ids=[concurrency_limit.id],
+        metadata=ConcurrencyLimitLeaseMetadata(slots=1),
+        ttl=timedelta(seconds=5),
+    )
+    missing_lease_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+
+    response = await client.post(
+        "/v2/concurrency_limits/leases/renew",
+        json={
+            "lease_ids": [
+                str(expiring_concurrency_lease.id),
+                str(missing_lease_id),
+                str(other_lease.id),
+            ],
+            "lease_duration": 600,
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == [str(expiring_concurrency_lease.id), str(other_lease.id)]
+
+    for lease_id in (expiring_concurrency_lease.id, other_lease.id):
+        lease = await lease_storage.read_lease(lease_id)
+        assert lease
+        assert (
+            now + timedelta(seconds=600)
+            <= lease.expiration
+            <= now + timedelta(seconds=602)
+        )
+
+
+class TestWaitingForSlots:
+    @pytest.fixture
+    async def occupied_limit(self, session: AsyncSession) -> ConcurrencyLimitV2:
+        concurrency_limit = await create_concurrency_limit(
+            session=session,
+            concurrency_limit=ConcurrencyLimitV2(
+                name="occupied_limit",
+                limit=1,
+                active_slots=1,
+            ),
+        )
+        await session.commit()
+
+        return ConcurrencyLimitV2.model_validate(concurrency_limit)
+
+    async def release(self, client: AsyncClient, limit: ConcurrencyLimitV2):
+        response = await client.post(
+            "/v2/concurrency_limits/decrement",
+            json={"names": [limit.name], "slots": 1},
+        )
+        assert response.status_code == 200, response.text
+
+    @pytest.fixture(autouse=True)
+    def waiting(self, monkeypatch: pytest.MonkeyPatch) -> set[uuid.UUID]:
+        """The IDs of the waiters that are waiting to be woken"""
+        waiting: set[uuid.UUID] = set()
+        wait = SlotWaiters.wait
+
+        async def tracked_wait(
+            waiters: SlotWaiters, waiter: SlotWaiter, timeout: float
+        ) -> None:
+            waiting.add(waiter.id)
+            try:
+                await wait(waiters, waiter, timeout)
+            finally:
+                waiting.discard(waiter.id)
+
+        monkeypatch.setattr(SlotWaiters, "wait", tracked_wait)
+        return waiting
+
+    async def wait_until_waiting(self, waiting: set[uuid.UUID], count: int):
+        # releasing slots while a waiter is taking them can lock SQLite
+        while len(waiting) < count:
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.parametrize("endpoint", ["increment", "increment-with-lease"])
+    async def test_waits_for_released_slots(
+        self,
+        waiting: set[uuid.UUID],
+        endpoint: str,
+        occupied_limit: ConcurrencyLimitV2,
+        client: AsyncClient,
+    ):
+        request = asyncio.create_task(
+            client.post(
+                f"/v2/concurrency_limits/{endpoint}",
+                json={"names": [occupied_limit.name], "slots": 1, "wait_seconds": 10},
+            )
+        )
+        await self.wait_until_waiting(waiting, 1)
+        assert not request.done()
+
+        await self.release(client, occupied_limit)
+
+        response = await asyncio.wait_for(request, timeout=5)
+        assert response.status_code == 200, response.text
+
+    async def test_responds_with_waiter_id_when_wait_ends(
+        self,
+        occupied_limit: ConcurrencyLimitV2,
+        client: AsyncClient,
+    ):
+        response = await client.post(
+            "/v2/concurrency_limits/increment",
+            json={"names": [occupied_limit.name], "slots": 1, "wait_seconds": 0.1},
+        )
+        assert response.status_code == 423
+        assert response.headers["Retry-After"] == "0"
+        assert uuid.UUID(response.headers[WAITER_ID_HEADER])
+
+    async def test_wait_seconds_out_of_range(
+        self,
+        occupied_limit: ConcurrencyLimitV2,
+        client: AsyncClient,
+    ):
+        response = await client.post(
+            "/v2/concurrency_limits/increment",
+            json={"names": [occupied_limit.name], "slots": 1, "wait_seconds": 31},
+        )
+        assert response.status_code == 422
+
+    async def test_grants_slots_in_arrival_order(
+        self,
+        waiting: set[uuid.UUID],
+        occupied_limit: ConcurrencyLimitV2,
+        client: AsyncClient,
+    ):
+        def acquire() -> asyncio.Task[httpx.Response]:
+            return asyncio.create_task(
+                client.post(
+                    "/v2/concurrency_limits/increment",
+                    json={
+                        "names": [occupied_limit.name],
+                        "slots": 1,
+                        "wait_seconds": 10,
+                    },
+                )
+            )
+
+        first = acquire()
+        await self.wait_until_waiting(waiting, 1)
+        second = acquire()
+        await self.wait_until_waiting(waiting, 2)
+
+        await self.release(client, occupied_limit)
+        response = await asyncio.wait_for(first, timeout=5)
+        assert response.status_code == 200, response.text
+        assert not second.done()
+
+        await self.release(client, occupied_limit)
+        response = await asyncio.wait_for(second, timeout=5)
+        assert response.status_code == 200, response.text
+
+    async def test_waiter_keeps_its_place_between_polls(
+        self,
+        occupied_limit: ConcurrencyLimitV2,
+        client: AsyncClient,
+    ):
+        response = await client.post(
+            "/v2/concurrency_limits/increment",
+            json={"names": [occupied_limit.name], "slots": 1, "wait_seconds": 0.1},
+        )
+        assert response.status_code == 423
+        waiter_id = response.headers[WAITER_ID_HEADER]
+
+        await self.release(client, occupied_limit)
+
+        # a later request waits behind the first, which has not polled again yet
+        response = await client.post(
+            "/v2/concurrency_limits/increment",
+            json={"names": [occupied_limit.name], "slots": 1, "wait_seconds": 0.1},
+        )
+        assert response.status_code == 423
+
+        response = await client.post(
+            "/v2/concurrency_limits/increment",
+            json={
+                "names": [occupied_limit.name],
+                "slots": 1,
+                "wait_seconds": 0.1,
+                "waiter_id": waiter_id,
+            },
+        )
+        assert response.status_code == 200, response.text
+
+    async def test_lease_release_wakes_waiters(
+        self,
+        waiting: set[uuid.UUID],
+        occupied_limit: ConcurrencyLimitV2,
+        client: AsyncClient,
+    ):
+        await self.release(client, occupied_limit)
+        response = await client.post(
+            "/v2/concurrency_limits/increment-with-lease",
+            json={"names": [occupied_limit.name], "slots": 1},
+        )
+        assert response.status_code == 200, response.text
+        lease_id = response.json()["lease_id"]
+
+        request = asyncio.create_task(
+            client.post(
+                "/v2/concurrency_limits/increment",
+                json={"names": [occupied_limit.name], "slots": 1, "wait_seconds": 10},
+            )
+        )
+        await self.wait_until_waiting(waiting, 1)
+
+        response = await client.post(
+            "/v2/concurrency_limits/decrement-with-lease",
+            json={"lease_id": lease_id},
+        )
+        assert response.status_code == 204, response.text
+
+        response = await asyncio.wait_for(request, timeout=5)
+        assert response.status_code == 200, response.text
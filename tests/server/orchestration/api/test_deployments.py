@@ -1220,6 +1220,48 @@ class TestReadDeployment:
             global_concurrency_limit.get("name") == f"deployment:{json_response['id']}"
         )
 
+    async def test_read_deployment_not_modified(self, client, deployment):
+        response = await client.get(f"/deployments/{deployment.id}")
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            f"/deployments/{deployment.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+
+    async def test_read_deployment_modified_by_schedule_change(
+        self, session, client, deployment
+    ):
+        response = await client.get(f"/deployments/{deployment.id}")
+        etag = response.headers["ETag"]
+
+        await models.deployments.create_deployment_schedules(
+            session=session,
+            deployment_id=deployment.id,
+            schedules=[
+                schemas.actions.DeploymentScheduleCreate(
+                    schedule=schemas.schedules.IntervalSchedule(
+                        interval=datetime.timedelta(days=1)
+                    ),
+                )
+            ],
+        )
+        await session.commit()
+
+        response = await client.get(
+            f"/deployments/{deployment.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
+        response = await client.get(
+            f"/deployments/{deployment.id}",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
 
 class TestReadDeploymentByName:
     async def test_read_deployment_by_name(self, client, flow, deployment):
@@ -1428,6 +1470,24 @@ class TestReadDeployments:
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == []
 
+    async def test_read_deployments_as_ndjson(self, deployments, client):
+        response = await client.post(
+            "/deployments/filter",
+            json=dict(sort=schemas.sorting.DeploymentSort.NAME_DESC),
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        streamed = [
+            DeploymentResponse.model_validate_json(line)
+            for line in response.text.splitlines()
+        ]
+        assert [deployment.name for deployment in streamed] == [
+            "My Deployment Y",
+            "My Deployment X",
+        ]
+
 
 class TestPaginateDeployments:
     @pytest.fixture
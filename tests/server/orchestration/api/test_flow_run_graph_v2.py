@@ -15,8 +15,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from prefect.server import models, schemas
 from prefect.server.database import PrefectDBInterface, orm_models
 from prefect.server.exceptions import FlowRunGraphTooLarge, ObjectNotFoundError
-from prefect.server.models.flow_runs import read_flow_run_graph
-from prefect.server.schemas.graph import Edge, Graph, GraphArtifact, GraphState, Node
+from prefect.server.models.flow_runs import (
+    invalidate_flow_run_graph_cache,
+    read_flow_run_graph,
+    read_flow_run_graph_delta,
+)
+from prefect.server.schemas.graph import (
+    Edge,
+    Graph,
+    GraphArtifact,
+    GraphDelta,
+    GraphState,
+    Node,
+)
 from prefect.server.schemas.states import StateType
 from prefect.settings import (
     PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS,
@@ -1687,3 +1698,255 @@ async def test_task_with_flow_run_input_creates_direct_edge(
     # Ensure the graph shows the direct connection: upstream_task -> subflow_run -> downstream_task
     assert len(downstream_node.parents) == 1
     assert downstream_node.parents[0].id == subflow_run.id
+
+
+@pytest.fixture(
+    params=[
+        "flat_tasks",
+        "nested_tasks",
+        "linked_tasks",
+        "subflow_run",
+        "tasks_with_flow_run_inputs",
+    ]
+)
+def graph_runs(request: pytest.FixtureRequest):
+    return request.getfixturevalue(request.param)
+
+
+async def test_reading_graph_delta_without_watermark_matches_full_graph(
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    graph_runs,
+):
+    graph = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    delta = await read_flow_run_graph_delta(session=session, flow_run_id=flow_run.id)
+
+    assert not delta.has_more
+    assert delta.start_time == graph.start_time
+    assert delta.end_time == graph.end_time
+    assert sorted(delta.root_node_ids) == sorted(graph.root_node_ids)
+    assert dict(delta.nodes) == dict(graph.nodes)
+    assert_graph_is_connected(delta, incremental=True)
+
+
+async def test_reading_graph_delta_for_nonexistant_flow_run(session: AsyncSession):
+    with pytest.raises(ObjectNotFoundError):
+        await read_flow_run_graph_delta(session=session, flow_run_id=uuid4())
+
+
+async def test_reading_graph_delta_without_changes_is_empty(
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    delta = await read_flow_run_graph_delta(session=session, flow_run_id=flow_run.id)
+    assert len(delta.nodes) == 6
+
+    invalidate_flow_run_graph_cache(flow_run.id)
+    next_delta = await read_flow_run_graph_delta(
+        session=session, flow_run_id=flow_run.id, watermark=delta.watermark
+    )
+
+    assert next_delta.nodes == []
+    assert next_delta.root_node_ids == []
+    assert next_delta.watermark == delta.watermark
+    assert not next_delta.has_more
+
+
+async def test_reading_graph_delta_returns_changed_nodes(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    delta = await read_flow_run_graph_delta(session=session, flow_run_id=flow_run.id)
+
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.id == linked_tasks[5].id)
+        .values(state_type=StateType.FAILED)
+    )
+    await session.commit()
+    invalidate_flow_run_graph_cache(flow_run.id)
+
+    next_delta = await read_flow_run_graph_delta(
+        session=session, flow_run_id=flow_run.id, watermark=delta.watermark
+    )
+
+    assert [id for id, _ in next_delta.nodes] == [linked_tasks[5].id]
+    assert next_delta.nodes[0][1].state_type == StateType.FAILED
+    assert next_delta.watermark > delta.watermark
+
+
+async def test_reading_graph_delta_returns_parents_of_new_nodes(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+    base_time: DateTime,
+):
+    delta = await read_flow_run_graph_delta(session=session, flow_run_id=flow_run.id)
+
+    new_task = db.TaskRun(
+        id=uuid4(),
+        flow_run_id=flow_run.id,
+        name="task-6",
+        task_key="task-6",
+        dynamic_key="task-6",
+        state_type=StateType.RUNNING,
+        state_name="Running",
+        expected_start_time=base_time + datetime.timedelta(seconds=6),
+        start_time=base_time + datetime.timedelta(seconds=6),
+        task_inputs={
+            "x": [{"id": linked_tasks[4].id, "input_type": "task_run"}],
+            "y": [{"id": linked_tasks[5].id, "input_type": "task_run"}],
+        },
+    )
+    session.add(new_task)
+    await session.commit()
+    invalidate_flow_run_graph_cache(flow_run.id)
+
+    next_delta = await read_flow_run_graph_delta(
+        session=session, flow_run_id=flow_run.id, watermark=delta.watermark
+    )
+
+    nodes = dict(next_delta.nodes)
+    assert set(nodes) == {new_task.id, linked_tasks[4].id, linked_tasks[5].id}
+    assert nodes[new_task.id].parents == [
+        Edge(id=linked_tasks[4].id),
+        Edge(id=linked_tasks[5].id),
+    ]
+    assert nodes[linked_tasks[4].id].children == [Edge(id=new_task.id)]
+    assert nodes[linked_tasks[5].id].children == [Edge(id=new_task.id)]
+    assert next_delta.root_node_ids == []
+
+
+async def test_reading_graph_delta_drops_deleted_nodes(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    delta = await read_flow_run_graph_delta(session=session, flow_run_id=flow_run.id)
+    assert linked_tasks[5].id in dict(delta.nodes)
+
+    await session.execute(
+        sa.delete(db.TaskRun).where(db.TaskRun.id == linked_tasks[5].id)
+    )
+    await session.commit()
+    invalidate_flow_run_graph_cache(flow_run.id)
+
+    next_delta = await read_flow_run_graph_delta(
+        session=session, flow_run_id=flow_run.id, watermark=delta.watermark
+    )
+    assert next_delta.watermark > delta.watermark
+    assert linked_tasks[5].id not in dict(next_delta.nodes)
+
+    graph = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    assert dict(next_delta.nodes) == dict(graph.nodes)
+
+
+async def test_reading_graph_delta_is_refreshed_by_task_run_state_changes(
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    delta = await read_flow_run_graph_delta(session=session, flow_run_id=flow_run.id)
+
+    await models.task_runs.set_task_run_state(
+        session=session,
+        task_run_id=linked_tasks[0].id,
+        state=schemas.states.Failed(),
+        force=True,
+    )
+    await session.commit()
+
+    next_delta = await read_flow_run_graph_delta(
+        session=session, flow_run_id=flow_run.id, watermark=delta.watermark
+    )
+
+    assert [id for id, _ in next_delta.nodes] == [linked_tasks[0].id]
+    assert next_delta.nodes[0][1].state_type == StateType.FAILED
+
+
+async def test_reading_graph_delta_is_served_from_cache_until_invalidated(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    delta = await read_flow_run_graph_delta(session=session, flow_run_id=flow_run.id)
+
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.id == linked_tasks[5].id)
+        .values(state_type=StateType.FAILED)
+    )
+    await session.commit()
+
+    with mock.patch.object(
+        db.queries,
+        "flow_run_graph_v2_changes",
+        wraps=db.queries.flow_run_graph_v2_changes,
+    ) as changes:
+        cached = await read_flow_run_graph_delta(
+            session=session, flow_run_id=flow_run.id, watermark=delta.watermark
+        )
+        assert cached.nodes == []
+        changes.assert_not_called()
+
+        invalidate_flow_run_graph_cache(flow_run.id)
+        refreshed = await read_flow_run_graph_delta(
+            session=session, flow_run_id=flow_run.id, watermark=delta.watermark
+        )
+        assert [id for id, _ in refreshed.nodes] == [linked_tasks[5].id]
+        changes.assert_awaited_once()
+
+
+async def test_reading_graph_delta_larger_than_max_nodes(
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    nodes = {}
+    watermark = None
+    with temporary_settings(updates={PREFECT_API_MAX_FLOW_RUN_GRAPH_NODES: 4}):
+        for _ in range(len(linked_tasks)):
+            delta = await read_flow_run_graph_delta(
+                session=session, flow_run_id=flow_run.id, watermark=watermark
+            )
+            nodes.update(delta.nodes)
+            watermark = delta.watermark
+            if not delta.has_more:
+                break
+
+    assert not delta.has_more
+    assert set(nodes) == {task_run.id for task_run in linked_tasks}
+
+    graph = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    assert nodes == dict(graph.nodes)
+
+
+async def test_api_delta(
+    client: AsyncClient,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    response = await client.get(f"/flow_runs/{flow_run.id}/graph-v2/delta")
+    assert response.status_code == 200, response.text
+
+    delta = GraphDelta.model_validate(response.json())
+    assert {id for id, _ in delta.nodes} == {task_run.id for task_run in linked_tasks}
+    assert not delta.has_more
+
+    response = await client.get(
+        f"/flow_runs/{flow_run.id}/graph-v2/delta",
+        params={"watermark": delta.watermark.isoformat()},
+    )
+    assert response.status_code == 200, response.text
+    assert GraphDelta.model_validate(response.json()).nodes == []
+
+
+async def test_api_delta_missing_flow_run_returns_404(client: AsyncClient):
+    response = await client.get(f"/flow_runs/{uuid4()}/graph-v2/delta")
+    assert response.status_code == 404, response.text
@@ -1,5 +1,6 @@
 import asyncio
 import datetime
+import gzip
 from typing import List, Optional
 from unittest import mock
 from uuid import UUID, uuid4
@@ -20,6 +21,7 @@ from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import TaskRunResult
 from prefect.server.schemas.responses import FlowRunResponse, OrchestrationResult
 from prefect.server.schemas.states import StateType
+from prefect.settings import PREFECT_API_DEFAULT_LIMIT, temporary_settings
 from prefect.states import (
     Completed,
     Paused,
@@ -562,6 +564,44 @@ class TestReadFlowRun:
         response = await client.get(f"/flow_runs/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
 
+    async def test_read_flow_run_not_modified(self, flow_run, client):
+        response = await client.get(f"/flow_runs/{flow_run.id}")
+        assert response.status_code == status.HTTP_200_OK, response.text
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        response = await client.get(
+            f"/flow_runs/{flow_run.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    async def test_read_flow_run_modified_since_etag(self, flow_run, client, session):
+        response = await client.get(f"/flow_runs/{flow_run.id}")
+        etag = response.headers["ETag"]
+
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run.id,
+            state=schemas.states.Running(),
+            force=True,
+        )
+        await session.commit()
+
+        response = await client.get(
+            f"/flow_runs/{flow_run.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers["ETag"] != etag
+        assert response.json()["state"]["type"] == "RUNNING"
+
+    async def test_read_flow_run_with_etag_returns_404_if_does_not_exist(self, client):
+        response = await client.get(
+            f"/flow_runs/{uuid4()}", headers={"If-None-Match": "*"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 class TestReadFlowRuns:
     @pytest.fixture
@@ -1370,6 +1410,90 @@ class TestDeleteFlowRuns:
         assert all([log.flow_run_id is None for log in logs])
 
 
+class TestBulkDeleteFlowRuns:
+    @pytest.fixture
+    async def flow_runs(self, flow, session):
+        flow_runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    tags=["bulk"] if i % 2 else [],
+                    state=schemas.states.Scheduled(),
+                ),
+            )
+            for i in range(6)
+        ]
+        await session.commit()
+        return flow_runs
+
+    async def test_bulk_delete_flow_runs(self, flow_runs, client, session):
+        response = await client.post(
+            "/flow_runs/bulk_delete",
+            json=dict(flow_runs=dict(tags=dict(all_=["bulk"]))),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        tagged = {run.id for run in flow_runs if run.tags}
+        untagged = {run.id for run in flow_runs if not run.tags}
+        assert set(UUID(id) for id in response.json()["deleted"]) == tagged
+
+        session.expire_all()
+        remaining = await models.flow_runs.read_flow_runs(session=session)
+        assert {run.id for run in remaining} == untagged
+
+    async def test_bulk_delete_flow_runs_respects_limit(
+        self, flow_runs, client, session
+    ):
+        response = await client.post("/flow_runs/bulk_delete", json=dict(limit=4))
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(response.json()["deleted"]) == 4
+
+        response = await client.post("/flow_runs/bulk_delete", json=dict(limit=4))
+        assert len(response.json()["deleted"]) == 2
+
+        session.expire_all()
+        assert await models.flow_runs.read_flow_runs(session=session) == []
+
+    async def test_bulk_delete_flow_runs_in_batches(
+        self, flow_runs, client, session, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "prefect.server.api.flow_runs.FLOW_RUN_BULK_OPERATION_BATCH_SIZE", 4
+        )
+        response = await client.post("/flow_runs/bulk_delete", json=dict())
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert set(UUID(id) for id in response.json()["deleted"]) == {
+            run.id for run in flow_runs
+        }
+
+    async def test_bulk_delete_flow_runs_rejects_large_limits(self, client):
+        response = await client.post(
+            "/flow_runs/bulk_delete", json=dict(limit=1_000_000)
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_bulk_delete_flow_runs_deletes_logs(
+        self, flow_run, logs, client, session
+    ):
+        response = await client.post(
+            "/flow_runs/bulk_delete",
+            json=dict(flow_runs=dict(id=dict(any_=[str(flow_run.id)]))),
+        )
+        assert response.json()["deleted"] == [str(flow_run.id)]
+
+        async def read_logs():
+            while True:
+                remaining_logs = await models.logs.read_logs(
+                    session=session, log_filter=None
+                )
+                if all(log.flow_run_id is None for log in remaining_logs):
+                    return remaining_logs
+                await asyncio.sleep(0.1)
+
+        await asyncio.wait_for(read_logs(), 10)
+
+
 class TestResumeFlowrun:
     @pytest.fixture
     async def paused_flow_run_waiting_for_input(
@@ -2011,6 +2135,150 @@ class TestSetFlowRunState:
                 mock_before_transition.assert_not_awaited()
 
 
+class TestBulkSetFlowRunState:
+    async def test_bulk_set_flow_run_state(self, flow, client, session):
+        scheduled = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id, state=schemas.states.Scheduled()
+                ),
+            )
+            for _ in range(3)
+        ]
+        completed = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=schemas.states.Completed()
+            ),
+        )
+        await session.commit()
+        scheduled_ids = {run.id for run in scheduled}
+        completed_id = completed.id
+
+        response = await client.post(
+            "/flow_runs/bulk_set_state",
+            json=dict(
+                state=dict(type="CANCELLING"),
+                flow_runs=dict(state=dict(type=dict(any_=["SCHEDULED"]))),
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        results = parse_obj_as(
+            List[responses.FlowRunOrchestrationResult], response.json()
+        )
+        assert {result.flow_run_id for result in results} == scheduled_ids
+
+        session.expire_all()
+        for flow_run_id in scheduled_ids:
+            run = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=flow_run_id
+            )
+            # scheduled runs are cancelled immediately by orchestration
+            assert run.state.type == StateType.CANCELLED
+
+        completed = await models.flow_runs.read_flow_run(
+            session=session, flow_run_id=completed_id
+        )
+        assert completed.state.type == StateType.COMPLETED
+
+    async def test_bulk_set_flow_run_state_orchestrates_each_run(
+        self, flow, client, session, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "prefect.server.api.flow_runs.FLOW_RUN_BULK_OPERATION_BATCH_SIZE", 1
+        )
+        running = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=schemas.states.Running()
+            ),
+        )
+        completed = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=schemas.states.Completed()
+            ),
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/flow_runs/bulk_set_state",
+            json=dict(state=dict(type="CANCELLING")),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        results = {
+            result.flow_run_id: result
+            for result in parse_obj_as(
+                List[responses.FlowRunOrchestrationResult], response.json()
+            )
+        }
+        assert results[running.id].status == responses.SetStateStatus.ACCEPT
+        assert results[running.id].state.type == StateType.CANCELLING
+        assert results[completed.id].status == responses.SetStateStatus.ABORT
+
+    async def test_bulk_set_flow_run_state_respects_limit(self, flow, client, session):
+        for _ in range(3):
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id, state=schemas.states.Running()
+                ),
+            )
+        await session.commit()
+
+        response = await client.post(
+            "/flow_runs/bulk_set_state",
+            json=dict(state=dict(type="CANCELLING"), limit=2),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(response.json()) == 2
+
+    async def test_bulk_set_flow_run_state_resumes_after_id(
+        self, flow, client, session
+    ):
+        for _ in range(3):
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id, state=schemas.states.Completed()
+                ),
+            )
+        await session.commit()
+
+        # completed runs can't be cancelled, so they keep matching the filters
+        body = dict(
+            state=dict(type="CANCELLING"),
+            flow_runs=dict(state=dict(type=dict(any_=["COMPLETED"]))),
+            limit=2,
+        )
+        response = await client.post("/flow_runs/bulk_set_state", json=body)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        first_page = [result["flow_run_id"] for result in response.json()]
+        assert first_page == sorted(first_page)
+
+        response = await client.post(
+            "/flow_runs/bulk_set_state", json=dict(body, after=first_page[-1])
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        second_page = [result["flow_run_id"] for result in response.json()]
+        assert len(second_page) == 1
+        assert second_page[0] > first_page[-1]
+
+    async def test_bulk_set_flow_run_state_with_no_matching_runs(self, client):
+        response = await client.post(
+            "/flow_runs/bulk_set_state",
+            json=dict(
+                state=dict(type="CANCELLING"),
+                flow_runs=dict(id=dict(any_=[str(uuid4())])),
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+
+
 class TestManuallyRetryingFlowRuns:
     async def test_manual_flow_run_retries(
         self, failed_flow_run_with_deployment, client, session
@@ -2910,6 +3178,175 @@ class TestPaginateFlowRuns:
         assert len(response.json()["results"]) == 0
 
 
+class TestReadFlowRunsWithCursor:
+    @pytest.fixture
+    async def flow_runs(self, flow, session):
+        start = now("UTC")
+        flow_runs = []
+        for i in range(7):
+            flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        # repeat names and times to exercise tie-breaking by id
+                        name=f"fr{i % 3}",
+                        expected_start_time=start + datetime.timedelta(minutes=i % 3),
+                        # leave some times null to exercise nulls ordering
+                        start_time=(
+                            start + datetime.timedelta(minutes=i) if i % 2 else None
+                        ),
+                        end_time=start + datetime.timedelta(hours=i) if i % 2 else None,
+                        next_scheduled_start_time=(
+                            start + datetime.timedelta(minutes=i) if i < 4 else None
+                        ),
+                    ),
+                )
+            )
+        await session.commit()
+        return flow_runs
+
+    async def read_all_pages(self, client, limit, **body):
+        ids = []
+        cursor = None
+        while True:
+            response = await client.post(
+                "/flow_runs/filter/cursor",
+                json=dict(body, limit=limit, cursor=cursor),
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            page = responses.FlowRunCursorPaginationResponse.model_validate(
+                response.json()
+            )
+            assert len(page.results) <= limit
+            ids.extend(run.id for run in page.results)
+            cursor = page.next_cursor
+            if cursor is None:
+                return ids
+
+    @pytest.mark.parametrize("sort", list(schemas.sorting.FlowRunSort))
+    async def test_pages_through_every_flow_run_once(self, flow_runs, client, sort):
+        ids = await self.read_all_pages(client, limit=2, sort=sort.value)
+
+        assert len(ids) == len(flow_runs)
+        assert set(ids) == {flow_run.id for flow_run in flow_runs}
+
+    async def test_pages_are_sorted(self, flow_runs, client):
+        ids = await self.read_all_pages(client, limit=2, sort="NAME_ASC")
+
+        names = {flow_run.id: flow_run.name for flow_run in flow_runs}
+        assert [names[id] for id in ids] == sorted(names.values())
+
+    async def test_last_page_has_no_cursor(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/filter/cursor", json=dict(limit=len(flow_runs))
+        )
+        assert len(response.json()["results"]) == len(flow_runs)
+        assert response.json()["next_cursor"] is None
+
+    async def test_applies_filters(self, flow_runs, client):
+        ids = await self.read_all_pages(
+            client, limit=1, flow_runs=dict(name=dict(any_=["fr0"]))
+        )
+        assert set(ids) == {
+            flow_run.id for flow_run in flow_runs if flow_run.name == "fr0"
+        }
+
+    async def test_rejects_invalid_cursor(self, client):
+        response = await client.post(
+            "/flow_runs/filter/cursor", json=dict(cursor="not-a-cursor")
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_rejects_cursor_for_another_sort(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/filter/cursor", json=dict(limit=1, sort="NAME_ASC")
+        )
+        cursor = response.json()["next_cursor"]
+
+        response = await client.post(
+            "/flow_runs/filter/cursor",
+            json=dict(limit=1, sort="NAME_DESC", cursor=cursor),
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestStreamFlowRuns:
+    NDJSON = {"Accept": "application/x-ndjson"}
+
+    @pytest.fixture
+    async def flow_runs(self, flow, session):
+        flow_runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(flow_id=flow.id, name=f"fr{i}"),
+            )
+            for i in range(5)
+        ]
+        await session.commit()
+        return flow_runs
+
+    @staticmethod
+    def parse_lines(response) -> List[FlowRunResponse]:
+        return [
+            FlowRunResponse.model_validate_json(line)
+            for line in response.text.splitlines()
+        ]
+
+    async def test_streams_flow_runs_as_ndjson(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/filter", json=dict(sort="NAME_ASC"), headers=self.NDJSON
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        streamed = self.parse_lines(response)
+        assert [flow_run.name for flow_run in streamed] == [f"fr{i}" for i in range(5)]
+
+    async def test_streamed_flow_runs_match_json_response(self, flow_runs, client):
+        expected = (await client.post("/flow_runs/filter", json={})).json()
+        response = await client.post("/flow_runs/filter", json={}, headers=self.NDJSON)
+        assert [orjson.loads(line) for line in response.text.splitlines()] == expected
+
+    async def test_streaming_applies_filters_limit_and_offset(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/filter",
+            json=dict(
+                sort="NAME_ASC",
+                offset=1,
+                limit=2,
+                flow_runs=dict(name=dict(any_=["fr0", "fr1", "fr2", "fr3"])),
+            ),
+            headers=self.NDJSON,
+        )
+        assert [run.name for run in self.parse_lines(response)] == ["fr1", "fr2"]
+
+    async def test_streaming_is_not_bound_by_the_default_limit(self, flow_runs, client):
+        with temporary_settings({PREFECT_API_DEFAULT_LIMIT: 2}):
+            limited = await client.post("/flow_runs/filter", json={})
+            streamed = await client.post(
+                "/flow_runs/filter", json={}, headers=self.NDJSON
+            )
+            too_large = await client.post(
+                "/flow_runs/filter", json=dict(limit=3), headers=self.NDJSON
+            )
+
+        assert len(limited.json()) == 2
+        assert len(self.parse_lines(streamed)) == 5
+        assert len(self.parse_lines(too_large)) == 3
+
+    async def test_streaming_rejects_negative_limit(self, client):
+        response = await client.post(
+            "/flow_runs/filter", json=dict(limit=-1), headers=self.NDJSON
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_streaming_with_no_results(self, client):
+        response = await client.post("/flow_runs/filter", json={}, headers=self.NDJSON)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == ""
+
+
 class TestDownloadFlowRunLogs:
     @pytest.fixture
     async def flow_run_1(self, session, flow):
@@ -3004,3 +3441,85 @@ class TestDownloadFlowRunLogs:
             assert line_count == expected_line_count, (
                 f"Expected {expected_line_count} lines, got {line_count}"
             )
+
+    async def test_download_flow_run_logs_buffers_rows_into_chunks(
+        self, client, flow_run_1, flow_run_1_logs
+    ):
+        async with client.stream(
+            "GET",
+            f"/flow_runs/{flow_run_1.id}/logs/download",
+            headers={"Accept-Encoding": "identity"},
+        ) as response:
+            chunks = [chunk async for chunk in response.aiter_raw()]
+
+        assert "content-encoding" not in response.headers
+        # the header and every row fit in a single chunk
+        assert len(chunks) == 1
+        assert len(b"".join(chunks).decode().splitlines()) == len(flow_run_1_logs) + 1
+
+    async def test_download_flow_run_logs_as_ndjson(
+        self,
+        client,
+        flow_run_1,
+        flow_run_1_logs,
+        flow_run_2_logs,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(
+            "prefect.server.api.flow_runs.FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT", 3
+        )
+
+        response = await client.get(
+            f"/flow_runs/{flow_run_1.id}/logs/download", params={"format": "ndjson"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.headers["content-disposition"].endswith("-logs.ndjson")
+
+        # one line per log, each ending in a newline
+        assert response.content.count(b"\n") == len(flow_run_1_logs)
+        assert response.content.endswith(b"\n")
+        logs = [orjson.loads(line) for line in response.text.splitlines()]
+        assert sorted(log["message"] for log in logs) == sorted(
+            log.message for log in flow_run_1_logs
+        )
+        assert {log["flow_run_id"] for log in logs} == {str(flow_run_1.id)}
+
+    async def test_download_flow_run_logs_with_gzip(
+        self, client, flow_run_1, flow_run_1_logs, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(
+            "prefect.server.api.flow_runs.FLOW_RUN_LOGS_DOWNLOAD_CHUNK_SIZE", 1
+        )
+
+        async with client.stream(
+            "GET",
+            f"/flow_runs/{flow_run_1.id}/logs/download",
+            headers={"Accept-Encoding": "gzip"},
+        ) as response:
+            compressed = b"".join([chunk async for chunk in response.aiter_raw()])
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+
+        lines = gzip.decompress(compressed).decode().splitlines()
+        assert lines[0] == "timestamp,level,flow_run_id,task_run_id,message"
+        assert len(lines) == len(flow_run_1_logs) + 1
+
+    async def test_download_flow_run_logs_without_accepted_gzip(
+        self, client, flow_run_1, flow_run_1_logs
+    ):
+        async with client.stream(
+            "GET",
+            f"/flow_runs/{flow_run_1.id}/logs/download",
+            headers={"Accept-Encoding": "gzip;q=0"},
+        ) as response:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+
+        assert "content-encoding" not in response.headers
+        assert len(body.decode().splitlines()) == len(flow_run_1_logs) + 1
+
+    async def test_download_logs_for_missing_flow_run(self, client):
+        response = await client.get(f"/flow_runs/{uuid4()}/logs/download")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
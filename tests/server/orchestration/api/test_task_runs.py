@@ -11,6 +11,7 @@ from starlette import status
 from prefect.client.orchestration import PrefectClient
 from prefect.client.schemas.objects import Flow, State
 from prefect.server import models, schemas
+from prefect.server.api.task_runs import TASK_RUN_BULK_OPERATION_LIMIT
 from prefect.server.database.orm_models import FlowRun, TaskRun
 from prefect.server.schemas import responses, states
 from prefect.server.schemas.responses import OrchestrationResult
@@ -215,6 +216,36 @@ class TestReadTaskRun:
         response = await client.get(f"/task_runs/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    async def test_read_task_run_not_modified(self, task_run, client):
+        response = await client.get(f"/task_runs/{task_run.id}")
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            f"/task_runs/{task_run.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+
+    async def test_read_task_run_modified_since_etag(self, task_run, client, session):
+        response = await client.get(f"/task_runs/{task_run.id}")
+        etag = response.headers["ETag"]
+
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=states.Running(),
+            force=True,
+        )
+        await session.commit()
+
+        response = await client.get(
+            f"/task_runs/{task_run.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        assert response.json()["state"]["type"] == "RUNNING"
+
 
 class TestReadTaskRuns:
     async def test_read_task_runs(self, task_run, client):
@@ -650,6 +681,71 @@ class TestPaginateTaskRuns:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+class TestReadTaskRunsWithCursor:
+    @pytest.fixture
+    async def task_runs(self, flow_run, session):
+        task_runs = []
+        for i in range(5):
+            task_runs.append(
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=schemas.core.TaskRun(
+                        flow_run_id=flow_run.id,
+                        task_key="my-key",
+                        dynamic_key=str(i),
+                        name=f"task-run-{i % 2}",
+                    ),
+                )
+            )
+        await session.commit()
+        return task_runs
+
+    @pytest.mark.parametrize("sort", list(schemas.sorting.TaskRunSort))
+    async def test_read_task_runs_with_cursor(self, task_runs, client, sort):
+        ids = []
+        cursor = None
+        while True:
+            response = await client.post(
+                "/task_runs/filter/cursor",
+                json=dict(limit=2, sort=sort.value, cursor=cursor),
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            ids.extend(run["id"] for run in response.json()["results"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(ids) == len(task_runs)
+        assert set(ids) == {str(task_run.id) for task_run in task_runs}
+
+    async def test_read_task_runs_with_invalid_cursor(self, client):
+        response = await client.post(
+            "/task_runs/filter/cursor", json=dict(cursor="not-a-cursor")
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_read_task_runs_as_ndjson(self, task_runs, client):
+        response = await client.post(
+            "/task_runs/filter",
+            json=dict(sort="EXPECTED_START_TIME_ASC"),
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        streamed = [
+            schemas.core.TaskRun.model_validate_json(line)
+            for line in response.text.splitlines()
+        ]
+        expected = await client.post(
+            "/task_runs/filter", json=dict(sort="EXPECTED_START_TIME_ASC")
+        )
+        assert [run.id for run in streamed] == [
+            uuid.UUID(run["id"]) for run in expected.json()
+        ]
+        assert len(streamed) == len(task_runs)
+
+
 class TestDeleteTaskRuns:
     async def test_delete_task_runs(self, task_run, client, session):
         # delete the task run
@@ -927,6 +1023,191 @@ class TestSetTaskRunState:
         )
 
 
+class TestBulkCreateTaskRuns:
+    async def test_bulk_create_task_runs(self, flow_run, client, session):
+        task_runs = [
+            {
+                "flow_run_id": str(flow_run.id),
+                "task_key": "my-task-key",
+                "name": f"my-task-run-{i}",
+                "dynamic_key": str(i),
+            }
+            for i in range(3)
+        ]
+        response = await client.post("/task_runs/bulk", json={"task_runs": task_runs})
+        assert response.status_code == status.HTTP_200_OK
+        assert [run["name"] for run in response.json()] == [
+            "my-task-run-0",
+            "my-task-run-1",
+            "my-task-run-2",
+        ]
+        assert all(run["state"]["type"] == "PENDING" for run in response.json())
+
+        for run in response.json():
+            task_run = await models.task_runs.read_task_run(
+                session=session, task_run_id=run["id"]
+            )
+            assert task_run.flow_run_id == flow_run.id
+
+    async def test_bulk_create_task_runs_returns_existing_runs(
+        self, flow_run, task_run, client
+    ):
+        response = await client.post(
+            "/task_runs/bulk",
+            json={
+                "task_runs": [
+                    {
+                        "flow_run_id": str(flow_run.id),
+                        "task_key": "other-key",
+                        "dynamic_key": "0",
+                    },
+                    {
+                        "flow_run_id": str(flow_run.id),
+                        "task_key": task_run.task_key,
+                        "dynamic_key": task_run.dynamic_key,
+                    },
+                ]
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["id"] != str(task_run.id)
+        assert response.json()[1]["id"] == str(task_run.id)
+
+    async def test_bulk_create_task_runs_with_client_provided_ids(
+        self, flow_run, client
+    ):
+        ids = [str(uuid4()), str(uuid4())]
+        response = await client.post(
+            "/task_runs/bulk",
+            json={
+                "task_runs": [
+                    {
+                        "id": id,
+                        "flow_run_id": str(flow_run.id),
+                        "task_key": "my-task-key",
+                        "dynamic_key": str(i),
+                    }
+                    for i, id in enumerate(ids)
+                ]
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [run["id"] for run in response.json()] == ids
+
+    async def test_bulk_create_task_runs_limits_task_runs(self, flow_run, client):
+        response = await client.post(
+            "/task_runs/bulk",
+            json={
+                "task_runs": [
+                    {
+                        "flow_run_id": str(flow_run.id),
+                        "task_key": "my-task-key",
+                        "dynamic_key": str(i),
+                    }
+                    for i in range(TASK_RUN_BULK_OPERATION_LIMIT + 1)
+                ]
+            },
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestBulkSetTaskRunState:
+    async def test_bulk_set_task_run_state(self, flow_run, client, session):
+        await client.post(
+            f"/flow_runs/{flow_run.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        task_runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.actions.TaskRunCreate(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                ),
+            )
+            for i in range(2)
+        ]
+        task_run_ids = [task_run.id for task_run in task_runs]
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/bulk_set_state",
+            json={
+                "task_run_states": [
+                    {
+                        "task_run_id": str(task_run_id),
+                        "state": {"type": "RUNNING", "name": "Test State"},
+                    }
+                    for task_run_id in task_run_ids
+                ]
+            },
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        results = [OrchestrationResult.model_validate(r) for r in response.json()]
+        assert [result.status for result in results] == [
+            responses.SetStateStatus.ACCEPT,
+            responses.SetStateStatus.ACCEPT,
+        ]
+
+        session.expire_all()
+        for task_run_id in task_run_ids:
+            run = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_id
+            )
+            assert run.state.type == states.StateType.RUNNING
+            assert run.state.name == "Test State"
+
+    async def test_bulk_set_task_run_state_aborts_missing_task_runs(
+        self, task_run, client, session
+    ):
+        await client.post(
+            f"/flow_runs/{task_run.flow_run_id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        missing_id = uuid4()
+        response = await client.post(
+            "/task_runs/bulk_set_state",
+            json={
+                "task_run_states": [
+                    {"task_run_id": str(missing_id), "state": {"type": "RUNNING"}},
+                    {"task_run_id": str(task_run.id), "state": {"type": "RUNNING"}},
+                ]
+            },
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        missing, existing = [
+            OrchestrationResult.model_validate(r) for r in response.json()
+        ]
+        assert missing.status == responses.SetStateStatus.ABORT
+        assert str(missing_id) in missing.details.reason
+        assert existing.status == responses.SetStateStatus.ACCEPT
+
+    async def test_bulk_set_task_run_state_without_new_states(self, client):
+        response = await client.post(
+            "/task_runs/bulk_set_state",
+            json={
+                "task_run_states": [
+                    {"task_run_id": str(uuid4()), "state": {"type": "RUNNING"}}
+                ]
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["status"] == "ABORT"
+
+    async def test_bulk_set_task_run_state_limits_task_runs(self, client):
+        response = await client.post(
+            "/task_runs/bulk_set_state",
+            json={
+                "task_run_states": [
+                    {"task_run_id": str(uuid4()), "state": {"type": "RUNNING"}}
+                    for _ in range(TASK_RUN_BULK_OPERATION_LIMIT + 1)
+                ]
+            },
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 class TestTaskRunHistory:
     async def test_history_interval_must_be_one_second_or_larger(self, client):
         response = await client.post(
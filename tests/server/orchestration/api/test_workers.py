@@ -949,6 +949,25 @@ class TestReadWorkPool:
             "bundle_execution_step": None,
         }
 
+    async def test_read_work_pool_not_modified(self, client, work_pool):
+        response = await client.get(f"/work_pools/{work_pool.name}")
+        assert response.status_code == status.HTTP_200_OK, response.text
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            f"/work_pools/{work_pool.name}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+
+        # responses to older clients differ, so are tagged separately
+        response = await client.get(
+            f"/work_pools/{work_pool.name}",
+            headers={"If-None-Match": etag, "User-Agent": "prefect/3.3.7 (API 0.8.4)"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
 
 class TestReadWorkPools:
     @pytest.fixture(autouse=True)
@@ -79,3 +79,39 @@ class TestPoliciesRespectOrdering:
 
         transition = (states.StateType.PENDING, states.StateType.RUNNING)
         assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+
+
+class TestCompiledTransitionRules:
+    def test_compiled_rules_follow_changes_to_priority(self, monkeypatch):
+        class FirstRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        class SecondRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        class Policy(BaseOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                return [FirstRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        assert Policy.compile_transition_rules(*transition) == [FirstRule]
+
+        monkeypatch.setattr(Policy, "priority", staticmethod(lambda: [SecondRule]))
+        assert Policy.compile_transition_rules(*transition) == [SecondRule]
+
+    def test_compiled_rules_are_not_shared_with_callers(self):
+        class ValidRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        class Policy(BaseOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                return [ValidRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        Policy.compile_transition_rules(*transition).clear()
+        assert Policy.compile_transition_rules(*transition) == [ValidRule]
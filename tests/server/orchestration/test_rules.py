@@ -995,6 +995,46 @@ class TestBaseOrchestrationRule:
         # because all fizzled rules cleaned up and invalid rules never fire, side-effects have been undone
         assert side_effects == 0
 
+    async def test_context_is_only_copied_for_defined_hooks(
+        self, session, task_run, monkeypatch
+    ):
+        before_transition_hook = MagicMock()
+
+        class BeforeOnlyRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+            async def before_transition(self, initial_state, proposed_state, context):
+                before_transition_hook()
+
+        intended_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        initial_state = await commit_task_run_state(
+            session, task_run, intended_transition[0]
+        )
+        ctx = OrchestrationContext(
+            session=session,
+            initial_state=initial_state,
+            proposed_state=states.State(type=intended_transition[1]),
+            run=task_run,
+        )
+        copies = 0
+        original_safe_copy = OrchestrationContext.safe_copy
+
+        def safe_copy(self):
+            nonlocal copies
+            copies += 1
+            return original_safe_copy(self)
+
+        monkeypatch.setattr(OrchestrationContext, "safe_copy", safe_copy)
+
+        async with BeforeOnlyRule(ctx, *intended_transition) as ctx:
+            pass
+
+        assert before_transition_hook.call_count == 1
+        assert copies == 1
+        assert ctx.rule_signature == [str(BeforeOnlyRule)]
+        assert ctx.finalization_signature == [str(BeforeOnlyRule)]
+
 
 class TestBaseUniversalTransform:
     async def test_universal_transforms_are_context_managers(self, session, task_run):
@@ -1314,3 +1314,97 @@ async def test_rrule_schedules_can_have_embedded_anchors(
     ]
     for date_obj in first_set:
         assert date_obj.weekday() == 4
+
+
+class TestGetDatesBatch:
+    """
+    Tests that the dates generated at once match the dates generated one at a time
+    """
+
+    starts = [
+        datetime(2024, 1, 15, 12, 34, 56, 789, tzinfo=ZoneInfo("UTC")),
+        # around the DST boundaries in America/New_York and Europe/London
+        datetime(2024, 3, 9, 23, tzinfo=ZoneInfo("America/New_York")),
+        datetime(2024, 10, 26, 22, 30, tzinfo=ZoneInfo("UTC")),
+        datetime(2024, 11, 2, 23, 59, 59, tzinfo=ZoneInfo("America/New_York")),
+    ]
+    timezones = ["UTC", "America/New_York", "Europe/London", "Etc/GMT+5"]
+
+    @pytest.mark.parametrize("start", starts)
+    @pytest.mark.parametrize("timezone", timezones)
+    @pytest.mark.parametrize(
+        "interval",
+        [
+            timedelta(minutes=10),
+            timedelta(hours=1),
+            timedelta(hours=7, seconds=3, microseconds=5),
+            timedelta(days=1),
+            timedelta(days=3, hours=2),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "n, span", [(100, timedelta(days=30)), (5, None), (2000, timedelta(days=500))]
+    )
+    def test_interval_schedule(self, start, timezone, interval, n, span):
+        s = IntervalSchedule(
+            interval=interval,
+            anchor_date=datetime(2020, 5, 17, 3, 21, tzinfo=ZoneInfo("Asia/Kolkata")),
+            timezone=timezone,
+        )
+        end = start + span if span else None
+
+        dates = s._get_dates_batch(n=n, start=start, end=end)
+
+        expected = list(s._get_dates_generator(n=n, start=start, end=end))
+        assert dates == expected
+        assert [str(d) for d in dates] == [str(d) for d in expected]
+
+    def test_interval_schedule_end_before_start(self):
+        s = IntervalSchedule(interval=timedelta(hours=1))
+        start = now("UTC")
+
+        assert (
+            s._get_dates_batch(n=10, start=start, end=start - timedelta(days=1)) == []
+        )
+
+    @pytest.mark.parametrize("start", starts)
+    @pytest.mark.parametrize("timezone", timezones)
+    @pytest.mark.parametrize(
+        "cron",
+        [
+            "*/10 * * * *",
+            "0 * * * *",
+            "30 2 * * *",
+            "0 9 * * 1-5",
+            "0 0 1,15 * 7",
+            "0 12 13 * 5",
+            "15 1,2,3 * 3,10,11 *",
+            "@daily",
+            # handled by croniter
+            "0 0 L * *",
+            "0 0 * * 5#2",
+        ],
+    )
+    @pytest.mark.parametrize("day_or", [True, False])
+    def test_cron_schedule(self, start, timezone, cron, day_or):
+        s = CronSchedule(cron=cron, timezone=timezone, day_or=day_or)
+        end = start + timedelta(days=60)
+
+        dates = s._get_dates_batch(n=100, start=start, end=end)
+
+        expected = list(s._get_dates_generator(n=100, start=start, end=end))
+        assert dates == expected
+        assert [str(d) for d in dates] == [str(d) for d in expected]
+
+    def test_cron_schedule_with_no_matching_dates(self):
+        s = CronSchedule(cron="0 0 30 2 *")
+
+        with pytest.raises(Exception, match="failed to find next date"):
+            s._get_dates_batch(n=1, start=dt)
+
+    async def test_rrule_schedule(self):
+        s = RRuleSchedule(rrule="FREQ=HOURLY;BYHOUR=9,10,17", timezone="Europe/Berlin")
+
+        dates = s._get_dates_batch(n=50, start=dt)
+
+        assert dates == await s.get_dates(n=50, start=dt)
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 from unittest import mock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -267,3 +267,146 @@ async def test_mark_late_runs_ignores_missing_runs(late_run: "ORMFlowRun"):
             await service.run_once()
         finally:
             await service._on_stop()
+
+
+@pytest.fixture
+async def many_late_runs(session, flow):
+    async with session.begin():
+        return [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=schemas.states.Scheduled(
+                        scheduled_time=datetime.now(timezone.utc)
+                        - timedelta(minutes=1 + i)
+                    ),
+                ),
+            )
+            for i in range(7)
+        ]
+
+
+@pytest.fixture
+async def late_subflow_run(session, flow):
+    async with session.begin():
+        parent_flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=schemas.states.Running()
+            ),
+        )
+        parent_task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=parent_flow_run.id,
+                task_key="subflow",
+                dynamic_key="0",
+                state=schemas.states.Pending(),
+            ),
+        )
+        return await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                parent_task_run_id=parent_task_run.id,
+                state=schemas.states.Scheduled(
+                    scheduled_time=datetime.now(timezone.utc) - timedelta(minutes=1)
+                ),
+            ),
+        )
+
+
+async def test_mark_late_runs_marks_runs_in_batches(session, many_late_runs):
+    service = MarkLateRuns()
+    service.batch_size = 3
+    await service.start(loops=1)
+
+    for run in many_late_runs:
+        scheduled_time = run.state.state_details.scheduled_time
+        await session.refresh(run)
+        assert run.state_type == schemas.states.StateType.SCHEDULED
+        assert run.state_name == "Late"
+        assert run.state_timestamp == run.state.timestamp
+        assert run.next_scheduled_start_time == scheduled_time
+        assert run.expected_start_time == scheduled_time
+        assert run.state.state_details.scheduled_time == scheduled_time
+        assert run.state.state_details.flow_run_id == run.id
+
+
+async def test_mark_late_runs_uses_overridden_per_run_hook(session, many_late_runs):
+    marked = []
+
+    class CustomMarkLateRuns(MarkLateRuns):
+        async def _mark_flow_run_as_late(self, session, flow_run):
+            marked.append(flow_run.id)
+            await super()._mark_flow_run_as_late(session=session, flow_run=flow_run)
+
+    with mock.patch(
+        "prefect.server.models.flow_runs.mark_flow_runs_late"
+    ) as mark_flow_runs_late:
+        await CustomMarkLateRuns().start(loops=1)
+
+    mark_flow_runs_late.assert_not_called()
+    assert sorted(marked) == sorted(run.id for run in many_late_runs)
+    for run in many_late_runs:
+        await session.refresh(run)
+        assert run.state_name == "Late"
+
+
+async def test_mark_flow_runs_late_skips_runs_that_are_not_scheduled(
+    session, late_run, pending_run
+):
+    async with session.begin():
+        marked = await models.flow_runs.mark_flow_runs_late(
+            session=session,
+            flow_run_ids=[late_run.id, pending_run.id, uuid4()],
+        )
+
+    assert marked == [late_run.id]
+
+    await session.refresh(late_run)
+    await session.refresh(pending_run)
+    assert late_run.state_name == "Late"
+    assert pending_run.state_name == "Pending"
+
+
+async def test_mark_late_runs_fires_an_event_for_each_run(session, many_late_runs):
+    previous_state_ids = {run.id: run.state_id for run in many_late_runs}
+
+    await MarkLateRuns().start(loops=1)
+
+    session.expunge_all()
+
+    assert AssertingEventsClient.last
+    events = {event.resource.id: event for event in AssertingEventsClient.last.events}
+    assert len(events) == len(many_late_runs)
+
+    for run in many_late_runs:
+        updated_flow_run = await models.flow_runs.read_flow_run(session, run.id)
+        event = events[f"prefect.flow-run.{run.id}"]
+        assert event.event == "prefect.flow-run.Late"
+        assert event.id == updated_flow_run.state_id
+        assert event.follows == previous_state_ids[run.id]
+        assert event.payload == {
+            "intended": {"from": "SCHEDULED", "to": "SCHEDULED"},
+            "initial_state": {"type": "SCHEDULED", "name": "Scheduled"},
+            "validated_state": {"type": "SCHEDULED", "name": "Late"},
+        }
+
+
+async def test_mark_late_runs_orchestrates_subflow_runs(session, late_subflow_run):
+    await MarkLateRuns().start(loops=1)
+
+    await session.refresh(late_subflow_run)
+    assert late_subflow_run.state_name == "Late"
+    assert (
+        late_subflow_run.state.state_details.task_run_id
+        == late_subflow_run.parent_task_run_id
+    )
+
+    parent_task_run = await models.task_runs.read_task_run(
+        session, late_subflow_run.parent_task_run_id
+    )
+    await session.refresh(parent_task_run)
+    assert parent_task_run.state_name == "Late"
@@ -1,10 +1,12 @@
 import asyncio
 import signal
 from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
 import pytest
 
 from prefect.server.services.base import LoopService
+from prefect.server.utilities import messaging
 from prefect.settings.models.server.services import ServicesBaseSetting
 
 
@@ -176,3 +178,113 @@ class TestSignalHandling:
         # yield so the signal handler would have time to run
         await asyncio.sleep(0.1)
         assert service._should_stop is False
+
+
+class TestWakeups:
+    async def test_wake_runs_the_service_before_its_next_loop(self):
+        class MyService(ExampleService):
+            loop_seconds = 60
+            counter = 0
+
+            async def run_once(self):
+                self.counter += 1
+
+        service = MyService()
+        task = asyncio.create_task(service.start())
+        try:
+            await asyncio.sleep(0.1)
+            assert service.counter == 1
+
+            service.wake()
+            await asyncio.sleep(0.1)
+            assert service.counter == 2
+        finally:
+            await service.stop()
+            await task
+
+    async def test_wake_at_runs_the_service_at_the_earliest_requested_time(self):
+        class MyService(ExampleService):
+            loop_seconds = 60
+            counter = 0
+
+            async def run_once(self):
+                self.counter += 1
+
+        service = MyService()
+        task = asyncio.create_task(service.start())
+        try:
+            await asyncio.sleep(0.1)
+            assert service.counter == 1
+
+            service.wake(at=datetime.now(timezone.utc) + timedelta(seconds=30))
+            service.wake(at=datetime.now(timezone.utc) + timedelta(seconds=0.5))
+            service.wake(at=datetime.now(timezone.utc) + timedelta(seconds=20))
+            await asyncio.sleep(0.2)
+            assert service.counter == 1
+
+            await asyncio.sleep(0.6)
+            assert service.counter == 2
+            assert service._wake_at is None
+        finally:
+            await service.stop()
+            await task
+
+    async def test_wakeups_during_a_run_are_coalesced(self):
+        class MyService(ExampleService):
+            loop_seconds = 60
+            counter = 0
+
+            async def run_once(self):
+                self.counter += 1
+                if self.counter == 1:
+                    self.wake()
+                    self.wake()
+
+        service = MyService()
+        task = asyncio.create_task(service.start())
+        try:
+            await asyncio.sleep(0.2)
+            assert service.counter == 2
+        finally:
+            await service.stop()
+            await task
+
+    async def test_wakeup_events_wake_the_service(self):
+        class MyService(ExampleService):
+            loop_seconds = 60
+            wakeup_events = frozenset({"prefect.flow-run.Cancelled"})
+            wakeup_delay_seconds = 0
+            counter = 0
+
+            async def run_once(self):
+                self.counter += 1
+
+        service = MyService()
+        task = asyncio.create_task(service.start())
+        try:
+            await asyncio.sleep(0.1)
+            assert service.counter == 1
+
+            async with messaging.create_publisher(topic="events") as publisher:
+                await publisher.publish_data(
+                    b"{}", {"id": str(uuid4()), "event": "prefect.flow-run.Running"}
+                )
+            await asyncio.sleep(0.2)
+            assert service.counter == 1
+
+            async with messaging.create_publisher(topic="events") as publisher:
+                await publisher.publish_data(
+                    b"{}", {"id": str(uuid4()), "event": "prefect.flow-run.Cancelled"}
+                )
+            await asyncio.sleep(0.2)
+            assert service.counter == 2
+        finally:
+            await service.stop()
+            await task
+
+        assert service._wakeup_listener is None
+
+    async def test_services_without_wakeup_events_do_not_subscribe(self):
+        service = ExampleService()
+        await service.start(loops=1)
+        assert service._wakeup_listener is None
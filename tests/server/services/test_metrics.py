@@ -0,0 +1,130 @@
+from typing import Optional
+from unittest import mock
+
+import pytest
+import sqlalchemy as sa
+from prometheus_client import REGISTRY
+
+from prefect.server.database import PrefectDBInterface
+from prefect.server.services.base import LoopService
+from prefect.server.services.metrics import instrument_handler
+from prefect.server.utilities.messaging import StopConsumer
+from prefect.settings.models.server.services import ServicesBaseSetting
+
+
+def sample(name: str, service: str) -> float:
+    value: Optional[float] = REGISTRY.get_sample_value(name, {"service": service})
+    return value or 0.0
+
+
+class MeasuredService(LoopService):
+    loop_seconds = 0
+
+    @classmethod
+    def service_settings(cls) -> ServicesBaseSetting:
+        return ServicesBaseSetting(enabled=True)
+
+    async def run_once(self) -> None:
+        pass
+
+
+async def test_loop_services_record_each_iteration():
+    class CountedService(MeasuredService):
+        pass
+
+    await CountedService().start(loops=3)
+
+    assert (
+        sample(
+            "prefect_server_service_iteration_duration_seconds_count", "CountedService"
+        )
+        == 3
+    )
+    assert (
+        sample("prefect_server_service_iteration_errors_total", "CountedService") == 0
+    )
+
+
+async def test_loop_services_record_errors():
+    class FailingService(MeasuredService):
+        async def run_once(self) -> None:
+            raise ValueError("oops")
+
+    await FailingService().start(loops=2)
+
+    assert (
+        sample("prefect_server_service_iteration_errors_total", "FailingService") == 2
+    )
+
+
+async def test_loop_services_record_database_time(db: PrefectDBInterface):
+    class QueryingService(MeasuredService):
+        async def run_once(self) -> None:
+            async with db.session_context() as session:
+                await session.execute(sa.text("SELECT 1"))
+                await session.execute(sa.text("SELECT 2"))
+
+    await QueryingService().start(loops=1)
+
+    assert (
+        sample("prefect_server_service_database_statements_total", "QueryingService")
+        == 2
+    )
+    database_seconds = sample(
+        "prefect_server_service_iteration_database_seconds_sum", "QueryingService"
+    )
+    python_seconds = sample(
+        "prefect_server_service_iteration_python_seconds_sum", "QueryingService"
+    )
+    total_seconds = sample(
+        "prefect_server_service_iteration_duration_seconds_sum", "QueryingService"
+    )
+    assert database_seconds > 0
+    assert database_seconds + python_seconds == pytest.approx(total_seconds)
+
+
+async def test_loop_services_record_items_processed():
+    class ProcessingService(MeasuredService):
+        async def run_once(self) -> None:
+            self.record_items_processed(5)
+
+    await ProcessingService().start(loops=2)
+
+    assert (
+        sample("prefect_server_service_items_processed_total", "ProcessingService")
+        == 10
+    )
+
+
+async def test_instrumented_handlers_record_each_message():
+    handler = mock.AsyncMock()
+    instrumented = instrument_handler("InstrumentedConsumer", handler)
+
+    await instrumented(mock.Mock())
+    await instrumented(mock.Mock())
+
+    assert handler.await_count == 2
+    assert (
+        sample(
+            "prefect_server_service_iteration_duration_seconds_count",
+            "InstrumentedConsumer",
+        )
+        == 2
+    )
+    assert (
+        sample("prefect_server_service_items_processed_total", "InstrumentedConsumer")
+        == 2
+    )
+
+
+async def test_instrumented_handlers_do_not_count_stopping_as_an_error():
+    instrumented = instrument_handler(
+        "StoppingConsumer", mock.AsyncMock(side_effect=StopConsumer(ack=True))
+    )
+
+    with pytest.raises(StopConsumer):
+        await instrumented(mock.Mock())
+
+    assert (
+        sample("prefect_server_service_iteration_errors_total", "StoppingConsumer") == 0
+    )
@@ -70,3 +70,14 @@ async def test_fails_multiple_expired_pauses(session, expired_pause, expired_pau
 
     assert expired_pause.state.type == "FAILED"
     assert expired_pause_2.state.type == "FAILED"
+
+
+async def test_wakes_when_active_pause_expires(session, active_pause, expired_pause):
+    service = FailExpiredPauses()
+    await service._on_start()
+    try:
+        await service.run_once()
+    finally:
+        await service._on_stop()
+
+    assert service._wake_at == active_pause.state.state_details.pause_timeout
@@ -7,11 +7,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.server import models, schemas
 from prefect.server.database import PrefectDBInterface
-from prefect.server.services.scheduler import RecentDeploymentsScheduler, Scheduler
+from prefect.server.services.scheduler import (
+    RecentDeploymentsScheduler,
+    Scheduler,
+    deployment_shard,
+)
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE,
     PREFECT_API_SERVICES_SCHEDULER_MIN_RUNS,
+    PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY,
     PREFECT_SERVER_SERVICES_SCHEDULER_RECENT_DEPLOYMENTS_LOOP_SECONDS,
+    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT,
+    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_INDEX,
     temporary_settings,
 )
 from prefect.types._datetime import now
@@ -697,3 +704,106 @@ class TestScheduleRulesWaterfall:
 
         runs = await models.flow_runs.read_flow_runs(session)
         assert len(runs) == n
+
+
+class TestConcurrentScheduling:
+    @pytest.fixture
+    async def deployments(self, flow: schemas.core.Flow, session: AsyncSession):
+        deployments = [
+            await models.deployments.create_deployment(
+                session=session,
+                deployment=schemas.core.Deployment(
+                    name=f"test-{i}",
+                    flow_id=flow.id,
+                    schedules=[
+                        schemas.core.DeploymentSchedule(
+                            schedule=schemas.schedules.IntervalSchedule(
+                                interval=datetime.timedelta(hours=1)
+                            ),
+                            active=True,
+                        )
+                    ],
+                ),
+            )
+            for i in range(12)
+        ]
+        await session.commit()
+        return deployments
+
+    async def scheduled_deployment_ids(self, session: AsyncSession) -> set:
+        runs = await models.flow_runs.read_flow_runs(session)
+        return {run.deployment_id for run in runs}
+
+    @pytest.mark.parametrize("concurrency", [1, 4, 20])
+    async def test_schedules_every_deployment(
+        self, session: AsyncSession, deployments, concurrency: int
+    ):
+        with temporary_settings(
+            {PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY: concurrency}
+        ):
+            await Scheduler().start(loops=1)
+
+        runs = await models.flow_runs.read_flow_runs(session)
+        assert (
+            len(runs)
+            == len(deployments) * PREFECT_API_SERVICES_SCHEDULER_MIN_RUNS.value()
+        )
+        assert await self.scheduled_deployment_ids(session) == {
+            deployment.id for deployment in deployments
+        }
+
+    async def test_error_scheduling_one_deployment_does_not_affect_others(
+        self, session: AsyncSession, deployments, monkeypatch
+    ):
+        generate = models.deployments._generate_scheduled_flow_runs
+
+        async def fail_for_first_deployment(db, deployment_id, **kwargs):
+            if deployment_id == deployments[0].id:
+                raise ValueError("bad schedule")
+            return await generate(db, deployment_id=deployment_id, **kwargs)
+
+        monkeypatch.setattr(
+            models.deployments,
+            "_generate_scheduled_flow_runs",
+            fail_for_first_deployment,
+        )
+
+        await Scheduler().start(loops=1)
+
+        assert await self.scheduled_deployment_ids(session) == {
+            deployment.id for deployment in deployments[1:]
+        }
+
+    async def test_shards_split_deployments(self, session: AsyncSession, deployments):
+        scheduled_by_shard = []
+        for shard_index in range(3):
+            with temporary_settings(
+                {
+                    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT: 3,
+                    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_INDEX: shard_index,
+                }
+            ):
+                await Scheduler().start(loops=1)
+
+            scheduled = await self.scheduled_deployment_ids(session)
+            scheduled_by_shard.append(scheduled - set().union(*scheduled_by_shard))
+
+        for shard_index, scheduled in enumerate(scheduled_by_shard):
+            assert scheduled == {
+                deployment.id
+                for deployment in deployments
+                if deployment_shard(deployment.id, 3) == shard_index
+            }
+        assert set().union(*scheduled_by_shard) == {
+            deployment.id for deployment in deployments
+        }
+
+    def test_shard_index_must_be_less_than_shard_count(self):
+        with pytest.raises(ValueError, match="shard_index must be less than"):
+            with temporary_settings(
+                {
+                    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT: 2,
+                    PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_INDEX: 2,
+                }
+            ):
+                pass
@@ -5,6 +5,8 @@ from prefect.server.api.server import create_app
 from prefect.settings import (
     PREFECT_SERVER_API_AUTH_STRING,
     PREFECT_SERVER_CSRF_PROTECTION_ENABLED,
+    PREFECT_SERVER_METRICS_ENABLED,
+    PREFECT_SERVER_PROFILING_ENABLED,
     PREFECT_UI_API_URL,
     temporary_settings,
 )
@@ -44,3 +46,22 @@ def test_app_add_csrf_middleware_when_enabled(enabled: bool):
             if "CsrfMiddleware" in str(middleware)
         ]
         assert len(matching) == (1 if enabled else 0)
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_app_exposes_profiler_when_enabled(enabled: bool):
+    with temporary_settings(
+        {
+            PREFECT_SERVER_METRICS_ENABLED: True,
+            PREFECT_SERVER_PROFILING_ENABLED: enabled,
+        }
+    ):
+        app = create_app(ignore_cache=True)
+
+    client = TestClient(app)
+    response = client.get("/api/metrics/profile", params={"seconds": 0.05})
+    if enabled:
+        response.raise_for_status()
+        assert response.headers["content-type"].startswith("text/plain")
+    else:
+        assert response.status_code == 404
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pytest
+
+from prefect.server.utilities.profiling import ProfilerBusy, sample_stacks
+
+
+def spin_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        pass
+
+
+@pytest.fixture
+def spinning_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=spin_until, args=(stop,), name="spinner")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+async def test_sample_stacks_returns_collapsed_stacks(spinning_thread):
+    profile = await sample_stacks(duration=0.1, interval=0.005)
+
+    spinner_stacks = [
+        line for line in profile.splitlines() if line.startswith("spinner;")
+    ]
+    assert spinner_stacks
+    assert any("spin_until (" in line for line in spinner_stacks)
+
+    for line in profile.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack
+        assert int(count) > 0
+
+
+async def test_sample_stacks_does_not_sample_itself():
+    profile = await sample_stacks(duration=0.05, interval=0.005)
+
+    assert "_sample_stacks (" not in profile
+
+
+async def test_only_one_profile_is_collected_at_a_time():
+    first = asyncio.create_task(sample_stacks(duration=0.2))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ProfilerBusy):
+        await sample_stacks(duration=0.05)
+
+    await first
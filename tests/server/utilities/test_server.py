@@ -1,12 +1,15 @@
+import datetime
 import urllib.parse
 
+import orjson
 import pytest
 from fastapi import (
     FastAPI,
 )
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.server import PrefectJSONResponse, PrefectRouter
 
 
 class TestParsing:
@@ -30,3 +33,54 @@ class TestParsing:
         quoted_response = client.get(urllib.parse.quote(f"/{x}"))
 
         assert x == response.json() == quoted_response.json()
+
+
+class Widget(BaseModel):
+    name: str
+    created: datetime.datetime
+
+
+class TestPrefectJSONResponse:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        router = PrefectRouter()
+
+        @router.get("/widget")
+        def read_widget() -> Widget:
+            return Widget(name="a", created=datetime.datetime(2024, 1, 1))
+
+        @router.get("/widgets")
+        def read_widgets():
+            return PrefectJSONResponse(
+                content=[
+                    Widget(name="a", created=datetime.datetime(2024, 1, 1)),
+                    Widget(name="b", created=datetime.datetime(2024, 1, 2)),
+                ]
+            )
+
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_routes_use_prefect_json_response_by_default(self, client):
+        route = next(route for route in client.app.routes if route.path == "/widget")
+        assert route.response_class is PrefectJSONResponse
+
+        response = client.get("/widget")
+        assert response.headers["Content-Type"] == "application/json"
+        assert response.json() == {"name": "a", "created": "2024-01-01T00:00:00"}
+
+    def test_renders_models(self, client):
+        response = client.get("/widgets")
+        assert response.json() == [
+            {"name": "a", "created": "2024-01-01T00:00:00"},
+            {"name": "b", "created": "2024-01-02T00:00:00"},
+        ]
+
+    @pytest.mark.parametrize(
+        "content", [{"a": 1}, [], [1, "two"], None, "value", {1: "non-string key"}]
+    )
+    def test_renders_plain_content(self, content):
+        assert PrefectJSONResponse(content=content).body == orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
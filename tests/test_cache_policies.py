@@ -15,6 +15,8 @@ from prefect.cache_policies import (
     _None,
 )
 from prefect.context import TaskRunContext
+from prefect.tasks import Task
+from prefect.utilities.hashing import hash_memo, structural_hash
 
 
 class TestBaseClass:
@@ -117,6 +119,52 @@ class TestInputsPolicy:
 
         assert key != other_key
 
+    def test_inputs_shared_within_a_hash_memo_are_hashed_once(self):
+        policy = Inputs()
+        shared = {"data": list(range(100))}
+
+        with patch(
+            "prefect.cache_policies.structural_hash", wraps=structural_hash
+        ) as spy:
+            with hash_memo([shared]):
+                key = policy.compute_key(
+                    task_ctx=None, inputs={"x": 1, "y": shared}, flow_parameters=None
+                )
+                other_key = policy.compute_key(
+                    task_ctx=None, inputs={"x": 2, "y": shared}, flow_parameters=None
+                )
+
+        # `y` is hashed once, `x` is hashed for each call
+        assert spy.call_count == 3
+        assert key != other_key
+
+    def test_key_does_not_depend_on_input_order(self):
+        policy = Inputs()
+        key = policy.compute_key(
+            task_ctx=None, inputs={"x": 1, "y": [1, 2]}, flow_parameters=None
+        )
+        other_key = policy.compute_key(
+            task_ctx=None, inputs={"y": [1, 2], "x": 1}, flow_parameters=None
+        )
+        assert key == other_key
+
+    def test_key_for_large_numpy_inputs(self):
+        np = pytest.importorskip("numpy")
+        policy = Inputs()
+
+        key = policy.compute_key(
+            task_ctx=None, inputs={"x": np.zeros(1_000_000)}, flow_parameters=None
+        )
+        same_key = policy.compute_key(
+            task_ctx=None, inputs={"x": np.zeros(1_000_000)}, flow_parameters=None
+        )
+        other_key = policy.compute_key(
+            task_ctx=None, inputs={"x": np.ones(1_000_000)}, flow_parameters=None
+        )
+
+        assert key == same_key
+        assert key != other_key
+
     def test_subtraction_results_in_new_policy_for_inputs(self):
         policy = Inputs()
         new_policy = policy - "foo"
@@ -313,6 +361,49 @@ class TestTaskSourcePolicy:
             assert fallback_key_a and fallback_key_b
             assert fallback_key_a != fallback_key_b
 
+    def test_source_hash_is_memoized_per_function(self):
+        policy = TaskSource()
+
+        def my_func():
+            pass
+
+        task_ctx = TaskRunContext.model_construct(task=Task(my_func))
+        key = policy.compute_key(task_ctx=task_ctx, inputs=None, flow_parameters=None)
+
+        with patch("inspect.getsource") as getsource:
+            new_key = policy.compute_key(
+                task_ctx=task_ctx, inputs=None, flow_parameters=None
+            )
+
+        getsource.assert_not_called()
+        assert key == new_key
+
+    def test_memoized_source_hash_is_invalidated_on_code_change(self):
+        policy = TaskSource()
+
+        def my_func():
+            pass
+
+        def other_func():
+            return 1
+
+        task_ctx = TaskRunContext.model_construct(task=MagicMock(fn=my_func))
+        with patch("inspect.getsource", return_value="def my_func(): pass"):
+            key = policy.compute_key(
+                task_ctx=task_ctx, inputs=None, flow_parameters=None
+            )
+
+        my_func.__code__ = other_func.__code__
+        with patch(
+            "inspect.getsource", return_value="def my_func(): return 1"
+        ) as getsource:
+            new_key = policy.compute_key(
+                task_ctx=task_ctx, inputs=None, flow_parameters=None
+            )
+
+        getsource.assert_called_once()
+        assert key != new_key
+
 
 class TestDefaultPolicy:
     def test_changing_the_inputs_busts_the_cache(self):
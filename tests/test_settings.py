@@ -280,7 +280,11 @@ SUPPORTED_SETTINGS = {
     "PREFECT_PROFILES_PATH": {"test_value": Path("/path/to/profiles.toml")},
     "PREFECT_RESULTS_DEFAULT_SERIALIZER": {"test_value": "serializer"},
     "PREFECT_RESULTS_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
+    "PREFECT_RESULTS_LOCAL_CACHE_ENABLED": {"test_value": True},
+    "PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES": {"test_value": 1024},
+    "PREFECT_RESULTS_LOCAL_CACHE_PATH": {"test_value": Path("/path/to/cache")},
     "PREFECT_RESULTS_LOCAL_STORAGE_PATH": {"test_value": Path("/path/to/storage")},
+    "PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES": {"test_value": 2048},
     "PREFECT_RESULTS_PERSIST_BY_DEFAULT": {"test_value": True},
     "PREFECT_RUNNER_HEARTBEAT_FREQUENCY": {"test_value": 30},
     "PREFECT_RUNNER_POLL_FREQUENCY": {"test_value": 10},
@@ -306,6 +310,8 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_CONCURRENCY_LEASE_STORAGE": {
         "test_value": "prefect.server.concurrency.lease_storage.filesystem"
     },
+    "PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_FLUSH_INTERVAL": {"test_value": 5.0},
     "PREFECT_SERVER_CORS_ALLOWED_HEADERS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_METHODS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_ORIGINS": {"test_value": "foo", "legacy": True},
@@ -379,6 +385,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_MEMO_STORE_PATH": {"test_value": Path("/path/to/memo")},
     "PREFECT_SERVER_MEMOIZE_BLOCK_AUTO_REGISTRATION": {"test_value": True},
     "PREFECT_SERVER_METRICS_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_PROFILING_ENABLED": {"test_value": True},
     "PREFECT_SERVER_REGISTER_BLOCKS_ON_START": {"test_value": True},
     "PREFECT_SERVER_SERVICES_CANCELLATION_CLEANUP_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS": {"test_value": 10.0},
@@ -408,6 +415,9 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_LOOP_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_REPOSSESSOR_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_REPOSSESSOR_LOOP_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_SCHEDULER_CONCURRENCY": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_SCHEDULER_DEPLOYMENT_BATCH_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_SCHEDULER_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_SCHEDULER_INSERT_BATCH_SIZE": {"test_value": 10},
@@ -423,6 +433,8 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_SCHEDULER_MIN_SCHEDULED_TIME": {
         "test_value": timedelta(minutes=10)
     },
+    "PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_COUNT": {"test_value": 3},
+    "PREFECT_SERVER_SERVICES_SCHEDULER_SHARD_INDEX": {"test_value": 0},
     "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_TRIGGERS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_TRIGGERS_PG_NOTIFY_HEARTBEAT_INTERVAL_SECONDS": {
@@ -453,6 +465,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_TASKS_DEFAULT_RETRY_DELAY_SECONDS": {"test_value": 10},
     "PREFECT_TASKS_DISABLE_CACHING": {"test_value": False},
     "PREFECT_TASKS_REFRESH_CACHE": {"test_value": True},
+    "PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS": {"test_value": 5},
     "PREFECT_TASKS_RUNNER_THREAD_POOL_MAX_WORKERS": {"test_value": 5},
     "PREFECT_TASKS_SCHEDULING_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
     "PREFECT_TASKS_SCHEDULING_DELETE_FAILED_SUBMISSIONS": {"test_value": True},
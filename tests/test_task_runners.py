@@ -1,3 +1,4 @@
+import asyncio
 import time
 import uuid
 from concurrent.futures import Future
@@ -6,20 +7,26 @@ from uuid import UUID
 
 import pytest
 
-from prefect.client.orchestration import PrefectClient
-from prefect.context import TagsContext, tags
+from prefect.client.orchestration import PrefectClient, get_client
+from prefect.context import AsyncClientContext, TagsContext, tags
 from prefect.filesystems import LocalFileSystem
 from prefect.flows import flow
 from prefect.futures import PrefectFuture, PrefectWrappedFuture
 from prefect.results import _default_storages
 from prefect.settings import (
+    PREFECT_API_KEY,
     PREFECT_DEFAULT_RESULT_STORAGE_BLOCK,
     PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
     PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK,
+    PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS,
     temporary_settings,
 )
 from prefect.states import Completed, Running
-from prefect.task_runners import PrefectTaskRunner, ThreadPoolTaskRunner
+from prefect.task_runners import (
+    PrefectTaskRunner,
+    ProcessPoolTaskRunner,
+    ThreadPoolTaskRunner,
+)
 from prefect.task_worker import TaskWorker
 from prefect.tasks import task
 
@@ -44,6 +51,21 @@ async def context_matters_async(param1=None, param2=None):
     return TagsContext.get().current_tags
 
 
+@task
+async def loop_and_client(param1=None, param2=None):
+    return id(asyncio.get_running_loop()), id(get_client())
+
+
+@task
+def add_one(x):
+    return x + 1
+
+
+@task
+def fails():
+    raise ValueError("oops")
+
+
 class MockFuture(PrefectWrappedFuture):
     def __init__(self, data: Any = 42):
         super().__init__(uuid.uuid4(), Future())
@@ -231,6 +253,167 @@ class TestThreadPoolTaskRunner:
 
         assert test_flow().result() == 0
 
+    def test_async_tasks_on_a_worker_reuse_its_loop_and_client(self):
+        with ThreadPoolTaskRunner(max_workers=1) as runner:
+            first = runner.submit(loop_and_client, {}).result()
+            second = runner.submit(loop_and_client, {}).result()
+
+            assert first == second
+            assert len(runner._worker_event_loops) == 1
+            (worker,) = runner._worker_event_loops
+            assert first == (id(worker.loop), id(worker.client_context.client))
+
+    def test_async_tasks_with_other_api_settings_do_not_use_the_shared_client(self):
+        with ThreadPoolTaskRunner(max_workers=1) as runner:
+            loop_id, client_id = runner.submit(loop_and_client, {}).result()
+            with temporary_settings({PREFECT_API_KEY: "other-key"}):
+                other_loop_id, other_client_id = runner.submit(
+                    loop_and_client, {}
+                ).result()
+
+            assert other_loop_id == loop_id
+            assert other_client_id != client_id
+            (worker,) = runner._worker_event_loops
+            assert id(worker.client_context.client) == client_id
+
+    def test_async_task_clients_must_match_the_running_loop(self):
+        with ThreadPoolTaskRunner(max_workers=1) as runner:
+            runner.submit(loop_and_client, {}).result()
+            (worker,) = runner._worker_event_loops
+
+        async def read_client():
+            AsyncClientContext.__var__.set(worker.client_context)
+            return get_client()
+
+        # a client is only shared with tasks running on the loop it was opened on
+        assert asyncio.run(read_client()) is not worker.client_context.client
+
+    @pytest.mark.parametrize("shutdown", ["exit", "cancel_all"])
+    def test_worker_event_loops_are_closed_on_shutdown(self, shutdown):
+        runner = ThreadPoolTaskRunner(max_workers=2)
+        runner.__enter__()
+        try:
+            futures = runner.map(loop_and_client, {"param1": [1, 2, 3, 4]})
+            for future in futures:
+                future.result()
+            workers = list(runner._worker_event_loops)
+            threads = list(runner._executor._threads)
+            assert workers and threads
+        finally:
+            if shutdown == "exit":
+                runner.__exit__(None, None, None)
+            else:
+                runner.cancel_all()
+
+        assert runner._worker_event_loops == []
+        assert all(worker.loop.is_closed() for worker in workers)
+        assert all(worker.client_context.client._closed for worker in workers)
+        assert not any(thread.is_alive() for thread in threads)
+
+        if shutdown == "cancel_all":
+            runner.__exit__(None, None, None)
+
+
+class TestProcessPoolTaskRunner:
+    @pytest.fixture(autouse=True)
+    def default_storage_setting(self, tmp_path):
+        name = str(uuid.uuid4())
+        LocalFileSystem(basepath=tmp_path).save(name)
+        with temporary_settings(
+            {
+                PREFECT_DEFAULT_RESULT_STORAGE_BLOCK: f"local-file-system/{name}",
+                PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK: f"local-file-system/{name}",
+            }
+        ):
+            yield
+
+    def test_duplicate(self):
+        runner = ProcessPoolTaskRunner(max_workers=3, chunksize=5)
+        duplicate_runner = runner.duplicate()
+        assert isinstance(duplicate_runner, ProcessPoolTaskRunner)
+        assert duplicate_runner is not runner
+        assert duplicate_runner == runner
+        assert duplicate_runner != ProcessPoolTaskRunner(max_workers=3)
+
+    def test_runner_must_be_started(self):
+        runner = ProcessPoolTaskRunner()
+        with pytest.raises(RuntimeError, match="Task runner is not started"):
+            runner.submit(my_test_task, {})
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError, match="chunksize must be greater than 0"):
+            ProcessPoolTaskRunner(chunksize=0)
+
+    def test_set_max_workers_through_settings(self):
+        with temporary_settings({PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS: 5}):
+            assert ProcessPoolTaskRunner()._max_workers == 5
+
+    def test_submit_sync_and_async_tasks(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            parameters = {"param1": 1, "param2": 2}
+            future = runner.submit(my_test_task, parameters)
+            async_future = runner.submit(my_test_async_task, parameters)
+            assert isinstance(future, PrefectFuture)
+            assert isinstance(future.task_run_id, UUID)
+            assert isinstance(future.wrapped_future, Future)
+
+            assert future.result() == (1, 2)
+            assert async_future.result() == (1, 2)
+
+    def test_submit_task_receives_context(self):
+        with tags("tag1", "tag2"):
+            with ProcessPoolTaskRunner(max_workers=1) as runner:
+                future = runner.submit(context_matters, {})
+                assert future.result() == {"tag1", "tag2"}
+
+    def test_submit_resolves_upstream_futures(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            upstream = runner.submit(add_one, {"x": 1})
+            downstream = runner.submit(add_one, {"x": upstream}, wait_for=[upstream])
+            assert downstream.result() == 3
+
+    def test_submit_reports_failed_state(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            future = runner.submit(fails, {})
+            future.wait()
+            assert future.state.is_failed()
+            with pytest.raises(ValueError, match="oops"):
+                future.result()
+
+    def test_map_sends_chunks_of_task_runs(self, monkeypatch):
+        runner = ProcessPoolTaskRunner(max_workers=1, chunksize=2)
+        chunk_sizes = []
+        send_to_workers = runner._send_to_workers
+
+        def record_chunk(task, context, task_runs):
+            chunk_sizes.append(len(task_runs))
+            return send_to_workers(task, context, task_runs)
+
+        monkeypatch.setattr(runner, "_send_to_workers", record_chunk)
+        with runner:
+            futures = runner.map(
+                my_test_task, {"param1": [1, 2, 3], "param2": [4, 5, 6]}
+            )
+            assert all(isinstance(future, PrefectFuture) for future in futures)
+
+            results = [future.result() for future in futures]
+            assert results == [(1, 4), (2, 5), (3, 6)]
+        assert chunk_sizes == [2, 1]
+
+    def test_map_async_task_with_context(self):
+        with tags("tag1", "tag2"):
+            with ProcessPoolTaskRunner(max_workers=1) as runner:
+                futures = runner.map(context_matters_async, {"param1": [1, 2, 3]})
+                results = [future.result() for future in futures]
+                assert results == [{"tag1", "tag2"}] * 3
+
+    def test_runs_in_flow(self):
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=2))
+        def test_flow():
+            return add_one.map(add_one.map([1, 2, 3])).result()
+
+        assert test_flow() == [3, 4, 5]
+
 
 class TestPrefectTaskRunner:
     @pytest.fixture(autouse=True)
@@ -1510,6 +1510,25 @@ class TestTaskCaching:
         assert second_state.name == "Cached"
         assert await second_state.result() == await first_state.result()
 
+    def test_inputs_of_tasks_called_by_mapped_tasks_are_not_memoized(self):
+        def key_of(values):
+            return INPUTS.compute_key(
+                task_ctx=None, inputs={"values": values}, flow_parameters={}
+            )
+
+        @task
+        def extend(value, offset):
+            values = [value]
+            key = key_of(values)
+            values.append(offset)
+            return key != key_of(values)
+
+        @flow
+        def bar():
+            return extend.map([1, 2], unmapped(100)).result()
+
+        assert bar() == [True, True]
+
     def test_many_repeated_cache_hits_within_flows_cached(
         self,
     ):
@@ -4315,6 +4334,33 @@ class TestTaskMap:
 
         await test_flow()
 
+    async def test_deferred_map_creates_task_runs_in_batches(self, monkeypatch):
+        @task
+        def test_task(x):
+            print(x)
+
+        batch_sizes = []
+        create_task_runs = PrefectClient.create_task_runs
+
+        async def spy(self, task_runs):
+            task_runs = list(task_runs)
+            batch_sizes.append(len(task_runs))
+            return await create_task_runs(self, task_runs)
+
+        monkeypatch.setattr(PrefectClient, "create_task_runs", spy)
+        monkeypatch.setattr("prefect.tasks.BULK_CREATE_CHUNK_SIZE", 2)
+
+        futures = test_task.map(x=[1, 2, 3], deferred=True)
+
+        assert batch_sizes == [2, 1]
+        assert len({future.task_run_id for future in futures}) == 3
+        for future, parameter_value in zip(futures, [1, 2, 3]):
+            assert (
+                await get_background_task_run_parameters(
+                    test_task, future.state.state_details.task_parameters_id
+                )
+            )["parameters"] == {"x": parameter_value}
+
     async def test_wait_mapped_tasks(self):
         @task
         def add_one(x):
@@ -1,11 +1,21 @@
 import hashlib
 import threading
+import uuid
 from unittest.mock import MagicMock
 
 import pytest
 
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import file_hash, hash_objects, stable_hash
+from prefect.utilities.hashing import (
+    HashMemo,
+    file_hash,
+    get_hash_memo,
+    hash_memo,
+    hash_objects,
+    stable_hash,
+    structural_hash,
+    use_hash_memo,
+)
 
 
 @pytest.mark.parametrize(
@@ -83,3 +93,101 @@ class TestHashObjects:
         assert "Unable to create hash" in error_msg
         assert "JSON error" in error_msg
         assert "Pickle error" in error_msg
+
+
+class TestStructuralHash:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            None,
+            True,
+            1,
+            1.5,
+            "hello",
+            b"hello",
+            bytearray(b"hello"),
+            ["a", 1, None],
+            ("a", 1, None),
+            {"a": [1, 2], "b": {"c": "d"}},
+            {1, 2, 3},
+        ],
+    )
+    def test_hash_is_stable(self, obj):
+        assert structural_hash(obj) == structural_hash(obj)
+
+    def test_distinguishes_types(self):
+        values = [1, "1", b"1", 1.0, True, [1], (1,), {1}, None, "None"]
+        assert len({structural_hash(v) for v in values}) == len(values)
+
+    def test_distinguishes_nesting(self):
+        assert structural_hash([["a"], "b"]) != structural_hash([["a", "b"]])
+        assert structural_hash(["ab"]) != structural_hash(["a", "b"])
+
+    def test_dict_and_set_order_does_not_matter(self):
+        assert structural_hash({"a": 1, "b": 2}) == structural_hash({"b": 2, "a": 1})
+        assert structural_hash({3, 1, 2}) == structural_hash({1, 2, 3})
+
+    def test_dict_keys_and_values_are_paired(self):
+        assert structural_hash({"a": 1, "b": 2}) != structural_hash({"a": 2, "b": 1})
+
+    def test_hashes_objects_without_a_fast_path(self):
+        assert structural_hash(uuid.UUID(int=1)) == structural_hash(uuid.UUID(int=1))
+        assert structural_hash(uuid.UUID(int=1)) != structural_hash(uuid.UUID(int=2))
+
+    def test_hashes_self_referencing_collections(self):
+        obj = [1, 2]
+        obj.append(obj)
+        assert structural_hash(obj) == structural_hash(obj)
+
+    def test_raises_on_unhashable_objects(self):
+        with pytest.raises(HashError, match="Unable to create hash"):
+            structural_hash({"data": "hello", "lock": threading.Lock()})
+
+    def test_hashes_numpy_arrays_by_content(self):
+        np = pytest.importorskip("numpy")
+
+        a = np.arange(100)
+        assert structural_hash(a) == structural_hash(np.arange(100))
+        assert structural_hash(a) != structural_hash(np.arange(1, 101))
+        assert structural_hash(a) != structural_hash(a.astype("float64"))
+        assert structural_hash(a) != structural_hash(a.reshape(10, 10))
+        # non-contiguous arrays hash the same as contiguous arrays with equal content
+        assert structural_hash(a[::2]) == structural_hash(np.arange(0, 100, 2))
+
+    def test_hashes_pandas_objects_by_content(self):
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        assert structural_hash(df) == structural_hash(df.copy())
+        assert structural_hash(df) == structural_hash(df[["b", "a"]])
+        assert structural_hash(df) != structural_hash(df.assign(a=[1, 2, 4]))
+        assert structural_hash(df["a"]) != structural_hash(df["a"].rename("c"))
+
+    def test_memo_returns_hash_for_the_same_object(self):
+        obj = {"a": [1, 2, 3]}
+        memo = HashMemo([obj])
+        digest = structural_hash(obj, memo=memo)
+
+        obj["a"].append(4)  # the memo assumes objects are not mutated
+
+        assert structural_hash(obj, memo=memo) == digest
+        assert structural_hash({"a": [1, 2, 3, 4]}, memo=memo) != digest
+
+    def test_memo_only_holds_the_objects_it_was_created_with(self):
+        obj = {"a": [1, 2, 3]}
+        memo = HashMemo()
+        digest = structural_hash(obj, memo=memo)
+
+        obj["a"].append(4)
+
+        assert structural_hash(obj, memo=memo) != digest
+
+    def test_hash_memo_context(self):
+        obj = [1, 2, 3]
+        assert get_hash_memo() is None
+        with hash_memo([obj]) as memo:
+            assert get_hash_memo() is memo
+            with use_hash_memo(None):
+                assert get_hash_memo() is None
+            assert get_hash_memo() is memo
+        assert get_hash_memo() is None